@@ -18,6 +18,9 @@ from agent_framework import BaseAgent, ChatMessage, Role, TextContent, AgentRunR
 
 from openai import AsyncAzureOpenAI
 
+from ..infra.llm_cache import cacheable_llm_calls
+from ..infra.llm_gateway import gate_openai_client
+
 logger = structlog.get_logger(__name__)
 
 
@@ -40,10 +43,13 @@ class EntityPIIAgent(BaseAgent):
         self.app_settings = settings
         
         # Initialize Azure OpenAI client for entity extraction
-        self.client = AsyncAzureOpenAI(
-            api_key=settings.AZURE_OPENAI_API_KEY,
-            api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT
+        self.client = gate_openai_client(
+            AsyncAzureOpenAI(
+                api_key=settings.AZURE_OPENAI_API_KEY,
+                api_version=settings.AZURE_OPENAI_API_VERSION,
+                azure_endpoint=settings.AZURE_OPENAI_ENDPOINT
+            ),
+            settings=settings
         )
         self.deployment = settings.AZURE_OPENAI_DEPLOYMENT
         
@@ -320,21 +326,23 @@ Return in this JSON structure:
 
 Only include categories that have entities found. If no entities in a category, omit it."""
             
-            response = await self.client.chat.completions.create(
-                model=self.deployment,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a financial entity extraction AI. Extract investment-related entities accurately."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.1,  # Very low temperature for extraction
-                response_format={"type": "json_object"}
-            )
+            # Extraction is near-deterministic; identical text gets the same result
+            with cacheable_llm_calls():
+                response = await self.client.chat.completions.create(
+                    model=self.deployment,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": "You are a financial entity extraction AI. Extract investment-related entities accurately."
+                        },
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ],
+                    temperature=0.1,  # Very low temperature for extraction
+                    response_format={"type": "json_object"}
+                )
             
             entities = json.loads(response.choices[0].message.content)
             
@@ -406,21 +414,23 @@ Return in JSON:
 
 Only include categories with PII found."""
             
-            response = await self.client.chat.completions.create(
-                model=self.deployment,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a PII detection AI. Identify all personally identifiable information accurately."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.1,
-                response_format={"type": "json_object"}
-            )
+            # Extraction is near-deterministic; identical text gets the same result
+            with cacheable_llm_calls():
+                response = await self.client.chat.completions.create(
+                    model=self.deployment,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": "You are a PII detection AI. Identify all personally identifiable information accurately."
+                        },
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ],
+                    temperature=0.1,
+                    response_format={"type": "json_object"}
+                )
             
             ai_pii = json.loads(response.choices[0].message.content)
             
@@ -18,6 +18,7 @@ from agent_framework import BaseAgent, ChatMessage, Role, TextContent, AgentRunR
 
 from openai import AsyncAzureOpenAI
 
+from ..infra.llm_gateway import gate_openai_client
 from ..models.task_models import (
     InvestmentRecommendation,
     RecommendationType
@@ -47,10 +48,13 @@ class InvestmentRecommendationAgent(BaseAgent):
         self.app_settings = settings
         
         # Initialize Azure OpenAI client
-        self.client = AsyncAzureOpenAI(
-            api_key=settings.AZURE_OPENAI_API_KEY,
-            api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT
+        self.client = gate_openai_client(
+            AsyncAzureOpenAI(
+                api_key=settings.AZURE_OPENAI_API_KEY,
+                api_version=settings.AZURE_OPENAI_API_VERSION,
+                azure_endpoint=settings.AZURE_OPENAI_ENDPOINT
+            ),
+            settings=settings
         )
         self.deployment = settings.AZURE_OPENAI_DEPLOYMENT
         
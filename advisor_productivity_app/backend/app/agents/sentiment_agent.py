@@ -18,6 +18,8 @@ from agent_framework import BaseAgent, ChatMessage, Role, TextContent, AgentRunR
 
 from openai import AsyncAzureOpenAI
 
+from ..infra.llm_cache import cacheable_llm_calls
+from ..infra.llm_gateway import gate_openai_client
 from ..models.task_models import (
     SentimentAnalysis,
     SentimentType
@@ -46,10 +48,13 @@ class InvestmentSentimentAgent(BaseAgent):
         self.app_settings = settings
         
         # Initialize Azure OpenAI client
-        self.client = AsyncAzureOpenAI(
-            api_key=settings.AZURE_OPENAI_API_KEY,
-            api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT
+        self.client = gate_openai_client(
+            AsyncAzureOpenAI(
+                api_key=settings.AZURE_OPENAI_API_KEY,
+                api_version=settings.AZURE_OPENAI_API_VERSION,
+                azure_endpoint=settings.AZURE_OPENAI_ENDPOINT
+            ),
+            settings=settings
         )
         self.deployment = settings.AZURE_OPENAI_DEPLOYMENT
         
@@ -523,21 +528,23 @@ COMPLIANCE FOCUS AREAS:
 
 Be thorough but balanced. Flag genuine concerns, not routine advisory discussions."""
             
-            response = await self.client.chat.completions.create(
-                model=self.deployment,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a compliance expert specializing in investment advisory regulations. Identify potential violations or concerning patterns."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.2,  # Lower temperature for compliance
-                response_format={"type": "json_object"}
-            )
+            # Identical transcripts get the same compliance findings
+            with cacheable_llm_calls():
+                response = await self.client.chat.completions.create(
+                    model=self.deployment,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": "You are a compliance expert specializing in investment advisory regulations. Identify potential violations or concerning patterns."
+                        },
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ],
+                    temperature=0.2,  # Lower temperature for compliance
+                    response_format={"type": "json_object"}
+                )
             
             result = json.loads(response.choices[0].message.content)
             
@@ -7,7 +7,9 @@ MAF-compatible agent implementation.
 """
 
 import asyncio
+import copy
 import json
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional, Literal, AsyncIterable
 from datetime import datetime
 from pathlib import Path
@@ -18,12 +20,17 @@ from agent_framework import BaseAgent, ChatMessage, Role, TextContent, AgentRunR
 
 from openai import AsyncAzureOpenAI
 
+from ..infra.llm_gateway import gate_openai_client
+from ..services.single_flight import SingleFlight, transcript_version
 from ..models.task_models import (
     SessionSummary
 )
 
 logger = structlog.get_logger(__name__)
 
+# Summary fields written per persona; everything else comes from the shared extraction
+PERSONA_FIELDS = ("summary", "key_points", "advisor_notes", "client_summary")
+
 
 class InvestmentSummarizationAgent(BaseAgent):
     """
@@ -45,10 +52,13 @@ class InvestmentSummarizationAgent(BaseAgent):
         self.app_settings = settings
         
         # Initialize Azure OpenAI client
-        self.client = AsyncAzureOpenAI(
-            api_key=settings.AZURE_OPENAI_API_KEY,
-            api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT
+        self.client = gate_openai_client(
+            AsyncAzureOpenAI(
+                api_key=settings.AZURE_OPENAI_API_KEY,
+                api_version=settings.AZURE_OPENAI_API_VERSION,
+                azure_endpoint=settings.AZURE_OPENAI_ENDPOINT
+            ),
+            settings=settings
         )
         self.deployment = settings.AZURE_OPENAI_DEPLOYMENT
         
@@ -58,6 +68,12 @@ class InvestmentSummarizationAgent(BaseAgent):
         # Personas
         self.personas = ["advisor", "compliance", "client", "general"]
         
+        # Two-stage summary caches (LRU), keyed by transcript hash
+        self.cache_entries = settings.summary_cache_entries
+        self._extraction_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._rendering_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._extraction_flight = SingleFlight("summary_extraction")
+        
         logger.info(
             f"Initialized {self.name}",
             summary_types=len(self.summary_types),
@@ -158,6 +174,11 @@ class InvestmentSummarizationAgent(BaseAgent):
         """
         Generate comprehensive session summary.
         
+        Runs in two stages: a persona-neutral extraction pass over the
+        transcript (shared by every persona and cached per transcript hash),
+        then a persona rendering from the extraction alone (cached per
+        extraction, persona and summary type).
+        
         Args:
             transcript_segments: List of conversation segments with text, speaker, timestamp
             sentiment_data: Aggregated sentiment analysis results
@@ -181,38 +202,18 @@ class InvestmentSummarizationAgent(BaseAgent):
         )
         
         try:
-            # Build full transcript from segments
-            full_transcript = self._build_transcript_from_segments(transcript_segments)
-            
-            # Build summary prompt
-            prompt = self._build_summary_prompt(
-                transcript=full_transcript,
+            transcript_hash = transcript_version(transcript_segments, sentiment_data, recommendations)
+            extraction = await self.extract_session_facts(
                 transcript_segments=transcript_segments,
                 sentiment_data=sentiment_data,
                 recommendations=recommendations,
-                summary_type=summary_type,
-                persona=persona
-            )
-            
-            # Call Azure OpenAI
-            response = await self.client.chat.completions.create(
-                model=self.deployment,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": self._get_persona_system_message(persona)
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.4,  # Moderate creativity for summaries
-                response_format={"type": "json_object"}
+                session_id=session_id,
+                transcript_hash=transcript_hash
             )
+            rendering = await self._render_persona(transcript_hash, extraction, persona, summary_type)
             
-            # Parse response
-            result = json.loads(response.choices[0].message.content)
+            # Persona rendering sits on top of the shared extraction
+            result = {**copy.deepcopy(extraction), **copy.deepcopy(rendering)}
             
             # Enhance with metadata
             result["metadata"] = {
@@ -223,6 +224,7 @@ class InvestmentSummarizationAgent(BaseAgent):
                 "segment_count": len(transcript_segments),
                 "has_sentiment_data": bool(sentiment_data),
                 "has_recommendations": bool(recommendations),
+                "transcript_hash": transcript_hash,
                 "agent": self.name
             }
             
@@ -239,6 +241,131 @@ class InvestmentSummarizationAgent(BaseAgent):
             logger.error(f"Failed to generate session summary", error=str(e), exc_info=True)
             raise
     
+    async def extract_session_facts(
+        self,
+        transcript_segments: List[Dict[str, Any]],
+        sentiment_data: Optional[Dict[str, Any]] = None,
+        recommendations: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+        transcript_hash: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Run (or reuse) the structured extraction pass for a transcript.
+        
+        Concurrent callers for the same transcript share one in-flight
+        request, so launching every persona at once still reads the
+        transcript only once.
+        
+        Returns:
+            Persona-neutral extraction (facts, decisions, risks, action items, ...).
+            Treat as read-only; it is shared with the cache.
+        """
+        transcript_hash = transcript_hash or transcript_version(
+            transcript_segments, sentiment_data, recommendations
+        )
+        
+        cached = self._extraction_cache.get(transcript_hash)
+        if cached is not None:
+            self._extraction_cache.move_to_end(transcript_hash)
+            logger.info("Summary extraction cache hit", session_id=session_id, transcript_hash=transcript_hash[:16])
+            return cached
+        
+        async def extract() -> Dict[str, Any]:
+            extraction = await self._run_extraction(transcript_segments, sentiment_data, recommendations, session_id)
+            self._remember(self._extraction_cache, transcript_hash, extraction)
+            return extraction
+        
+        return await self._extraction_flight.do(transcript_hash, extract)
+    
+    async def _run_extraction(
+        self,
+        transcript_segments: List[Dict[str, Any]],
+        sentiment_data: Optional[Dict[str, Any]],
+        recommendations: Optional[Dict[str, Any]],
+        session_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """Single LLM pass over the full transcript."""
+        logger.info("Running summary extraction", session_id=session_id, segment_count=len(transcript_segments))
+        
+        full_transcript = self._build_transcript_from_segments(transcript_segments)
+        prompt = self._build_extraction_prompt(
+            transcript=full_transcript,
+            transcript_segments=transcript_segments,
+            sentiment_data=sentiment_data,
+            recommendations=recommendations
+        )
+        
+        response = await self.client.chat.completions.create(
+            model=self.deployment,
+            messages=[
+                {
+                    "role": "system",
+                    "content": """You are an AI assistant that extracts structured records from investment advisor-client meetings.
+Record what was said, decided and committed to, objectively and completely.
+Do not write for any particular audience; later steps tailor the wording."""
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            temperature=0.2,  # Extraction should be stable across runs
+            response_format={"type": "json_object"}
+        )
+        
+        extraction = json.loads(response.choices[0].message.content)
+        logger.info(
+            "Summary extraction completed",
+            session_id=session_id,
+            facts=len(extraction.get("facts", [])),
+            action_items=len(extraction.get("action_items", [])),
+            risks=len(extraction.get("risks", []))
+        )
+        return extraction
+    
+    async def _render_persona(
+        self,
+        transcript_hash: str,
+        extraction: Dict[str, Any],
+        persona: str,
+        summary_type: str
+    ) -> Dict[str, Any]:
+        """Render the persona-specific narrative fields from an extraction."""
+        cache_key = (transcript_hash, persona, summary_type)
+        cached = self._rendering_cache.get(cache_key)
+        if cached is not None:
+            self._rendering_cache.move_to_end(cache_key)
+            return cached
+        
+        response = await self.client.chat.completions.create(
+            model=self.deployment,
+            messages=[
+                {
+                    "role": "system",
+                    "content": self._get_persona_system_message(persona)
+                },
+                {
+                    "role": "user",
+                    "content": self._build_rendering_prompt(extraction, persona, summary_type)
+                }
+            ],
+            temperature=0.4,  # Moderate creativity for summaries
+            response_format={"type": "json_object"}
+        )
+        
+        rendering = json.loads(response.choices[0].message.content)
+        # Only narrative fields come from the rendering; facts stay as extracted
+        rendering = {key: rendering[key] for key in PERSONA_FIELDS if key in rendering}
+        self._remember(self._rendering_cache, cache_key, rendering)
+        return rendering
+    
+    def _remember(self, cache: "OrderedDict", key: Any, value: Dict[str, Any]):
+        """Insert into an LRU cache, evicting the oldest entries."""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.cache_entries:
+            cache.popitem(last=False)
+    
     def _build_transcript_from_segments(
         self,
         segments: List[Dict[str, Any]]
@@ -258,16 +385,14 @@ class InvestmentSummarizationAgent(BaseAgent):
         
         return "\n\n".join(transcript_lines)
     
-    def _build_summary_prompt(
+    def _build_extraction_prompt(
         self,
         transcript: str,
         transcript_segments: List[Dict[str, Any]],
         sentiment_data: Optional[Dict[str, Any]],
-        recommendations: Optional[Dict[str, Any]],
-        summary_type: str,
-        persona: str
+        recommendations: Optional[Dict[str, Any]]
     ) -> str:
-        """Build specialized prompt for investment session summary."""
+        """Build the persona-neutral extraction prompt for an investment session."""
         
         # Build sentiment context section
         sentiment_section = ""
@@ -294,47 +419,31 @@ INVESTMENT RECOMMENDATIONS GENERATED:
 The following recommendations were created based on the conversation:
 {json.dumps(recommendations, indent=2, default=str)}
 
-Incorporate these recommendations into your summary by:
+Incorporate these recommendations by:
 - Noting which recommendations align with discussed topics
-- Highlighting client reactions to investment suggestions
+- Recording client reactions to investment suggestions
 - Tracking recommendation acceptance, questions, or concerns
 - Identifying next steps for recommendation follow-through
 """
         
-        # Determine detail level
-        if summary_type == "brief":
-            detail_guidance = "Provide a concise 2-3 paragraph summary focusing on the most critical points."
-        elif summary_type == "detailed":
-            detail_guidance = "Provide a comprehensive summary covering all important aspects of the conversation."
-        else:  # comprehensive
-            detail_guidance = "Provide an exhaustive summary with detailed coverage of all discussion points, decisions, and nuances."
-        
-        prompt = f"""Generate a comprehensive summary of this investment advisor-client session.
+        prompt = f"""Extract a complete structured record of this investment advisor-client session.
 
 CONVERSATION TRANSCRIPT ({len(transcript_segments)} segments):
 {transcript}
 {sentiment_section}
 {recommendations_section}
 
-SUMMARY REQUIREMENTS:
-- Summary Type: {summary_type}
-- Target Persona: {persona}
-- {detail_guidance}
-
-IMPORTANT: Integrate the sentiment analysis and recommendations data above into your summary. 
-The summary should reflect how the client's emotional state, investment readiness, and risk 
-tolerance evolved throughout the conversation, and how the generated recommendations align 
-with the discussion topics and client needs.
+IMPORTANT: Integrate the sentiment analysis and recommendations data above. The record should
+reflect how the client's emotional state, investment readiness, and risk tolerance evolved
+throughout the conversation, and how the generated recommendations align with the discussion
+topics and client needs. Be exhaustive: summaries for different audiences and levels of detail
+will be written from this record alone, without the transcript.
 
-Provide the summary in this JSON structure:
+Provide the record in this JSON structure:
 
 {{
-    "summary": "Main narrative summary of the session",
-    
-    "key_points": [
-        "Key point 1",
-        "Key point 2",
-        "Key point 3"
+    "facts": [
+        "Objective fact stated in the session (client situation, goals, holdings, constraints)"
     ],
     
     "action_items": [
@@ -355,6 +464,14 @@ Provide the summary in this JSON structure:
         }}
     ],
     
+    "risks": [
+        {{
+            "risk": "Financial, suitability or compliance risk identified",
+            "severity": "high|medium|low",
+            "evidence": "What in the conversation indicates it"
+        }}
+    ],
+    
     "client_commitments": [
         {{
             "commitment": "What client committed to",
@@ -422,24 +539,63 @@ Provide the summary in this JSON structure:
         "Any compliance-relevant observations, disclosures made, or concerns"
     ],
     
-    "advisor_notes": "Private notes for the advisor (not for client)",
-    
-    "client_summary": "Simplified summary suitable for sharing with client",
-    
     "next_meeting_agenda": [
         "Suggested topic 1",
         "Suggested topic 2"
     ]
 }}
 
-PERSONA-SPECIFIC GUIDANCE:
-
-{self._get_persona_guidance(persona)}
-
-Be thorough, accurate, and professional. Base all insights on the actual conversation content."""
+Be thorough, accurate, and professional. Base everything on the actual conversation content."""
         
         return prompt
     
+    def _build_rendering_prompt(
+        self,
+        extraction: Dict[str, Any],
+        persona: str,
+        summary_type: str
+    ) -> str:
+        """Build the prompt that renders a persona summary from an extraction."""
+        
+        # Determine detail level
+        if summary_type == "brief":
+            detail_guidance = "Provide a concise 2-3 paragraph summary focusing on the most critical points."
+        elif summary_type == "detailed":
+            detail_guidance = "Provide a comprehensive summary covering all important aspects of the conversation."
+        else:  # comprehensive
+            detail_guidance = "Provide an exhaustive summary with detailed coverage of all discussion points, decisions, and nuances."
+        
+        return f"""Write the summary of an investment advisor-client session from the structured record below.
+
+SESSION RECORD:
+{json.dumps(extraction, indent=2, ensure_ascii=False, default=str)}
+
+SUMMARY REQUIREMENTS:
+- Summary Type: {summary_type}
+- Target Persona: {persona}
+- {detail_guidance}
+- Use only information in the record; do not invent details
+
+Provide the summary in this JSON structure:
+
+{{
+    "summary": "Main narrative summary of the session",
+    
+    "key_points": [
+        "Key point 1",
+        "Key point 2",
+        "Key point 3"
+    ],
+    
+    "advisor_notes": "Private notes for the advisor (not for client)",
+    
+    "client_summary": "Simplified summary suitable for sharing with client"
+}}
+
+PERSONA-SPECIFIC GUIDANCE:
+
+{self._get_persona_guidance(persona)}"""
+    
     def _get_persona_system_message(self, persona: str) -> str:
         """Get system message tailored to persona."""
         
@@ -519,14 +675,24 @@ GENERAL FOCUS:
         session_id: Optional[str] = None
     ) -> Dict[str, Dict[str, Any]]:
         """
-        Generate summaries for all personas in parallel.
+        Generate summaries for all personas.
+        
+        The transcript is extracted once; the persona renderings then run in
+        parallel from that extraction.
         
         Returns:
             Dictionary with keys: advisor, compliance, client, general
         """
         logger.info("Generating multi-persona summaries", session_id=session_id)
         
-        # Generate all persona summaries in parallel
+        # Warm the shared extraction before fanning out to the personas
+        await self.extract_session_facts(
+            transcript_segments=transcript_segments,
+            sentiment_data=sentiment_data,
+            recommendations=recommendations,
+            session_id=session_id
+        )
+        
         tasks = []
         for persona in self.personas:
             task = self.generate_session_summary(
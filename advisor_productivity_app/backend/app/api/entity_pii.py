@@ -14,6 +14,7 @@ from fastapi.responses import JSONResponse
 import structlog
 
 from ..infra.settings import get_settings
+from ..infra.llm_gateway import llm_request_context
 from ..agents.entity_pii_agent import EntityPIIAgent
 
 logger = structlog.get_logger(__name__)
@@ -75,7 +76,8 @@ class EntityPIIWebSocketManager:
             })
             
             # Extract entities and detect PII
-            result = await self.agent.extract_all(text, redact_pii=redact_pii)
+            with llm_request_context(session_id):
+                result = await self.agent.extract_all(text, redact_pii=redact_pii)
             
             # Store results
             session_entities[session_id] = result
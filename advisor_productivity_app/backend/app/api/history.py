@@ -5,11 +5,11 @@ Endpoints for managing and retrieving advisor session history.
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from fastapi.responses import JSONResponse
 import structlog
 
-from ..persistence.cosmos_memory import CosmosMemoryStore
+from ..persistence.cosmos_memory import CosmosMemoryStore, InvalidContinuationToken, create_memory_store
 from ..models.persistence_models import AdvisorSession, SessionSearchResult
 from ..infra.settings import get_settings
 
@@ -17,6 +17,9 @@ logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/history", tags=["history"])
 
+# Response header carrying the cursor for the next page of a list endpoint
+CONTINUATION_HEADER = "X-Continuation-Token"
+
 # Initialize Cosmos DB store
 cosmos_store: Optional[CosmosMemoryStore] = None
 
@@ -27,15 +30,7 @@ async def get_cosmos_store() -> CosmosMemoryStore:
     
     if cosmos_store is None:
         settings = get_settings()
-        cosmos_store = CosmosMemoryStore(
-            endpoint=settings.COSMOSDB_ENDPOINT,
-            database_name=settings.COSMOSDB_DATABASE,
-            container_name=settings.COSMOSDB_CONTAINER,
-            user_id="default_advisor",
-            tenant_id=settings.azure_tenant_id,
-            client_id=settings.azure_client_id,
-            client_secret=settings.azure_client_secret
-        )
+        cosmos_store = create_memory_store(settings)
         await cosmos_store.initialize()
     
     return cosmos_store
@@ -43,31 +38,46 @@ async def get_cosmos_store() -> CosmosMemoryStore:
 
 @router.get("/sessions")
 async def get_sessions(
+    response: Response,
     user_id: Optional[str] = Query(None, description="Filter by user ID"),
     status: Optional[str] = Query(None, description="Filter by status (active, completed, archived)"),
-    limit: int = Query(50, ge=1, le=100, description="Maximum number of sessions to return")
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of sessions to return"),
+    continuation_token: Optional[str] = Query(
+        None,
+        description="Cursor from the X-Continuation-Token header of the previous page"
+    )
 ) -> List[SessionSearchResult]:
     """
     Get list of all sessions with optional filters.
     Returns lightweight session summaries.
+    
+    When more sessions are available, the cursor for the next page is returned
+    in the X-Continuation-Token response header.
     """
     try:
         store = await get_cosmos_store()
-        sessions = await store.get_all_sessions(
+        sessions, next_token = await store.get_sessions_page(
             user_id=user_id,
             limit=limit,
-            status=status
+            status=status,
+            continuation_token=continuation_token
         )
         
+        if next_token:
+            response.headers[CONTINUATION_HEADER] = next_token
+        
         logger.info(
             "Retrieved sessions",
             count=len(sessions),
             user_id=user_id,
-            status=status
+            status=status,
+            has_more=bool(next_token)
         )
         
         return sessions
         
+    except InvalidContinuationToken as e:
+        raise HTTPException(status_code=400, detail=f"{e}; request the first page again")
     except Exception as e:
         logger.error(f"Error retrieving sessions", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
@@ -15,10 +15,12 @@ from fastapi.responses import JSONResponse
 import structlog
 
 from ..infra.settings import get_settings
+from ..infra.llm_gateway import llm_request_context
 from ..agents.summarization_agent import InvestmentSummarizationAgent
 from ..models.task_models import SessionSummary
 from ..models.persistence_models import AdvisorSession
-from ..persistence.cosmos_memory import CosmosMemoryStore
+from ..persistence.cosmos_memory import CosmosMemoryStore, create_memory_store
+from ..services.single_flight import get_summary_flight, transcript_version
 
 logger = structlog.get_logger(__name__)
 
@@ -39,19 +41,40 @@ async def get_cosmos_store() -> CosmosMemoryStore:
     
     if cosmos_store is None:
         settings = get_settings()
-        cosmos_store = CosmosMemoryStore(
-            endpoint=settings.COSMOSDB_ENDPOINT,
-            database_name=settings.COSMOSDB_DATABASE,
-            container_name=settings.COSMOSDB_CONTAINER,
-            user_id="default_advisor",
-            tenant_id=settings.azure_tenant_id,
-            client_id=settings.azure_client_id,
-            client_secret=settings.azure_client_secret
-        )
+        cosmos_store = create_memory_store(settings)
         await cosmos_store.initialize()
     
     return cosmos_store
 
+async def summarize_once(
+    agent: InvestmentSummarizationAgent,
+    session_id: str,
+    transcript_segments: List[Dict[str, Any]],
+    sentiment_data: Optional[Dict[str, Any]] = None,
+    recommendations: Optional[Dict[str, Any]] = None,
+    summary_type: str = "detailed",
+    persona: str = "advisor"
+) -> Dict[str, Any]:
+    """
+    Generate a summary, sharing the result with identical concurrent requests.
+    
+    Keyed on session, transcript version, persona and summary type.
+    """
+    version = transcript_version(transcript_segments, sentiment_data, recommendations)
+    with llm_request_context(session_id):
+        return await get_summary_flight().do(
+            (session_id, version, persona, summary_type),
+            lambda: agent.generate_session_summary(
+                transcript_segments=transcript_segments,
+                sentiment_data=sentiment_data,
+                recommendations=recommendations,
+                session_id=session_id,
+                summary_type=summary_type,
+                persona=persona
+            )
+        )
+
+
 class SummaryWebSocketManager:
     """Manages WebSocket connections for summarization."""
     
@@ -105,12 +128,13 @@ class SummaryWebSocketManager:
                 "timestamp": datetime.utcnow().isoformat()
             })
             
-            # Generate summary
-            result = await self.agent.generate_session_summary(
+            # Generate summary (joins an identical in-flight request if there is one)
+            result = await summarize_once(
+                self.agent,
+                session_id=session_id,
                 transcript_segments=transcript_segments,
                 sentiment_data=sentiment_data,
                 recommendations=recommendations,
-                session_id=session_id,
                 summary_type=summary_type,
                 persona=persona
             )
@@ -215,8 +239,9 @@ async def summary_websocket(websocket: WebSocket, session_id: str):
                     })
                     continue
                 
-                # Generate all personas in background
-                for persona in ["advisor", "compliance", "client", "general"]:
+                # Generate all personas in background; the tasks share a single
+                # transcript extraction and only the persona renderings run per task
+                for persona in summarization_agent.personas:
                     asyncio.create_task(
                         ws_manager.generate_and_stream_summary(
                             session_id=session_id,
@@ -297,12 +322,13 @@ async def generate_summary(
         if not transcript_segments:
             raise HTTPException(status_code=400, detail="No transcript segments provided")
         
-        # Generate summary
-        result = await summarization_agent.generate_session_summary(
+        # Generate summary (joins an identical in-flight request if there is one)
+        result = await summarize_once(
+            summarization_agent,
+            session_id=session_id,
             transcript_segments=transcript_segments,
             sentiment_data=sentiment_data,
             recommendations=recommendations,
-            session_id=session_id,
             summary_type=summary_type,
             persona=persona
         )
@@ -320,6 +346,103 @@ async def generate_summary(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _generate_and_save_all_personas(
+    session_id: str,
+    transcript_segments: List[Dict[str, Any]],
+    sentiment_data: Optional[Dict[str, Any]],
+    recommendations: Optional[Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """Generate every persona summary and persist the completed session."""
+    results = await summarization_agent.generate_persona_summaries(
+        transcript_segments=transcript_segments,
+        sentiment_data=sentiment_data,
+        recommendations=recommendations,
+        session_id=session_id
+    )
+    
+    # Store all summaries in memory
+    session_summaries[session_id] = results
+    
+    # Save session to Cosmos DB
+    try:
+        store = await get_cosmos_store()
+        
+        # Calculate session metrics
+        total_words = sum(len(seg.get("text", "").split()) for seg in transcript_segments)
+        exchange_count = len(transcript_segments)
+        
+        # Extract client/advisor names if available
+        client_name = None
+        advisor_name = None
+        for seg in transcript_segments:
+            speaker = seg.get("speaker", "").lower()
+            if "client" in speaker or "unknown" in speaker:
+                # Try to extract name from early transcript
+                pass
+            elif "advisor" in speaker:
+                pass
+        
+        # Extract investment readiness from sentiment
+        investment_readiness_score = None
+        risk_tolerance = None
+        key_phrases = []
+        if sentiment_data:
+            if isinstance(sentiment_data.get("investment_readiness"), dict):
+                investment_readiness_score = sentiment_data["investment_readiness"].get("score")
+            if isinstance(sentiment_data.get("risk_tolerance"), dict):
+                risk_tolerance = sentiment_data["risk_tolerance"].get("level")
+            key_phrases = sentiment_data.get("key_phrases", [])
+        
+        # Count decisions and actions from summaries
+        decisions_count = 0
+        action_items_count = 0
+        for persona_data in results.values():
+            if isinstance(persona_data, dict):
+                decisions_count = max(decisions_count, len(persona_data.get("decisions_made", [])))
+                action_items_count = max(action_items_count, len(persona_data.get("action_items", [])))
+        
+        # Create AdvisorSession model
+        session = AdvisorSession(
+            session_id=session_id,
+            user_id="default_advisor",
+            created_at=datetime.utcnow(),
+            started_at=datetime.utcnow(),
+            ended_at=datetime.utcnow(),
+            status="completed",
+            transcript=transcript_segments,
+            total_words=total_words,
+            exchange_count=exchange_count,
+            sentiment_data=sentiment_data,
+            recommendations=recommendations,
+            summaries=results,
+            client_name=client_name,
+            advisor_name=advisor_name,
+            investment_readiness_score=investment_readiness_score,
+            risk_tolerance=risk_tolerance,
+            key_phrases=key_phrases[:10] if key_phrases else [],
+            decisions_count=decisions_count,
+            action_items_count=action_items_count
+        )
+        
+        await store.save_session(session)
+        logger.info(
+            "Session saved to Cosmos DB",
+            session_id=session_id,
+            exchange_count=exchange_count,
+            total_words=total_words
+        )
+    
+    except Exception as db_error:
+        # Log but don't fail the request if DB save fails
+        logger.error(
+            "Failed to save session to Cosmos DB",
+            error=str(db_error),
+            session_id=session_id
+        )
+    
+    return results
+
+
 @router.post("/generate-all-personas/{session_id}")
 async def generate_all_persona_summaries(
     session_id: str,
@@ -343,92 +466,18 @@ async def generate_all_persona_summaries(
         if not transcript_segments:
             raise HTTPException(status_code=400, detail="No transcript segments provided")
         
-        # Generate all persona summaries
-        results = await summarization_agent.generate_persona_summaries(
-            transcript_segments=transcript_segments,
-            sentiment_data=sentiment_data,
-            recommendations=recommendations,
-            session_id=session_id
-        )
-        
-        # Store all summaries in memory
-        session_summaries[session_id] = results
-        
-        # Save session to Cosmos DB
-        try:
-            store = await get_cosmos_store()
-            
-            # Calculate session metrics
-            total_words = sum(len(seg.get("text", "").split()) for seg in transcript_segments)
-            exchange_count = len(transcript_segments)
-            
-            # Extract client/advisor names if available
-            client_name = None
-            advisor_name = None
-            for seg in transcript_segments:
-                speaker = seg.get("speaker", "").lower()
-                if "client" in speaker or "unknown" in speaker:
-                    # Try to extract name from early transcript
-                    pass
-                elif "advisor" in speaker:
-                    pass
-            
-            # Extract investment readiness from sentiment
-            investment_readiness_score = None
-            risk_tolerance = None
-            key_phrases = []
-            if sentiment_data:
-                if isinstance(sentiment_data.get("investment_readiness"), dict):
-                    investment_readiness_score = sentiment_data["investment_readiness"].get("score")
-                if isinstance(sentiment_data.get("risk_tolerance"), dict):
-                    risk_tolerance = sentiment_data["risk_tolerance"].get("level")
-                key_phrases = sentiment_data.get("key_phrases", [])
-            
-            # Count decisions and actions from summaries
-            decisions_count = 0
-            action_items_count = 0
-            for persona_data in results.values():
-                if isinstance(persona_data, dict):
-                    decisions_count = max(decisions_count, len(persona_data.get("decisions_made", [])))
-                    action_items_count = max(action_items_count, len(persona_data.get("action_items", [])))
-            
-            # Create AdvisorSession model
-            session = AdvisorSession(
-                session_id=session_id,
-                user_id="default_advisor",
-                created_at=datetime.utcnow(),
-                started_at=datetime.utcnow(),
-                ended_at=datetime.utcnow(),
-                status="completed",
-                transcript=transcript_segments,
-                total_words=total_words,
-                exchange_count=exchange_count,
-                sentiment_data=sentiment_data,
-                recommendations=recommendations,
-                summaries=results,
-                client_name=client_name,
-                advisor_name=advisor_name,
-                investment_readiness_score=investment_readiness_score,
-                risk_tolerance=risk_tolerance,
-                key_phrases=key_phrases[:10] if key_phrases else [],
-                decisions_count=decisions_count,
-                action_items_count=action_items_count
-            )
-            
-            await store.save_session(session)
-            logger.info(
-                "Session saved to Cosmos DB",
-                session_id=session_id,
-                exchange_count=exchange_count,
-                total_words=total_words
-            )
-            
-        except Exception as db_error:
-            # Log but don't fail the request if DB save fails
-            logger.error(
-                "Failed to save session to Cosmos DB",
-                error=str(db_error),
-                session_id=session_id
+        # Generate and save all persona summaries; a repeated click while this is
+        # running shares the same computation (and the same saved session)
+        version = transcript_version(transcript_segments, sentiment_data, recommendations)
+        with llm_request_context(session_id):
+            results = await get_summary_flight().do(
+                (session_id, version, "all_personas", "detailed"),
+                lambda: _generate_and_save_all_personas(
+                    session_id,
+                    transcript_segments,
+                    sentiment_data,
+                    recommendations
+                )
             )
         
         return JSONResponse(content=results)
@@ -541,5 +590,6 @@ async def health_check():
         "agent": summarization_agent.name,
         "active_connections": len(ws_manager.active_connections),
         "stored_sessions": len(session_summaries),
+        "single_flight": get_summary_flight().stats(),
         "timestamp": datetime.utcnow().isoformat()
     })
@@ -49,6 +49,9 @@ class Settings(BaseSettings):
     cosmosdb_key: Optional[str] = Field(default=None, alias="COSMOSDB_KEY")
     cosmosdb_database: str = Field(default="advisor_productivity", alias="COSMOS_DB_DATABASE")
     cosmosdb_container: str = Field(default="sessions", alias="COSMOS_DB_CONTAINER")
+    memory_store_backend: str = Field(default="cosmos", alias="MEMORY_STORE_BACKEND")  # cosmos | sqlite
+    sqlite_memory_path: str = Field(default="data/memory_store.db", alias="SQLITE_MEMORY_PATH")
+    memory_store_record_path: Optional[str] = Field(default=None, alias="MEMORY_STORE_RECORD_PATH")
     
     # ========================================
     # Azure Storage (for audio file storage)
@@ -121,6 +124,24 @@ class Settings(BaseSettings):
     default_agent_timeout: int = Field(default=300, alias="DEFAULT_AGENT_TIMEOUT")
     enable_agent_telemetry: bool = Field(default=True, alias="ENABLE_AGENT_TELEMETRY")
     
+    # ========================================
+    # LLM Gateway (deployment quotas shared by all agents; 0 = no limit)
+    # ========================================
+    llm_gateway_enabled: bool = Field(default=True, alias="LLM_GATEWAY_ENABLED")
+    llm_requests_per_minute: int = Field(default=0, alias="LLM_REQUESTS_PER_MINUTE")
+    llm_tokens_per_minute: int = Field(default=0, alias="LLM_TOKENS_PER_MINUTE")
+    llm_max_concurrent_requests: int = Field(default=0, alias="LLM_MAX_CONCURRENT_REQUESTS")
+    llm_max_retries: int = Field(default=4, alias="LLM_MAX_RETRIES")
+    
+    # ========================================
+    # LLM Response Cache (exact-match; opt-in)
+    # ========================================
+    llm_cache_enabled: bool = Field(default=False, alias="LLM_CACHE_ENABLED")
+    llm_cache_memory_mb: int = Field(default=16, alias="LLM_CACHE_MEMORY_MB")
+    llm_cache_sqlite_path: Optional[str] = Field(default=None, alias="LLM_CACHE_SQLITE_PATH")
+    llm_cache_sqlite_max_mb: int = Field(default=256, alias="LLM_CACHE_SQLITE_MAX_MB")
+    llm_cache_ttl_seconds: int = Field(default=86400, alias="LLM_CACHE_TTL_SECONDS")
+    
     # ========================================
     # Sentiment Analysis Configuration
     # ========================================
@@ -176,6 +197,9 @@ class Settings(BaseSettings):
     default_summary_type: str = Field(default="detailed", alias="DEFAULT_SUMMARY_TYPE")  # brief, detailed, comprehensive
     default_summary_persona: str = Field(default="advisor", alias="DEFAULT_SUMMARY_PERSONA")  # advisor, compliance, client
     
+    # Entries kept in each summary cache (transcript extractions and persona renderings)
+    summary_cache_entries: int = Field(default=128, alias="SUMMARY_CACHE_ENTRIES")
+    
     # ========================================
     # Compliance Configuration
     # ========================================
@@ -15,6 +15,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
 
 from app.infra.settings import get_settings
+from app.infra.llm_cache import get_llm_cache
+from app.infra.llm_gateway import get_llm_gateway
 from app.routers import transcription, sentiment, recommendations
 from app.api import summary, entity_pii, orchestration, history
 
@@ -133,6 +135,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Continuation-Token"],
 )
 
 
@@ -159,10 +162,13 @@ async def api_status():
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
+    gateway, cache = get_llm_gateway(settings), get_llm_cache(settings)
     return {
         "status": "healthy",
         "service": "advisor_productivity_app",
-        "version": "0.1.0"
+        "version": "0.1.0",
+        "llm_gateway": gateway.stats() if gateway else None,
+        "llm_cache": cache.stats() if cache else None
     }
 
 
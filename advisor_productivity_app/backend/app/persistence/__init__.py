@@ -1,5 +1,6 @@
 """Persistence layer for advisor productivity application."""
 
-from .cosmos_memory import CosmosMemoryStore
+from .cosmos_memory import CosmosMemoryStore, create_memory_store
+from .sqlite_memory import SqliteMemoryStore
 
-__all__ = ["CosmosMemoryStore"]
+__all__ = ["CosmosMemoryStore", "SqliteMemoryStore", "create_memory_store"]
@@ -8,9 +8,10 @@ Supports Azure AD authentication via service principal or managed identity.
 import asyncio
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from azure.cosmos.aio import CosmosClient
+from azure.cosmos.exceptions import CosmosHttpResponseError
 from azure.cosmos.partition_key import PartitionKey
 from azure.identity.aio import (
     DefaultAzureCredential,
@@ -19,9 +20,39 @@ from azure.identity.aio import (
 import structlog
 
 from ..models.persistence_models import AdvisorSession, SessionSearchResult
+from .sqlite_container import RecordingContainer
 
 logger = structlog.get_logger(__name__)
 
+# Fields needed to build a SessionSearchResult; the list queries project only
+# these so transcripts, summaries and entity payloads never leave the server
+SESSION_SUMMARY_FIELDS = (
+    "session_id",
+    "created_at",
+    "ended_at",
+    "duration_seconds",
+    "status",
+    "client_name",
+    "advisor_name",
+    "exchange_count",
+    "investment_readiness_score",
+    "key_topics",
+)
+
+
+class InvalidContinuationToken(ValueError):
+    """A paging cursor that is malformed, expired or belongs to another query."""
+
+
+def _is_bad_continuation_token(error: Exception, continuation_token: Optional[str]) -> bool:
+    """Whether a paged query failed because of the continuation token it resumed from."""
+    if not continuation_token:
+        return False
+    if isinstance(error, CosmosHttpResponseError):
+        return error.status_code == 400
+    # The SDK (and the SQLite container) decode the token client-side
+    return isinstance(error, (ValueError, TypeError, KeyError))
+
 
 class CosmosMemoryStore:
     """
@@ -40,6 +71,7 @@ class CosmosMemoryStore:
         tenant_id: Optional[str] = None,
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
+        record_path: Optional[str] = None,
     ):
         """
         Initialize Cosmos DB memory store.
@@ -52,6 +84,7 @@ class CosmosMemoryStore:
             tenant_id: Azure AD tenant ID (for service principal auth)
             client_id: Service principal client ID
             client_secret: Service principal client secret
+            record_path: Optional JSONL file recording every container operation
         """
         self.endpoint = endpoint
         self.database_name = database_name
@@ -60,6 +93,7 @@ class CosmosMemoryStore:
         self.tenant_id = tenant_id
         self.client_id = client_id
         self.client_secret = client_secret
+        self.record_path = record_path
         
         self._client: Optional[CosmosClient] = None
         self._database = None
@@ -98,6 +132,10 @@ class CosmosMemoryStore:
                 offer_throughput=400
             )
             
+            # Record the live workload for replay by the persistence benchmark
+            if self.record_path:
+                self._container = RecordingContainer(self._container, self.record_path)
+            
             logger.info(
                 "CosmosDB initialized successfully",
                 endpoint=self.endpoint,
@@ -118,6 +156,8 @@ class CosmosMemoryStore:
     
     async def close(self) -> None:
         """Close the Cosmos DB client."""
+        if isinstance(self._container, RecordingContainer):
+            self._container.close()
         if self._client:
             await self._client.close()
             logger.info("CosmosDB client closed")
@@ -259,6 +299,99 @@ class CosmosMemoryStore:
             )
             raise
     
+    async def get_sessions_page(
+        self,
+        user_id: Optional[str] = None,
+        limit: int = 50,
+        status: Optional[str] = None,
+        continuation_token: Optional[str] = None
+    ) -> Tuple[List[SessionSearchResult], Optional[str]]:
+        """
+        Retrieve one page of session summaries, most recent first.
+        
+        Uses a projection query and a Cosmos continuation token instead of
+        OFFSET/LIMIT, so request charge and payload size stay flat regardless
+        of session size or page depth.
+        
+        Args:
+            user_id: Optional user filter
+            limit: Maximum number of sessions in the page
+            status: Optional status filter
+            continuation_token: Token returned with the previous page
+            
+        Returns:
+            Tuple of (sessions, continuation token for the next page or None)
+        """
+        await self.ensure_initialized()
+        
+        projection = ", ".join(f"c.{field}" for field in SESSION_SUMMARY_FIELDS)
+        query_parts = [f"SELECT {projection} FROM c WHERE c.data_type='advisor_session'"]
+        parameters = []
+        
+        if user_id:
+            query_parts.append("AND c.user_id=@user_id")
+            parameters.append({"name": "@user_id", "value": user_id})
+        
+        if status:
+            query_parts.append("AND c.status=@status")
+            parameters.append({"name": "@status", "value": status})
+        
+        query_parts.append("ORDER BY c.created_at DESC")
+        query = " ".join(query_parts)
+        
+        # Cross-partition query (no partition_key specified)
+        query_iter = self._container.query_items(
+            query=query,
+            parameters=parameters,
+            max_item_count=limit
+        )
+        
+        items = []
+        next_token = None
+        try:
+            pages = query_iter.by_page(continuation_token)
+            async for page in pages:
+                async for item in page:
+                    try:
+                        # Parse datetime strings
+                        if "created_at" in item and isinstance(item["created_at"], str):
+                            item["created_at"] = datetime.fromisoformat(item["created_at"])
+                        if "ended_at" in item and item["ended_at"] and isinstance(item["ended_at"], str):
+                            item["ended_at"] = datetime.fromisoformat(item["ended_at"])
+                        
+                        search_result = SessionSearchResult(
+                            session_id=item["session_id"],
+                            created_at=item["created_at"],
+                            ended_at=item.get("ended_at"),
+                            duration_seconds=item.get("duration_seconds"),
+                            status=item.get("status", "unknown"),
+                            client_name=item.get("client_name"),
+                            advisor_name=item.get("advisor_name"),
+                            exchange_count=item.get("exchange_count", 0),
+                            investment_readiness_score=item.get("investment_readiness_score"),
+                            key_topics=item.get("key_topics", [])
+                        )
+                        items.append(search_result)
+                    except Exception as e:
+                        logger.warning(f"Failed to parse session: {e}")
+                        continue
+                next_token = pages.continuation_token
+                # Cross-partition pages can come back empty while more results remain
+                if items or not next_token:
+                    break
+        except Exception as e:
+            if _is_bad_continuation_token(e, continuation_token):
+                raise InvalidContinuationToken("Invalid or expired continuation token") from e
+            raise
+        
+        logger.info(
+            f"Retrieved {len(items)} sessions",
+            user_id=user_id if user_id else "all",
+            status=status if status else "all",
+            has_more=bool(next_token)
+        )
+        return items, next_token
+    
     async def get_all_sessions(
         self,
         user_id: Optional[str] = None,
@@ -267,63 +400,10 @@ class CosmosMemoryStore:
     ) -> List[SessionSearchResult]:
         """
         Retrieve all sessions, optionally filtered by user and status.
-        Returns lightweight SessionSearchResult objects.
+        Returns lightweight SessionSearchResult objects (first page only).
         """
-        await self.ensure_initialized()
-        
         try:
-            query_parts = ["SELECT * FROM c WHERE c.data_type='advisor_session'"]
-            parameters = []
-            
-            if user_id:
-                query_parts.append("AND c.user_id=@user_id")
-                parameters.append({"name": "@user_id", "value": user_id})
-            
-            if status:
-                query_parts.append("AND c.status=@status")
-                parameters.append({"name": "@status", "value": status})
-            
-            query_parts.append(f"ORDER BY c.created_at DESC OFFSET 0 LIMIT {limit}")
-            query = " ".join(query_parts)
-            
-            items = []
-            # Cross-partition query (no partition_key specified)
-            query_iter = self._container.query_items(
-                query=query,
-                parameters=parameters
-            )
-            
-            async for item in query_iter:
-                try:
-                    # Parse datetime strings
-                    if "created_at" in item and isinstance(item["created_at"], str):
-                        item["created_at"] = datetime.fromisoformat(item["created_at"])
-                    if "ended_at" in item and item["ended_at"] and isinstance(item["ended_at"], str):
-                        item["ended_at"] = datetime.fromisoformat(item["ended_at"])
-                    
-                    # Create lightweight search result
-                    search_result = SessionSearchResult(
-                        session_id=item["session_id"],
-                        created_at=item["created_at"],
-                        ended_at=item.get("ended_at"),
-                        duration_seconds=item.get("duration_seconds"),
-                        status=item.get("status", "unknown"),
-                        client_name=item.get("client_name"),
-                        advisor_name=item.get("advisor_name"),
-                        exchange_count=item.get("exchange_count", 0),
-                        investment_readiness_score=item.get("investment_readiness_score"),
-                        key_topics=item.get("key_topics", [])
-                    )
-                    items.append(search_result)
-                except Exception as e:
-                    logger.warning(f"Failed to parse session: {e}")
-                    continue
-            
-            logger.info(
-                f"Retrieved {len(items)} sessions",
-                user_id=user_id if user_id else "all",
-                status=status if status else "all"
-            )
+            items, _ = await self.get_sessions_page(user_id=user_id, limit=limit, status=status)
             return items
             
         except Exception as e:
@@ -390,3 +470,33 @@ class CosmosMemoryStore:
                 session_id=session_id
             )
             raise
+
+
+def create_memory_store(settings) -> CosmosMemoryStore:
+    """
+    Build the memory store selected by MEMORY_STORE_BACKEND.
+    
+    Args:
+        settings: Application settings
+        
+    Returns:
+        CosmosMemoryStore, or SqliteMemoryStore for the "sqlite" backend
+    """
+    if settings.memory_store_backend.strip().lower() == "sqlite":
+        from .sqlite_memory import SqliteMemoryStore
+        return SqliteMemoryStore(
+            path=settings.sqlite_memory_path,
+            user_id="default_advisor",
+            record_path=settings.memory_store_record_path
+        )
+    
+    return CosmosMemoryStore(
+        endpoint=settings.COSMOSDB_ENDPOINT,
+        database_name=settings.COSMOSDB_DATABASE,
+        container_name=settings.COSMOSDB_CONTAINER,
+        user_id="default_advisor",
+        tenant_id=settings.azure_tenant_id,
+        client_id=settings.azure_client_id,
+        client_secret=settings.azure_client_secret,
+        record_path=settings.memory_store_record_path
+    )
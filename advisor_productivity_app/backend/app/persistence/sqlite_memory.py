@@ -0,0 +1,71 @@
+"""
+SQLite Memory Store for Advisor Productivity Application
+
+Runs the Cosmos memory store against a local SQLite (WAL) database, so the
+application and the persistence benchmark work without a Cosmos account.
+Every store method is inherited unchanged; only the container underneath is
+replaced, which keeps queries, partitioning (session_id) and paging identical.
+
+Selected with MEMORY_STORE_BACKEND=sqlite (default: cosmos).
+"""
+
+from pathlib import Path
+from typing import Optional
+
+import structlog
+
+from .cosmos_memory import CosmosMemoryStore
+from .sqlite_container import RecordingContainer, SqliteContainer
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_SQLITE_PATH = str(Path(__file__).resolve().parents[2] / "data" / "memory_store.db")
+
+# Secondary indexes matching the session list filters and sort order
+SQLITE_INDEXES = (
+    ("data_type", "user_id", "created_at"),
+    ("data_type", "status", "created_at"),
+    ("data_type", "created_at"),
+)
+
+
+class SqliteMemoryStore(CosmosMemoryStore):
+    """CosmosMemoryStore backed by a local SQLite database."""
+    
+    def __init__(
+        self,
+        path: str = DEFAULT_SQLITE_PATH,
+        user_id: Optional[str] = "default_advisor",
+        record_path: Optional[str] = None
+    ):
+        """
+        Initialize SQLite memory store.
+        
+        Args:
+            path: SQLite database file (":memory:" for an in-memory database)
+            user_id: Optional default user ID for operations
+            record_path: Optional JSONL file recording every container operation
+        """
+        super().__init__(endpoint="", database_name="", container_name="", user_id=user_id)
+        self.path = path
+        self.record_path = record_path
+        self._sqlite: Optional[SqliteContainer] = None
+    
+    async def initialize(self) -> None:
+        """Open the database and create the table and indexes."""
+        if self._initialized.is_set():
+            return
+        
+        self._sqlite = await SqliteContainer(self.path, partition_key_path="/session_id", indexes=SQLITE_INDEXES).open()
+        self._container = RecordingContainer(self._sqlite, self.record_path) if self.record_path else self._sqlite
+        
+        logger.info("SQLite memory store initialized", path=self.path, recording=bool(self.record_path))
+        self._initialized.set()
+    
+    async def close(self) -> None:
+        """Close the database."""
+        if isinstance(self._container, RecordingContainer):
+            self._container.close()
+        if self._sqlite:
+            await self._sqlite.close()
+            logger.info("SQLite memory store closed")
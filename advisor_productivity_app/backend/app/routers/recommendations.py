@@ -18,6 +18,7 @@ from ..models.task_models import (
     RecommendationType
 )
 from ..infra.settings import get_settings
+from ..infra.llm_gateway import llm_request_context
 
 logger = structlog.get_logger(__name__)
 router = APIRouter(prefix="/recommendations", tags=["recommendations"])
@@ -163,13 +164,14 @@ async def recommendation_websocket(websocket: WebSocket, session_id: str):
                 
                 # Generate recommendations
                 try:
-                    result = await recommendation_agent.generate_recommendations(
-                        conversation_context=conversation_context,
-                        sentiment_data=sentiment_data,
-                        session_id=session_id,
-                        client_profile=client_profile,
-                        context=data
-                    )
+                    with llm_request_context(session_id):
+                        result = await recommendation_agent.generate_recommendations(
+                            conversation_context=conversation_context,
+                            sentiment_data=sentiment_data,
+                            session_id=session_id,
+                            client_profile=client_profile,
+                            context=data
+                        )
                     
                     # Send result to client
                     await recommendation_ws_manager.send_recommendations(
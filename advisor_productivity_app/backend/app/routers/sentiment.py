@@ -19,6 +19,7 @@ from ..models.task_models import (
     Session
 )
 from ..infra.settings import get_settings
+from ..infra.llm_gateway import llm_request_context
 
 logger = structlog.get_logger(__name__)
 router = APIRouter(prefix="/sentiment", tags=["sentiment"])
@@ -166,12 +167,13 @@ async def sentiment_websocket(websocket: WebSocket, session_id: str):
                 
                 # Perform sentiment analysis
                 try:
-                    result = await sentiment_agent.analyze_investment_sentiment(
-                        content=text,
-                        session_id=session_id,
-                        speaker=speaker,
-                        context=context
-                    )
+                    with llm_request_context(session_id):
+                        result = await sentiment_agent.analyze_investment_sentiment(
+                            content=text,
+                            session_id=session_id,
+                            speaker=speaker,
+                            context=context
+                        )
                     
                     # Send result to client
                     await sentiment_ws_manager.send_sentiment_update(
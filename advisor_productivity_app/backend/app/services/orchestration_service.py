@@ -27,6 +27,8 @@ from ..agents.summarization_agent import InvestmentSummarizationAgent
 from ..agents.entity_pii_agent import EntityPIIAgent
 from ..agents.planner_agent import PlannerAgent
 from ..infra.settings import Settings
+from ..infra.llm_gateway import Priority, llm_request_context
+from .single_flight import get_analysis_flight, get_summary_flight, transcript_version
 
 logger = structlog.get_logger(__name__)
 
@@ -312,11 +314,12 @@ Provide comprehensive analysis including sentiment, entities, and any compliance
                     # Execute all agents concurrently using asyncio.gather()
                     logger.info("Executing agents in parallel with asyncio.gather")
                     
-                    results = await asyncio.gather(
-                        sentiment_agent.run(messages=task),
-                        recommendations_agent.run(messages=task),
-                        return_exceptions=True
-                    )
+                    with llm_request_context(session_id):
+                        results = await asyncio.gather(
+                            sentiment_agent.run(messages=task),
+                            recommendations_agent.run(messages=task),
+                            return_exceptions=True
+                        )
                     
                     # Build concurrent_result in expected format
                     concurrent_result = {
@@ -456,10 +459,16 @@ Provide comprehensive analysis including sentiment, entities, and any compliance
             
             session["agents_status"]["recommendations"] = "processing"
             
-            recommendations = await self.recommendation_agent.run({
-                "text": full_transcript,
-                "sentiment_data": session["data"]["sentiment"]
-            })
+            # Concurrent requests for the same transcript share one agent run
+            version = transcript_version(session["data"]["transcript"], session["data"]["sentiment"])
+            with llm_request_context(session_id):
+                recommendations = await get_analysis_flight().do(
+                    (session_id, version, "recommendations"),
+                    lambda: self.recommendation_agent.run({
+                        "text": full_transcript,
+                        "sentiment_data": session["data"]["sentiment"]
+                    })
+                )
             
             session["data"]["recommendations"] = recommendations.get("recommendations", [])
             session["agents_status"]["recommendations"] = "completed"
@@ -477,7 +486,8 @@ Provide comprehensive analysis including sentiment, entities, and any compliance
     async def generate_summary(
         self,
         session_id: str,
-        personas: Optional[List[str]] = None
+        personas: Optional[List[str]] = None,
+        priority: Priority = Priority.INTERACTIVE
     ) -> Dict[str, Any]:
         """
         Generate session summary.
@@ -485,6 +495,7 @@ Provide comprehensive analysis including sentiment, entities, and any compliance
         Args:
             session_id: Session identifier
             personas: List of personas for summary
+            priority: Scheduling class of the summary's LLM calls
         
         Returns:
             Summaries
@@ -494,20 +505,31 @@ Provide comprehensive analysis including sentiment, entities, and any compliance
                 raise ValueError(f"Session {session_id} not found")
             
             session = self.sessions[session_id]
-            full_transcript = " ".join([t["text"] for t in session["data"]["transcript"]])
+            # Snapshot the transcript so chunks arriving meanwhile don't change the key
+            transcript_segments = list(session["data"]["transcript"])
+            sentiment_data = session["data"]["sentiment"]
             
             session["agents_status"]["summary"] = "processing"
             
             personas = personas or ["advisor", "compliance", "client"]
-            summaries = []
+            version = transcript_version(transcript_segments, sentiment_data)
+            summary_flight = get_summary_flight()
+            
+            def summarize(persona: str):
+                return summary_flight.do(
+                    (session_id, version, persona, "detailed"),
+                    lambda: self.summarization_agent.generate_session_summary(
+                        transcript_segments=transcript_segments,
+                        sentiment_data=sentiment_data,
+                        session_id=session_id,
+                        summary_type="detailed",
+                        persona=persona
+                    )
+                )
             
-            for persona in personas:
-                summary = await self.summarization_agent.run({
-                    "text": full_transcript,
-                    "persona": persona,
-                    "summary_type": "detailed"
-                })
-                summaries.append(summary)
+            # Personas share one transcript extraction inside the agent
+            with llm_request_context(session_id, priority):
+                summaries = list(await asyncio.gather(*(summarize(persona) for persona in personas)))
             
             session["data"]["summary"] = summaries
             session["agents_status"]["summary"] = "completed"
@@ -547,7 +569,8 @@ Provide comprehensive analysis including sentiment, entities, and any compliance
             
             # Generate summary if requested
             if auto_summary and not session["data"]["summary"]:
-                await self.generate_summary(session_id)
+                # The closing summary queues behind live sessions' transcript analysis
+                await self.generate_summary(session_id, priority=Priority.BACKGROUND)
             
             logger.info("Session ended", session_id=session_id)
             
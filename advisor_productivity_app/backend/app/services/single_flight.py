@@ -0,0 +1,112 @@
+"""
+Single-Flight Request De-duplication
+
+Concurrent identical requests - a double-clicked button, two open tabs, the
+websocket and REST routes firing together - share one in-flight computation
+and its result instead of each calling the LLM. Keys identify the work
+(session, transcript version, persona, summary type); entries are dropped as
+soon as the computation finishes, so this is de-duplication, not caching.
+"""
+
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def transcript_version(
+    transcript_segments: List[Dict[str, Any]],
+    sentiment_data: Optional[Dict[str, Any]] = None,
+    recommendations: Optional[Any] = None
+) -> str:
+    """Stable hash of the inputs a summary or analysis is computed from."""
+    material = json.dumps(
+        {
+            "segments": [
+                [seg.get("speaker", "Unknown"), seg.get("text", ""), seg.get("timestamp", "")]
+                for seg in transcript_segments
+            ],
+            "sentiment": sentiment_data,
+            "recommendations": recommendations,
+        },
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class SingleFlight:
+    """Keyed single-flight group for async computations."""
+
+    def __init__(self, name: str):
+        """Initialize an empty group."""
+        self.name = name
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.started = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``fn`` for ``key`` unless an identical call is already in flight.
+
+        Every concurrent caller receives the same result (or exception). A
+        caller that is cancelled stops waiting without cancelling the shared
+        computation for the others.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.create_task(fn())
+            self._calls[key] = task
+            self.started += 1
+            task.add_done_callback(lambda finished, k=key: self._forget(k, finished))
+        else:
+            self.shared += 1
+            logger.info("Joining in-flight request", group=self.name, key=str(key)[:120])
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception retrieved even if every caller went away
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self) -> int:
+        """Number of computations currently running."""
+        return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for diagnostics."""
+        return {
+            "in_flight": self.in_flight(),
+            "started": self.started,
+            "shared": self.shared,
+        }
+
+
+# Process-wide groups, shared by the summary routes and the orchestration service
+_summary_flight: Optional[SingleFlight] = None
+_analysis_flight: Optional[SingleFlight] = None
+
+
+def get_summary_flight() -> SingleFlight:
+    """Get the single-flight group for summary generation."""
+    global _summary_flight
+    if _summary_flight is None:
+        _summary_flight = SingleFlight("summary")
+    return _summary_flight
+
+
+def get_analysis_flight() -> SingleFlight:
+    """Get the single-flight group for analysis (recommendations, etc.)."""
+    global _analysis_flight
+    if _analysis_flight is None:
+        _analysis_flight = SingleFlight("analysis")
+    return _analysis_flight
@@ -0,0 +1,277 @@
+"""
+LLM Gateway Benchmark
+
+Simulates a multi-user burst against a local fake Azure OpenAI deployment that
+enforces requests- and tokens-per-minute quotas the way Azure does (sliding
+windows, 429 with ``retry-after-ms``), and compares the OpenAI SDK on its own
+with the same client routed through the selected app's LLM gateway.
+
+The workload mixes one user fanning out many concurrent calls (a research run
+or plan execution), several users making a few sequential interactive calls,
+and a batch of background calls. It runs three modes: the SDK's own retries,
+the gateway with no quotas configured (reacting to 429s only, the default),
+and the gateway configured with the deployment's quotas. For each it reports
+429s served, failed calls, per-class latency percentiles and throughput.
+
+Usage (from the repository root):
+    python benchmarks/bench_llm_gateway.py --app finagent_app
+    python benchmarks/bench_llm_gateway.py --app multimodal_insights_app --rpm 300 --tpm 60000 \\
+        --heavy-calls 80 --light-users 6 --background-calls 30
+
+Requires the selected app's backend requirements (openai, httpx). No network
+access is needed: requests never leave the process.
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import random
+import sys
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import httpx
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+APPS = {
+    "advisor_productivity_app": "advisor_productivity_app/backend",
+    "finagent_app": "finagent_app/backend",
+    "finagent_dynamic_app": "finagent_dynamic_app/backend",
+    "multimodal_insights_app": "multimodal_insights_app/backend",
+}
+
+DEPLOYMENT = "bench-deployment"
+
+
+def load_gateway_module(app: str):
+    """Import the selected app's ``app.infra.llm_gateway``."""
+    sys.path.insert(0, str(REPO_ROOT / APPS[app]))
+    return importlib.import_module("app.infra.llm_gateway")
+
+
+class FakeAzureDeployment(httpx.AsyncBaseTransport):
+    """
+    In-process chat completions endpoint with Azure-style quota enforcement.
+
+    Each request is charged its prompt estimate plus ``max_tokens`` against
+    the TPM quota. Quotas are enforced over a sliding window of
+    ``window_seconds`` (quota * window / 60 per window); over-quota requests
+    get a 429 with the time until enough of the window frees up.
+    """
+
+    def __init__(self, rpm: int, tpm: int, window_seconds: float, latency: float, seconds_per_token: float):
+        self.window = window_seconds
+        self.request_limit = rpm * window_seconds / 60
+        self.token_limit = tpm * window_seconds / 60
+        self.latency = latency
+        self.seconds_per_token = seconds_per_token
+        self._admitted: Deque[Tuple[float, int]] = deque()
+        self.served = 0
+        self.throttled = 0
+
+    def _retry_after(self, now: float, tokens: int) -> Optional[float]:
+        while self._admitted and self._admitted[0][0] <= now - self.window:
+            self._admitted.popleft()
+        used = sum(charged for _, charged in self._admitted)
+        if len(self._admitted) + 1 <= self.request_limit and used + tokens <= self.token_limit:
+            return None
+        # Wait until enough of the oldest admissions leave the window
+        count, freed = len(self._admitted), used
+        for admitted_at, charged in self._admitted:
+            count -= 1
+            freed -= charged
+            if count + 1 <= self.request_limit and freed + tokens <= self.token_limit:
+                return admitted_at + self.window - now
+        return self.window
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        prompt = sum(len(m.get("content") or "") for m in body.get("messages", [])) // 4
+        completion = body.get("max_tokens") or 1000
+        now = time.monotonic()
+        retry_after = self._retry_after(now, prompt + completion)
+        if retry_after is not None:
+            self.throttled += 1
+            return httpx.Response(
+                429,
+                headers={"retry-after-ms": str(int(retry_after * 1000) + 1)},
+                json={"error": {"code": "429", "message": "Rate limit is exceeded."}},
+                request=request
+            )
+        self._admitted.append((now, prompt + completion))
+        output = completion // 2
+        await asyncio.sleep(self.latency + output * self.seconds_per_token)
+        self.served += 1
+        return httpx.Response(
+            200,
+            json={
+                "id": f"chatcmpl-{self.served}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body.get("model", DEPLOYMENT),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "ok " * output},
+                    "finish_reason": "stop",
+                }],
+                "usage": {"prompt_tokens": prompt, "completion_tokens": output, "total_tokens": prompt + output},
+            },
+            request=request
+        )
+
+
+def build_workload(args) -> List[Dict[str, Any]]:
+    """Calls as (user, class, sequence): concurrent fan-out, sequential light users, background batch."""
+    rng = random.Random(args.seed)
+    calls = []
+    for n in range(args.heavy_calls):
+        calls.append({"user": "heavy", "cls": "fan-out", "group": "heavy", "offset": 0.0})
+    for u in range(args.light_users):
+        for n in range(args.light_calls):
+            # Light users arrive just after the fan-out and call one after another
+            calls.append({"user": f"light-{u}", "cls": "interactive", "group": f"light-{u}", "offset": 0.5 + u * 0.2})
+    for n in range(args.background_calls):
+        calls.append({"user": "batch", "cls": "background", "group": "batch", "offset": 0.0})
+    for call in calls:
+        call["prompt"] = "x" * (4 * rng.randint(args.prompt_tokens // 2, args.prompt_tokens * 3 // 2))
+    return calls
+
+
+MODES = ("sdk retries", "gateway, no quotas", "gateway, quotas")
+
+
+async def run_mode(gateway_module, args, mode: str) -> Dict[str, Any]:
+    """Run the workload once, returning latencies per class and server counters."""
+    from openai import AsyncAzureOpenAI
+
+    server = FakeAzureDeployment(args.rpm, args.tpm, args.window, args.latency, args.seconds_per_token)
+    client = AsyncAzureOpenAI(
+        api_key="bench",
+        api_version="2024-06-01",
+        azure_endpoint="https://bench.openai.azure.com",
+        http_client=httpx.AsyncClient(transport=server),
+    )
+    gateway = None
+    if mode != "sdk retries":
+        configured = mode == "gateway, quotas"
+        gateway = gateway_module.LLMGateway(
+            requests_per_minute=args.rpm if configured else 0,
+            tokens_per_minute=args.tpm if configured else 0,
+            max_concurrent_requests=args.max_concurrent,
+            max_retries=args.max_retries,
+        )
+        client = gateway_module.gate_openai_client(client, gateway)
+
+    calls = build_workload(args)
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    failures: Dict[str, int] = defaultdict(int)
+    completed_tokens = 0
+
+    async def one_call(call: Dict[str, Any]) -> None:
+        nonlocal completed_tokens
+        priority = gateway_module.Priority.BACKGROUND if call["cls"] == "background" else gateway_module.Priority.INTERACTIVE
+        started = time.monotonic()
+        try:
+            with gateway_module.llm_request_context(call["user"], priority):
+                response = await client.chat.completions.create(
+                    model=DEPLOYMENT,
+                    messages=[{"role": "user", "content": call["prompt"]}],
+                    max_tokens=args.max_tokens,
+                )
+            completed_tokens += response.usage.total_tokens
+            latencies[call["cls"]].append(time.monotonic() - started)
+        except Exception:
+            failures[call["cls"]] += 1
+
+    async def run_group(group: List[Dict[str, Any]]) -> None:
+        await asyncio.sleep(group[0]["offset"])
+        if group[0]["cls"] == "interactive":
+            for call in group:
+                await one_call(call)
+        else:
+            await asyncio.gather(*(one_call(call) for call in group))
+
+    groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for call in calls:
+        groups[call["group"]].append(call)
+
+    started = time.monotonic()
+    await asyncio.gather(*(run_group(group) for group in groups.values()))
+    elapsed = time.monotonic() - started
+
+    return {
+        "mode": mode,
+        "elapsed": elapsed,
+        "server_429": server.throttled,
+        "served": server.served,
+        "latencies": latencies,
+        "failures": failures,
+        "tokens_per_second": completed_tokens / elapsed if elapsed else 0.0,
+        "gateway": gateway.stats() if gateway else None,
+    }
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def print_report(result: Dict[str, Any]) -> None:
+    print(f"\n== {result['mode']} ==")
+    print(
+        f"elapsed {result['elapsed']:.1f}s  served {result['served']}  "
+        f"server 429s {result['server_429']}  throughput {result['tokens_per_second']:.0f} tok/s"
+    )
+    print(f"{'class':<12} {'ok':>5} {'failed':>7} {'p50 s':>8} {'p95 s':>8} {'max s':>8}")
+    for cls in ("interactive", "fan-out", "background"):
+        values = result["latencies"].get(cls, [])
+        print(
+            f"{cls:<12} {len(values):>5} {result['failures'].get(cls, 0):>7} "
+            f"{percentile(values, 0.5):>8.2f} {percentile(values, 0.95):>8.2f} "
+            f"{max(values) if values else float('nan'):>8.2f}"
+        )
+    if result["gateway"]:
+        stats = result["gateway"]
+        print(
+            f"gateway: retries {stats['retries']:.0f}  throttled {stats['throttled']:.0f}  "
+            f"max queue wait {stats['max_queue_wait_seconds']:.2f}s"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the LLM gateway against a quota-enforcing fake deployment")
+    parser.add_argument("--app", choices=sorted(APPS), default="finagent_app")
+    parser.add_argument("--rpm", type=int, default=600, help="Deployment requests-per-minute quota")
+    parser.add_argument("--tpm", type=int, default=120000, help="Deployment tokens-per-minute quota")
+    parser.add_argument("--window", type=float, default=10.0, help="Quota evaluation window in seconds")
+    parser.add_argument("--latency", type=float, default=0.2, help="Base response latency in seconds")
+    parser.add_argument("--seconds-per-token", type=float, default=0.001, help="Generation time per output token")
+    parser.add_argument("--heavy-calls", type=int, default=60, help="Concurrent calls from the fan-out user")
+    parser.add_argument("--light-users", type=int, default=4)
+    parser.add_argument("--light-calls", type=int, default=4, help="Sequential calls per light user")
+    parser.add_argument("--background-calls", type=int, default=20)
+    parser.add_argument("--prompt-tokens", type=int, default=200, help="Mean prompt size")
+    parser.add_argument("--max-tokens", type=int, default=500)
+    parser.add_argument("--max-concurrent", type=int, default=0, help="Gateway in-flight cap (0 = none)")
+    parser.add_argument("--max-retries", type=int, default=4, help="Gateway retries per call")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    gateway_module = load_gateway_module(args.app)
+    print(
+        f"Deployment quota: {args.rpm} RPM, {args.tpm} TPM over {args.window:.0f}s windows; "
+        f"{args.heavy_calls} fan-out, {args.light_users}x{args.light_calls} interactive, "
+        f"{args.background_calls} background calls"
+    )
+    for mode in MODES:
+        print_report(asyncio.run(run_mode(gateway_module, args, mode)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""
+Memory Store Persistence Benchmark
+
+Replays a container-level workload against one app's memory store backend and
+reports per-operation latency percentiles and overall throughput. The same
+harness serves every app: each backend ships an identical SqliteContainer and
+its own secondary indexes, which are loaded from the selected app.
+
+Workloads are JSON lines as written by RecordingContainer (set
+MEMORY_STORE_RECORD_PATH while exercising an app against Cosmos or SQLite), or
+a synthetic session/run-shaped workload generated with --synthesize.
+
+Usage (from the repository root):
+    python benchmarks/bench_memory_store.py --app deep_research_app --synthesize 200
+    python benchmarks/bench_memory_store.py --app finagent_app --workload data/memory_workload.jsonl
+    python benchmarks/bench_memory_store.py --app patterns --workload wl.jsonl --backend cosmos \\
+        --cosmos-endpoint https://<account>.documents.azure.com:443/ --cosmos-database bench --cosmos-container items
+
+Requires the selected app's backend requirements. The cosmos backend writes to
+the given container; point it at a scratch container, never production data.
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+APPS = {
+    "advisor_productivity_app": ("advisor_productivity_app/backend", "app.persistence"),
+    "deep_research_app": ("deep_research_app/backend", "app.persistence"),
+    "finagent_app": ("finagent_app/backend", "app.persistence"),
+    "finagent_dynamic_app": ("finagent_dynamic_app/backend", "app.persistence"),
+    "multimodal_insights_app": ("multimodal_insights_app/backend", "app.persistence"),
+    "patterns": ("patterns/backend", "persistence"),
+}
+
+
+def load_app_persistence(app: str):
+    """Import the selected app's SqliteContainer and index definitions."""
+    backend_dir, package = APPS[app]
+    sys.path.insert(0, str(REPO_ROOT / backend_dir))
+    container_module = importlib.import_module(f"{package}.sqlite_container")
+    memory_module = importlib.import_module(f"{package}.sqlite_memory")
+    return container_module.SqliteContainer, memory_module.SQLITE_INDEXES
+
+
+def read_workload(path: Path) -> List[Dict[str, Any]]:
+    """Load recorded operations, skipping blank lines."""
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def synthesize_workload(sessions: int, runs_per_session: int, seed: int) -> Iterator[Dict[str, Any]]:
+    """
+    Generate a session/run-shaped workload: session creation, run creation,
+    progress patches, point reads, per-session listings and paged history
+    pages across users, interleaved the way the research apps issue them.
+    """
+    rng = random.Random(seed)
+    users = [f"user-{n}" for n in range(max(1, sessions // 20))]
+    started = datetime(2025, 1, 1)
+    run_ids: List[Tuple[str, str]] = []
+
+    for n in range(sessions):
+        session_id = str(uuid.UUID(int=rng.getrandbits(128)))
+        user_id = rng.choice(users)
+        created_at = (started + timedelta(minutes=n)).isoformat()
+        yield {"op": "create_item", "body": {
+            "id": session_id, "session_id": session_id, "user_id": user_id,
+            "data_type": "session", "created_at": created_at, "title": f"Session {n}",
+        }}
+
+        for r in range(runs_per_session):
+            doc_id = str(uuid.UUID(int=rng.getrandbits(128)))
+            run_id = f"run-{n}-{r}"
+            run_ids.append((doc_id, session_id))
+            yield {"op": "create_item", "body": {
+                "id": doc_id, "session_id": session_id, "user_id": user_id, "run_id": run_id,
+                "data_type": "research_run", "status": "running", "progress": 0,
+                "started_at": (started + timedelta(minutes=n, seconds=r)).isoformat(),
+                "topic": f"topic {rng.randint(0, 50)}", "report": "x" * rng.randint(2_000, 20_000),
+                "sources": [{"url": f"https://example.com/{k}"} for k in range(rng.randint(5, 30))],
+            }}
+            for progress in (25, 50, 75, 100):
+                yield {"op": "patch_item", "item": doc_id, "partition_key": session_id, "patch_operations": [
+                    {"op": "set", "path": "/progress", "value": progress},
+                    {"op": "set", "path": "/status", "value": "completed" if progress == 100 else "running"},
+                ]}
+            yield {"op": "read_item", "item": doc_id, "partition_key": session_id}
+
+        yield {
+            "op": "query_items",
+            "query": "SELECT * FROM c WHERE c.session_id=@session_id AND c.data_type='research_run' "
+                     "ORDER BY c.started_at DESC",
+            "parameters": [{"name": "@session_id", "value": session_id}],
+            "partition_key": session_id,
+            "max_item_count": None,
+        }
+        yield {
+            "op": "query_items",
+            "query": "SELECT c.session_id, c.title, c.created_at FROM c WHERE c.data_type='session' "
+                     "AND c.user_id=@user_id ORDER BY c.created_at DESC",
+            "parameters": [{"name": "@user_id", "value": rng.choice(users)}],
+            "partition_key": None,
+            "max_item_count": 20,
+        }
+
+        if run_ids and rng.random() < 0.3:
+            doc_id, session_id = rng.choice(run_ids)
+            yield {"op": "read_item", "item": doc_id, "partition_key": session_id}
+
+
+async def replay_op(container: Any, op: Dict[str, Any]):
+    """Issue one recorded operation against ``container``."""
+    kind = op["op"]
+    if kind == "create_item":
+        await container.create_item(body=op["body"])
+    elif kind == "upsert_item":
+        await container.upsert_item(body=op["body"])
+    elif kind == "replace_item":
+        await container.replace_item(item=op["item"], body=op["body"])
+    elif kind == "read_item":
+        await container.read_item(item=op["item"], partition_key=op["partition_key"])
+    elif kind == "delete_item":
+        await container.delete_item(item=op["item"], partition_key=op["partition_key"])
+    elif kind == "patch_item":
+        await container.patch_item(
+            item=op["item"], partition_key=op["partition_key"], patch_operations=op["patch_operations"]
+        )
+    elif kind == "query_items":
+        kwargs = {}
+        if op.get("partition_key") is not None:
+            kwargs["partition_key"] = op["partition_key"]
+        if op.get("max_item_count"):
+            # Paged listings: the apps read a single page per request
+            kwargs["max_item_count"] = op["max_item_count"]
+            pages = container.query_items(query=op["query"], parameters=op.get("parameters") or [], **kwargs).by_page()
+            async for page in pages:
+                [item async for item in page]
+                break
+        else:
+            [item async for item in container.query_items(query=op["query"], parameters=op.get("parameters") or [], **kwargs)]
+    else:
+        raise ValueError(f"Unknown operation: {kind}")
+
+
+async def replay(container: Any, ops: List[Dict[str, Any]]) -> Tuple[Dict[str, List[float]], Dict[str, int], float]:
+    """Replay operations in order, timing each one."""
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    started = time.perf_counter()
+    for op in ops:
+        op_started = time.perf_counter()
+        try:
+            await replay_op(container, op)
+        except Exception:
+            # Recorded workloads include expected misses (not found, already exists)
+            errors[op["op"]] += 1
+        latencies[op["op"]].append(time.perf_counter() - op_started)
+    return latencies, errors, time.perf_counter() - started
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+def print_report(latencies: Dict[str, List[float]], errors: Dict[str, int], elapsed: float, label: str):
+    """Print the per-operation latency table and overall throughput."""
+    total = sum(len(values) for values in latencies.values())
+    print(f"\n{label}: {total} operations in {elapsed:.2f}s ({total / elapsed:,.0f} ops/s)\n")
+    print(f"{'operation':<14} {'count':>7} {'errors':>7} {'mean ms':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    print("-" * 67)
+    for kind in sorted(latencies):
+        values = latencies[kind]
+        print(
+            f"{kind:<14} {len(values):>7} {errors.get(kind, 0):>7} "
+            f"{statistics.fmean(values) * 1000:>9.3f} {percentile(values, 50) * 1000:>8.3f} "
+            f"{percentile(values, 95) * 1000:>8.3f} {percentile(values, 99) * 1000:>8.3f}"
+        )
+
+
+async def open_cosmos_container(args):
+    """Open the scratch Cosmos container named on the command line."""
+    from azure.cosmos.aio import CosmosClient
+    from azure.cosmos.partition_key import PartitionKey
+    from azure.identity.aio import DefaultAzureCredential
+
+    client = CosmosClient(args.cosmos_endpoint, credential=DefaultAzureCredential())
+    database = client.get_database_client(args.cosmos_database)
+    container = await database.create_container_if_not_exists(
+        id=args.cosmos_container,
+        partition_key=PartitionKey(path="/session_id")
+    )
+    return client, container
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--app", choices=sorted(APPS), default="deep_research_app",
+                        help="App whose SQLite container and indexes are used")
+    parser.add_argument("--workload", type=Path, help="Recorded JSONL workload to replay")
+    parser.add_argument("--synthesize", type=int, default=200, metavar="SESSIONS",
+                        help="Sessions in the synthetic workload (used when --workload is not given)")
+    parser.add_argument("--runs-per-session", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--save-workload", type=Path, help="Write the synthetic workload to this file")
+    parser.add_argument("--backend", choices=["sqlite", "cosmos"], default="sqlite")
+    parser.add_argument("--db", help="SQLite database file (default: fresh temporary file)")
+    parser.add_argument("--no-indexes", action="store_true", help="Replay without secondary indexes")
+    parser.add_argument("--cosmos-endpoint")
+    parser.add_argument("--cosmos-database")
+    parser.add_argument("--cosmos-container")
+    args = parser.parse_args()
+
+    if args.workload:
+        ops = read_workload(args.workload)
+        source = str(args.workload)
+    else:
+        ops = list(synthesize_workload(args.synthesize, args.runs_per_session, args.seed))
+        source = f"synthetic ({args.synthesize} sessions x {args.runs_per_session} runs)"
+        if args.save_workload:
+            args.save_workload.write_text("".join(json.dumps(op) + "\n" for op in ops), encoding="utf-8")
+
+    print(f"Workload: {source}, {len(ops)} operations")
+
+    if args.backend == "cosmos":
+        if not (args.cosmos_endpoint and args.cosmos_database and args.cosmos_container):
+            parser.error("--backend cosmos requires --cosmos-endpoint, --cosmos-database and --cosmos-container")
+        client, container = await open_cosmos_container(args)
+        try:
+            latencies, errors, elapsed = await replay(container, ops)
+        finally:
+            await client.close()
+        print_report(latencies, errors, elapsed, f"cosmos ({args.cosmos_database}/{args.cosmos_container})")
+        return
+
+    SqliteContainer, indexes = load_app_persistence(args.app)
+    if args.no_indexes:
+        indexes = ()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.db or str(Path(tmp) / "bench.db")
+        container = await SqliteContainer(path, partition_key_path="/session_id", indexes=indexes).open()
+        try:
+            latencies, errors, elapsed = await replay(container, ops)
+        finally:
+            await container.close()
+        print_report(latencies, errors, elapsed, f"sqlite ({args.app}, {len(indexes)} secondary indexes)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -9,12 +9,17 @@ Implements Phase 2 capabilities:
 """
 
 import asyncio
+import contextvars
+import functools
+import re
+import threading
 import structlog
-from typing import List, Dict, Any, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 from dataclasses import dataclass
 from enum import Enum
 
 from .services.tavily_search_service import ensure_source_dict
+from .services.context_budget import ContextBudget
 
 logger = structlog.get_logger(__name__)
 
@@ -165,6 +170,143 @@ def filter_sources_by_tier(sources: List[Any], min_tier: SourceTier = SourceTier
     return filtered_sources, assessments
 
 
+# Exhaustive-mode review fan-out: items run concurrently, bounded and individually timed out
+MAX_CONCURRENT_REVIEWS = 4
+REVIEW_TIMEOUT_SECONDS = 120
+CLAIM_TIMEOUT_SECONDS = 90
+
+# Input tokens one multi-perspective analysis may send, split evenly across the reviewers
+PERSPECTIVE_TOKEN_BUDGET = 60_000
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class _FanOutSlot:
+    """
+    One of a fan-out's concurrency slots, held until its item has finished
+    and every worker thread the item started has returned.
+    """
+    
+    def __init__(self, semaphore: asyncio.Semaphore):
+        self.semaphore = semaphore
+        self.threads = 0
+        self.item_done = False
+    
+    def thread_started(self) -> None:
+        self.threads += 1
+    
+    def thread_finished(self) -> None:
+        self.threads -= 1
+        self._release_when_idle()
+    
+    def item_finished(self) -> None:
+        self.item_done = True
+        self._release_when_idle()
+    
+    def _release_when_idle(self) -> None:
+        if self.item_done and self.threads == 0:
+            self.semaphore.release()
+
+
+_current_slot: contextvars.ContextVar[Optional[_FanOutSlot]] = contextvars.ContextVar(
+    "fan_out_slot", default=None
+)
+
+
+async def to_thread(fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+    """
+    ``asyncio.to_thread`` that keeps the calling fan-out item's slot taken
+    until the thread returns.
+    
+    Cancelling the await (e.g. on an item's timeout) cannot stop a running
+    thread, so without this a timed-out item would free its slot while its
+    blocking call carried on, and threads would pile up past the limit.
+    """
+    slot = _current_slot.get()
+    if slot is None:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    
+    loop = asyncio.get_running_loop()
+    lock = threading.Lock()
+    state = {"started": False, "abandoned": False}
+    
+    def call() -> R:
+        with lock:
+            if state["abandoned"]:
+                return None
+            state["started"] = True
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            loop.call_soon_threadsafe(slot.thread_finished)
+    
+    slot.thread_started()
+    try:
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(None, functools.partial(context.run, call))
+    except asyncio.CancelledError:
+        # A call still queued in the executor will never run; give its share back now
+        with lock:
+            if not state["started"]:
+                state["abandoned"] = True
+                slot.thread_finished()
+        raise
+
+
+async def bounded_fan_out(
+    items: List[T],
+    worker: Callable[[T], Awaitable[R]],
+    label: str,
+    max_concurrency: int = MAX_CONCURRENT_REVIEWS,
+    timeout: float = REVIEW_TIMEOUT_SECONDS
+) -> List[Optional[R]]:
+    """
+    Run ``worker`` over ``items`` concurrently.
+    
+    At most ``max_concurrency`` items run at once and each is cancelled after
+    ``timeout`` seconds. A failed or timed-out item yields None in its slot
+    instead of failing the whole stage, so callers keep partial results.
+    Blocking calls a worker makes through ``to_thread`` hold the item's slot
+    until they return, even after the item has timed out.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def run(index: int, item: T) -> Optional[R]:
+        await semaphore.acquire()
+        slot = _FanOutSlot(semaphore)
+        _current_slot.set(slot)
+        try:
+            return await asyncio.wait_for(worker(item), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"{label} timed out", item=index, timeout_seconds=timeout)
+        except Exception as e:
+            logger.warning(f"{label} failed", item=index, error=str(e))
+        finally:
+            slot.item_finished()
+        return None
+    
+    return await asyncio.gather(*(run(index, item) for index, item in enumerate(items)))
+
+
+def fit_to_context(
+    text: str,
+    model: str,
+    *prompt_parts: str,
+    name: str = "report",
+    max_tokens: Optional[int] = None
+) -> str:
+    """
+    Fit ``text`` into what is left of the model's context window (or of
+    ``max_tokens``, if smaller) after the surrounding prompt parts, leaving
+    room for the response.
+    """
+    budget = ContextBudget(model)
+    limit = budget.budget_tokens if max_tokens is None else min(max_tokens, budget.budget_tokens)
+    available = limit - sum(budget.count(part) for part in prompt_parts)
+    return budget.fit(text, available, name=name)
+
+
 # ============================================================
 # Gap Analysis for Multi-pass Refinement
 # ============================================================
@@ -208,7 +350,7 @@ Research Topic: {topic}
 Iteration: {iteration}/5
 
 Current Findings:
-{previous_findings[:3000]}  # Truncate for context window
+{{findings}}
 
 Source Quality Distribution:
 - Tier 1 (Peer-reviewed): {tier_counts['tier_1']}
@@ -233,8 +375,13 @@ RECOMMENDED_QUERIES:
 SOURCE_QUALITY_NEEDS:
 - [Specify what types of sources we need: "more peer-reviewed", "official documentation", etc.]
 """
+    # Give the findings whatever context the rest of the prompt leaves
+    gap_analysis_prompt = gap_analysis_prompt.replace(
+        "{findings}",
+        fit_to_context(previous_findings, model, gap_analysis_prompt, name="findings")
+    )
     
-    response = await asyncio.to_thread(
+    response = await to_thread(
         azure_client.chat.completions.create,
         model=model,
         messages=[
@@ -381,7 +528,8 @@ CRITICAL ENHANCEMENTS: [Provide specific recommendations]
 async def multi_perspective_analysis(
     report: str,
     azure_client: Any,
-    model: str
+    model: str,
+    token_budget: int = PERSPECTIVE_TOKEN_BUDGET
 ) -> Dict[str, str]:
     """
     Analyze research report from multiple expert perspectives.
@@ -390,21 +538,26 @@ async def multi_perspective_analysis(
         report: Research report to analyze
         azure_client: Azure OpenAI client
         model: Model deployment name
+        token_budget: Prompt tokens for the whole analysis; each perspective gets an equal share
         
     Returns:
         Dict with reviews from each perspective
     """
     logger.info("🎭 Starting multi-perspective analysis")
     
-    perspectives = {}
+    roles = list(PerspectiveRole)
+    share = token_budget // len(roles)
     
-    for role in PerspectiveRole:
+    async def review(role: PerspectiveRole) -> str:
         logger.info(f"  Analyzing from {role.value} perspective")
         
         prompt_config = PERSPECTIVE_PROMPTS[role]
-        task_prompt = prompt_config["task"].format(report=report[:4000])  # Truncate for context
+        report_text = fit_to_context(
+            report, model, prompt_config["system"], prompt_config["task"], max_tokens=share
+        )
+        task_prompt = prompt_config["task"].format(report=report_text)
         
-        response = await asyncio.to_thread(
+        response = await to_thread(
             azure_client.chat.completions.create,
             model=model,
             messages=[
@@ -414,10 +567,23 @@ async def multi_perspective_analysis(
             temperature=0.4
         )
         
-        perspectives[role.value] = response.choices[0].message.content
         logger.info(f"  ✓ {role.value} review completed")
+        return response.choices[0].message.content
     
-    logger.info("✅ Multi-perspective analysis completed")
+    reviews = await bounded_fan_out(roles, review, label="Perspective review")
+    
+    # Keep the perspectives that finished; a slow or failed reviewer only loses its own review
+    perspectives = {
+        role.value: content
+        for role, content in zip(roles, reviews)
+        if content is not None
+    }
+    
+    logger.info(
+        "✅ Multi-perspective analysis completed",
+        completed=len(perspectives),
+        failed=len(roles) - len(perspectives)
+    )
     return perspectives
 
 
@@ -448,10 +614,12 @@ async def fact_check_claims(
     logger.info("✓ Starting fact-checking layer")
     
     # Step 1: Extract key claims
+    # Claim extraction instructions and reply are short; the output reserve covers them
+    report_text = fit_to_context(report, model)
     extraction_prompt = f"""Extract the top 5-7 most important factual claims from this research report.
 
 Report:
-{report[:3000]}
+{report_text}
 
 For each claim, provide:
 1. The specific claim (be precise and concise)
@@ -466,7 +634,7 @@ CITED: [Yes/Partially/No]
 CLAIM 2: ...
 """
     
-    claims_response = await asyncio.to_thread(
+    claims_response = await to_thread(
         azure_client.chat.completions.create,
         model=model,
         messages=[
@@ -479,24 +647,124 @@ CLAIM 2: ...
     extracted_claims = claims_response.choices[0].message.content
     logger.info("  Claims extracted for verification")
     
-    # Step 2: Verify claims (simplified - in production would do actual verification searches)
+    # Step 2: Verify each claim independently and concurrently
     academic_sources = [s for s in sources if 'edu' in ensure_source_dict(s).get('url', '').lower()]
-    verification_prompt = f"""Review these extracted claims against the original sources and assess verification status.
+    source_quality = f"{len(academic_sources)} academic, {len(sources) - len(academic_sources)} other"
+    claims = parse_claims(extracted_claims)
+    
+    if not claims:
+        # Unparseable extraction output: assess the claims block as a whole
+        claims = [{"claim": extracted_claims, "importance": "", "cited": ""}]
+    
+    async def verify(claim: Dict[str, str]) -> Dict[str, Any]:
+        return await verify_claim(
+            claim=claim,
+            source_count=len(sources),
+            source_quality=source_quality,
+            azure_client=azure_client,
+            model=model,
+            tavily_search_service=tavily_search_service
+        )
+    
+    verifications = await bounded_fan_out(
+        claims, verify, label="Claim verification", timeout=CLAIM_TIMEOUT_SECONDS
+    )
+    
+    claim_results = []
+    for index, (claim, verification) in enumerate(zip(claims, verifications), 1):
+        if verification is None:
+            verification = {
+                **claim,
+                "verification": "VERIFICATION_STATUS: Unverified\nRECOMMENDATION: Flag for review (verification did not complete)",
+                "external_sources": 0,
+                "completed": False
+            }
+        claim_results.append({"index": index, **verification})
+    
+    verification_results = "\n\n".join(
+        f"CLAIM {result['index']}: {result['claim']}\n{result['verification']}"
+        for result in claim_results
+    )
+    failed = len([result for result in claim_results if not result["completed"]])
+    
+    logger.info("✅ Fact-checking completed", claims=len(claim_results), failed=failed)
+    
+    return {
+        "extracted_claims": extracted_claims,
+        "verification_results": verification_results,
+        "claims": claim_results,
+        "claims_failed": failed,
+        "sources_analyzed": len(sources)
+    }
+
+
+def parse_claims(extracted_claims: str) -> List[Dict[str, str]]:
+    """Split the extraction reply (CLAIM n / IMPORTANCE / CITED blocks) into claims."""
+    claims = []
+    for block in re.split(r"(?im)^\s*\**CLAIM\s*\d+\**\s*:", extracted_claims)[1:]:
+        lines = [line.strip() for line in block.strip().splitlines() if line.strip()]
+        if not lines:
+            continue
+        fields = {"claim": lines[0].strip("* "), "importance": "", "cited": ""}
+        for line in lines[1:]:
+            key, _, value = line.lstrip("*- ").partition(":")
+            key = key.strip("* ").lower()
+            if key in ("importance", "cited"):
+                fields[key] = value.strip()
+        claims.append(fields)
+    return claims
+
+
+async def verify_claim(
+    claim: Dict[str, str],
+    source_count: int,
+    source_quality: str,
+    azure_client: Any,
+    model: str,
+    tavily_search_service: Any = None
+) -> Dict[str, Any]:
+    """
+    Verify one claim, using a fresh web search as independent evidence when
+    a search service is available.
+    """
+    evidence = ""
+    external_sources = 0
+    if tavily_search_service is not None and getattr(tavily_search_service, "api_key", None):
+        try:
+            search = await tavily_search_service.search(
+                claim["claim"],
+                max_results=3,
+                search_depth="basic",
+                include_images=False
+            )
+            found = search.get("sources", [])
+            external_sources = len(found)
+            if found:
+                evidence = tavily_search_service.format_context_for_llm(found, max_tokens=6000, model=model)
+        except Exception as e:
+            # Verification still runs against the report's own sources
+            logger.warning("Claim evidence search failed", error=str(e))
+    
+    verification_prompt = f"""Assess the verification status of this claim from a research report.
 
-Claims:
-{extracted_claims}
+CLAIM: {claim['claim']}
+IMPORTANCE: {claim.get('importance') or 'Not stated'}
+CITED IN REPORT: {claim.get('cited') or 'Unknown'}
 
-Original Source Count: {len(sources)}
-Source Quality: {len(academic_sources)} academic, {len(sources) - len(academic_sources)} other
+Original Source Count: {source_count}
+Source Quality: {source_quality}
 
-For each claim, provide:
+Independent Evidence:
+{evidence or 'No independent search results available.'}
+
+Provide:
 VERIFICATION_STATUS: [Verified/Partially Verified/Unverified]
 CONFIDENCE_SCORE: [0-100]
 EVIDENCE_QUALITY: [Strong/Moderate/Weak]
 RECOMMENDATION: [Accept/Flag for review/Requires additional sources]
 """
     
-    verification_response = await asyncio.to_thread(
+    response = await to_thread(
         azure_client.chat.completions.create,
         model=model,
         messages=[
@@ -506,12 +774,9 @@ RECOMMENDATION: [Accept/Flag for review/Requires additional sources]
         temperature=0.2
     )
     
-    verification_results = verification_response.choices[0].message.content
-    
-    logger.info("✅ Fact-checking completed")
-    
     return {
-        "extracted_claims": extracted_claims,
-        "verification_results": verification_results,
-        "sources_analyzed": len(sources)
+        **claim,
+        "verification": response.choices[0].message.content,
+        "external_sources": external_sources,
+        "completed": True
     }
@@ -5,6 +5,7 @@ from .registry import AgentRegistry  # noqa: F401
 from .observability import ObservabilityService  # noqa: F401
 from .mcp_client import MCPClient  # noqa: F401
 from .orchestrator import MagenticOrchestrator, ExecutionContext  # noqa: F401
+from .workflow_cache import WorkflowCache  # noqa: F401
 from .workflows.engine import WorkflowEngine, WorkflowStatus, TaskStatus  # noqa: F401
 
 __all__ = [
@@ -14,6 +15,7 @@ __all__ = [
     "MCPClient",
     "MagenticOrchestrator",
     "ExecutionContext",
+    "WorkflowCache",
     "WorkflowEngine",
     "WorkflowStatus",
     "TaskStatus",
@@ -13,8 +13,6 @@ import structlog
 from agent_framework import (
     ChatMessage,
     Role,
-    SequentialBuilder,
-    ConcurrentBuilder,
     WorkflowOutputEvent,
     TextContent,
     AgentRunResponse,
@@ -22,6 +20,7 @@ from agent_framework import (
 from .registry import AgentRegistry
 from .observability import ObservabilityService
 from .settings import Settings
+from .workflow_cache import WorkflowCache
 
 logger = structlog.get_logger(__name__)
 
@@ -52,6 +51,8 @@ class MagenticOrchestrator:
         self._settings = settings or Settings()
         self._registry = agent_registry or AgentRegistry(self._settings)
         self._observability = observability or ObservabilityService(self._settings)
+        self._workflows = WorkflowCache()
+        self._registry.attach_workflow_cache(self._workflows)
         logger.info("Magentic orchestrator initialised")
 
     # ------------------------------------------------------------------
@@ -122,20 +123,15 @@ class MagenticOrchestrator:
         if tools:
             logger.debug("Tools parameter acknowledged", tools=list(tools))
 
-        builder = SequentialBuilder()
-        if agent_instances:
-            builder = builder.participants(agent_instances)
-        workflow = builder.build()
         messages = self._normalise_messages(task)
-
-        workflow_events = await workflow.run(messages)
         results: List[Dict[str, Any]] = []
         final_conversation: Optional[List[ChatMessage]] = None
 
-        for event in workflow_events:
-            if isinstance(event, WorkflowOutputEvent):
-                if event.source_executor_id == "end" and event.data:
-                    final_conversation = list(event.data)
+        async with self._workflows.lease("sequential", agent_instances) as workflow:
+            async for event in workflow.run_stream(messages):
+                if isinstance(event, WorkflowOutputEvent):
+                    if event.source_executor_id == "end" and event.data:
+                        final_conversation = list(event.data)
 
         if final_conversation:
             mapping = {display: agent for display, agent in zip(agent_display_names, agents)}
@@ -193,18 +189,16 @@ class MagenticOrchestrator:
         if tools:
             logger.debug("Tools parameter acknowledged", tools=list(tools))
 
-        builder = ConcurrentBuilder().participants(agent_instances)
-        workflow = builder.build()
         messages = self._normalise_messages(task)
-        events = await workflow.run(messages)
 
         aggregated: Dict[str, str] = {}
-        for event in events:
-            if isinstance(event, WorkflowOutputEvent) and event.data:
-                text_blocks = []
-                for msg in event.data:
-                    text_blocks.append(getattr(msg, "text", ""))
-                aggregated[event.source_executor_id] = "\n".join(filter(None, text_blocks))
+        async with self._workflows.lease("concurrent", agent_instances) as workflow:
+            async for event in workflow.run_stream(messages):
+                if isinstance(event, WorkflowOutputEvent) and event.data:
+                    text_blocks = []
+                    for msg in event.data:
+                        text_blocks.append(getattr(msg, "text", ""))
+                    aggregated[event.source_executor_id] = "\n".join(filter(None, text_blocks))
 
         results = [
             {
@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
 import structlog
 
 from .settings import Settings
 
+if TYPE_CHECKING:
+    from .workflow_cache import WorkflowCache
+
 logger = structlog.get_logger(__name__)
 
 
@@ -29,6 +32,7 @@ class AgentRegistry:
     def __init__(self, settings: Optional[Settings] = None) -> None:
         self._settings = settings
         self._records: Dict[str, AgentRecord] = {}
+        self._workflow_caches: List["WorkflowCache"] = []
         self._lock = asyncio.Lock()
         logger.info("Agent registry initialised")
 
@@ -40,8 +44,15 @@ class AgentRegistry:
         """Cleanup hook – currently just clears in-memory state."""
         async with self._lock:
             self._records.clear()
+            for cache in self._workflow_caches:
+                cache.clear()
         logger.info("Agent registry shutdown complete")
 
+    def attach_workflow_cache(self, cache: "WorkflowCache") -> None:
+        """Have ``cache`` drop the workflows of agents removed from this registry."""
+        if cache not in self._workflow_caches:
+            self._workflow_caches.append(cache)
+
     async def register_agent(self, name: str, agent: Any, *, tags: Iterable[str] | None = None, description: str | None = None) -> None:
         """Register a new agent by name.
 
@@ -59,7 +70,11 @@ class AgentRegistry:
 
     async def unregister_agent(self, name: str) -> None:
         async with self._lock:
-            self._records.pop(name, None)
+            record = self._records.pop(name, None)
+            if record is not None:
+                # Built workflows hold the agent's executors; never lease them out again
+                for cache in self._workflow_caches:
+                    cache.invalidate(record.agent)
             logger.info("Unregistered agent", agent=name)
 
     async def get_agent(self, name: str) -> Any:
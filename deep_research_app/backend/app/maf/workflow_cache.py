@@ -0,0 +1,130 @@
+"""Reusable Sequential/Concurrent workflows keyed by mode and participants.
+
+Building a workflow validates the graph and wires executors for every
+participant; for collaborative steps that run the same few agent combinations
+over and over, that work can be done once and the built workflow leased out
+per run instead.
+
+A workflow runs one execution at a time, and each ``AgentExecutor`` keeps the
+agent thread and conversation of its run, so a leased workflow is exclusive
+to its caller and is never leased again: once it is returned, a replacement
+with new executors (and so new agent threads) is built for the pool on the
+next loop iteration, off the caller's path. Without that, the conversation of
+one run would be replayed into the next one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Sequence, Tuple
+
+import structlog
+
+from agent_framework import (
+    AgentExecutor,
+    ConcurrentBuilder,
+    SequentialBuilder,
+    Workflow,
+)
+
+logger = structlog.get_logger(__name__)
+
+WorkflowKey = Tuple[str, Tuple[int, ...]]
+
+_BUILDERS = {
+    "sequential": SequentialBuilder,
+    "concurrent": ConcurrentBuilder,
+}
+
+
+class WorkflowCache:
+    """Pool of built workflows, leased out one run at a time."""
+
+    def __init__(self, max_keys: int = 64, max_idle_per_key: int = 4) -> None:
+        """
+        Args:
+            max_keys: Participant combinations kept; the least recently used is dropped
+            max_idle_per_key: Idle workflows kept per combination (concurrent runs build extras)
+        """
+        self.max_keys = max_keys
+        self.max_idle_per_key = max_idle_per_key
+        self._idle: "OrderedDict[WorkflowKey, List[Workflow]]" = OrderedDict()
+        # Bumped by invalidate/clear so replacements scheduled before it are dropped
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(mode: str, agents: Sequence[object]) -> WorkflowKey:
+        # Agent identity, not name: re-registering an agent must not reuse its old executors
+        return mode, tuple(id(agent) for agent in agents)
+
+    @staticmethod
+    def _build(mode: str, agents: Sequence[object]) -> Workflow:
+        # Explicit executors: each gets a new agent thread from the public constructor
+        executors = [AgentExecutor(agent) for agent in agents]
+        return _BUILDERS[mode]().participants(executors).build()
+
+    @asynccontextmanager
+    async def lease(self, mode: str, agents: Sequence[object]) -> AsyncIterator[Workflow]:
+        """Borrow a built workflow for ``agents``, building one if none is idle."""
+        if mode not in _BUILDERS:
+            raise ValueError(f"Unsupported workflow mode '{mode}'")
+
+        key = self._key(mode, agents)
+        idle = self._idle.get(key)
+        if idle:
+            workflow = idle.pop()
+            self._idle.move_to_end(key)
+            self.hits += 1
+        else:
+            workflow = self._build(mode, agents)
+            self.misses += 1
+            logger.debug("Built workflow", mode=mode, participants=len(agents))
+
+        try:
+            yield workflow
+        finally:
+            # The used workflow is dropped; the next caller gets a fresh one
+            asyncio.get_running_loop().call_soon(
+                self._replenish, key, mode, list(agents), self._generation
+            )
+
+    def _replenish(self, key: WorkflowKey, mode: str, agents: List[object], generation: int) -> None:
+        if generation != self._generation:
+            return
+        idle = self._idle.get(key, [])
+        if len(idle) >= self.max_idle_per_key:
+            return
+        try:
+            workflow = self._build(mode, agents)
+        except Exception as e:
+            logger.warning("Could not build replacement workflow", mode=mode, error=str(e))
+            return
+
+        idle = self._idle.setdefault(key, idle)
+        self._idle.move_to_end(key)
+        idle.append(workflow)
+        while len(self._idle) > self.max_keys:
+            self._idle.popitem(last=False)
+
+    def invalidate(self, agent: object) -> None:
+        """Drop cached workflows that include ``agent``."""
+        self._generation += 1
+        agent_id = id(agent)
+        for key in [key for key in self._idle if agent_id in key[1]]:
+            del self._idle[key]
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._idle.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "keys": len(self._idle),
+            "idle": sum(len(idle) for idle in self._idle.values()),
+        }
@@ -68,6 +68,7 @@ from .services.tavily_search_service import (
     ensure_sources_dict,
 )
 from .services.export_service import ExportService, get_export_service
+from .services.export_workers import shutdown_export_pool
 from .services.file_handler import FileHandler
 from .services.document_intelligence_service import DocumentIntelligenceService
 from .services.document_research_service import DocumentResearchService
@@ -80,6 +81,7 @@ from .config.research_config import (
 
 # Import validation service
 from .services.research_validation import get_validator, ValidationResult
+from .services.deployment_catalog import get_deployment_catalog
 
 # Import MAF workflow module
 from . import maf_workflow
@@ -675,22 +677,13 @@ async def execute_research_programmatically(
         # PHASE 4: Model Selection by Depth
         # ============================================================
         # Get optimal model configuration for this depth
-        from .services.azure_openai_deployment_service import get_deployment_service
-        from .services.model_config_service import ModelConfigService
-        
         model_config = None
         try:
-            subscription_id = os.getenv("AZURE_SUBSCRIPTION_ID")
-            resource_group = os.getenv("AZURE_AI_FOUNDRY_RESOURCE_GROUP")
-            endpoint = os.getenv("AZURE_OPENAI_ENDPOINT", "")
-            account_name = endpoint.split("//")[1].split(".")[0] if "//" in endpoint else ""
-            
-            if all([subscription_id, resource_group, account_name]):
-                async with get_deployment_service(subscription_id, resource_group, account_name) as service:
-                    summary = await service.get_deployments_summary()
-                    chat_models = summary.get("chat_models", [])
-                
-                config_service = ModelConfigService(available_deployments=chat_models)
+            catalog = get_deployment_catalog()
+            
+            if catalog.configured:
+                # Served from the cached catalog; ARM is only contacted in the background
+                config_service = await catalog.get_config_service()
                 model_config = config_service.get_model_config_for_depth(depth)
                 
                 logger.info(
@@ -1593,53 +1586,56 @@ Provide an improved version that maintains accuracy while addressing validation
         # ============================================================
         # EXHAUSTIVE MODE: Multi-Perspective Analysis & Fact-Checking
         # ============================================================
-        if depth == "exhaustive" and depth_config.get("enable_multi_perspective"):
-            logger.info("🎭 EXHAUSTIVE MODE: Multi-perspective analysis")
-            
-            # Update progress
-            if execution_id in active_executions:
-                active_executions[execution_id]["current_task"] = "Multi-Perspective Analysis"
-                active_executions[execution_id]["progress"] = 92.0
-            
-            # Get the final report for analysis
-            final_report = results.get("final_report", results.get("draft_report", ""))
-            
-            if final_report:
-                # Run multi-perspective analysis
-                perspectives = await multi_perspective_analysis(
+        # Both stages review the same final report, so they run side by side
+        run_perspectives = depth == "exhaustive" and depth_config.get("enable_multi_perspective")
+        run_fact_check = depth == "exhaustive" and depth_config.get("enable_fact_checking")
+        final_report = results.get("final_report", results.get("draft_report", ""))
+        
+        if final_report and (run_perspectives or run_fact_check):
+            review_model = os.getenv("AZURE_OPENAI_CHAT_DEPLOYMENT_NAME", "chat4o")
+            stages = {}
+            
+            if run_perspectives:
+                logger.info("🎭 EXHAUSTIVE MODE: Multi-perspective analysis")
+                stages["multi_perspective_analysis"] = multi_perspective_analysis(
                     report=final_report,
                     azure_client=azure_client,
-                    model=os.getenv("AZURE_OPENAI_CHAT_DEPLOYMENT_NAME", "chat4o")
+                    model=review_model
                 )
-                
-                results["multi_perspective_analysis"] = perspectives
-                logger.info("✅ Multi-perspective analysis completed", 
-                           perspectives=list(perspectives.keys()))
-        
-        if depth == "exhaustive" and depth_config.get("enable_fact_checking"):
-            logger.info("✓ EXHAUSTIVE MODE: Fact-checking layer")
-            
-            # Update progress
-            if execution_id in active_executions:
-                active_executions[execution_id]["current_task"] = "Fact-Checking"
-                active_executions[execution_id]["progress"] = 95.0
             
-            # Get the final report for fact-checking
-            final_report = results.get("final_report", results.get("draft_report", ""))
-            
-            if final_report:
-                # Run fact-checking
-                fact_check_results = await fact_check_claims(
+            if run_fact_check:
+                logger.info("✓ EXHAUSTIVE MODE: Fact-checking layer")
+                stages["fact_check"] = fact_check_claims(
                     report=final_report,
                     sources=unique_sources,
                     azure_client=azure_client,
-                    model=os.getenv("AZURE_OPENAI_CHAT_DEPLOYMENT_NAME", "chat4o"),
+                    model=review_model,
                     tavily_search_service=tavily_service
                 )
-                
-                results["fact_check"] = fact_check_results
+            
+            # Update progress
+            if execution_id in active_executions:
+                active_executions[execution_id]["current_task"] = (
+                    "Multi-Perspective Analysis & Fact-Checking" if len(stages) > 1
+                    else "Multi-Perspective Analysis" if run_perspectives else "Fact-Checking"
+                )
+                active_executions[execution_id]["progress"] = 92.0
+            
+            stage_results = await asyncio.gather(*stages.values(), return_exceptions=True)
+            
+            for name, outcome in zip(stages.keys(), stage_results):
+                if isinstance(outcome, Exception):
+                    logger.error(f"❌ Exhaustive stage {name} failed", error=str(outcome))
+                    continue
+                results[name] = outcome
+            
+            if "multi_perspective_analysis" in results:
+                logger.info("✅ Multi-perspective analysis completed", 
+                           perspectives=list(results["multi_perspective_analysis"].keys()))
+            if "fact_check" in results:
                 logger.info("✅ Fact-checking completed",
-                           claims_analyzed=fact_check_results["sources_analyzed"])
+                           claims_analyzed=len(results["fact_check"]["claims"]),
+                           claims_failed=results["fact_check"]["claims_failed"])
         
         # Source Quality Assessment (for all modes)
         logger.info("📊 Assessing source quality")
@@ -1741,7 +1737,10 @@ async def lifespan(app: FastAPI):
             azure_tenant_id=os.getenv("AZURE_TENANT_ID"),
             azure_client_id=os.getenv("AZURE_CLIENT_ID"),
             azure_client_secret=os.getenv("AZURE_CLIENT_SECRET"),
-            azure_blob_storage_name=os.getenv("AZURE_BLOB_STORAGE_NAME")
+            azure_blob_storage_name=os.getenv("AZURE_BLOB_STORAGE_NAME"),
+            cache_directory=os.getenv("EXTRACTION_CACHE_DIRECTORY", str(backend_dir / "data" / "extraction_cache")),
+            max_concurrent_analyses=int(os.getenv("DOC_INTELLIGENCE_MAX_CONCURRENT", "4")),
+            pages_per_range=int(os.getenv("DOC_INTELLIGENCE_PAGES_PER_RANGE", "50"))
         )
         logger.info("Document Intelligence service initialized")
         
@@ -1780,14 +1779,21 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Failed to initialize Cosmos DB: {e}. Session persistence will not be available.")
     
+    # Warm the deployment catalog used for model selection (non-blocking)
+    get_deployment_catalog().start()
+    
     logger.info("Deep Research Backend API started successfully")
     
     yield
     
     # Shutdown
     logger.info("Shutting down Deep Research Backend API")
+    await get_deployment_catalog().stop()
     if file_handler:
         await file_handler.shutdown()
+    if doc_intelligence:
+        await doc_intelligence.close()
+    shutdown_export_pool()
 
 
 # Create FastAPI app
@@ -1808,6 +1814,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Continuation-Token"],
 )
 
 # Register routers
@@ -1892,7 +1899,8 @@ async def health_check():
     return {
         "status": "healthy",
         "timestamp": datetime.utcnow().isoformat(),
-        "workflow_engine": "ready" if workflow_engine else "initializing"
+        "workflow_engine": "ready" if workflow_engine else "initializing",
+        "deployment_catalog": get_deployment_catalog().status()
     }
 
 
@@ -2576,27 +2584,19 @@ async def get_deployments():
     Returns chat and embedding model deployments with metadata.
     """
     try:
-        from .services.azure_openai_deployment_service import get_deployment_service
+        catalog = get_deployment_catalog()
         
-        # Get configuration from environment
-        subscription_id = os.getenv("AZURE_SUBSCRIPTION_ID")
-        resource_group = os.getenv("AZURE_AI_FOUNDRY_RESOURCE_GROUP")
-        
-        # Extract account name from endpoint
-        endpoint = os.getenv("AZURE_OPENAI_ENDPOINT", "")
-        account_name = endpoint.split("//")[1].split(".")[0] if "//" in endpoint else ""
-        
-        if not all([subscription_id, resource_group, account_name]):
+        if not catalog.configured:
             logger.error("Missing Azure configuration for deployment service")
             raise HTTPException(
                 status_code=500,
                 detail="Azure OpenAI configuration incomplete. Check AZURE_SUBSCRIPTION_ID, AZURE_AI_FOUNDRY_RESOURCE_GROUP, and AZURE_OPENAI_ENDPOINT"
             )
         
-        async with get_deployment_service(subscription_id, resource_group, account_name) as service:
-            summary = await service.get_deployments_summary()
-            return summary
+        return await catalog.get_summary()
             
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching deployments: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to fetch deployments: {str(e)}")
@@ -2609,26 +2609,15 @@ async def get_model_configs():
     Shows recommended models, temperature, max_tokens for each depth.
     """
     try:
-        from .services.azure_openai_deployment_service import get_deployment_service
-        from .services.model_config_service import ModelConfigService
-        
-        # Get configuration from environment
-        subscription_id = os.getenv("AZURE_SUBSCRIPTION_ID")
-        resource_group = os.getenv("AZURE_AI_FOUNDRY_RESOURCE_GROUP")
-        endpoint = os.getenv("AZURE_OPENAI_ENDPOINT", "")
-        account_name = endpoint.split("//")[1].split(".")[0] if "//" in endpoint else ""
+        catalog = get_deployment_catalog()
         
-        if not all([subscription_id, resource_group, account_name]):
+        if not catalog.configured:
             logger.error("Missing Azure configuration")
             raise HTTPException(status_code=500, detail="Azure configuration incomplete")
         
-        # Fetch available deployments
-        async with get_deployment_service(subscription_id, resource_group, account_name) as service:
-            summary = await service.get_deployments_summary()
-            chat_models = summary.get("chat_models", [])
-        
-        # Create model config service with available deployments
-        config_service = ModelConfigService(available_deployments=chat_models)
+        # Cached deployments and the model config service built from them
+        chat_models = await catalog.get_chat_models()
+        config_service = await catalog.get_config_service()
         
         # Get configurations for all depth levels
         all_configs = config_service.get_all_depth_configs()
@@ -2638,6 +2627,8 @@ async def get_model_configs():
             "available_chat_models": chat_models
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching model configs: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to fetch model configs: {str(e)}")
@@ -2655,22 +2646,8 @@ async def get_models_for_depth(depth: str):
         raise HTTPException(status_code=400, detail=f"Invalid depth: {depth}")
     
     try:
-        from .services.azure_openai_deployment_service import get_deployment_service
-        from .services.model_config_service import ModelConfigService
-        
-        # Get configuration from environment
-        subscription_id = os.getenv("AZURE_SUBSCRIPTION_ID")
-        resource_group = os.getenv("AZURE_AI_FOUNDRY_RESOURCE_GROUP")
-        endpoint = os.getenv("AZURE_OPENAI_ENDPOINT", "")
-        account_name = endpoint.split("//")[1].split(".")[0] if "//" in endpoint else ""
-        
-        # Fetch available deployments
-        async with get_deployment_service(subscription_id, resource_group, account_name) as service:
-            summary = await service.get_deployments_summary()
-            chat_models = summary.get("chat_models", [])
-        
-        # Create model config service
-        config_service = ModelConfigService(available_deployments=chat_models)
+        # Model config service over the cached deployment catalog
+        config_service = await get_deployment_catalog().get_config_service()
         
         # Get recommended models for this depth
         recommended_models = config_service.get_available_models_for_depth(depth)
@@ -3201,7 +3178,7 @@ async def save_execution_to_cosmos(execution_id: str, status: str, results: Dict
         if "completed_tasks" in exec_info:
             update_data["completed_tasks"] = sanitize_for_json(exec_info["completed_tasks"])
         
-        await cosmos.update_run(run_id, update_data)
+        await cosmos.update_run(run_id, update_data, session_id=session_id)
         logger.info(f"✅ Saved execution to Cosmos DB successfully", run_id=run_id, status=update_data["status"])
         
     except Exception as e:
@@ -3263,7 +3240,10 @@ async def monitor_execution(execution_id: str):
                             if completed_tasks:
                                 progress_update["completed_tasks"] = completed_tasks
                         
-                        await cosmos.update_run(run_id, progress_update)
+                        # Only write when something changed; each write is a small patch
+                        if progress_update != exec_info.get("last_progress_update"):
+                            await cosmos.update_run(run_id, progress_update, session_id=exec_info.get("session_id"))
+                            exec_info["last_progress_update"] = progress_update
                 except Exception as e:
                     logger.debug(f"Failed to update progress in Cosmos DB: {e}")
                 
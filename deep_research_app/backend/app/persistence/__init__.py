@@ -3,5 +3,6 @@ Persistence Package for Deep Research Application
 """
 
 from .cosmos_memory import CosmosMemoryStore, get_cosmos_store
+from .sqlite_memory import SqliteMemoryStore, get_sqlite_store
 
-__all__ = ["CosmosMemoryStore", "get_cosmos_store"]
+__all__ = ["CosmosMemoryStore", "get_cosmos_store", "SqliteMemoryStore", "get_sqlite_store"]
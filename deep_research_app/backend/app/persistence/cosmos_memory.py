@@ -7,10 +7,14 @@ Supports Azure AD authentication via service principal or managed identity.
 
 import asyncio
 import logging
+import os
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from azure.core import MatchConditions
 from azure.cosmos.aio import CosmosClient
+from azure.cosmos.exceptions import CosmosAccessConditionFailedError, CosmosHttpResponseError
 from azure.cosmos.partition_key import PartitionKey
 from azure.identity.aio import (
     DefaultAzureCredential,
@@ -19,9 +23,62 @@ from azure.identity.aio import (
 import structlog
 
 from ..models.persistence_models import ResearchSession, ResearchRun
+from .sqlite_container import RecordingContainer
 
 logger = structlog.get_logger(__name__)
 
+# Fields projected by the run summary queries; the report body and citations are
+# reduced to a has_report flag so history pages stay small regardless of run size
+RUN_SUMMARY_PROJECTION = ", ".join([
+    "c.run_id",
+    "c.session_id",
+    "c.topic",
+    "c.depth",
+    "c.execution_mode",
+    "c.status",
+    "c.started_at",
+    "c.completed_at",
+    "c.execution_time",
+    "c.progress",
+    "c.sources_analyzed",
+    "c.summary",
+    "(IS_STRING(c.research_report) AND LENGTH(c.research_report) > 0) AS has_report",
+])
+
+# Cosmos DB accepts at most 10 operations per patch request
+MAX_PATCH_OPERATIONS = 10
+
+# run_id -> (document id, session_id) locations kept for point writes
+RUN_LOCATION_CACHE_SIZE = 1024
+
+# Attempts at a conditional full replace before a concurrent writer wins
+MAX_REPLACE_ATTEMPTS = 5
+
+
+def _to_document_value(value: Any) -> Any:
+    """Serialize a field value the way create_run stores it."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {key: _to_document_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_document_value(item) for item in value]
+    return value
+
+
+class InvalidContinuationToken(ValueError):
+    """A paging cursor that is malformed, expired or belongs to another query."""
+
+
+def _is_bad_continuation_token(error: Exception, continuation_token: Optional[str]) -> bool:
+    """Whether a paged query failed because of the continuation token it resumed from."""
+    if not continuation_token:
+        return False
+    if isinstance(error, CosmosHttpResponseError):
+        return error.status_code == 400
+    # The SDK (and the SQLite container) decode the token client-side
+    return isinstance(error, (ValueError, TypeError, KeyError))
+
 
 class CosmosMemoryStore:
     """
@@ -61,6 +118,8 @@ class CosmosMemoryStore:
         self.client_id = client_id
         self.client_secret = client_secret
         
+        self._run_locations: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+        
         self._client: Optional[CosmosClient] = None
         self._database = None
         self._container = None
@@ -98,6 +157,11 @@ class CosmosMemoryStore:
                 offer_throughput=400
             )
             
+            # Record the live workload for replay by the persistence benchmark
+            record_path = os.getenv("MEMORY_STORE_RECORD_PATH")
+            if record_path:
+                self._container = RecordingContainer(self._container, record_path)
+            
             logger.info(
                 "CosmosDB initialized successfully",
                 endpoint=self.endpoint,
@@ -199,41 +263,92 @@ class CosmosMemoryStore:
             logger.error(f"Failed to update session", error=str(e), session_id=session_id)
             raise
     
-    async def get_all_sessions(self, user_id: Optional[str] = None, limit: int = 50) -> List[ResearchSession]:
-        """Retrieve all sessions, optionally filtered by user."""
+    async def _query_page(
+        self,
+        query: str,
+        parameters: List[Dict[str, Any]],
+        limit: int,
+        continuation_token: Optional[str] = None,
+        partition_key: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Run a query and return a single page of at most ``limit`` items.
+        
+        Paging uses Cosmos continuation tokens rather than OFFSET/LIMIT, so the
+        request charge of page N does not grow with N.
+        
+        Returns:
+            Tuple of (items, continuation token for the next page or None)
+        """
+        kwargs: Dict[str, Any] = {"max_item_count": limit}
+        if partition_key is not None:
+            kwargs["partition_key"] = partition_key
+        
+        query_iter = self._container.query_items(query=query, parameters=parameters, **kwargs)
+        items: List[Dict[str, Any]] = []
+        next_token = None
+        try:
+            pages = query_iter.by_page(continuation_token)
+            async for page in pages:
+                items.extend([item async for item in page])
+                next_token = pages.continuation_token
+                # Cross-partition pages can come back empty while more results remain
+                if items or not next_token:
+                    break
+        except Exception as e:
+            if _is_bad_continuation_token(e, continuation_token):
+                raise InvalidContinuationToken("Invalid or expired continuation token") from e
+            raise
+        
+        return items, next_token
+    
+    async def get_sessions_page(
+        self,
+        user_id: Optional[str] = None,
+        limit: int = 50,
+        continuation_token: Optional[str] = None
+    ) -> Tuple[List[ResearchSession], Optional[str]]:
+        """
+        Retrieve one page of sessions (most recent first), optionally filtered by user.
+        
+        Returns:
+            Tuple of (sessions, continuation token for the next page or None)
+        """
         await self.ensure_initialized()
         
+        query_parts = ["SELECT * FROM c WHERE c.data_type='session'"]
+        parameters = []
+        
+        if user_id:
+            query_parts.append("AND c.user_id=@user_id")
+            parameters.append({"name": "@user_id", "value": user_id})
+        
+        query_parts.append("ORDER BY c.created_at DESC")
+        query = " ".join(query_parts)
+        
+        # Cross-partition query (no partition_key specified)
+        raw_items, next_token = await self._query_page(query, parameters, limit, continuation_token)
+        
+        items = []
+        for item in raw_items:
+            try:
+                # Parse datetime strings
+                if "created_at" in item and isinstance(item["created_at"], str):
+                    item["created_at"] = datetime.fromisoformat(item["created_at"])
+                if "last_active" in item and isinstance(item["last_active"], str):
+                    item["last_active"] = datetime.fromisoformat(item["last_active"])
+                items.append(ResearchSession(**item))
+            except Exception as e:
+                logger.warning(f"Failed to parse session: {e}")
+                continue
+        
+        logger.info(f"Retrieved {len(items)} sessions", user_id=user_id if user_id else "all", has_more=bool(next_token))
+        return items, next_token
+    
+    async def get_all_sessions(self, user_id: Optional[str] = None, limit: int = 50) -> List[ResearchSession]:
+        """Retrieve all sessions, optionally filtered by user (first page only)."""
         try:
-            query_parts = ["SELECT * FROM c WHERE c.data_type='session'"]
-            parameters = []
-            
-            if user_id:
-                query_parts.append("AND c.user_id=@user_id")
-                parameters.append({"name": "@user_id", "value": user_id})
-            
-            query_parts.append(f"ORDER BY c.created_at DESC OFFSET 0 LIMIT {limit}")
-            query = " ".join(query_parts)
-            
-            items = []
-            # Cross-partition query (no partition_key specified)
-            query_iter = self._container.query_items(
-                query=query,
-                parameters=parameters
-            )
-            
-            async for item in query_iter:
-                try:
-                    # Parse datetime strings
-                    if "created_at" in item and isinstance(item["created_at"], str):
-                        item["created_at"] = datetime.fromisoformat(item["created_at"])
-                    if "last_active" in item and isinstance(item["last_active"], str):
-                        item["last_active"] = datetime.fromisoformat(item["last_active"])
-                    items.append(ResearchSession(**item))
-                except Exception as e:
-                    logger.warning(f"Failed to parse session: {e}")
-                    continue
-            
-            logger.info(f"Retrieved {len(items)} sessions", user_id=user_id if user_id else "all")
+            items, _ = await self.get_sessions_page(user_id=user_id, limit=limit)
             return items
             
         except Exception as e:
@@ -309,6 +424,7 @@ class CosmosMemoryStore:
             logger.info(f"📝 Creating ResearchRun document in Cosmos DB: run_id={run.run_id}, session_id={run.session_id}, topic={run.topic}")
             
             await self._container.create_item(body=run_dict)
+            self._remember_run_location(run.run_id, run.id, run.session_id)
             
             logger.info(f"✅ ResearchRun created successfully in Cosmos DB", run_id=run.run_id, topic=run.topic, user_id=run.user_id)
             return run
@@ -338,7 +454,9 @@ class CosmosMemoryStore:
                         item["started_at"] = datetime.fromisoformat(item["started_at"])
                     if "completed_at" in item and item["completed_at"] and isinstance(item["completed_at"], str):
                         item["completed_at"] = datetime.fromisoformat(item["completed_at"])
-                    return ResearchRun(**item)
+                    run = ResearchRun(**item)
+                    self._remember_run_location(run.run_id, run.id, run.session_id)
+                    return run
                 except Exception as e:
                     logger.warning(f"Failed to parse run: {e}")
                     continue
@@ -349,35 +467,138 @@ class CosmosMemoryStore:
             logger.error(f"Failed to get run", error=str(e), run_id=run_id)
             return None
     
-    async def update_run(self, run_id: str, updates: Dict[str, Any]) -> None:
-        """Partially update a run with given fields."""
+    def _remember_run_location(self, run_id: str, item_id: str, session_id: str) -> None:
+        self._run_locations[run_id] = (item_id, session_id)
+        self._run_locations.move_to_end(run_id)
+        while len(self._run_locations) > RUN_LOCATION_CACHE_SIZE:
+            self._run_locations.popitem(last=False)
+    
+    async def _locate_run(self, run_id: str, session_id: Optional[str] = None) -> Optional[Tuple[str, str]]:
+        """
+        Find the document id and partition key of a run.
+        
+        Runs created or read by this process are known already; otherwise a
+        projection query fetches just the id (scoped to one partition when the
+        session is known).
+        """
+        location = self._run_locations.get(run_id)
+        if location:
+            return location
+        
+        query = "SELECT c.id, c.session_id FROM c WHERE c.run_id=@run_id AND c.data_type='research_run'"
+        parameters = [{"name": "@run_id", "value": run_id}]
+        kwargs = {"partition_key": session_id} if session_id else {}
+        
+        async for item in self._container.query_items(query=query, parameters=parameters, **kwargs):
+            self._remember_run_location(run_id, item["id"], item["session_id"])
+            return item["id"], item["session_id"]
+        
+        return None
+    
+    async def patch_run(
+        self,
+        run_id: str,
+        fields: Dict[str, Any],
+        session_id: Optional[str] = None
+    ) -> None:
+        """
+        Set top-level run fields with a partial-document patch.
+        
+        Progress and status updates become a point write of just the changed
+        fields instead of a read and full-document upsert. Unknown fields are
+        ignored, as in update_run.
+        """
+        await self.ensure_initialized()
+        
+        operations = [
+            {"op": "set", "path": f"/{key}", "value": _to_document_value(value)}
+            for key, value in fields.items()
+            if key in ResearchRun.model_fields and key not in ("id", "run_id", "session_id")
+        ]
+        if not operations:
+            return
+        
+        location = await self._locate_run(run_id, session_id)
+        if not location:
+            raise ValueError(f"Run {run_id} not found")
+        item_id, partition_key = location
+        
+        try:
+            for start in range(0, len(operations), MAX_PATCH_OPERATIONS):
+                await self._container.patch_item(
+                    item=item_id,
+                    partition_key=partition_key,
+                    patch_operations=operations[start:start + MAX_PATCH_OPERATIONS]
+                )
+            logger.debug(f"Run patched", run_id=run_id, fields=list(fields.keys()))
+        except Exception as e:
+            self._run_locations.pop(run_id, None)
+            logger.error(f"Failed to patch run", error=str(e), run_id=run_id)
+            raise
+    
+    async def update_run(
+        self,
+        run_id: str,
+        updates: Dict[str, Any],
+        session_id: Optional[str] = None
+    ) -> None:
+        """
+        Partially update a run with given fields.
+        
+        Small updates (up to MAX_PATCH_OPERATIONS fields, e.g. progress and
+        status) are applied as a single patch. Larger ones, such as the final
+        save of results, read the document by point lookup and replace it so
+        all fields change atomically. The replace is conditional on the
+        document's etag and starts over from a fresh read if another writer
+        got there first, so concurrent progress patches are never lost.
+        """
         await self.ensure_initialized()
         
+        known_updates = {key: value for key, value in updates.items() if key in ResearchRun.model_fields}
+        if len(known_updates) <= MAX_PATCH_OPERATIONS:
+            await self.patch_run(run_id, known_updates, session_id=session_id)
+            return
+        
         try:
-            # Get existing run
-            run = await self.get_run(run_id)
-            if not run:
+            location = await self._locate_run(run_id, session_id)
+            if not location:
                 raise ValueError(f"Run {run_id} not found")
-            
-            # Apply updates
-            for key, value in updates.items():
-                if hasattr(run, key):
-                    setattr(run, key, value)
-            
-            # Convert to dict for upsert
-            run_dict = run.dict()
-            # Serialize datetime objects
-            run_dict["started_at"] = run.started_at.isoformat()
-            if run.completed_at:
-                run_dict["completed_at"] = run.completed_at.isoformat()
-            
-            await self._container.upsert_item(body=run_dict)
+            item_id, partition_key = location
+            
+            for attempt in range(1, MAX_REPLACE_ATTEMPTS + 1):
+                run_dict = await self._container.read_item(item=item_id, partition_key=partition_key)
+                
+                # Apply updates
+                for key, value in known_updates.items():
+                    run_dict[key] = _to_document_value(value)
+                
+                try:
+                    await self._replace_if_unchanged(item_id, run_dict)
+                    break
+                except CosmosAccessConditionFailedError:
+                    if attempt == MAX_REPLACE_ATTEMPTS:
+                        raise
+                    logger.debug(f"Run changed during update, retrying", run_id=run_id, attempt=attempt)
             logger.debug(f"Run updated", run_id=run_id, updates=list(updates.keys()))
             
         except Exception as e:
             logger.error(f"Failed to update run", error=str(e), run_id=run_id)
             raise
     
+    async def _replace_if_unchanged(self, item_id: str, document: Dict[str, Any]) -> None:
+        """Replace a document read earlier, failing with a 412 if it has changed since."""
+        etag = document.get("_etag")
+        if etag is None:
+            # The local SQLite container keeps no etags
+            await self._container.replace_item(item=item_id, body=document)
+            return
+        await self._container.replace_item(
+            item=item_id,
+            body=document,
+            etag=etag,
+            match_condition=MatchConditions.IfNotModified
+        )
+    
     async def get_runs_by_session(self, session_id: str) -> List[ResearchRun]:
         """Retrieve all runs for a session."""
         await self.ensure_initialized()
@@ -453,6 +674,58 @@ class CosmosMemoryStore:
             logger.error(f"Failed to get runs by user", error=str(e), user_id=user_id)
             return []
     
+    async def get_run_summaries_by_session(self, session_id: str) -> List[Dict[str, Any]]:
+        """
+        Retrieve summary fields for all runs in a session (most recent first).
+        
+        Returns raw projected documents (timestamps as ISO strings) without the
+        report body or citations.
+        """
+        await self.ensure_initialized()
+        
+        try:
+            query = f"""
+            SELECT {RUN_SUMMARY_PROJECTION} FROM c
+            WHERE c.session_id=@session_id AND c.data_type='research_run'
+            ORDER BY c.started_at DESC
+            """
+            parameters = [{"name": "@session_id", "value": session_id}]
+            
+            query_iter = self._container.query_items(
+                query=query,
+                parameters=parameters,
+                partition_key=session_id
+            )
+            return [item async for item in query_iter]
+            
+        except Exception as e:
+            logger.error(f"Failed to get run summaries by session", error=str(e), session_id=session_id)
+            return []
+    
+    async def get_run_summaries_page(
+        self,
+        user_id: str,
+        limit: int = 50,
+        continuation_token: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Retrieve one page of run summaries for a user (most recent first).
+        
+        Returns:
+            Tuple of (projected run documents, continuation token for the next page or None)
+        """
+        await self.ensure_initialized()
+        
+        query = f"""
+        SELECT {RUN_SUMMARY_PROJECTION} FROM c
+        WHERE c.user_id=@user_id AND c.data_type='research_run'
+        ORDER BY c.started_at DESC
+        """
+        parameters = [{"name": "@user_id", "value": user_id}]
+        
+        # Cross-partition query
+        return await self._query_page(query, parameters, limit, continuation_token)
+    
     async def get_runs_by_topic(self, topic: str, user_id: Optional[str] = None, limit: int = 20) -> List[ResearchRun]:
         """Retrieve all runs for a specific topic, optionally filtered by user."""
         await self.ensure_initialized()
@@ -512,11 +785,16 @@ def get_cosmos_store() -> CosmosMemoryStore:
     - AZURE_TENANT_ID: Azure AD tenant ID (optional)
     - AZURE_CLIENT_ID: Service principal client ID (optional)
     - AZURE_CLIENT_SECRET: Service principal client secret (optional)
+    - MEMORY_STORE_BACKEND: "cosmos" (default) or "sqlite" (see sqlite_memory)
+    - MEMORY_STORE_RECORD_PATH: Optional JSONL file recording container operations
     """
     global _cosmos_store
     
     if _cosmos_store is None:
-        import os
+        if os.getenv("MEMORY_STORE_BACKEND", "cosmos").strip().lower() == "sqlite":
+            from .sqlite_memory import get_sqlite_store
+            _cosmos_store = get_sqlite_store()
+            return _cosmos_store
         
         endpoint = os.getenv("COSMOSDB_ENDPOINT")
         database = os.getenv("COSMOS_DB_DATABASE")
@@ -0,0 +1,100 @@
+"""
+SQLite Memory Store for Deep Research Application
+
+Runs the Cosmos memory store against a local SQLite (WAL) database, so the
+application and the persistence benchmark work without a Cosmos account.
+Every store method is inherited unchanged; only the container underneath is
+replaced, which keeps queries, partitioning (session_id) and paging identical.
+
+Selected with MEMORY_STORE_BACKEND=sqlite (default: cosmos).
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+import structlog
+
+from .cosmos_memory import CosmosMemoryStore
+from .sqlite_container import RecordingContainer, SqliteContainer
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_SQLITE_PATH = str(Path(__file__).resolve().parents[2] / "data" / "memory_store.db")
+
+# Secondary indexes matching the store's filters and sort orders
+SQLITE_INDEXES = (
+    ("data_type", "user_id", "created_at"),
+    ("data_type", "user_id", "started_at"),
+    ("run_id",),
+    ("data_type", "topic"),
+)
+
+
+def memory_store_backend() -> str:
+    """Configured memory store backend: 'cosmos' or 'sqlite'."""
+    return os.getenv("MEMORY_STORE_BACKEND", "cosmos").strip().lower()
+
+
+class SqliteMemoryStore(CosmosMemoryStore):
+    """CosmosMemoryStore backed by a local SQLite database."""
+    
+    def __init__(
+        self,
+        path: str = DEFAULT_SQLITE_PATH,
+        user_id: Optional[str] = None,
+        record_path: Optional[str] = None
+    ):
+        """
+        Initialize SQLite memory store.
+        
+        Args:
+            path: SQLite database file (":memory:" for an in-memory database)
+            user_id: Optional default user ID for operations
+            record_path: Optional JSONL file recording every container operation
+        """
+        super().__init__(endpoint="", database_name="", container_name="", user_id=user_id)
+        self.path = path
+        self.record_path = record_path
+        self._sqlite: Optional[SqliteContainer] = None
+    
+    async def initialize(self) -> None:
+        """Open the database and create the table and indexes."""
+        if self._initialized.is_set():
+            return
+        
+        self._sqlite = await SqliteContainer(self.path, partition_key_path="/session_id", indexes=SQLITE_INDEXES).open()
+        self._container = RecordingContainer(self._sqlite, self.record_path) if self.record_path else self._sqlite
+        
+        logger.info("SQLite memory store initialized", path=self.path, recording=bool(self.record_path))
+        self._initialized.set()
+    
+    async def close(self) -> None:
+        """Close the database."""
+        if isinstance(self._container, RecordingContainer):
+            self._container.close()
+        if self._sqlite:
+            await self._sqlite.close()
+            logger.info("SQLite memory store closed")
+
+
+_sqlite_store: Optional[SqliteMemoryStore] = None
+
+
+def get_sqlite_store() -> SqliteMemoryStore:
+    """
+    Get or create singleton SqliteMemoryStore instance.
+    
+    Uses environment variables for configuration:
+    - SQLITE_MEMORY_PATH: Database file (default: backend/data/memory_store.db)
+    - MEMORY_STORE_RECORD_PATH: Optional workload recording file
+    """
+    global _sqlite_store
+    
+    if _sqlite_store is None:
+        _sqlite_store = SqliteMemoryStore(
+            path=os.getenv("SQLITE_MEMORY_PATH", DEFAULT_SQLITE_PATH),
+            record_path=os.getenv("MEMORY_STORE_RECORD_PATH")
+        )
+    
+    return _sqlite_store
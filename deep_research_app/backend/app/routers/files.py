@@ -11,6 +11,7 @@ import uuid
 
 from ..models.file_models import FileMetadata, FileUploadResponse
 from ..services.file_handler import FileHandler
+from ..services.blob_upload import UploadTooLargeError
 from ..services.document_intelligence_service import DocumentIntelligenceService
 from ..models.file_models import ProcessingStatus
 
@@ -179,6 +180,12 @@ async def upload_files(
             files=uploaded_files
         )
         
+    except UploadTooLargeError as e:
+        logger.warning("Rejected oversized upload", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
     except ValueError as e:
         logger.error("File validation error", error=str(e))
         raise HTTPException(
@@ -5,7 +5,7 @@ Handles session history and research run retrieval endpoints.
 All endpoints require authentication and filter by authenticated user.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Request, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Query, Response
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
@@ -13,13 +13,17 @@ import structlog
 import os
 
 from ..models.persistence_models import ResearchSession, ResearchRun
-from ..persistence.cosmos_memory import CosmosMemoryStore
+from ..persistence.cosmos_memory import CosmosMemoryStore, InvalidContinuationToken
+from ..persistence.sqlite_memory import get_sqlite_store, memory_store_backend
 from ..auth.auth_utils import get_authenticated_user_details
 
 logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/api/sessions", tags=["sessions"])
 
+# Response header carrying the cursor for the next page of a list endpoint
+CONTINUATION_HEADER = "X-Continuation-Token"
+
 # Global cosmos store instance
 _cosmos_store: Optional[CosmosMemoryStore] = None
 
@@ -28,6 +32,11 @@ async def get_cosmos_store() -> CosmosMemoryStore:
     """Dependency to get or create Cosmos DB store."""
     global _cosmos_store
     
+    if _cosmos_store is None and memory_store_backend() == "sqlite":
+        _cosmos_store = get_sqlite_store()
+        await _cosmos_store.initialize()
+        logger.info("SQLite memory store initialized for sessions API")
+    
     if _cosmos_store is None:
         cosmos_endpoint = os.getenv("COSMOSDB_ENDPOINT")
         cosmos_database = os.getenv("COSMOS_DB_DATABASE")
@@ -129,14 +138,20 @@ class RunSummary(BaseModel):
 @router.get("", response_model=List[SessionWithDetails])
 async def list_sessions(
     request: Request,
+    response: Response,
     limit: int = Query(50, description="Maximum number of sessions to return"),
+    continuation_token: Optional[str] = Query(
+        None,
+        description="Cursor from the X-Continuation-Token header of the previous page"
+    ),
     cosmos: CosmosMemoryStore = Depends(get_cosmos_store)
 ):
     """
     Get all research sessions for the authenticated user with enriched details.
     
     Returns sessions ordered by most recent first, with summary information
-    about research runs in each session.
+    about research runs in each session. When more sessions are available the
+    cursor for the next page is returned in the X-Continuation-Token header.
     """
     # Extract authenticated user details
     user_details = get_authenticated_user_details(request.headers)
@@ -149,13 +164,19 @@ async def list_sessions(
     
     try:
         # Get sessions filtered by authenticated user
-        sessions = await cosmos.get_all_sessions(user_id=user_id, limit=limit)
+        sessions, next_token = await cosmos.get_sessions_page(
+            user_id=user_id,
+            limit=limit,
+            continuation_token=continuation_token
+        )
+        if next_token:
+            response.headers[CONTINUATION_HEADER] = next_token
         
         # Enrich each session with research run details
         enriched_sessions = []
         for session in sessions:
-            # Get runs for this session
-            runs = await cosmos.get_runs_by_session(session.session_id)
+            # Get run summaries (no report bodies) for this session
+            runs = await cosmos.get_run_summaries_by_session(session.session_id)
             
             # Calculate aggregates
             latest_topic = None
@@ -168,16 +189,16 @@ async def list_sessions(
             if runs:
                 # Get latest run details
                 latest_run = runs[0]  # Already sorted DESC by started_at
-                latest_topic = latest_run.topic
-                latest_depth = latest_run.depth
-                latest_execution_mode = latest_run.execution_mode
-                latest_status = latest_run.status
+                latest_topic = latest_run.get("topic")
+                latest_depth = latest_run.get("depth")
+                latest_execution_mode = latest_run.get("execution_mode")
+                latest_status = latest_run.get("status")
                 
                 # Sum execution times and sources
                 total_execution_time = sum(
-                    r.execution_time for r in runs if r.execution_time
+                    r["execution_time"] for r in runs if r.get("execution_time")
                 )
-                total_sources_analyzed = sum(r.sources_analyzed for r in runs)
+                total_sources_analyzed = sum(r.get("sources_analyzed") or 0 for r in runs)
             
             enriched_session = SessionWithDetails(
                 id=session.id,
@@ -198,6 +219,8 @@ async def list_sessions(
         logger.info("Sessions listed", count=len(enriched_sessions), user_id=user_id)
         return enriched_sessions
         
+    except InvalidContinuationToken as e:
+        raise HTTPException(status_code=400, detail=f"{e}; request the first page again")
     except Exception as e:
         logger.error("Failed to list sessions", error=str(e), user_id=user_id)
         raise HTTPException(status_code=500, detail="Failed to retrieve sessions")
@@ -412,13 +435,20 @@ async def get_runs_by_topic(
 @router.get("/user/history", response_model=List[RunSummary])
 async def get_user_history(
     request: Request,
+    response: Response,
     limit: int = Query(50, description="Maximum number of runs to return"),
+    continuation_token: Optional[str] = Query(
+        None,
+        description="Cursor from the X-Continuation-Token header of the previous page"
+    ),
     cosmos: CosmosMemoryStore = Depends(get_cosmos_store)
 ):
     """
     Get complete research history for the authenticated user.
     
-    Returns all research runs ordered by most recent first.
+    Returns research runs ordered by most recent first. When more runs are
+    available the cursor for the next page is returned in the
+    X-Continuation-Token header.
     """
     # Extract authenticated user
     user_details = get_authenticated_user_details(request.headers)
@@ -430,24 +460,30 @@ async def get_user_history(
     logger.info("Getting user history", user_id=user_id, limit=limit)
     
     try:
-        # Get all runs for this user
-        runs = await cosmos.get_runs_by_user(user_id, limit=limit)
+        # Get projected run summaries for this user
+        runs, next_token = await cosmos.get_run_summaries_page(
+            user_id,
+            limit=limit,
+            continuation_token=continuation_token
+        )
+        if next_token:
+            response.headers[CONTINUATION_HEADER] = next_token
         
         # Convert to summaries
         run_summaries = [
             RunSummary(
-                run_id=run.run_id,
-                topic=run.topic,
-                depth=run.depth,
-                execution_mode=run.execution_mode,
-                status=run.status,
-                started_at=run.started_at.isoformat(),
-                completed_at=run.completed_at.isoformat() if run.completed_at else None,
-                execution_time=run.execution_time,
-                progress=run.progress,
-                sources_analyzed=run.sources_analyzed,
-                has_report=bool(run.research_report),
-                summary=run.summary
+                run_id=run["run_id"],
+                topic=run.get("topic", ""),
+                depth=run.get("depth", "comprehensive"),
+                execution_mode=run.get("execution_mode", "workflow"),
+                status=run.get("status", "unknown"),
+                started_at=run["started_at"],
+                completed_at=run.get("completed_at"),
+                execution_time=run.get("execution_time"),
+                progress=run.get("progress") or 0.0,
+                sources_analyzed=run.get("sources_analyzed") or 0,
+                has_report=bool(run.get("has_report")),
+                summary=run.get("summary")
             )
             for run in runs
         ]
@@ -455,6 +491,8 @@ async def get_user_history(
         logger.info("User history retrieved", user_id=user_id, count=len(run_summaries))
         return run_summaries
         
+    except InvalidContinuationToken as e:
+        raise HTTPException(status_code=400, detail=f"{e}; request the first page again")
     except Exception as e:
         logger.error("Failed to get user history", error=str(e), user_id=user_id)
         raise HTTPException(status_code=500, detail="Failed to retrieve history")
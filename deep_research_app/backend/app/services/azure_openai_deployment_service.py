@@ -79,15 +79,21 @@ class AzureOpenAIDeploymentService:
         if self.credential:
             await self.credential.close()
     
-    async def get_deployments(self) -> List[DeploymentInfo]:
+    async def get_deployments(self, raise_errors: bool = False) -> List[DeploymentInfo]:
         """
         Fetch all deployments from Azure OpenAI account using Management SDK.
         
+        Args:
+            raise_errors: Re-raise Azure errors instead of returning an empty list,
+                so callers can tell a failed fetch from an account with no deployments
+        
         Returns:
             List of DeploymentInfo objects with deployment details
         """
         if not self.client:
             logger.error("Client not initialized. Use async context manager.")
+            if raise_errors:
+                raise RuntimeError("Deployment service client not initialized")
             return []
         
         try:
@@ -120,9 +126,13 @@ class AzureOpenAIDeploymentService:
             
         except AzureError as e:
             logger.error(f"Azure error fetching deployments: {e}")
+            if raise_errors:
+                raise
             return []
         except Exception as e:
             logger.error(f"Error fetching deployments: {e}", exc_info=True)
+            if raise_errors:
+                raise
             return []
     
     def _parse_deployment(self, deployment: Any) -> Optional[DeploymentInfo]:
@@ -211,14 +221,17 @@ class AzureOpenAIDeploymentService:
         logger.info(f"Found {len(embedding_deployments)} embedding model deployments")
         return embedding_deployments
     
-    async def get_deployments_summary(self) -> Dict[str, Any]:
+    async def get_deployments_summary(self, raise_errors: bool = False) -> Dict[str, Any]:
         """
         Get a summary of available deployments grouped by type.
         
+        Args:
+            raise_errors: Propagate fetch errors (see get_deployments)
+        
         Returns:
             Dictionary with deployment summary
         """
-        deployments = await self.get_deployments()
+        deployments = await self.get_deployments(raise_errors=raise_errors)
         
         chat_models = [d for d in deployments if d.model_type == 'chat']
         embedding_models = [d for d in deployments if d.model_type == 'embedding']
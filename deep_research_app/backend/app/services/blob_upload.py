@@ -0,0 +1,126 @@
+"""
+Streaming Blob Upload
+
+Streams an incoming upload to Azure Blob Storage as staged blocks. Blocks are
+staged concurrently while the request body is still being read, the size limit
+is enforced as bytes arrive, and a SHA-256 digest is computed on the fly, so
+peak memory per upload is bounded by ``block_size * (max_concurrency + 1)``
+regardless of file size.
+"""
+
+import asyncio
+import base64
+import hashlib
+from dataclasses import dataclass
+from typing import List, Optional
+
+import structlog
+from fastapi import UploadFile
+from azure.storage.blob import BlobBlock, ContentSettings
+from azure.storage.blob.aio import BlobClient
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_BLOCK_SIZE = 4 * 1024 * 1024  # 4 MB
+
+
+class UploadTooLargeError(ValueError):
+    """Raised as soon as an upload is known to exceed the size limit."""
+
+
+@dataclass
+class UploadResult:
+    """Outcome of a streamed upload."""
+
+    size: int
+    sha256: str
+    block_count: int
+
+
+def _block_id(index: int) -> str:
+    # Block ids must be base64 and all the same length within a blob
+    return base64.b64encode(f"{index:08d}".encode()).decode()
+
+
+async def stream_upload(
+    blob_client: BlobClient,
+    file: UploadFile,
+    max_size: int,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    max_concurrency: int = 4,
+    content_type: Optional[str] = None
+) -> UploadResult:
+    """
+    Stream ``file`` into ``blob_client`` as a block blob.
+
+    Args:
+        blob_client: Destination blob
+        file: Incoming upload
+        max_size: Maximum accepted size in bytes
+        block_size: Size of each staged block
+        max_concurrency: Maximum blocks being staged at once
+        content_type: Content type stored on the committed blob
+
+    Returns:
+        UploadResult with the byte count and hex SHA-256 digest
+
+    Raises:
+        UploadTooLargeError: If the upload exceeds ``max_size``
+    """
+    declared_size = getattr(file, "size", None)
+    if declared_size is not None and declared_size > max_size:
+        raise UploadTooLargeError(f"File size {declared_size} exceeds maximum {max_size}")
+
+    hasher = hashlib.sha256()
+    slots = asyncio.Semaphore(max_concurrency)
+    block_ids: List[str] = []
+    staging: List[asyncio.Task] = []
+    size = 0
+
+    async def stage(block_id: str, chunk: bytes):
+        try:
+            await blob_client.stage_block(block_id=block_id, data=chunk, length=len(chunk))
+        finally:
+            slots.release()
+
+    try:
+        while True:
+            # Wait for a free slot before reading, so at most max_concurrency blocks are in memory
+            await slots.acquire()
+            chunk = await file.read(block_size)
+            if not chunk:
+                slots.release()
+                break
+
+            size += len(chunk)
+            if size > max_size:
+                slots.release()
+                raise UploadTooLargeError(f"File size exceeds maximum {max_size}")
+
+            hasher.update(chunk)
+            block_id = _block_id(len(block_ids))
+            block_ids.append(block_id)
+            staging.append(asyncio.create_task(stage(block_id, chunk)))
+
+            # Surface staging failures early instead of after reading the whole body
+            failed = next((t for t in staging if t.done() and t.exception()), None)
+            if failed:
+                raise failed.exception()
+
+        await asyncio.gather(*staging)
+
+        digest = hasher.hexdigest()
+        await blob_client.commit_block_list(
+            [BlobBlock(block_id=block_id) for block_id in block_ids],
+            content_settings=ContentSettings(content_type=content_type) if content_type else None,
+            metadata={"sha256": digest}
+        )
+    except BaseException:
+        # Uncommitted blocks are discarded by the service; just stop staging
+        for task in staging:
+            task.cancel()
+        await asyncio.gather(*staging, return_exceptions=True)
+        raise
+
+    logger.info("Streamed upload committed", size=size, blocks=len(block_ids), sha256=digest)
+    return UploadResult(size=size, sha256=digest, block_count=len(block_ids))
@@ -0,0 +1,322 @@
+"""
+Context Budget
+
+Packs prioritized prompt sections (task, dependency artifacts, sources,
+documents) into a model-specific token budget, measured with a local
+tokenizer instead of character cuts. Sections are kept whole when they fit;
+otherwise lower-priority sections are truncated or dropped first, and sections
+of equal priority share the remaining budget fairly. Every decision is
+reported so dropped content is visible in the logs.
+
+Uses tiktoken when installed and falls back to a conservative
+characters-per-token estimate otherwise.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import groupby
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Context windows (tokens) by model family; the longest matching prefix wins
+MODEL_CONTEXT_TOKENS = {
+    "gpt-35-turbo": 16_385,
+    "gpt-3.5-turbo": 16_385,
+    "gpt-4": 8_192,
+    "gpt-4-32k": 32_768,
+    "gpt-4-turbo": 128_000,
+    "gpt-4o": 128_000,
+    "gpt-4o-mini": 128_000,
+    "gpt-4.1": 1_047_576,
+    "gpt-5": 272_000,
+    "o1": 200_000,
+    "o3": 200_000,
+    "o4-mini": 200_000,
+}
+DEFAULT_CONTEXT_TOKENS = 128_000
+
+# Fallback estimate when tiktoken is unavailable; deliberately pessimistic
+CHARS_PER_TOKEN = 3.5
+
+TRUNCATION_MARKER = "\n[... truncated ...]"
+
+
+def context_window(model: Optional[str]) -> int:
+    """Context window for a model or deployment name."""
+    name = (model or "").lower()
+    matches = [prefix for prefix in MODEL_CONTEXT_TOKENS if name.startswith(prefix)]
+    if not matches:
+        return DEFAULT_CONTEXT_TOKENS
+    return MODEL_CONTEXT_TOKENS[max(matches, key=len)]
+
+
+class Tokenizer:
+    """Token counting and truncation for one model."""
+
+    def __init__(self, model: Optional[str] = None):
+        """Load the model's encoding (or fall back to the estimate)."""
+        self.model = model
+        self._encoding = None
+        try:
+            import tiktoken
+            try:
+                self._encoding = tiktoken.encoding_for_model(model or "gpt-4o")
+            except KeyError:
+                # Azure deployment names rarely match OpenAI model names
+                self._encoding = tiktoken.get_encoding("o200k_base")
+        except ImportError:
+            logger.warning("tiktoken not installed; estimating token counts from characters")
+
+    @property
+    def exact(self) -> bool:
+        """Whether counts come from a real tokenizer."""
+        return self._encoding is not None
+
+    def count(self, text: str) -> int:
+        """Number of tokens in ``text``."""
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        return int(len(text) / CHARS_PER_TOKEN) + 1
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Cut ``text`` to at most ``max_tokens`` tokens, preferring a line or sentence boundary."""
+        if max_tokens <= 0:
+            return ""
+        if self._encoding is not None:
+            tokens = self._encoding.encode(text, disallowed_special=())
+            if len(tokens) <= max_tokens:
+                return text
+            cut = self._encoding.decode(tokens[:max_tokens])
+        else:
+            max_chars = int(max_tokens * CHARS_PER_TOKEN)
+            if len(text) <= max_chars:
+                return text
+            cut = text[:max_chars]
+
+        boundary = max(cut.rfind("\n"), cut.rfind(". "))
+        if boundary > len(cut) * 0.8:
+            cut = cut[:boundary + 1]
+        return cut
+
+
+@lru_cache(maxsize=16)
+def get_tokenizer(model: Optional[str] = None) -> Tokenizer:
+    """Get a cached tokenizer for a model."""
+    return Tokenizer(model)
+
+
+@dataclass
+class ContextSection:
+    """
+    A piece of prompt content competing for the budget.
+
+    Lower ``priority`` values are more important. ``min_tokens`` is the
+    smallest useful truncation; below it the section is dropped instead.
+    Sections with ``truncatable=False`` are kept whole or dropped.
+    """
+
+    name: str
+    text: str
+    priority: int = 100
+    min_tokens: int = 0
+    truncatable: bool = True
+
+
+@dataclass
+class PackingDecision:
+    """What happened to one section."""
+
+    name: str
+    priority: int
+    original_tokens: int
+    packed_tokens: int
+    action: str  # kept, truncated, dropped
+
+
+@dataclass
+class PackedContext:
+    """Result of packing sections into a budget."""
+
+    sections: Dict[str, str]
+    decisions: List[PackingDecision]
+    budget_tokens: int
+    used_tokens: int
+    separator: str = "\n\n"
+    exact: bool = True
+    order: List[str] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        """Kept sections joined in their original order."""
+        return self.separator.join(self.sections[name] for name in self.order if self.sections.get(name))
+
+    def get(self, name: str, default: str = "") -> str:
+        """Packed text of one section."""
+        return self.sections.get(name) or default
+
+    @property
+    def dropped(self) -> List[str]:
+        """Names of sections that did not fit at all."""
+        return [d.name for d in self.decisions if d.action == "dropped"]
+
+    @property
+    def truncated(self) -> List[str]:
+        """Names of sections that were cut."""
+        return [d.name for d in self.decisions if d.action == "truncated"]
+
+    def report(self) -> Dict[str, Any]:
+        """Packing summary for logs and diagnostics."""
+        return {
+            "budget_tokens": self.budget_tokens,
+            "used_tokens": self.used_tokens,
+            "exact_tokenizer": self.exact,
+            "decisions": [
+                {
+                    "name": d.name,
+                    "priority": d.priority,
+                    "original_tokens": d.original_tokens,
+                    "packed_tokens": d.packed_tokens,
+                    "action": d.action,
+                }
+                for d in self.decisions
+            ],
+        }
+
+
+class ContextBudget:
+    """Token budget for one model call."""
+
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        max_context_tokens: Optional[int] = None,
+        reserve_output_tokens: int = 4096,
+        overhead_tokens: int = 0
+    ):
+        """
+        Initialize the budget.
+
+        Args:
+            model: Model or deployment name (selects tokenizer and context window)
+            max_context_tokens: Override for the model's context window
+            reserve_output_tokens: Tokens left free for the completion
+            overhead_tokens: Tokens already spent elsewhere (system prompt, instructions)
+        """
+        self.model = model
+        self.tokenizer = get_tokenizer(model)
+        window = max_context_tokens or context_window(model)
+        self.budget_tokens = max(0, window - reserve_output_tokens - overhead_tokens)
+
+    def count(self, text: str) -> int:
+        """Token count using this budget's tokenizer."""
+        return self.tokenizer.count(text)
+
+    def fit(self, text: str, max_tokens: int, name: str = "text") -> str:
+        """Fit a single text into ``max_tokens``, marking and logging any cut."""
+        packed = self.pack([ContextSection(name=name, text=text)], budget_tokens=max_tokens)
+        return packed.get(name)
+
+    def pack(
+        self,
+        sections: List[ContextSection],
+        budget_tokens: Optional[int] = None,
+        separator: str = "\n\n"
+    ) -> PackedContext:
+        """
+        Pack sections into the budget.
+
+        Priority groups are filled most important first. Within a group every
+        section gets an equal share; sections smaller than their share are kept
+        whole and the slack is redistributed to the larger ones.
+        """
+        budget = self.budget_tokens if budget_tokens is None else budget_tokens
+        separator_tokens = self.count(separator)
+        marker_tokens = self.count(TRUNCATION_MARKER)
+
+        sizes = {id(section): self.count(section.text) for section in sections}
+        allocations: Dict[int, int] = {}
+        remaining = budget
+
+        ordered = sorted(sections, key=lambda section: section.priority)
+        for _, group_iter in groupby(ordered, key=lambda section: section.priority):
+            group = list(group_iter)
+            # Each packed section also costs a separator
+            needs = {id(s): sizes[id(s)] + separator_tokens for s in group if sizes[id(s)] > 0}
+
+            if sum(needs.values()) <= remaining:
+                for key, need in needs.items():
+                    allocations[key] = need - separator_tokens
+                remaining -= sum(needs.values())
+                continue
+
+            # Water-fill: small sections whole, the rest share what is left
+            pending = sorted((s for s in group if id(s) in needs), key=lambda s: needs[id(s)])
+            while pending:
+                share = remaining // len(pending)
+                section = pending[0]
+                if needs[id(section)] <= share:
+                    allocations[id(section)] = sizes[id(section)]
+                    remaining -= needs[id(section)]
+                    pending.pop(0)
+                    continue
+                for section in pending:
+                    allowance = share - separator_tokens
+                    if section.truncatable and allowance - marker_tokens >= max(section.min_tokens, 1):
+                        allocations[id(section)] = allowance
+                        remaining -= share
+                    else:
+                        allocations[id(section)] = 0
+                pending = []
+
+        packed_sections: Dict[str, str] = {}
+        decisions: List[PackingDecision] = []
+        used = 0
+        for section in sections:
+            original = sizes[id(section)]
+            allowance = allocations.get(id(section), 0)
+            if original and allowance >= original:
+                text, action, tokens = section.text, "kept", original
+            elif original and allowance > 0:
+                text = self.tokenizer.truncate(section.text, allowance - marker_tokens) + TRUNCATION_MARKER
+                action, tokens = "truncated", self.count(text)
+            else:
+                text, action, tokens = "", ("dropped" if original else "kept"), 0
+
+            packed_sections[section.name] = text
+            decisions.append(PackingDecision(
+                name=section.name,
+                priority=section.priority,
+                original_tokens=original,
+                packed_tokens=tokens,
+                action=action
+            ))
+            if tokens:
+                used += tokens + separator_tokens
+
+        packed = PackedContext(
+            sections=packed_sections,
+            decisions=decisions,
+            budget_tokens=budget,
+            used_tokens=used,
+            separator=separator,
+            exact=self.tokenizer.exact,
+            order=[section.name for section in sections]
+        )
+
+        cut = [d for d in decisions if d.action != "kept"]
+        log = logger.info if cut else logger.debug
+        log(
+            "Context packed",
+            model=self.model,
+            budget_tokens=budget,
+            used_tokens=used,
+            sections=len(sections),
+            truncated=[d.name for d in cut if d.action == "truncated"],
+            dropped=[d.name for d in cut if d.action == "dropped"]
+        )
+        return packed
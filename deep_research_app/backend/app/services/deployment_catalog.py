@@ -0,0 +1,237 @@
+"""
+Deployment Catalog
+
+Process-wide cache of the Azure OpenAI deployment list. Listing deployments is
+an ARM management-plane call, so the catalog is fetched once, served from
+memory, and refreshed in the background when it goes stale. A failed refresh
+(throttling, transient ARM errors) keeps serving the last good catalog and is
+retried after a short delay instead of on every request.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from .azure_openai_deployment_service import get_deployment_service
+from .model_config_service import ModelConfigService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 600
+RETRY_AFTER_ERROR_SECONDS = 30
+
+
+def _account_name_from_endpoint(endpoint: str) -> str:
+    """Extract the account name from an https://<account>.openai.azure.com endpoint."""
+    return endpoint.split("//")[1].split(".")[0] if "//" in endpoint else ""
+
+
+class DeploymentCatalog:
+    """
+    Cached deployment summary and the ModelConfigService built from it.
+
+    Readers never wait on ARM once the first fetch has completed: stale entries
+    are returned immediately while a single background task refreshes them.
+    """
+
+    def __init__(
+        self,
+        subscription_id: Optional[str],
+        resource_group: Optional[str],
+        account_name: Optional[str],
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        retry_after_error_seconds: int = RETRY_AFTER_ERROR_SECONDS
+    ):
+        """
+        Initialize the catalog.
+
+        Args:
+            subscription_id: Azure subscription ID
+            resource_group: Resource group of the Azure OpenAI account
+            account_name: Azure OpenAI account name
+            ttl_seconds: Age after which the catalog is refreshed in the background
+            retry_after_error_seconds: Delay before retrying a failed refresh
+        """
+        self.subscription_id = subscription_id
+        self.resource_group = resource_group
+        self.account_name = account_name
+        self.ttl_seconds = ttl_seconds
+        self.retry_after_error_seconds = retry_after_error_seconds
+
+        self._summary: Optional[Dict[str, Any]] = None
+        self._config_service = ModelConfigService(available_deployments=[])
+        self._fetched_at: Optional[float] = None
+        self._next_attempt_at = 0.0
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._periodic_task: Optional[asyncio.Task] = None
+
+        self.refreshes = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def configured(self) -> bool:
+        """Whether enough Azure configuration exists to list deployments."""
+        return all([self.subscription_id, self.resource_group, self.account_name])
+
+    @property
+    def age_seconds(self) -> Optional[float]:
+        """Seconds since the last successful fetch, or None if never fetched."""
+        if self._fetched_at is None:
+            return None
+        return time.monotonic() - self._fetched_at
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the catalog is missing or older than the TTL."""
+        age = self.age_seconds
+        return age is None or age >= self.ttl_seconds
+
+    def _empty_summary(self) -> Dict[str, Any]:
+        return {
+            "total_deployments": 0,
+            "chat_models": [],
+            "embedding_models": [],
+            "other_models": [],
+            "account_info": {
+                "account_name": self.account_name,
+                "resource_group": self.resource_group,
+                "subscription_id": self.subscription_id
+            }
+        }
+
+    async def _fetch(self) -> bool:
+        """Fetch the deployment list from ARM. Returns True on success."""
+        started = time.perf_counter()
+        try:
+            async with get_deployment_service(
+                self.subscription_id, self.resource_group, self.account_name
+            ) as service:
+                summary = await service.get_deployments_summary(raise_errors=True)
+        except Exception as e:
+            self.failures += 1
+            self.last_error = str(e)
+            self._next_attempt_at = time.monotonic() + self.retry_after_error_seconds
+            logger.warning(
+                f"Deployment catalog refresh failed, serving "
+                f"{'cached' if self._summary else 'empty'} catalog: {e}"
+            )
+            return False
+
+        self._summary = summary
+        self._config_service = ModelConfigService(available_deployments=summary.get("chat_models", []))
+        self._fetched_at = time.monotonic()
+        self._next_attempt_at = 0.0
+        self.refreshes += 1
+        self.last_error = None
+        logger.info(
+            f"Deployment catalog refreshed: {summary.get('total_deployments', 0)} deployments "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+        return True
+
+    def _refresh_in_background(self) -> Optional[asyncio.Task]:
+        """Start a refresh unless one is running or a failed one is backing off."""
+        if not self.configured:
+            return None
+        if self._refresh_task and not self._refresh_task.done():
+            return self._refresh_task
+        if time.monotonic() < self._next_attempt_at:
+            return None
+        self._refresh_task = asyncio.create_task(self._fetch())
+        return self._refresh_task
+
+    async def refresh(self) -> bool:
+        """Refresh now (joining an in-flight refresh). Returns True on success."""
+        task = self._refresh_in_background()
+        if task is None:
+            return False
+        return await asyncio.shield(task)
+
+    async def _ensure_loaded(self):
+        if self._summary is None:
+            # Only the very first request (or one after startup failed) waits on ARM
+            task = self._refresh_in_background()
+            if task is not None:
+                await asyncio.shield(task)
+        elif self.is_stale:
+            self._refresh_in_background()
+
+    async def get_summary(self) -> Dict[str, Any]:
+        """Deployment summary grouped by model type (see get_deployments_summary)."""
+        await self._ensure_loaded()
+        return self._summary or self._empty_summary()
+
+    async def get_chat_models(self) -> List[Dict[str, Any]]:
+        """Chat model deployments."""
+        summary = await self.get_summary()
+        return summary.get("chat_models", [])
+
+    async def get_config_service(self) -> ModelConfigService:
+        """ModelConfigService over the current chat deployments."""
+        await self._ensure_loaded()
+        return self._config_service
+
+    async def _refresh_periodically(self):
+        while True:
+            await asyncio.sleep(self.ttl_seconds)
+            await self.refresh()
+
+    def start(self):
+        """Warm the catalog and keep it fresh in the background."""
+        if not self.configured:
+            logger.warning("Azure deployment config incomplete, deployment catalog disabled")
+            return
+        self._refresh_in_background()
+        if self._periodic_task is None or self._periodic_task.done():
+            self._periodic_task = asyncio.create_task(self._refresh_periodically())
+
+    async def stop(self):
+        """Cancel background refreshes."""
+        for task in (self._periodic_task, self._refresh_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._periodic_task = None
+        self._refresh_task = None
+
+    def status(self) -> Dict[str, Any]:
+        """Catalog freshness for diagnostics."""
+        age = self.age_seconds
+        return {
+            "configured": self.configured,
+            "loaded": self._summary is not None,
+            "age_seconds": round(age, 1) if age is not None else None,
+            "stale": self.is_stale,
+            "ttl_seconds": self.ttl_seconds,
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "last_error": self.last_error
+        }
+
+
+# Singleton instance
+_catalog: Optional[DeploymentCatalog] = None
+
+
+def get_deployment_catalog() -> DeploymentCatalog:
+    """
+    Get the process-wide deployment catalog, configured from the environment.
+
+    Returns:
+        DeploymentCatalog instance
+    """
+    global _catalog
+    if _catalog is None:
+        _catalog = DeploymentCatalog(
+            subscription_id=os.getenv("AZURE_SUBSCRIPTION_ID"),
+            resource_group=os.getenv("AZURE_AI_FOUNDRY_RESOURCE_GROUP"),
+            account_name=_account_name_from_endpoint(os.getenv("AZURE_OPENAI_ENDPOINT", "")),
+            ttl_seconds=int(os.getenv("DEPLOYMENT_CATALOG_TTL_SECONDS", str(DEFAULT_TTL_SECONDS)))
+        )
+    return _catalog
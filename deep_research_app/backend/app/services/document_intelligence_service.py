@@ -5,13 +5,14 @@ Processes uploaded documents (PDF, DOCX, TXT) and extracts content as markdown.
 Uses Azure Document Intelligence for PDF and DOCX, simple text extraction for TXT.
 """
 
+import asyncio
 import aiofiles
 import structlog
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from urllib.parse import urlparse
-from azure.ai.documentintelligence import DocumentIntelligenceClient
+from azure.ai.documentintelligence.aio import DocumentIntelligenceClient
 from azure.ai.documentintelligence.models import DocumentContentFormat
 from azure.core.credentials import AzureKeyCredential
 from azure.storage.blob.aio import BlobServiceClient
@@ -22,9 +23,16 @@ from docx import Document as DocxDocument
 import tempfile
 
 from ..models.file_models import FileType, FileMetadata
+from .extraction_cache import ExtractionCache, make_cache_key
 
 logger = structlog.get_logger(__name__)
 
+# Counting pages downloads the PDF a second time; past these limits the
+# document is analyzed as a single range instead
+PAGE_COUNT_TIMEOUT_SECONDS = 60
+PAGE_COUNT_MAX_BYTES = 200 * 1024 * 1024
+DOWNLOAD_CHUNK_BYTES = 1024 * 1024
+
 
 class DocumentIntelligenceService:
     """
@@ -34,6 +42,11 @@ class DocumentIntelligenceService:
     - PDF: Azure Document Intelligence with markdown output
     - DOCX: python-docx for text extraction
     - TXT: Direct text reading
+    
+    PDF analysis uses the async client, so polling never blocks the event loop.
+    Large PDFs are split into page ranges that are analyzed in parallel (bounded
+    by ``max_concurrent_analyses`` across the whole service) and stitched back
+    together in page order.
     """
     
     def __init__(
@@ -43,7 +56,10 @@ class DocumentIntelligenceService:
         azure_tenant_id: str = None,
         azure_client_id: str = None,
         azure_client_secret: str = None,
-        azure_blob_storage_name: str = None
+        azure_blob_storage_name: str = None,
+        cache_directory: Optional[str] = None,
+        max_concurrent_analyses: int = 4,
+        pages_per_range: int = 50
     ):
         """Initialize Document Intelligence service."""
         self.endpoint = endpoint
@@ -55,12 +71,19 @@ class DocumentIntelligenceService:
         self.azure_client_secret = azure_client_secret
         self.azure_blob_storage_name = azure_blob_storage_name
         
-        # Create Document Intelligence client
+        # Create async Document Intelligence client
         self.client = DocumentIntelligenceClient(
             endpoint=endpoint,
             credential=AzureKeyCredential(key)
         )
         
+        # Bound concurrent layout analyses (page ranges count individually)
+        self.pages_per_range = pages_per_range
+        self._analysis_slots = asyncio.Semaphore(max_concurrent_analyses)
+        
+        # Content-addressed cache of extracted markdown (shared across sessions/users)
+        self.extraction_cache = ExtractionCache(cache_directory) if cache_directory else None
+        
         logger.info("Document Intelligence service initialized")
     
     async def process_document(
@@ -83,15 +106,31 @@ class DocumentIntelligenceService:
             filename=file_metadata.filename
         )
         
+        content_sha256 = (file_metadata.metadata or {}).get("sha256")
+        cache_key = None
+        if self.extraction_cache is not None and content_sha256:
+            cache_key = make_cache_key(
+                content_sha256,
+                file_metadata.file_type.value,
+                self._processing_params(file_metadata.file_type)
+            )
+            cached = await self.extraction_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
             if file_metadata.file_type == FileType.PDF:
-                return await self._process_pdf(file_metadata)
+                result = await self._process_pdf(file_metadata)
             elif file_metadata.file_type == FileType.DOCX:
-                return await self._process_docx(file_metadata)
+                result = await self._process_docx(file_metadata)
             elif file_metadata.file_type == FileType.TXT:
-                return await self._process_txt(file_metadata)
+                result = await self._process_txt(file_metadata)
             else:
                 raise ValueError(f"Unsupported file type: {file_metadata.file_type}")
+            
+            if cache_key is not None:
+                await self.extraction_cache.put(cache_key, result)
+            return result
                 
         except Exception as e:
             logger.error(
@@ -101,6 +140,19 @@ class DocumentIntelligenceService:
             )
             raise
     
+    def _processing_params(self, file_type: FileType) -> Dict[str, Any]:
+        """Parameters that affect extraction output and therefore the cache key."""
+        if file_type == FileType.PDF:
+            # Ranges are analyzed separately and stitched, so their size shapes the markdown
+            return {
+                "model": "prebuilt-layout",
+                "output_format": "markdown",
+                "pages_per_range": self.pages_per_range,
+            }
+        if file_type == FileType.DOCX:
+            return {"extractor": "python-docx"}
+        return {"extractor": "plain-text"}
+    
     async def _process_pdf(self, file_metadata: FileMetadata) -> Dict[str, Any]:
         """
         Process PDF using Azure Document Intelligence.
@@ -133,27 +185,35 @@ class DocumentIntelligenceService:
                 
                 logger.info("Analyzing PDF from URL", file_id=file_metadata.id)
             
-            # Use Document Intelligence with markdown output format
-            poller = self.client.begin_analyze_document(
-                model_id="prebuilt-layout",
-                body=analyze_request,
-                output_content_format=DocumentContentFormat.MARKDOWN
-            )
+            page_ranges = await self._plan_page_ranges(analyze_request["urlSource"])
+            if len(page_ranges) > 1:
+                logger.info(
+                    "Analyzing PDF in parallel page ranges",
+                    file_id=file_metadata.id,
+                    range_count=len(page_ranges)
+                )
             
-            result = poller.result()
+            results = await asyncio.gather(*(
+                self._analyze_layout(analyze_request, pages)
+                for pages in page_ranges
+            ))
             
-            # Extract markdown content
-            markdown_content = result.content or ""
+            # Stitch range results back together in page order
+            markdown_content = "\n\n<!-- PageBreak -->\n\n".join(
+                result.content for result in results if result.content
+            )
             
             # Extract metadata
             metadata = {
-                "page_count": len(result.pages) if result.pages else 0,
+                "page_count": sum(len(result.pages or []) for result in results),
                 "word_count": len(markdown_content.split()),
-                "has_tables": bool(result.tables),
-                "table_count": len(result.tables) if result.tables else 0,
-                "has_figures": bool(result.figures),
-                "figure_count": len(result.figures) if result.figures else 0
+                "has_tables": any(result.tables for result in results),
+                "table_count": sum(len(result.tables or []) for result in results),
+                "has_figures": any(result.figures for result in results),
+                "figure_count": sum(len(result.figures or []) for result in results)
             }
+            if len(page_ranges) > 1:
+                metadata["page_ranges"] = len(page_ranges)
             
             logger.info(
                 "PDF processing completed",
@@ -171,6 +231,80 @@ class DocumentIntelligenceService:
             logger.error("PDF processing failed", error=str(e), file_id=file_metadata.id)
             raise
     
+    async def _analyze_layout(self, analyze_request: Dict[str, Any], pages: Optional[str]):
+        """Run one layout analysis, waiting for a free analysis slot first."""
+        async with self._analysis_slots:
+            poller = await self.client.begin_analyze_document(
+                model_id="prebuilt-layout",
+                body=analyze_request,
+                pages=pages,
+                output_content_format=DocumentContentFormat.MARKDOWN
+            )
+            return await poller.result()
+    
+    async def _plan_page_ranges(self, source_url: str) -> List[Optional[str]]:
+        """
+        Split a PDF into page ranges of ``pages_per_range`` pages.
+        
+        Returns ``[None]`` (analyze the whole document at once) when the page
+        count cannot be determined or the document fits in a single range.
+        """
+        page_count = await self._count_pdf_pages(source_url)
+        if not page_count or page_count <= self.pages_per_range:
+            return [None]
+        
+        return [
+            f"{start}-{min(start + self.pages_per_range - 1, page_count)}"
+            for start in range(1, page_count + 1, self.pages_per_range)
+        ]
+    
+    async def _count_pdf_pages(self, source_url: str) -> Optional[int]:
+        """
+        Stream the PDF to a temporary file and count its pages (off the event loop).
+        
+        The download is bounded by PAGE_COUNT_TIMEOUT_SECONDS and
+        PAGE_COUNT_MAX_BYTES, and is never held in memory as a whole.
+        """
+        try:
+            from pypdf import PdfReader
+        except ImportError:
+            return None
+        
+        tmp_path = None
+        try:
+            timeout = aiohttp.ClientTimeout(total=PAGE_COUNT_TIMEOUT_SECONDS)
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                async with session.get(source_url) as response:
+                    if response.status != 200:
+                        return None
+                    if (response.content_length or 0) > PAGE_COUNT_MAX_BYTES:
+                        logger.info("PDF too large to count pages, analyzing as one range",
+                                    size=response.content_length)
+                        return None
+                    
+                    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
+                        tmp_path = tmp_file.name
+                    size = 0
+                    async with aiofiles.open(tmp_path, "wb") as tmp_file:
+                        async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_BYTES):
+                            size += len(chunk)
+                            if size > PAGE_COUNT_MAX_BYTES:
+                                logger.info("PDF too large to count pages, analyzing as one range")
+                                return None
+                            await tmp_file.write(chunk)
+            
+            return await asyncio.to_thread(lambda: len(PdfReader(tmp_path).pages))
+        except Exception as e:
+            logger.warning("Could not count PDF pages, analyzing as one range", error=str(e))
+            return None
+        finally:
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+    
+    async def close(self):
+        """Close the Document Intelligence client."""
+        await self.client.close()
+    
     async def _generate_sas_url(self, blob_url: str) -> str:
         """
         Generate a SAS token for a blob URL.
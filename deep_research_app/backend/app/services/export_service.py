@@ -8,10 +8,13 @@ This service handles exporting research reports to various formats:
 
 import os
 import asyncio
+import hashlib
+import json
 import tempfile
+import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Awaitable, Callable, Dict, Any, Optional
 import structlog
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -20,8 +23,38 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
 from reportlab.lib.colors import HexColor
 import markdown
 
+from .export_workers import get_export_pool
+
 logger = structlog.get_logger(__name__)
 
+# Bump when report layout changes, so exports cached on disk are re-rendered
+EXPORT_VERSION = 1
+
+
+def make_export_key(export_format: str, report_content: str, title: str, **options: Any) -> str:
+    """Hash everything an export is rendered from.
+    
+    Exports are stored under this key, so downloading an unchanged report
+    again costs no rendering.
+    """
+    material = json.dumps(
+        {
+            "version": EXPORT_VERSION,
+            "format": export_format,
+            "title": title,
+            "options": options,
+            "content_sha256": hashlib.sha256(report_content.encode("utf-8")).hexdigest(),
+        },
+        sort_keys=True,
+        separators=(",", ":")
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _write_text(file_path: str, content: str) -> None:
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
 
 class ExportService:
     """Service for exporting research reports to various formats."""
@@ -34,8 +67,49 @@ class ExportService:
         """
         self.export_dir = export_dir or Path(tempfile.gettempdir()) / "deep_research_exports"
         self.export_dir.mkdir(parents=True, exist_ok=True)
+        # Exports being rendered, by filename, so concurrent requests share one render
+        self._rendering: Dict[str, asyncio.Future] = {}
         logger.info("Export service initialized", export_dir=str(self.export_dir))
     
+    async def _write_export(
+        self,
+        export_key: str,
+        extension: str,
+        render: Callable[[str], Awaitable[Any]]
+    ) -> str:
+        """Return the export file for ``export_key``, rendering it if it doesn't exist yet.
+        
+        Args:
+            export_key: Key from make_export_key
+            extension: File extension
+            render: Writes the file to the temporary path it is given, which is
+                renamed into place only once complete
+            
+        Returns:
+            Path to the export file
+        """
+        file_path = self.export_dir / f"report_{export_key[:24]}.{extension}"
+        if file_path.exists():
+            logger.info("Serving cached export", file_path=str(file_path))
+            return str(file_path)
+        
+        pending = self._rendering.get(file_path.name)
+        if pending is None:
+            pending = asyncio.ensure_future(self._render_file(file_path, render))
+            self._rendering[file_path.name] = pending
+            pending.add_done_callback(lambda _: self._rendering.pop(file_path.name, None))
+        # A client going away must not abort a render other requests wait on
+        await asyncio.shield(pending)
+        return str(file_path)
+    
+    async def _render_file(self, file_path: Path, render: Callable[[str], Awaitable[Any]]) -> None:
+        tmp_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            await render(str(tmp_path))
+            os.replace(tmp_path, file_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+    
     async def export_markdown(
         self,
         report_content: str,
@@ -70,11 +144,13 @@ class ExportService:
             
             markdown_content = "\n".join(lines)
             
-            # Save to file
-            file_path = self.export_dir / f"report_{export_id}.md"
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            # Save to file (unchanged reports are served from the existing file)
+            export_key = make_export_key("markdown", report_content, title, include_metadata=include_metadata)
+            file_path = await self._write_export(
+                export_key,
+                "md",
+                lambda tmp_path: get_export_pool().run(_write_text, tmp_path, markdown_content)
+            )
             
             logger.info("Markdown export completed", export_id=export_id, file_path=str(file_path))
             return str(file_path)
@@ -104,12 +180,14 @@ class ExportService:
         try:
             logger.info("Exporting report as PDF", export_id=export_id, title=title)
             
-            file_path = self.export_dir / f"report_{export_id}.pdf"
-            
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self._generate_pdf_with_reportlab(
-                    report_content, title, str(file_path), include_metadata
+            # ReportLab layout is CPU-bound; it runs in an export worker process
+            export_key = make_export_key("pdf", report_content, title, include_metadata=include_metadata)
+            file_path = await self._write_export(
+                export_key,
+                "pdf",
+                lambda tmp_path: get_export_pool().run_in_process(
+                    ExportService._generate_pdf_with_reportlab,
+                    report_content, title, tmp_path, include_metadata
                 )
             )
             
@@ -143,14 +221,22 @@ class ExportService:
         try:
             logger.info("Exporting report as HTML", export_id=export_id, title=title)
             
-            file_path = self.export_dir / f"report_{export_id}.html"
-            
-            html_content = await self._generate_html_content(
-                report_content, title, include_metadata, custom_css
+            export_key = make_export_key(
+                "html", report_content, title,
+                include_metadata=include_metadata, custom_css=custom_css
             )
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            def render(tmp_path: str) -> None:
+                html_content = self._generate_html_content(
+                    report_content, title, include_metadata, custom_css
+                )
+                _write_text(tmp_path, html_content)
+            
+            file_path = await self._write_export(
+                export_key,
+                "html",
+                lambda tmp_path: get_export_pool().run(render, tmp_path)
+            )
             
             logger.info("HTML export completed", export_id=export_id, file_path=str(file_path))
             return str(file_path)
@@ -159,14 +245,14 @@ class ExportService:
             logger.error("HTML export failed", export_id=export_id, error=str(e), exc_info=True)
             raise
     
+    @staticmethod
     def _generate_pdf_with_reportlab(
-        self,
         report_content: str,
         title: str,
         file_path: str,
         include_metadata: bool
     ) -> None:
-        """Generate PDF using ReportLab from Markdown content."""
+        """Generate PDF using ReportLab from Markdown content (runs in an export worker process)."""
         from reportlab.platypus import Table, TableStyle
         from reportlab.lib import colors
         import re
@@ -234,14 +320,7 @@ class ExportService:
             story.append(Paragraph(metadata_text, body_style))
             story.append(Spacer(1, 20))
         
-        # Convert markdown to HTML using the markdown library
-        html_content = markdown.markdown(
-            report_content,
-            extensions=['extra', 'codehilite', 'tables', 'fenced_code']
-        )
-        
-        # Parse HTML and convert to ReportLab elements
-        # Split by HTML tags to process sections
+        # Convert Markdown line by line to ReportLab elements
         lines = report_content.split('\n')
         current_paragraph = []
         in_list = False
@@ -363,7 +442,7 @@ class ExportService:
         # Build PDF
         doc.build(story)
     
-    async def _generate_html_content(
+    def _generate_html_content(
         self,
         report_content: str,
         title: str,
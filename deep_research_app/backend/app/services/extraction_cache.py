@@ -0,0 +1,122 @@
+"""
+Extraction Cache - Deep Research Application
+
+Content-addressed cache for document extraction results (markdown). Keys
+combine the SHA-256 of the uploaded bytes with the processing parameters, so
+the same 10-K or report uploaded in any session by any user is extracted
+once. Entries live in a small in-memory LRU in front of a directory of JSON
+files.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Bump when the shape of cached results changes
+CACHE_VERSION = 1
+
+
+def make_cache_key(content_sha256: str, kind: str, params: Dict[str, Any]) -> str:
+    """Derive the cache key from content hash, file kind and processing parameters."""
+    material = json.dumps(
+        {
+            "version": CACHE_VERSION,
+            "content_sha256": content_sha256,
+            "kind": kind,
+            "params": params,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ExtractionCache:
+    """
+    Two-tier (memory + disk) cache of extraction results keyed by content.
+
+    Disk entries are written atomically (temp file + rename), so concurrent
+    workers sharing the directory never observe partial JSON.
+    """
+
+    def __init__(self, directory: str, memory_entries: int = 64):
+        """Initialize the cache."""
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.memory_entries = memory_entries
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        # Fan out over sub-directories to keep directory listings small
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _remember(self, key: str, value: Dict[str, Any]):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _read(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Ignoring unreadable extraction cache entry", path=str(path), error=str(e))
+            return None
+
+    def _write(self, path: Path, value: Dict[str, Any]):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(value, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached result, or None."""
+        value = self._memory.get(key)
+        if value is None:
+            value = await asyncio.to_thread(self._read, self._path(key))
+            if value is not None:
+                self._remember(key, value)
+        else:
+            self._memory.move_to_end(key)
+
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        logger.info("Extraction cache hit", key=key[:16])
+        # Callers personalise the result (file/session ids); never hand out the shared copy
+        return json.loads(json.dumps(value))
+
+    async def put(self, key: str, value: Dict[str, Any]):
+        """Store a result."""
+        self._remember(key, value)
+        try:
+            await asyncio.to_thread(self._write, self._path(key), value)
+        except OSError as e:
+            logger.warning("Failed to persist extraction cache entry", key=key[:16], error=str(e))
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for diagnostics."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "memory_entries": len(self._memory),
+        }
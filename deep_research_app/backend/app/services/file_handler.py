@@ -18,6 +18,7 @@ from azure.identity.aio import ClientSecretCredential
 from datetime import datetime
 
 from ..models.file_models import FileMetadata, FileType, ProcessingStatus
+from .blob_upload import DEFAULT_BLOCK_SIZE, stream_upload
 
 logger = structlog.get_logger(__name__)
 
@@ -41,7 +42,9 @@ class FileHandler:
         azure_blob_storage_name: str,
         azure_storage_container: str = "research-documents",
         upload_directory: str = "uploads",
-        data_directory: str = "data"
+        data_directory: str = "data",
+        upload_block_size: int = DEFAULT_BLOCK_SIZE,
+        upload_max_concurrency: int = 4
     ):
         """Initialize file handler."""
         # Azure AD credential
@@ -74,6 +77,10 @@ class FileHandler:
         # Max file size (50 MB)
         self.max_upload_size = 50 * 1024 * 1024
         
+        # Streaming upload: staged block size and blocks staged in parallel
+        self.upload_block_size = upload_block_size
+        self.upload_max_concurrency = upload_max_concurrency
+        
         logger.info("File handler initialized", container=self.container_name)
     
     async def initialize(self):
@@ -146,15 +153,6 @@ class FileHandler:
         )
         
         try:
-            # Read and validate file
-            content = await file.read()
-            file_size = len(content)
-            
-            if file_size > self.max_upload_size:
-                raise ValueError(
-                    f"File size {file_size} exceeds maximum {self.max_upload_size}"
-                )
-            
             # Determine file type
             file_type = self._detect_file_type(file.filename)
             
@@ -162,13 +160,21 @@ class FileHandler:
             file_extension = Path(file.filename).suffix
             blob_name = f"{session_id}/{file_id}{file_extension}"
             
-            # Upload to Azure Blob Storage
+            # Stream to Azure Blob Storage in staged blocks (size checked as bytes arrive)
             blob_client = self.blob_service_client.get_blob_client(
                 container=self.container_name,
                 blob=blob_name
             )
             
-            await blob_client.upload_blob(content, overwrite=True)
+            upload = await stream_upload(
+                blob_client,
+                file,
+                max_size=self.max_upload_size,
+                block_size=self.upload_block_size,
+                max_concurrency=self.upload_max_concurrency,
+                content_type=file.content_type
+            )
+            file_size = upload.size
             
             # Get blob URL
             blob_url = blob_client.url
@@ -189,7 +195,8 @@ class FileHandler:
                 file_size=file_size,
                 mime_type=file.content_type or "application/octet-stream",
                 file_path=blob_url,
-                processing_status=ProcessingStatus.PENDING
+                processing_status=ProcessingStatus.PENDING,
+                metadata={"sha256": upload.sha256}
             )
             
             # Save metadata to local storage
@@ -9,6 +9,8 @@ import aiohttp
 import structlog
 from typing import Dict, List, Optional, Any, Iterable
 
+from .context_budget import ContextBudget, ContextSection
+
 
 def _strip_private_keys(data: Dict[str, Any]) -> Dict[str, Any]:
     """Return a shallow copy without private keys."""
@@ -313,13 +315,23 @@ class TavilySearchService:
             logger.error("Tavily search failed", query=query, error=str(e))
             raise Exception(f"Tavily search failed: {str(e)}")
     
-    def format_context_for_llm(self, sources: List[Source], max_total_chars: int = 240000) -> str:
+    def format_context_for_llm(
+        self,
+        sources: List[Source],
+        max_tokens: int = 60000,
+        model: Optional[str] = None
+    ) -> str:
         """
-        Format search results as context for LLM processing with content length limits
+        Format search results as context for LLM processing within a token budget
+        
+        Sources share the budget fairly: short sources are kept whole and the
+        remaining tokens are split among the longer ones, which are cut at a
+        line or sentence boundary. Citation headers are never cut.
         
         Args:
             sources: List of search result sources
-            max_total_chars: Maximum total characters for all content combined
+            max_tokens: Token budget for all sources combined
+            model: Model/deployment name used to pick the tokenizer
             
         Returns:
             Formatted context string with citations, truncated if necessary
@@ -327,50 +339,32 @@ class TavilySearchService:
         if not sources:
             return "No search results available."
         
+        budget = ContextBudget(model)
+        headers = [f"[{idx}] {source.title}\nURL: {source.url}" for idx, source in enumerate(sources, 1)]
+        header_tokens = sum(budget.count(header) + 2 for header in headers)
+        
+        packed = budget.pack(
+            [
+                ContextSection(name=str(idx), text=source.content, priority=10)
+                for idx, source in enumerate(sources, 1)
+            ],
+            budget_tokens=max(0, max_tokens - header_tokens),
+            separator="\n"
+        )
+        
         context_parts = []
-        total_chars = 0
-        max_chars_per_source = max_total_chars // max(len(sources), 1)  # Distribute evenly
+        for idx, header in enumerate(headers, 1):
+            content = packed.get(str(idx))
+            if content:
+                context_parts.append(f"{header}\n{content}\n")
         
-        for idx, source in enumerate(sources, 1):
-            # Calculate remaining space
-            remaining_chars = max_total_chars - total_chars
-            if remaining_chars <= 0:
-                logger.warning(
-                    "Context truncated - reached maximum character limit",
-                    sources_processed=idx-1,
-                    total_sources=len(sources),
-                    total_chars=total_chars
-                )
-                break
-            
-            # Limit this source's content to available space or per-source limit
-            source_char_limit = min(max_chars_per_source, remaining_chars - 100)  # Reserve space for metadata
-            
-            # Truncate content if necessary
-            content = source.content
-            if len(content) > source_char_limit:
-                # Try to truncate at sentence boundary
-                truncated = content[:source_char_limit]
-                last_period = truncated.rfind('.')
-                last_newline = truncated.rfind('\n')
-                last_boundary = max(last_period, last_newline)
-                
-                if last_boundary > source_char_limit * 0.7:  # Only if we don't lose too much
-                    content = truncated[:last_boundary + 1]
-                else:
-                    content = truncated + "..."
-                
-                logger.debug(
-                    "Source content truncated",
-                    source_index=idx,
-                    original_length=len(source.content),
-                    truncated_length=len(content)
-                )
-            
-            # Format with citation number
-            source_text = f"[{idx}] {source.title}\nURL: {source.url}\n{content}\n"
-            context_parts.append(source_text)
-            total_chars += len(source_text)
+        if packed.dropped:
+            logger.warning(
+                "Context budget exhausted - sources omitted",
+                dropped_sources=packed.dropped,
+                total_sources=len(sources),
+                budget_tokens=max_tokens
+            )
         
         return "\n".join(context_parts)
     
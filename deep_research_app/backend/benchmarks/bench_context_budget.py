@@ -0,0 +1,110 @@
+"""
+Context Packing Benchmark
+
+Packs synthetic search results into a token budget with ContextBudget and
+compares the outcome with the old fixed character cut: packing time, tokens
+actually sent and how far each approach lands from the budget.
+
+Usage (from deep_research_app/backend):
+    python -m benchmarks.bench_context_budget
+    python -m benchmarks.bench_context_budget --sources 50 --budget 30000 --model gpt-4o
+
+Token counts are exact when tiktoken is installed and estimated otherwise.
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from app.services.context_budget import ContextBudget, ContextSection
+
+WORDS = (
+    "market revenue growth analysis regulation model data report quarter "
+    "energy storage battery supply chain policy research evidence trend "
+    "2024 2025 42% $1.3B Q3 EBITDA API GPU latency throughput"
+).split()
+
+
+def make_sources(count: int, seed: int) -> list:
+    """Synthetic source texts with a long-tailed size distribution."""
+    rng = random.Random(seed)
+    sources = []
+    for _ in range(count):
+        words = int(rng.paretovariate(1.2) * 300)
+        sentences = []
+        while words > 0:
+            length = min(words, rng.randint(8, 25))
+            sentences.append(" ".join(rng.choice(WORDS) for _ in range(length)).capitalize() + ".")
+            words -= length
+        sources.append(" ".join(sentences))
+    return sources
+
+
+def char_cut(sources: list, max_total_chars: int) -> str:
+    """The previous behaviour: append sources until a character limit."""
+    parts = []
+    total = 0
+    for text in sources:
+        if total + len(text) > max_total_chars:
+            remaining = max_total_chars - total
+            if remaining > 500:
+                parts.append(text[:remaining] + "...")
+            break
+        parts.append(text)
+        total += len(text)
+    return "\n".join(parts)
+
+
+def time_call(fn, repeat: int) -> list:
+    """Wall time of each call in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sources", type=int, default=25, help="Number of synthetic sources")
+    parser.add_argument("--budget", type=int, default=60000, help="Token budget for all sources")
+    parser.add_argument("--model", default="gpt-4o", help="Model used to pick the tokenizer")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed iterations per approach")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    budget = ContextBudget(args.model)
+    sources = make_sources(args.sources, args.seed)
+    sections = [ContextSection(name=str(i), text=text, priority=10) for i, text in enumerate(sources)]
+    total_tokens = sum(budget.count(text) for text in sources)
+
+    # Four characters per token was the assumption behind the old limits
+    packed = budget.pack(sections, budget_tokens=args.budget, separator="\n")
+    cut = char_cut(sources, args.budget * 4)
+    pack_ms = time_call(lambda: budget.pack(sections, budget_tokens=args.budget, separator="\n"), args.repeat)
+    cut_ms = time_call(lambda: char_cut(sources, args.budget * 4), args.repeat)
+
+    cut_tokens = budget.count(cut)
+    kept_by_cut = sum(1 for text in sources if text in cut)
+
+    print(
+        f"{args.sources} sources, {total_tokens} tokens total, budget {args.budget} "
+        f"({'tiktoken' if budget.tokenizer.exact else 'estimated'} counts)"
+    )
+    print(f"\n{'approach':<12}{'p50 ms':>10}{'max ms':>10}{'tokens':>10}{'vs budget':>12}{'whole':>8}{'cut':>6}{'lost':>6}")
+    rows = [
+        ("char cut", cut_ms, cut_tokens, kept_by_cut, 1 if cut.endswith("...") else 0),
+        ("pack", pack_ms, packed.used_tokens, len([d for d in packed.decisions if d.action == "kept"]), len(packed.truncated)),
+    ]
+    for name, timings, tokens, whole, truncated in rows:
+        lost = args.sources - whole - truncated
+        print(
+            f"{name:<12}{statistics.median(timings):>10.2f}{max(timings):>10.2f}{tokens:>10}"
+            f"{tokens - args.budget:>+12}{whole:>8}{truncated:>6}{lost:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
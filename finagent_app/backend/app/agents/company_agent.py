@@ -14,6 +14,8 @@ import json
 # Microsoft Agent Framework imports
 from agent_framework import BaseAgent, ChatMessage, Role, TextContent, AgentRunResponse, AgentRunResponseUpdate, AgentThread
 
+from .streaming import complete, emit, stream_run
+
 # Import data providers
 import sys
 from pathlib import Path
@@ -157,7 +159,15 @@ Be data-driven, factual, and provide actionable insights. Always cite your data
         # Execute with Azure OpenAI
         try:
             logger.info(f"CompanyAgent calling LLM for {ticker}")
+            heading = f"## Company Analysis for {ticker}\n\n"
+            footer = """
+
+---
+*Analysis provided by CompanyAgent using market data APIs and financial databases*
+"""
+            emit(heading)
             response = await self._execute_llm(prompt)
+            emit(footer)
             
             logger.info(
                 f"CompanyAgent LLM response received",
@@ -165,13 +175,7 @@ Be data-driven, factual, and provide actionable insights. Always cite your data
                 response_length=len(response) if response else 0
             )
             
-            result_text = f"""## Company Analysis for {ticker}
-
-{response}
-
----
-*Analysis provided by CompanyAgent using market data APIs and financial databases*
-"""
+            result_text = f"{heading}{response}{footer}"
             
             # Track artifacts
             artifacts = context.get("artifacts", [])
@@ -379,9 +383,10 @@ Include specific numbers and dates where available."""
         
         logger.info("Calling Azure OpenAI", model=self.model, prompt_length=len(prompt))
         
-        response = await self.azure_client.chat.completions.create(
-            model=self.model,
-            messages=[
+        text = await complete(
+            self.azure_client,
+            self.model,
+            [
                 {"role": "system", "content": self.system_prompt},
                 {"role": "user", "content": prompt}
             ],
@@ -394,10 +399,10 @@ Include specific numbers and dates where available."""
             "Azure OpenAI response received",
             model=self.model,
             duration_seconds=round(duration, 2),
-            response_tokens=len(response.choices[0].message.content) if response.choices else 0
+            response_tokens=len(text) if text else 0
         )
         
-        return response.choices[0].message.content
+        return text
     
     def _extract_task(self, messages) -> str:
         """Extract task from messages."""
@@ -437,19 +442,11 @@ Include specific numbers and dates where available."""
         Yields:
             AgentRunResponseUpdate objects containing chunks of the response
         """
-        # For now, implement non-streaming version by yielding complete response
-        # Future: Implement true streaming with Azure OpenAI streaming API
-        response = await self.run(messages, thread=thread, **kwargs)
-        
-        # Yield the complete response as a single update
-        for message in response.messages:
-            if message.contents:
-                for content in message.contents:
-                    if isinstance(content, TextContent):
-                        yield AgentRunResponseUpdate(
-                            contents=[content],
-                            role=Role.ASSISTANT
-                        )
+        async for update in stream_run(
+            lambda: self.run(messages, thread=thread, **kwargs),
+            author_name=self.name
+        ):
+            yield update
     
     async def process(self, task: str, context: Dict[str, Any] = None) -> str:
         """Legacy method for YAML-based workflow compatibility."""
@@ -13,6 +13,8 @@ import structlog
 # Microsoft Agent Framework imports
 from agent_framework import BaseAgent, ChatMessage, Role, TextContent, AgentRunResponse, AgentRunResponseUpdate, AgentThread
 
+from .streaming import complete, emit, stream_run
+
 # Import data providers
 import sys
 from pathlib import Path
@@ -139,7 +141,15 @@ Be quantitative, use specific numbers, and highlight trends and anomalies."""
         
         try:
             logger.info(f"FundamentalsAgent calling LLM for {ticker}")
+            heading = f"## Fundamental Analysis for {ticker}\n\n"
+            footer = """
+
+---
+*Fundamental analysis by FundamentalsAgent based on real financial statements and ratios*
+"""
+            emit(heading)
             response = await self._execute_llm(prompt)
+            emit(footer)
             
             logger.info(
                 f"FundamentalsAgent LLM response received",
@@ -147,13 +157,7 @@ Be quantitative, use specific numbers, and highlight trends and anomalies."""
                 response_length=len(response) if response else 0
             )
             
-            result_text = f"""## Fundamental Analysis for {ticker}
-
-{response}
-
----
-*Fundamental analysis by FundamentalsAgent based on real financial statements and ratios*
-"""
+            result_text = f"{heading}{response}{footer}"
             
             # Track artifacts
             artifacts = context.get("artifacts", [])
@@ -378,9 +382,10 @@ Be specific with numbers from the data above. Identify trends, anomalies, and pr
         if not self.azure_client:
             return f"[Simulated Fundamental Analysis]\n{prompt}"
         
-        response = await self.azure_client.chat.completions.create(
-            model=self.model,
-            messages=[
+        text = await complete(
+            self.azure_client,
+            self.model,
+            [
                 {"role": "system", "content": self.system_prompt},
                 {"role": "user", "content": prompt}
             ],
@@ -388,7 +393,7 @@ Be specific with numbers from the data above. Identify trends, anomalies, and pr
             max_tokens=3000
         )
         
-        return response.choices[0].message.content
+        return text
     
     def _create_response(self, text: str) -> AgentRunResponse:
         """Create agent response following MAF pattern."""
@@ -396,12 +401,11 @@ Be specific with numbers from the data above. Identify trends, anomalies, and pr
     
     async def run_stream(self, messages: str | ChatMessage | list[str] | list[ChatMessage] | None = None, *, thread: AgentThread | None = None, **kwargs: Any) -> AsyncIterable[AgentRunResponseUpdate]:
         """Execute and yield streaming response (MAF required method)."""
-        response = await self.run(messages, thread=thread, **kwargs)
-        for message in response.messages:
-            if message.contents:
-                for content in message.contents:
-                    if isinstance(content, TextContent):
-                        yield AgentRunResponseUpdate(contents=[content], role=Role.ASSISTANT)
+        async for update in stream_run(
+            lambda: self.run(messages, thread=thread, **kwargs),
+            author_name=self.name
+        ):
+            yield update
     
     async def process(self, task: str, context: Dict[str, Any] = None) -> str:
         """Legacy method for YAML workflow compatibility."""
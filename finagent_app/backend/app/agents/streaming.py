@@ -0,0 +1,171 @@
+"""
+Token Streaming
+
+The financial agents build a prompt from fetched data, make one Azure OpenAI
+chat completion and wrap the answer in a heading and footer. ``complete`` makes
+that completion: while a token sink is installed it requests a streamed
+completion and forwards every content delta as it arrives, otherwise it is a
+plain request. ``emit`` forwards the fixed text around the answer, so a stream
+concatenates to exactly the text ``run`` returns.
+
+``stream_run`` installs a sink for the duration of one ``run`` and backs each
+agent's ``run_stream``. Time to first token is measured on model output only,
+for the ``StreamStats`` installed with ``stream_tokens`` or ``track_stream``.
+"""
+
+import asyncio
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence
+
+from agent_framework import AgentRunResponse, AgentRunResponseUpdate, Role, TextContent
+
+TokenSink = Callable[[str], None]
+
+_sink: ContextVar[Optional[TokenSink]] = ContextVar("agent_token_sink", default=None)
+_stats: ContextVar[Optional["StreamStats"]] = ContextVar("agent_stream_stats", default=None)
+
+
+@dataclass
+class StreamStats:
+    """Timing of one streamed agent run."""
+
+    started_at: float = field(default_factory=time.perf_counter)
+    first_token_at: Optional[float] = None
+    chunks: int = 0
+    chars: int = 0
+
+    def record(self, text: str) -> None:
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+        self.chunks += 1
+        self.chars += len(text)
+
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        """Seconds from the start of the run to the first streamed text."""
+        if self.first_token_at is None:
+            return None
+        return self.first_token_at - self.started_at
+
+    def as_metadata(self) -> dict:
+        ttft = self.time_to_first_token
+        return {
+            "time_to_first_token_ms": round(ttft * 1000) if ttft is not None else None,
+            "duration_ms": round((time.perf_counter() - self.started_at) * 1000),
+            "streamed_chunks": self.chunks,
+        }
+
+
+@contextmanager
+def stream_tokens(sink: TokenSink, stats: Optional[StreamStats] = None) -> Iterator[None]:
+    """Forward agent output produced in this task (and tasks it spawns) to ``sink``."""
+    token = _sink.set(sink)
+    stats_token = _stats.set(stats) if stats is not None else None
+    try:
+        yield
+    finally:
+        if stats_token is not None:
+            _stats.reset(stats_token)
+        _sink.reset(token)
+
+
+@contextmanager
+def track_stream(stats: StreamStats) -> Iterator[None]:
+    """Record model output timing into ``stats`` without installing a sink."""
+    token = _stats.set(stats)
+    try:
+        yield
+    finally:
+        _stats.reset(token)
+
+
+def emit(text: str) -> None:
+    """Forward fixed agent output (headings, footers) to the active sink, if any."""
+    sink = _sink.get()
+    if sink is not None and text:
+        sink(text)
+
+
+async def complete(azure_client: Any, model: str, messages: Sequence[Dict[str, str]], **options: Any) -> str:
+    """Run one chat completion, streaming deltas to the active sink when there is one."""
+    sink = _sink.get()
+    if sink is None:
+        response = await azure_client.chat.completions.create(model=model, messages=list(messages), **options)
+        return response.choices[0].message.content
+
+    stats = _stats.get()
+    chunks: List[str] = []
+    stream = await azure_client.chat.completions.create(model=model, messages=list(messages), stream=True, **options)
+    async for chunk in stream:
+        # Azure sends content filter results in chunks without choices
+        if not chunk.choices:
+            continue
+        text = chunk.choices[0].delta.content
+        if text:
+            if stats is not None:
+                stats.record(text)
+            chunks.append(text)
+            sink(text)
+    return "".join(chunks)
+
+
+def _update(text: str, author_name: Optional[str], message_id: str) -> AgentRunResponseUpdate:
+    return AgentRunResponseUpdate(
+        contents=[TextContent(text=text)],
+        role=Role.ASSISTANT,
+        author_name=author_name,
+        message_id=message_id
+    )
+
+
+async def stream_run(
+    run: Callable[[], Awaitable[AgentRunResponse]],
+    author_name: Optional[str] = None
+) -> AsyncIterator[AgentRunResponseUpdate]:
+    """
+    Stream an agent's ``run`` as response updates.
+
+    Output forwarded through ``emit``/``complete`` is yielded as soon as it is
+    produced. If ``run`` finally returns text that does not continue what was
+    streamed (an error reply, a fallback without an LLM call), that text is
+    yielded as a separate message, which supersedes the partial one.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    with stream_tokens(queue.put_nowait):
+        # The task copies the current context, sink included
+        task = asyncio.create_task(run())
+
+    message_id = str(uuid.uuid4())
+    streamed: List[str] = []
+    try:
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+            if getter not in done:
+                getter.cancel()
+                break
+            text = getter.result()
+            streamed.append(text)
+            yield _update(text, author_name, message_id)
+
+        while not queue.empty():
+            text = queue.get_nowait()
+            streamed.append(text)
+            yield _update(text, author_name, message_id)
+
+        response = task.result()
+    finally:
+        if not task.done():
+            task.cancel()
+
+    final = response.messages[-1].text if response.messages else ""
+    sent = "".join(streamed)
+    if final.startswith(sent):
+        if final[len(sent):]:
+            yield _update(final[len(sent):], author_name, message_id)
+    elif final:
+        yield _update(final, author_name, str(uuid.uuid4()))
@@ -12,6 +12,8 @@ import structlog
 # Microsoft Agent Framework imports
 from agent_framework import BaseAgent, ChatMessage, Role, TextContent, AgentRunResponse, AgentRunResponseUpdate, AgentThread
 
+from .streaming import complete, emit, stream_run
+
 # Import data providers
 import sys
 from pathlib import Path
@@ -129,7 +131,15 @@ Be data-driven and explain the reasoning behind signals."""
         
         try:
             logger.info(f"TechnicalsAgent calling LLM for {ticker}")
+            heading = f"## Technical Analysis for {ticker}\n\n"
+            footer = """
+
+---
+*Technical analysis by TechnicalsAgent based on real price data and calculated indicators*
+"""
+            emit(heading)
             response = await self._execute_llm(prompt)
+            emit(footer)
             
             logger.info(
                 f"TechnicalsAgent LLM response received",
@@ -137,13 +147,7 @@ Be data-driven and explain the reasoning behind signals."""
                 response_length=len(response) if response else 0
             )
             
-            result_text = f"""## Technical Analysis for {ticker}
-
-{response}
-
----
-*Technical analysis by TechnicalsAgent based on real price data and calculated indicators*
-"""
+            result_text = f"{heading}{response}{footer}"
             
             # Track artifacts
             artifacts = context.get("artifacts", [])
@@ -401,9 +405,10 @@ Be specific with the actual numbers from the data above. Explain why certain ind
         if not self.azure_client:
             return f"[Simulated Technical Analysis]\n{prompt}"
         
-        response = await self.azure_client.chat.completions.create(
-            model=self.model,
-            messages=[
+        text = await complete(
+            self.azure_client,
+            self.model,
+            [
                 {"role": "system", "content": self.system_prompt},
                 {"role": "user", "content": prompt}
             ],
@@ -411,7 +416,7 @@ Be specific with the actual numbers from the data above. Explain why certain ind
             max_tokens=3000
         )
         
-        return response.choices[0].message.content
+        return text
     
     def _create_response(self, text: str) -> AgentRunResponse:
         """Create agent response following MAF pattern."""
@@ -419,12 +424,11 @@ Be specific with the actual numbers from the data above. Explain why certain ind
     
     async def run_stream(self, messages: str | ChatMessage | list[str] | list[ChatMessage] | None = None, *, thread: AgentThread | None = None, **kwargs: Any) -> AsyncIterable[AgentRunResponseUpdate]:
         """Execute and yield streaming response (MAF required method)."""
-        response = await self.run(messages, thread=thread, **kwargs)
-        for message in response.messages:
-            if message.contents:
-                for content in message.contents:
-                    if isinstance(content, TextContent):
-                        yield AgentRunResponseUpdate(contents=[content], role=Role.ASSISTANT)
+        async for update in stream_run(
+            lambda: self.run(messages, thread=thread, **kwargs),
+            author_name=self.name
+        ):
+            yield update
     
     async def process(self, task: str, context: Dict[str, Any] = None) -> str:
         """Legacy method for YAML workflow compatibility."""
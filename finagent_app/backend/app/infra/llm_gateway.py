@@ -0,0 +1,537 @@
+"""
+LLM Gateway
+
+Process-wide scheduler for Azure OpenAI chat completions. Every agent in the
+app calls the same deployment, so without coordination one user's concurrent
+fan-out exhausts the deployment's quota and everyone gets 429s. Clients
+wrapped with ``gate_openai_client`` (or ``gate_chat_client`` for
+agent-framework chat clients) send every chat completion through one
+``LLMGateway``, which:
+
+- paces requests within the deployment's requests- and tokens-per-minute
+  quotas, charging each request the way Azure does (estimated prompt tokens
+  plus the completion allowance, ``max_tokens``);
+- queues waiting requests per user and serves users in token-fair order, so
+  one user's burst doesn't hold up another user's single request;
+- serves interactive requests before background ones;
+- on a 429 pauses all dispatch for the server's ``retry-after`` and re-queues
+  the request at the front of its user's queue; timeouts, connection errors
+  and 5xx responses are retried with backoff.
+
+The user and priority of a call come from ``llm_request_context``, set around
+a unit of work; tasks spawned inside it inherit them. When the response cache
+is enabled (see ``llm_cache``), gated clients consult it first, so repeated
+requests never queue.
+"""
+
+import asyncio
+import email.utils
+import random
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, Optional, Tuple, TypeVar
+
+import openai
+import structlog
+
+from .llm_cache import LLMResponseCache, get_llm_cache, is_cacheable, make_cache_key
+from .settings import Settings
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_USER = "anonymous"
+
+# Azure reserves max_tokens against the TPM quota up front; requests that
+# don't set it are charged a typical completion
+DEFAULT_COMPLETION_TOKENS = 1000
+
+# Requests reach the service a little after they're admitted, so admissions
+# are kept in the sliding window slightly longer than the service keeps them
+WINDOW_MARGIN_SECONDS = 0.25
+
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+MAX_RETRY_DELAY_SECONDS = 60.0
+
+
+class Priority(IntEnum):
+    """Dispatch classes; lower values are served first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+_request_context: ContextVar[Tuple[str, Priority]] = ContextVar(
+    "llm_request_context", default=(DEFAULT_USER, Priority.INTERACTIVE)
+)
+
+
+@contextmanager
+def llm_request_context(
+    user_id: Optional[str] = None,
+    priority: Priority = Priority.INTERACTIVE
+) -> Iterator[None]:
+    """Attribute LLM calls made in this task (and tasks it spawns) to ``user_id`` at ``priority``."""
+    token = _request_context.set((user_id or DEFAULT_USER, priority))
+    try:
+        yield
+    finally:
+        _request_context.reset(token)
+
+
+def estimate_tokens(messages: Any, max_tokens: Optional[int] = None) -> int:
+    """Tokens a request is charged against TPM: prompt estimate plus completion allowance."""
+    chars = 0
+    for message in messages or []:
+        content = message.get("content") if isinstance(message, dict) else getattr(message, "content", None)
+        if isinstance(content, str):
+            chars += len(content)
+        elif isinstance(content, list):
+            for part in content:
+                if isinstance(part, dict) and isinstance(part.get("text"), str):
+                    chars += len(part["text"])
+    # ~4 characters per token for English text
+    return chars // 4 + (max_tokens or DEFAULT_COMPLETION_TOKENS)
+
+
+def _retry_after(headers: Any) -> Optional[float]:
+    """Server-requested delay from ``retry-after-ms`` / ``retry-after``, in seconds."""
+    try:
+        return float(headers["retry-after-ms"]) / 1000
+    except (KeyError, TypeError, ValueError):
+        pass
+    value = headers.get("retry-after") if headers is not None else None
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp() - time.time()
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_delay(error: BaseException, attempt: int) -> Optional[Tuple[float, bool]]:
+    """
+    Delay before retrying a failed call, and whether the deployment is
+    throttling (so every caller should wait); None if it isn't retryable.
+    """
+    backoff = min(0.5 * 2 ** attempt, 8.0) * random.uniform(0.75, 1.0)
+    if isinstance(error, openai.APIConnectionError):
+        return backoff, False
+    if not isinstance(error, openai.APIStatusError) or error.status_code not in RETRYABLE_STATUS_CODES:
+        return None
+    delay = _retry_after(error.response.headers)
+    if delay is None or delay < 0:
+        delay = backoff
+    return min(delay, MAX_RETRY_DELAY_SECONDS), error.status_code == 429
+
+
+class QuotaLimiter:
+    """
+    Paces use of a per-minute quota; a rate of 0 means unlimited.
+
+    A token bucket holding ``burst_seconds`` of quota spreads admissions out,
+    so one caller's burst can't take a whole window at once, and a log of
+    recent admissions keeps every ``window_seconds`` sliding window within
+    quota, which is how Azure evaluates it.
+    """
+
+    def __init__(self, per_minute: float, window_seconds: float, burst_seconds: float):
+        self.rate = per_minute / 60.0
+        self.window = window_seconds + WINDOW_MARGIN_SECONDS
+        self.limit = self.rate * window_seconds
+        self.capacity = max(self.rate * burst_seconds, 1.0)
+        self.level = self.capacity
+        self.updated = time.monotonic()
+        self._log: Deque[Tuple[float, float]] = deque()
+        self._used = 0.0
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+        while self._log and self._log[0][0] <= now - self.window:
+            self._used -= self._log.popleft()[1]
+
+    def delay(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` can be taken."""
+        if self.rate <= 0:
+            return 0.0
+        self._refill(now)
+        # Larger requests wait for a full bucket (or an empty window) and run into debt
+        bucket_delay = max(0.0, (min(amount, self.capacity) - self.level) / self.rate)
+        excess = self._used + min(amount, self.limit) - self.limit
+        window_delay = 0.0
+        for admitted_at, taken in self._log:
+            if excess <= 0:
+                break
+            excess -= taken
+            window_delay = admitted_at + self.window - now
+        return max(bucket_delay, window_delay)
+
+    def take(self, amount: float, now: float) -> None:
+        if self.rate <= 0:
+            return
+        self._refill(now)
+        self.level -= amount
+        self._log.append((now, amount))
+        self._used += amount
+
+
+@dataclass
+class _Waiter:
+    user_id: str
+    priority: Priority
+    tokens: int
+    future: asyncio.Future
+    enqueued_at: float
+
+
+class LLMGateway:
+    """Admits chat completions under the deployment's quotas, fairly across users."""
+
+    def __init__(
+        self,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        max_concurrent_requests: int = 0,
+        max_retries: int = 4,
+        window_seconds: float = 10.0,
+        burst_seconds: float = 1.0
+    ):
+        """
+        Args:
+            requests_per_minute: Deployment RPM quota (0 = no limit)
+            tokens_per_minute: Deployment TPM quota (0 = no limit)
+            max_concurrent_requests: Cap on requests in flight (0 = no cap)
+            max_retries: Retries per call for 429s and transient failures
+            window_seconds: Sliding window over which the quotas are enforced
+            burst_seconds: Share of quota that may be used at once, in seconds of it
+        """
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_retries = max_retries
+        self._requests = QuotaLimiter(requests_per_minute, window_seconds, burst_seconds)
+        self._tokens = QuotaLimiter(tokens_per_minute, window_seconds, burst_seconds)
+        self._queues: Dict[Priority, Dict[str, Deque[_Waiter]]] = {p: {} for p in Priority}
+        # Start-time fair queuing: tokens granted per user, and the virtual clock per class
+        self._virtual_time: Dict[Priority, Dict[str, float]] = {p: {} for p in Priority}
+        self._clock: Dict[Priority, float] = {p: 0.0 for p in Priority}
+        self._in_flight = 0
+        self._paused_until = 0.0
+        # In-flight cap learned from 429s: halved on each, raised by one per success
+        self._adaptive_limit: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._stats: Dict[str, float] = {
+            "calls": 0,
+            "throttled": 0,
+            "retries": 0,
+            "failed": 0,
+            "queue_wait_seconds": 0.0,
+            "max_queue_wait_seconds": 0.0,
+        }
+
+    async def submit(self, call: Callable[[], Awaitable[T]], estimated_tokens: int) -> T:
+        """Run ``call`` once admitted, retrying throttled and transient failures."""
+        user_id, priority = _request_context.get()
+        self._stats["calls"] += 1
+        attempt = 0
+        while True:
+            await self._acquire(user_id, priority, estimated_tokens, retry=attempt > 0)
+            try:
+                result = await call()
+                self._succeeded()
+                return result
+            except Exception as e:
+                retry = retry_delay(e, attempt)
+                if retry is None or attempt >= self.max_retries:
+                    self._stats["failed"] += 1
+                    raise
+                delay, throttled = retry
+                if throttled:
+                    self._stats["throttled"] += 1
+                    self._throttle(delay)
+                    logger.warning("LLM deployment throttled, pausing dispatch", retry_after=round(delay, 2), user_id=user_id)
+            finally:
+                self._release()
+            self._stats["retries"] += 1
+            attempt += 1
+            if not throttled:
+                await asyncio.sleep(delay)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and current queue depth, for diagnostics."""
+        return {
+            **self._stats,
+            "in_flight": self._in_flight,
+            "concurrency_limit": self._concurrency_limit(),
+            "queued": {
+                priority.name.lower(): sum(len(queue) for queue in self._queues[priority].values())
+                for priority in Priority
+            },
+            "paused_seconds": max(0.0, self._paused_until - time.monotonic()),
+        }
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    async def _acquire(self, user_id: str, priority: Priority, tokens: int, retry: bool) -> None:
+        self._ensure_dispatcher()
+        waiter = _Waiter(user_id, priority, tokens, self._loop.create_future(), time.monotonic())
+        self._enqueue(waiter, front=retry)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted just as the caller went away; hand the slot back
+                self._release()
+            raise
+        waited = time.monotonic() - waiter.enqueued_at
+        self._stats["queue_wait_seconds"] += waited
+        self._stats["max_queue_wait_seconds"] = max(self._stats["max_queue_wait_seconds"], waited)
+
+    def _ensure_dispatcher(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._dispatcher = None
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = loop.create_task(self._dispatch())
+
+    def _enqueue(self, waiter: _Waiter, front: bool) -> None:
+        users = self._queues[waiter.priority]
+        queue = users.get(waiter.user_id)
+        if queue is None:
+            queue = users[waiter.user_id] = deque()
+            # A user returning from idle gets no credit for the idle time
+            virtual_time = self._virtual_time[waiter.priority]
+            virtual_time[waiter.user_id] = max(
+                virtual_time.get(waiter.user_id, 0.0), self._clock[waiter.priority]
+            )
+        if front:
+            queue.appendleft(waiter)
+        else:
+            queue.append(waiter)
+        self._wakeup.set()
+
+    def _next_waiter(self) -> Optional[_Waiter]:
+        """Head of the queue of the user furthest behind, in the most urgent class."""
+        for priority in Priority:
+            users = self._queues[priority]
+            for user_id in list(users):
+                queue = users[user_id]
+                while queue and queue[0].future.done():
+                    queue.popleft()  # caller went away
+                if not queue:
+                    self._forget(priority, user_id)
+            if users:
+                virtual_time = self._virtual_time[priority]
+                return users[min(users, key=virtual_time.__getitem__)][0]
+        return None
+
+    def _forget(self, priority: Priority, user_id: str) -> None:
+        del self._queues[priority][user_id]
+        if self._virtual_time[priority][user_id] <= self._clock[priority]:
+            del self._virtual_time[priority][user_id]
+
+    def _admit(self, waiter: _Waiter, now: float) -> None:
+        self._requests.take(1, now)
+        self._tokens.take(waiter.tokens, now)
+        self._queues[waiter.priority][waiter.user_id].popleft()
+        virtual_time = self._virtual_time[waiter.priority]
+        self._clock[waiter.priority] = virtual_time[waiter.user_id]
+        virtual_time[waiter.user_id] += waiter.tokens
+        if not self._queues[waiter.priority][waiter.user_id]:
+            self._forget(waiter.priority, waiter.user_id)
+        self._in_flight += 1
+        waiter.future.set_result(None)
+
+    async def _dispatch(self) -> None:
+        while True:
+            waiter = self._next_waiter()
+            if waiter is None or (
+                self._concurrency_limit() and self._in_flight >= self._concurrency_limit()
+            ):
+                await self._sleep(None)
+                continue
+            now = time.monotonic()
+            delay = max(
+                self._paused_until - now,
+                self._requests.delay(1, now),
+                self._tokens.delay(waiter.tokens, now)
+            )
+            if delay > 0:
+                # Woken early if something more urgent arrives
+                await self._sleep(delay)
+                continue
+            self._admit(waiter, now)
+
+    async def _sleep(self, timeout: Optional[float]) -> None:
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _concurrency_limit(self) -> int:
+        limits = [limit for limit in (self.max_concurrent_requests, self._adaptive_limit) if limit]
+        return min(limits) if limits else 0
+
+    def _throttle(self, seconds: float) -> None:
+        """Pause dispatch, and resume with half the requests in flight so the backlog doesn't re-trip the limit."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._adaptive_limit = max(1, min(self._in_flight, self._adaptive_limit or self._in_flight) // 2)
+
+    def _succeeded(self) -> None:
+        if self._adaptive_limit is not None:
+            self._adaptive_limit += 1
+            if self.max_concurrent_requests and self._adaptive_limit >= self.max_concurrent_requests:
+                self._adaptive_limit = None
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._wakeup.set()
+
+
+class _GatedCompletions:
+    def __init__(
+        self,
+        completions: Any,
+        endpoint: str,
+        gateway: Optional[LLMGateway],
+        cache: Optional[LLMResponseCache]
+    ):
+        self._completions = completions
+        self._endpoint = endpoint
+        self._gateway = gateway
+        self._cache = cache
+
+    async def create(self, **kwargs: Any) -> Any:
+        if self._cache is not None and is_cacheable(kwargs):
+            key = make_cache_key(self._endpoint, kwargs)
+            return await self._cache.get_or_create(key, lambda: self._create(kwargs))
+        return await self._create(kwargs)
+
+    async def _create(self, kwargs: Dict[str, Any]) -> Any:
+        if self._gateway is None:
+            return await self._completions.create(**kwargs)
+        tokens = estimate_tokens(
+            kwargs.get("messages"),
+            kwargs.get("max_tokens") or kwargs.get("max_completion_tokens")
+        )
+        # Streams are admitted as a whole; a 429 arrives before the first chunk
+        return await self._gateway.submit(lambda: self._completions.create(**kwargs), tokens)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._completions, name)
+
+
+class _GatedChat:
+    def __init__(self, chat: Any, completions: _GatedCompletions):
+        self._chat = chat
+        self.completions = completions
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._chat, name)
+
+
+class GatedOpenAIClient:
+    """
+    ``AsyncOpenAI``/``AsyncAzureOpenAI`` client whose chat completions are
+    answered from the response cache when possible and otherwise go through
+    the gateway. With a gateway the SDK's own retries are off: the gateway
+    retries instead, and a 429 pauses every caller rather than just the one
+    that hit it.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        gateway: Optional[LLMGateway],
+        cache: Optional[LLMResponseCache] = None
+    ):
+        if gateway is not None and hasattr(client, "with_options"):
+            client = client.with_options(max_retries=0)
+        self._client = client
+        completions = _GatedCompletions(
+            client.chat.completions, str(getattr(client, "base_url", "")), gateway, cache
+        )
+        self.chat = _GatedChat(client.chat, completions)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+def gate_openai_client(
+    client: Any,
+    gateway: Optional[LLMGateway] = None,
+    cache: Optional[LLMResponseCache] = None,
+    settings: Optional[Settings] = None
+) -> Any:
+    """
+    Route an OpenAI SDK client's chat completions through the cache and gateway.
+    
+    The process-wide gateway and cache fill in whatever is not passed when
+    ``settings`` is given, or when neither a gateway nor a cache is. A caller
+    that passes its own gateway or cache without settings gets just those.
+    """
+    if client is None or isinstance(client, GatedOpenAIClient):
+        return client
+    if settings is not None or (gateway is None and cache is None):
+        if gateway is None:
+            gateway = get_llm_gateway(settings)
+        if cache is None:
+            cache = get_llm_cache(settings)
+    if gateway is None and cache is None:
+        return client
+    return GatedOpenAIClient(client, gateway, cache)
+
+
+def gate_chat_client(
+    chat_client: Any,
+    gateway: Optional[LLMGateway] = None,
+    cache: Optional[LLMResponseCache] = None,
+    settings: Optional[Settings] = None
+) -> Any:
+    """Route an agent-framework OpenAI chat client's requests through the cache and gateway."""
+    if chat_client is not None and getattr(chat_client, "client", None) is not None:
+        chat_client.client = gate_openai_client(chat_client.client, gateway, cache, settings)
+    return chat_client
+
+
+# Process-wide gateway; resolved once, so a disabled gateway is not re-read from settings
+_gateway: Optional[LLMGateway] = None
+_gateway_resolved = False
+
+
+def get_llm_gateway(settings: Optional[Settings] = None) -> Optional[LLMGateway]:
+    """Get or create the gateway singleton (None when LLM_GATEWAY_ENABLED is off)."""
+    global _gateway, _gateway_resolved
+    if not _gateway_resolved:
+        settings = settings or Settings()
+        _gateway_resolved = True
+        if not settings.llm_gateway_enabled:
+            return None
+        _gateway = LLMGateway(
+            requests_per_minute=settings.llm_requests_per_minute,
+            tokens_per_minute=settings.llm_tokens_per_minute,
+            max_concurrent_requests=settings.llm_max_concurrent_requests,
+            max_retries=settings.llm_max_retries
+        )
+        logger.info(
+            "LLM gateway initialized",
+            requests_per_minute=settings.llm_requests_per_minute,
+            tokens_per_minute=settings.llm_tokens_per_minute,
+            max_concurrent_requests=settings.llm_max_concurrent_requests
+        )
+    return _gateway
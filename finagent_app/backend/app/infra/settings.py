@@ -70,6 +70,9 @@ class Settings(BaseSettings):
     cosmos_db_key: Optional[str] = Field(default=None, alias="COSMOS_DB_KEY")
     cosmos_db_database: str = Field(default="finagent", alias="COSMOS_DB_DATABASE")
     cosmos_db_container: str = Field(default="sessions", alias="COSMOS_DB_CONTAINER")
+    memory_store_backend: str = Field(default="cosmos", alias="MEMORY_STORE_BACKEND")  # cosmos | sqlite
+    sqlite_memory_path: str = Field(default="data/memory_store.db", alias="SQLITE_MEMORY_PATH")
+    memory_store_record_path: Optional[str] = Field(default=None, alias="MEMORY_STORE_RECORD_PATH")
     
     # Application Insights
     applicationinsights_connection_string: Optional[str] = Field(
@@ -106,6 +109,24 @@ class Settings(BaseSettings):
     default_agent_timeout: int = Field(default=300, alias="DEFAULT_AGENT_TIMEOUT")
     enable_agent_telemetry: bool = Field(default=True, alias="ENABLE_AGENT_TELEMETRY")
     
+    # LLM Gateway (deployment quotas shared by all agents; 0 = no limit)
+    llm_gateway_enabled: bool = Field(default=True, alias="LLM_GATEWAY_ENABLED")
+    llm_requests_per_minute: int = Field(default=0, alias="LLM_REQUESTS_PER_MINUTE")
+    llm_tokens_per_minute: int = Field(default=0, alias="LLM_TOKENS_PER_MINUTE")
+    llm_max_concurrent_requests: int = Field(default=0, alias="LLM_MAX_CONCURRENT_REQUESTS")
+    llm_max_retries: int = Field(default=4, alias="LLM_MAX_RETRIES")
+    
+    # LLM Response Cache (exact-match; opt-in)
+    llm_cache_enabled: bool = Field(default=False, alias="LLM_CACHE_ENABLED")
+    llm_cache_memory_mb: int = Field(default=16, alias="LLM_CACHE_MEMORY_MB")
+    llm_cache_sqlite_path: Optional[str] = Field(default=None, alias="LLM_CACHE_SQLITE_PATH")
+    llm_cache_sqlite_max_mb: int = Field(default=256, alias="LLM_CACHE_SQLITE_MAX_MB")
+    llm_cache_ttl_seconds: int = Field(default=86400, alias="LLM_CACHE_TTL_SECONDS")
+    
+    # WebSocket Updates (slow clients are disconnected instead of delaying others)
+    ws_send_queue_size: int = Field(default=256, alias="WS_SEND_QUEUE_SIZE")
+    ws_send_timeout_seconds: float = Field(default=10.0, alias="WS_SEND_TIMEOUT_SECONDS")
+    
     # Execution Configuration
     max_sequential_steps: int = Field(default=10, alias="MAX_SEQUENTIAL_STEPS")
     handoff_max_iterations: int = Field(default=10, alias="HANDOFF_MAX_ITERATIONS")
@@ -10,6 +10,8 @@ import structlog
 
 from agent_framework import AgentRunResponse, ChatAgent, ChatMessage, Role, TextContent
 
+from ..infra.llm_cache import cacheable_llm_calls
+
 logger = structlog.get_logger(__name__)
 
 
@@ -64,11 +66,13 @@ class MAFDynamicPlanner:
         prompt = self._build_prompt(objective, files_info, summary_type, persona, ticker)
         logger.debug("Generating plan with financial MAF planner", objective_preview=objective[:80])
 
-        response = await self._planner_agent.run(
-            messages=[
-                ChatMessage(role=Role.USER, contents=[TextContent(text=prompt)]),
-            ]
-        )
+        # Identical planning prompts get the same plan
+        with cacheable_llm_calls():
+            response = await self._planner_agent.run(
+                messages=[
+                    ChatMessage(role=Role.USER, contents=[TextContent(text=prompt)]),
+                ]
+            )
 
         plan_text = self._extract_text(response)
         steps = self.parse_plan_text(
@@ -23,7 +23,10 @@ from .models.dto import (
     OrchestrationPattern
 )
 from .services.orchestrator import FinancialOrchestrationService
+from .services.run_updates import get_run_broadcaster
 from .infra.settings import get_settings
+from .infra.llm_cache import get_llm_cache
+from .infra.llm_gateway import gate_openai_client, get_llm_gateway, llm_request_context
 from .infra.telemetry import get_telemetry
 from .auth.auth_utils import get_authenticated_user_details
 from .routers import sessions
@@ -32,7 +35,6 @@ logger = structlog.get_logger(__name__)
 
 # Global state
 orchestration_service: Optional[FinancialOrchestrationService] = None
-websocket_connections: List[WebSocket] = []
 
 
 @asynccontextmanager
@@ -46,11 +48,14 @@ async def lifespan(app: FastAPI):
     telemetry = get_telemetry(settings)
     telemetry.initialize(app)
     
-    # Initialize Azure OpenAI client
-    azure_client = AsyncAzureOpenAI(
-        api_key=settings.azure_openai_api_key,
-        api_version=settings.azure_openai_api_version,
-        azure_endpoint=settings.azure_openai_endpoint
+    # Initialize Azure OpenAI client (every agent's calls share the gateway's quota)
+    azure_client = gate_openai_client(
+        AsyncAzureOpenAI(
+            api_key=settings.azure_openai_api_key,
+            api_version=settings.azure_openai_api_version,
+            azure_endpoint=settings.azure_openai_endpoint
+        ),
+        settings=settings
     )
     
     # Initialize orchestration service
@@ -88,6 +93,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Continuation-Token"],
 )
 
 # Include routers
@@ -99,7 +105,14 @@ app.include_router(sessions.router)
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "service": "financial-research-api"}
+    gateway, cache = get_llm_gateway(settings), get_llm_cache(settings)
+    return {
+        "status": "healthy",
+        "service": "financial-research-api",
+        "llm_gateway": gateway.stats() if gateway else None,
+        "llm_cache": cache.stats() if cache else None,
+        "websocket": get_run_broadcaster(settings).stats()
+    }
 
 
 @app.get("/status", response_model=SystemStatusResponse)
@@ -179,6 +192,8 @@ async def run_sequential(request_obj: SequentialResearchRequest, request: Reques
         )
         
         # Start background task for actual execution
+        # Updates of the run go to its owner's WebSocket connections only
+        get_run_broadcaster(settings).register_run(run_id, user_id)
         asyncio.create_task(execute_sequential_background(
             run_id=run_id,
             ticker=request_obj.ticker,
@@ -213,16 +228,18 @@ async def execute_sequential_background(
     start_time = time.time()
     
     try:
-        result = await orchestration_service.execute_sequential(
-            ticker=ticker,
-            scope=scope,
-            depth=depth,
-            include_pdf=include_pdf,
-            year=year,
-            run_id=run_id,  # Pass the run_id
-            user_id=user_id,  # Pass user_id for tracking
-            progress_callback=broadcast_execution_update  # Pass broadcast callback for real-time updates
-        )
+        # LLM calls of the run queue fairly against other users' runs
+        with llm_request_context(user_id):
+            result = await orchestration_service.execute_sequential(
+                ticker=ticker,
+                scope=scope,
+                depth=depth,
+                include_pdf=include_pdf,
+                year=year,
+                run_id=run_id,  # Pass the run_id
+                user_id=user_id,  # Pass user_id for tracking
+                progress_callback=broadcast_execution_update  # Pass broadcast callback for real-time updates
+            )
         
         duration = time.time() - start_time
         result.execution_time = duration
@@ -290,6 +307,8 @@ async def run_concurrent(request_obj: ConcurrentResearchRequest, request: Reques
         )
         
         # Start background task
+        # Updates of the run go to its owner's WebSocket connections only
+        get_run_broadcaster(settings).register_run(run_id, user_id)
         asyncio.create_task(execute_concurrent_background(
             run_id=run_id,
             ticker=request_obj.ticker,
@@ -323,16 +342,18 @@ async def execute_concurrent_background(
     start_time = time.time()
     
     try:
-        result = await orchestration_service.execute_concurrent(
-            ticker=ticker,
-            modules=modules,
-            aggregation_strategy=aggregation_strategy,
-            include_pdf=include_pdf,
-            year=year,
-            run_id=run_id,
-            user_id=user_id,  # Pass user_id for tracking
-            progress_callback=broadcast_execution_update  # Real-time updates
-        )
+        # LLM calls of the run queue fairly against other users' runs
+        with llm_request_context(user_id):
+            result = await orchestration_service.execute_concurrent(
+                ticker=ticker,
+                modules=modules,
+                aggregation_strategy=aggregation_strategy,
+                include_pdf=include_pdf,
+                year=year,
+                run_id=run_id,
+                user_id=user_id,  # Pass user_id for tracking
+                progress_callback=broadcast_execution_update  # Real-time updates
+            )
         
         duration = time.time() - start_time
         result.execution_time = duration
@@ -424,44 +445,32 @@ async def get_agent_health(agent_id: str):
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
-    """WebSocket endpoint for real-time execution updates."""
+    """WebSocket endpoint for real-time execution updates of the user's runs."""
+    authenticated_user = get_authenticated_user_details(request_headers=websocket.headers)
+    user_id = authenticated_user.get("user_principal_id", "unknown-user")
+    
     await websocket.accept()
-    websocket_connections.append(websocket)
+    broadcaster = get_run_broadcaster(settings)
+    connection = broadcaster.connect(websocket, user_id)
     
-    logger.info("WebSocket client connected")
+    logger.info("WebSocket client connected", user_id=user_id)
     
     try:
         while True:
-            # Keep connection alive
+            # Subscriptions and heartbeats; replies go through the connection's send queue
             data = await websocket.receive_text()
-            # Echo back for heartbeat
-            await websocket.send_json({"type": "pong", "data": data})
+            broadcaster.handle_client_message(connection, data)
             
-    except WebSocketDisconnect:
-        websocket_connections.remove(websocket)
-        logger.info("WebSocket client disconnected")
+    except (WebSocketDisconnect, RuntimeError):
+        # RuntimeError: the broadcaster already closed a slow client's socket
+        logger.info("WebSocket client disconnected", user_id=user_id)
+    finally:
+        broadcaster.disconnect(connection)
 
 
 async def broadcast_execution_update(run_id: str, event_type: str, data: dict):
-    """Broadcast execution update to all WebSocket clients."""
-    message = {
-        "type": event_type,
-        "run_id": run_id,
-        "data": data
-    }
-    
-    disconnected = []
-    for ws in websocket_connections:
-        try:
-            await ws.send_json(message)
-        except Exception as e:
-            logger.warning("Failed to send WebSocket message", error=str(e))
-            disconnected.append(ws)
-    
-    # Remove disconnected clients
-    for ws in disconnected:
-        if ws in websocket_connections:
-            websocket_connections.remove(ws)
+    """Publish an execution update to the WebSocket clients following the run."""
+    get_run_broadcaster(settings).publish(run_id, event_type, data)
 
 
 # ============= Error Handlers =============
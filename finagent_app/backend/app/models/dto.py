@@ -143,6 +143,7 @@ class ExecutionStep(BaseModel):
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     duration_seconds: Optional[float] = None
+    time_to_first_token_seconds: Optional[float] = None  # First model output, streamed runs only
     result: Optional[Dict[str, Any]] = None
     output: Optional[str] = None  # Short output preview
     error: Optional[str] = None
@@ -6,18 +6,35 @@ Stores research runs and sessions in Cosmos DB with session_id as partition key.
 import asyncio
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from azure.cosmos.aio import CosmosClient
+from azure.cosmos.exceptions import CosmosHttpResponseError
 from azure.cosmos.partition_key import PartitionKey
 from azure.identity import DefaultAzureCredential
 from azure.identity.aio import ClientSecretCredential as AsyncClientSecretCredential
 
 from app.models.persistence_models import ResearchRun, ResearchSession
 from app.persistence.memory_store_base import MemoryStoreBase
+from app.persistence.sqlite_container import RecordingContainer
 
 logger = logging.getLogger(__name__)
 
+# Fields projected by the run summary queries; PDF location is reduced to a
+# has_pdf flag so history pages stay small regardless of run size
+RUN_SUMMARY_PROJECTION = ", ".join([
+    "c.run_id",
+    "c.session_id",
+    "c.ticker",
+    "c.pattern",
+    "c.status",
+    "c.started_at",
+    "c.completed_at",
+    "c.execution_time",
+    "c.steps_count",
+    "c.summary",
+    "(IS_STRING(c.pdf_url) AND LENGTH(c.pdf_url) > 0) AS has_pdf",
+])
 
 def _serialize_datetime(obj: Any) -> Any:
     """
@@ -39,6 +56,20 @@ def _serialize_datetime(obj: Any) -> Any:
         return obj
 
 
+class InvalidContinuationToken(ValueError):
+    """A paging cursor that is malformed, expired or belongs to another query."""
+
+
+def _is_bad_continuation_token(error: Exception, continuation_token: Optional[str]) -> bool:
+    """Whether a paged query failed because of the continuation token it resumed from."""
+    if not continuation_token:
+        return False
+    if isinstance(error, CosmosHttpResponseError):
+        return error.status_code == 400
+    # The SDK (and the SQLite container) decode the token client-side
+    return isinstance(error, (ValueError, TypeError, KeyError))
+
+
 class CosmosMemoryStore(MemoryStoreBase):
     """
     CosmosDB-backed memory store for research runs.
@@ -55,6 +86,7 @@ class CosmosMemoryStore(MemoryStoreBase):
         tenant_id: Optional[str] = None,
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
+        record_path: Optional[str] = None,
     ):
         self.endpoint = endpoint
         self.database_name = database_name
@@ -63,6 +95,7 @@ class CosmosMemoryStore(MemoryStoreBase):
         self.tenant_id = tenant_id
         self.client_id = client_id
         self.client_secret = client_secret
+        self.record_path = record_path
         
         self._client: Optional[CosmosClient] = None
         self._database = None
@@ -100,6 +133,10 @@ class CosmosMemoryStore(MemoryStoreBase):
                 partition_key=PartitionKey(path="/session_id"),
             )
             
+            # Record the live workload for replay by the persistence benchmark
+            if self.record_path:
+                self._container = RecordingContainer(self._container, self.record_path)
+            
             logger.info(f"CosmosDB initialized: {self.database_name}/{self.container_name}")
             self._initialized.set()
             
@@ -114,6 +151,8 @@ class CosmosMemoryStore(MemoryStoreBase):
     
     async def close(self) -> None:
         """Close Cosmos client."""
+        if isinstance(self._container, RecordingContainer):
+            self._container.close()
         if self._client:
             await self._client.close()
             self._client = None
@@ -194,35 +233,86 @@ class CosmosMemoryStore(MemoryStoreBase):
         """Update an existing session."""
         await self._update_item(session)
     
-    async def get_all_sessions(self, user_id: Optional[str] = None, limit: int = 50) -> List[ResearchSession]:
-        """Retrieve all sessions, optionally filtered by user."""
+    async def _query_page(
+        self,
+        query: str,
+        parameters: List[Dict[str, Any]],
+        limit: int,
+        continuation_token: Optional[str] = None,
+        partition_key: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Run a query and return a single page of at most ``limit`` items.
+        
+        Paging uses Cosmos continuation tokens rather than OFFSET/LIMIT, so the
+        request charge of page N does not grow with N.
+        
+        Returns:
+            Tuple of (items, continuation token for the next page or None)
+        """
+        kwargs: Dict[str, Any] = {"max_item_count": limit}
+        if partition_key is not None:
+            kwargs["partition_key"] = partition_key
+        
+        query_iter = self._container.query_items(query=query, parameters=parameters, **kwargs)
+        items: List[Dict[str, Any]] = []
+        next_token = None
+        try:
+            pages = query_iter.by_page(continuation_token)
+            async for page in pages:
+                items.extend([item async for item in page])
+                next_token = pages.continuation_token
+                # Cross-partition pages can come back empty while more results remain
+                if items or not next_token:
+                    break
+        except Exception as e:
+            if _is_bad_continuation_token(e, continuation_token):
+                raise InvalidContinuationToken("Invalid or expired continuation token") from e
+            raise
+        
+        return items, next_token
+    
+    async def get_sessions_page(
+        self,
+        user_id: Optional[str] = None,
+        limit: int = 50,
+        continuation_token: Optional[str] = None
+    ) -> Tuple[List[ResearchSession], Optional[str]]:
+        """
+        Retrieve one page of sessions (most recent first), optionally filtered by user.
+        
+        Returns:
+            Tuple of (sessions, continuation token for the next page or None)
+        """
         await self.ensure_initialized()
         
+        query_parts = ["SELECT * FROM c WHERE c.data_type='session'"]
+        parameters = []
+        
+        if user_id:
+            query_parts.append("AND c.user_id=@user_id")
+            parameters.append({"name": "@user_id", "value": user_id})
+        
+        query_parts.append("ORDER BY c.created_at DESC")
+        query = " ".join(query_parts)
+        
+        # Note: Not specifying partition_key allows cross-partition queries by default
+        raw_items, next_token = await self._query_page(query, parameters, limit, continuation_token)
+        
+        items = []
+        for item in raw_items:
+            try:
+                items.append(ResearchSession(**item))
+            except Exception as e:
+                logger.warning(f"Failed to parse session: {e}")
+                continue
+        
+        return items, next_token
+    
+    async def get_all_sessions(self, user_id: Optional[str] = None, limit: int = 50) -> List[ResearchSession]:
+        """Retrieve all sessions, optionally filtered by user (first page only)."""
         try:
-            query_parts = ["SELECT * FROM c WHERE c.data_type='session'"]
-            parameters = []
-            
-            if user_id:
-                query_parts.append("AND c.user_id=@user_id")
-                parameters.append({"name": "@user_id", "value": user_id})
-            
-            query_parts.append(f"ORDER BY c.created_at DESC OFFSET 0 LIMIT {limit}")
-            query = " ".join(query_parts)
-            
-            items = []
-            # Note: Not specifying partition_key allows cross-partition queries by default
-            query_iter = self._container.query_items(
-                query=query,
-                parameters=parameters
-            )
-            
-            async for item in query_iter:
-                try:
-                    items.append(ResearchSession(**item))
-                except Exception as e:
-                    logger.warning(f"Failed to parse session: {e}")
-                    continue
-            
+            items, _ = await self.get_sessions_page(user_id=user_id, limit=limit)
             return items
             
         except Exception as e:
@@ -332,6 +422,57 @@ class CosmosMemoryStore(MemoryStoreBase):
             logger.error(f"Failed to get runs by user: {e}")
             return []
     
+    async def get_run_summaries_by_session(self, session_id: str) -> List[Dict[str, Any]]:
+        """
+        Retrieve summary fields for all runs in a session (most recent first).
+        
+        Returns raw projected documents (timestamps as ISO strings).
+        """
+        await self.ensure_initialized()
+        
+        try:
+            query = f"""
+            SELECT {RUN_SUMMARY_PROJECTION} FROM c
+            WHERE c.session_id=@session_id AND c.data_type='research_run'
+            ORDER BY c.started_at DESC
+            """
+            parameters = [{"name": "@session_id", "value": session_id}]
+            
+            query_iter = self._container.query_items(
+                query=query,
+                parameters=parameters,
+                partition_key=session_id
+            )
+            return [item async for item in query_iter]
+            
+        except Exception as e:
+            logger.error(f"Failed to get run summaries by session: {e}")
+            return []
+    
+    async def get_run_summaries_page(
+        self,
+        user_id: str,
+        limit: int = 50,
+        continuation_token: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Retrieve one page of run summaries for a user (most recent first).
+        
+        Returns:
+            Tuple of (projected run documents, continuation token for the next page or None)
+        """
+        await self.ensure_initialized()
+        
+        query = f"""
+        SELECT {RUN_SUMMARY_PROJECTION} FROM c
+        WHERE c.user_id=@user_id AND c.data_type='research_run'
+        ORDER BY c.started_at DESC
+        """
+        parameters = [{"name": "@user_id", "value": user_id}]
+        
+        # Cross-partition query
+        return await self._query_page(query, parameters, limit, continuation_token)
+    
     async def get_runs_by_ticker(self, ticker: str, user_id: Optional[str] = None, limit: int = 20) -> List[ResearchRun]:
         """Retrieve all runs for a specific ticker, optionally filtered by user."""
         await self.ensure_initialized()
@@ -366,3 +507,29 @@ class CosmosMemoryStore(MemoryStoreBase):
         except Exception as e:
             logger.error(f"Failed to get runs by ticker: {e}")
             return []
+
+
+def create_memory_store(settings) -> Optional[CosmosMemoryStore]:
+    """
+    Build the memory store selected by MEMORY_STORE_BACKEND.
+    
+    Returns:
+        SqliteMemoryStore for the "sqlite" backend, CosmosMemoryStore when
+        Cosmos DB is configured, otherwise None
+    """
+    if settings.memory_store_backend.strip().lower() == "sqlite":
+        from app.persistence.sqlite_memory import SqliteMemoryStore
+        return SqliteMemoryStore(
+            path=settings.sqlite_memory_path,
+            record_path=settings.memory_store_record_path,
+        )
+    
+    if not settings.cosmos_db_endpoint:
+        return None
+    
+    return CosmosMemoryStore(
+        endpoint=settings.cosmos_db_endpoint,
+        database_name=settings.cosmos_db_database,
+        container_name=settings.cosmos_db_container,
+        record_path=settings.memory_store_record_path,
+    )
@@ -0,0 +1,63 @@
+"""
+SQLite implementation for research run persistence.
+
+Runs the Cosmos memory store against a local SQLite (WAL) database, so the
+application and the persistence benchmark work without a Cosmos account.
+Every store method is inherited unchanged; only the container underneath is
+replaced, which keeps queries, partitioning (session_id) and paging identical.
+
+Selected with MEMORY_STORE_BACKEND=sqlite (default: cosmos).
+"""
+import logging
+from pathlib import Path
+from typing import Optional
+
+from app.persistence.cosmos_memory import CosmosMemoryStore
+from app.persistence.sqlite_container import RecordingContainer, SqliteContainer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SQLITE_PATH = str(Path(__file__).resolve().parents[2] / "data" / "memory_store.db")
+
+# Secondary indexes matching the store's filters and sort orders
+SQLITE_INDEXES = (
+    ("data_type", "user_id", "created_at"),
+    ("data_type", "user_id", "started_at"),
+    ("run_id",),
+    ("data_type", "ticker", "started_at"),
+)
+
+
+class SqliteMemoryStore(CosmosMemoryStore):
+    """CosmosMemoryStore backed by a local SQLite database."""
+    
+    def __init__(
+        self,
+        path: str = DEFAULT_SQLITE_PATH,
+        user_id: Optional[str] = None,
+        record_path: Optional[str] = None,
+    ):
+        super().__init__(endpoint="", database_name="", container_name="", user_id=user_id)
+        self.path = path
+        self.record_path = record_path
+        self._sqlite: Optional[SqliteContainer] = None
+    
+    async def initialize(self) -> None:
+        """Open the database and create the table and indexes."""
+        if self._initialized.is_set():
+            return
+        
+        self._sqlite = await SqliteContainer(self.path, partition_key_path="/session_id", indexes=SQLITE_INDEXES).open()
+        self._container = RecordingContainer(self._sqlite, self.record_path) if self.record_path else self._sqlite
+        
+        logger.info(f"SQLite memory store initialized: {self.path}")
+        self._initialized.set()
+    
+    async def close(self) -> None:
+        """Close the database."""
+        if isinstance(self._container, RecordingContainer):
+            self._container.close()
+        if self._sqlite:
+            await self._sqlite.close()
+            self._sqlite = None
+            self._initialized.clear()
@@ -5,14 +5,14 @@ Handles session history and research run retrieval endpoints.
 All endpoints require authentication and filter by authenticated user.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Request, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Query, Response
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 import structlog
 
 from ..models.persistence_models import ResearchSession, ResearchRun
-from ..persistence.cosmos_memory import CosmosMemoryStore
+from ..persistence.cosmos_memory import CosmosMemoryStore, InvalidContinuationToken, create_memory_store
 from ..auth.auth_utils import get_authenticated_user_details
 from ..infra.settings import get_settings
 
@@ -20,6 +20,9 @@ logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/api/sessions", tags=["sessions"])
 
+# Response header carrying the cursor for the next page of a list endpoint
+CONTINUATION_HEADER = "X-Continuation-Token"
+
 # Global cosmos store instance
 _cosmos_store: Optional[CosmosMemoryStore] = None
 
@@ -29,19 +32,15 @@ async def get_cosmos_store() -> CosmosMemoryStore:
     global _cosmos_store
     
     if _cosmos_store is None:
-        settings = get_settings()
-        if not settings.cosmos_db_endpoint:
+        store = create_memory_store(get_settings())
+        if store is None:
             raise HTTPException(
                 status_code=503,
                 detail="Cosmos DB not configured"
             )
         
-        _cosmos_store = CosmosMemoryStore(
-            endpoint=settings.cosmos_db_endpoint,
-            database_name=settings.cosmos_db_database,
-            container_name=settings.cosmos_db_container
-        )
-        await _cosmos_store.initialize()
+        await store.initialize()
+        _cosmos_store = store
     
     return _cosmos_store
 
@@ -81,14 +80,20 @@ class RunSummary(BaseModel):
 @router.get("", response_model=List[SessionWithDetails])
 async def list_sessions(
     request: Request,
+    response: Response,
     limit: int = Query(50, description="Maximum number of sessions to return"),
+    continuation_token: Optional[str] = Query(
+        None,
+        description="Cursor from the X-Continuation-Token header of the previous page"
+    ),
     cosmos: CosmosMemoryStore = Depends(get_cosmos_store)
 ):
     """
     Get all research sessions for the authenticated user with enriched details.
     
     Returns sessions ordered by most recent first, with summary information
-    about research runs in each session.
+    about research runs in each session. When more sessions are available the
+    cursor for the next page is returned in the X-Continuation-Token header.
     """
     # Extract authenticated user details
     user_details = get_authenticated_user_details(request.headers)
@@ -101,13 +106,19 @@ async def list_sessions(
     
     try:
         # Get sessions filtered by authenticated user
-        sessions = await cosmos.get_all_sessions(user_id=user_id, limit=limit)
+        sessions, next_token = await cosmos.get_sessions_page(
+            user_id=user_id,
+            limit=limit,
+            continuation_token=continuation_token
+        )
+        if next_token:
+            response.headers[CONTINUATION_HEADER] = next_token
         
         # Enrich each session with research run details
         enriched_sessions = []
         for session in sessions:
-            # Get runs for this session
-            runs = await cosmos.get_runs_by_session(session.session_id)
+            # Get run summaries for this session
+            runs = await cosmos.get_run_summaries_by_session(session.session_id)
             
             # Calculate aggregates
             ticker = None
@@ -118,13 +129,13 @@ async def list_sessions(
             if runs:
                 # Get latest run details
                 latest_run = runs[0]  # Already sorted DESC by started_at
-                ticker = latest_run.ticker
-                pattern = latest_run.pattern
-                latest_status = latest_run.status
+                ticker = latest_run.get("ticker")
+                pattern = latest_run.get("pattern")
+                latest_status = latest_run.get("status")
                 
                 # Sum execution times
                 total_execution_time = sum(
-                    r.execution_time for r in runs if r.execution_time
+                    r["execution_time"] for r in runs if r.get("execution_time")
                 )
             
             enriched_session = SessionWithDetails(
@@ -144,6 +155,8 @@ async def list_sessions(
         logger.info("Sessions listed", count=len(enriched_sessions), user_id=user_id)
         return enriched_sessions
         
+    except InvalidContinuationToken as e:
+        raise HTTPException(status_code=400, detail=f"{e}; request the first page again")
     except Exception as e:
         logger.error("Failed to list sessions", error=str(e), user_id=user_id)
         raise HTTPException(status_code=500, detail="Failed to retrieve sessions")
@@ -354,13 +367,20 @@ async def get_runs_by_ticker(
 @router.get("/user/history", response_model=List[RunSummary])
 async def get_user_history(
     request: Request,
+    response: Response,
     limit: int = Query(50, description="Maximum number of runs to return"),
+    continuation_token: Optional[str] = Query(
+        None,
+        description="Cursor from the X-Continuation-Token header of the previous page"
+    ),
     cosmos: CosmosMemoryStore = Depends(get_cosmos_store)
 ):
     """
     Get complete research history for the authenticated user.
     
-    Returns all research runs ordered by most recent first.
+    Returns research runs ordered by most recent first. When more runs are
+    available the cursor for the next page is returned in the
+    X-Continuation-Token header.
     """
     # Extract authenticated user
     user_details = get_authenticated_user_details(request.headers)
@@ -372,22 +392,28 @@ async def get_user_history(
     logger.info("Getting user history", user_id=user_id, limit=limit)
     
     try:
-        # Get all runs for this user
-        runs = await cosmos.get_runs_by_user(user_id, limit=limit)
+        # Get projected run summaries for this user
+        runs, next_token = await cosmos.get_run_summaries_page(
+            user_id,
+            limit=limit,
+            continuation_token=continuation_token
+        )
+        if next_token:
+            response.headers[CONTINUATION_HEADER] = next_token
         
         # Convert to summaries
         run_summaries = [
             RunSummary(
-                run_id=run.run_id,
-                ticker=run.ticker,
-                pattern=run.pattern,
-                status=run.status,
-                started_at=run.started_at.isoformat(),
-                completed_at=run.completed_at.isoformat() if run.completed_at else None,
-                execution_time=run.execution_time,
-                steps_count=run.steps_count,
-                has_pdf=bool(run.pdf_url),
-                summary=run.summary
+                run_id=run["run_id"],
+                ticker=run.get("ticker", ""),
+                pattern=run.get("pattern", ""),
+                status=run.get("status", "unknown"),
+                started_at=run["started_at"],
+                completed_at=run.get("completed_at"),
+                execution_time=run.get("execution_time"),
+                steps_count=run.get("steps_count") or 0,
+                has_pdf=bool(run.get("has_pdf")),
+                summary=run.get("summary")
             )
             for run in runs
         ]
@@ -395,6 +421,8 @@ async def get_user_history(
         logger.info("User history retrieved", user_id=user_id, count=len(run_summaries))
         return run_summaries
         
+    except InvalidContinuationToken as e:
+        raise HTTPException(status_code=400, detail=f"{e}; request the first page again")
     except Exception as e:
         logger.error("Failed to get user history", error=str(e), user_id=user_id)
         raise HTTPException(status_code=500, detail="Failed to retrieve history")
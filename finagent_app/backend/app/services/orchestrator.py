@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import time
 import uuid
 from datetime import datetime
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 import structlog
+from agent_framework import AgentRunResponse, AgentRunResponseUpdate
 from openai import AsyncAzureOpenAI
 
 from ..agents import (
@@ -18,6 +20,7 @@ from ..agents import (
     SECAgent,
     TechnicalsAgent,
 )
+from ..agents.streaming import StreamStats, track_stream
 from ..infra.settings import Settings
 from ..maf import MAFOrchestrator
 from ..models.dto import (
@@ -29,12 +32,15 @@ from ..models.dto import (
     ResearchArtifact,
 )
 from ..models.persistence_models import ResearchRun, ResearchSession
-from ..persistence.cosmos_memory import CosmosMemoryStore
+from ..persistence.cosmos_memory import CosmosMemoryStore, create_memory_store
 
 logger = structlog.get_logger(__name__)
 
 ProgressCallback = Callable[[str, str, Dict[str, Any]], Awaitable[None]]
 
+# Streamed text is sent to clients in batches at most this often (seconds)
+TOKEN_FLUSH_INTERVAL = 0.1
+
 
 class FinancialOrchestrationService:
     """Coordinate sequential and concurrent research workflows for finagent."""
@@ -50,15 +56,11 @@ class FinancialOrchestrationService:
 
         self._active_runs: Dict[str, OrchestrationResponse] = {}
 
-        self.cosmos: Optional[CosmosMemoryStore] = None
-        if settings.cosmos_db_endpoint:
-            self.cosmos = CosmosMemoryStore(
-                endpoint=settings.cosmos_db_endpoint,
-                database_name=settings.cosmos_db_database,
-                container_name=settings.cosmos_db_container,
-            )
+        self.cosmos: Optional[CosmosMemoryStore] = create_memory_store(settings)
+        if self.cosmos:
             logger.info(
-                "Cosmos DB persistence enabled",
+                "Run persistence enabled",
+                backend=settings.memory_store_backend,
                 database=settings.cosmos_db_database,
                 container=settings.cosmos_db_container,
             )
@@ -303,7 +305,11 @@ class FinancialOrchestrationService:
                 )
 
                 try:
-                    result = await agent.run(
+                    result = await self._run_agent_streaming(
+                        agent,
+                        step=step,
+                        run_id=run_id,
+                        progress_callback=progress_callback,
                         messages=task_message,
                         ticker=ticker,
                         context=context,
@@ -516,7 +522,11 @@ class FinancialOrchestrationService:
                     response.steps.append(report_step)
 
                     try:
-                        report_result = await report_agent.run(
+                        report_result = await self._run_agent_streaming(
+                            report_agent,
+                            step=report_step,
+                            run_id=run_id,
+                            progress_callback=progress_callback,
                             messages="Generate comprehensive equity research report",
                             ticker=ticker,
                             context=context,
@@ -607,7 +617,11 @@ class FinancialOrchestrationService:
     ) -> str:
         try:
             logger.info("Starting concurrent agent", agent=agent_name)
-            result = await agent.run(
+            result = await self._run_agent_streaming(
+                agent,
+                step=step,
+                run_id=run_id,
+                progress_callback=progress_callback,
                 messages=task,
                 ticker=ticker,
                 context=context,
@@ -643,6 +657,74 @@ class FinancialOrchestrationService:
 
             raise
 
+    async def _run_agent_streaming(
+        self,
+        agent: Any,
+        *,
+        step: ExecutionStep,
+        run_id: str,
+        progress_callback: Optional[ProgressCallback],
+        **run_kwargs: Any,
+    ) -> AgentRunResponse:
+        """Run an agent via ``run_stream``, pushing its text to clients as it is generated.
+
+        Deltas are batched into ``step_token`` events, the step's output preview
+        grows with the text, and time to first token is recorded on the step.
+        """
+        stats = StreamStats()
+        updates: List[AgentRunResponseUpdate] = []
+        pending: List[str] = []
+        pending_message_id: Optional[str] = None
+        streamed: List[str] = []
+        last_flush = time.monotonic()
+
+        async def flush() -> None:
+            nonlocal last_flush
+            if pending and progress_callback:
+                await progress_callback(
+                    run_id,
+                    "step_token",
+                    {
+                        "step_number": step.step_number,
+                        "agent": step.agent,
+                        "message_id": pending_message_id,
+                        "delta": "".join(pending),
+                    },
+                )
+            pending.clear()
+            last_flush = time.monotonic()
+
+        with track_stream(stats):
+            async for update in agent.run_stream(**run_kwargs):
+                updates.append(update)
+                text = update.text
+                if not text:
+                    continue
+                if update.message_id != pending_message_id:
+                    await flush()
+                    pending_message_id = update.message_id
+                    streamed.clear()
+                pending.append(text)
+                streamed.append(text)
+                if time.monotonic() - last_flush >= TOKEN_FLUSH_INTERVAL:
+                    step.output = "".join(streamed)[:500]
+                    await flush()
+        await flush()
+
+        step.time_to_first_token_seconds = stats.time_to_first_token
+        logger.info(
+            "Agent stream finished",
+            agent=step.agent,
+            step=step.step_number,
+            time_to_first_token_seconds=step.time_to_first_token_seconds,
+            chunks=stats.chunks,
+        )
+
+        result = AgentRunResponse.from_agent_run_response_updates(updates)
+        # A later message (e.g. an error reply) supersedes partially streamed text
+        result.messages = result.messages[-1:]
+        return result
+
     def get_run_status(self, run_id: str) -> Optional[OrchestrationResponse]:
         return self._active_runs.get(run_id)
 
@@ -0,0 +1,330 @@
+"""
+Run Update Broadcaster
+
+Delivers research run execution updates to WebSocket clients. A connection
+belongs to the user who opened it and only receives that user's runs: all of
+them by default, or only the runs it has subscribed to.
+
+Publishing never waits on a client. Each connection has a bounded send queue
+drained by its own sender task; a client whose queue fills up, or whose send
+stalls past the timeout, is disconnected (close code 1013) instead of holding
+up everyone else. When it reconnects it gets a fresh snapshot of its runs.
+
+Run state events carry deltas instead of the whole run: the changed fields,
+the steps that changed, and the messages and artifacts added since the
+previous event (see ``diff_run_state``). A connection receives the full state
+of a run before any delta for it, so deltas always apply to state it has.
+Each payload is serialized once, however many connections receive it.
+
+Client messages:
+    {"type": "subscribe", "run_id": "..."}    follow only the listed runs
+    {"type": "unsubscribe", "run_id": "..."}  stop receiving a run (also when following all runs)
+    anything else                              answered with {"type": "pong"}
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Set
+
+import structlog
+from fastapi import WebSocket
+from fastapi.encoders import jsonable_encoder
+
+from ..infra.settings import Settings
+
+logger = structlog.get_logger(__name__)
+
+# WebSocket close code: the server is overloaded for this client, retry later
+CLOSE_TRY_AGAIN_LATER = 1013
+
+TERMINAL_EVENTS = {"completed", "error"}
+
+# Run fields that only ever grow; deltas carry the new items
+APPEND_ONLY_FIELDS = ("messages", "artifacts")
+
+
+def _is_run_state(data: Dict[str, Any]) -> bool:
+    """Whether an event carries the whole run (``OrchestrationResponse``)."""
+    return "run_id" in data and "steps" in data
+
+
+def diff_run_state(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Changes from ``old`` to ``new``:
+        fields: top-level fields with a new value
+        steps: steps (matched by step_number) that are new or changed
+        messages / artifacts: items appended since ``old``
+    """
+    delta: Dict[str, Any] = {}
+    fields = {}
+    for key, value in new.items():
+        previous = old.get(key)
+        if value == previous:
+            continue
+        if key == "steps":
+            before = {step.get("step_number"): step for step in previous or []}
+            delta["steps"] = [step for step in value if before.get(step.get("step_number")) != step]
+        elif key in APPEND_ONLY_FIELDS and isinstance(previous, list) and value[:len(previous)] == previous:
+            delta[key] = value[len(previous):]
+        else:
+            fields[key] = value
+    if fields:
+        delta["fields"] = fields
+    return delta
+
+
+def apply_run_delta(state: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply a ``diff_run_state`` delta to a run state, returning the new state."""
+    state = {**state, **delta.get("fields", {})}
+    if "steps" in delta:
+        steps = {step.get("step_number"): step for step in state.get("steps", [])}
+        steps.update({step.get("step_number"): step for step in delta["steps"]})
+        state["steps"] = list(steps.values())
+    for key in APPEND_ONLY_FIELDS:
+        if key in delta:
+            state[key] = state.get(key, []) + delta[key]
+    return state
+
+
+@dataclass
+class RunChannel:
+    """Owner, latest state and event count of one run."""
+    run_id: str
+    user_id: str
+    sequence: int = 0
+    state: Dict[str, Any] = field(default_factory=dict)
+    finished: bool = False
+
+
+class Connection:
+    """One WebSocket client, with its subscriptions and bounded send queue."""
+
+    def __init__(self, websocket: WebSocket, user_id: str, queue_size: int):
+        self.websocket = websocket
+        self.user_id = user_id
+        self.runs: Optional[Set[str]] = None  # None: every run of the user
+        self.excluded: Set[str] = set()  # runs unsubscribed from while following every run
+        self.known: Set[str] = set()  # runs whose full state has been queued
+        self.closed = False
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.sender: Optional[asyncio.Task] = None
+
+    def follows(self, channel: RunChannel) -> bool:
+        if channel.user_id != self.user_id:
+            return False
+        if self.runs is None:
+            return channel.run_id not in self.excluded
+        return channel.run_id in self.runs
+
+
+class RunUpdateBroadcaster:
+    """Per-user fan-out of run execution updates to WebSocket connections."""
+
+    def __init__(
+        self,
+        queue_size: int = 256,
+        send_timeout_seconds: float = 10.0,
+        linger_seconds: float = 300.0
+    ):
+        """
+        Args:
+            queue_size: Messages buffered per connection before it is evicted as too slow
+            send_timeout_seconds: Longest a single send may take before the connection is evicted
+            linger_seconds: How long a finished run stays available to new subscribers
+        """
+        self.queue_size = queue_size
+        self.send_timeout_seconds = send_timeout_seconds
+        self.linger_seconds = linger_seconds
+        self._runs: Dict[str, RunChannel] = {}
+        self._connections: Dict[str, Set[Connection]] = {}
+        self.published = 0
+        self.delivered = 0
+        self.evicted = 0
+
+    # ------------------------------------------------------------------
+    # Runs (called by the execution endpoints and the orchestrator)
+    # ------------------------------------------------------------------
+
+    def register_run(self, run_id: str, user_id: str) -> None:
+        """Record the owner of a run before its first update is published."""
+        self._runs[run_id] = RunChannel(run_id=run_id, user_id=user_id)
+
+    def publish(self, run_id: str, event_type: str, data: Dict[str, Any]) -> None:
+        """Queue an update for every connection following the run."""
+        channel = self._runs.get(run_id)
+        if channel is None:
+            logger.debug("Update for unregistered run dropped", run_id=run_id, event_type=event_type)
+            return
+
+        channel.sequence += 1
+        self.published += 1
+        followers = [
+            connection for connection in self._connections.get(channel.user_id, ())
+            if connection.follows(channel)
+        ]
+        if _is_run_state(data):
+            state = jsonable_encoder(data)
+            delta = diff_run_state(channel.state, state)
+            channel.state = state
+            full_text = delta_text = None
+            for connection in followers:
+                if run_id in connection.known:
+                    if delta_text is None:
+                        delta_text = self._encode(event_type, channel, delta=delta)
+                    self._offer(connection, delta_text)
+                else:
+                    if full_text is None:
+                        full_text = self._encode(event_type, channel, data=state)
+                    if self._offer(connection, full_text):
+                        connection.known.add(run_id)
+        elif followers:
+            text = self._encode(event_type, channel, data=jsonable_encoder(data))
+            for connection in followers:
+                self._offer(connection, text)
+
+        if event_type in TERMINAL_EVENTS and not channel.finished:
+            channel.finished = True
+            asyncio.get_running_loop().call_later(self.linger_seconds, self._expire, channel)
+
+    # ------------------------------------------------------------------
+    # Connections (called by the WebSocket endpoint)
+    # ------------------------------------------------------------------
+
+    def connect(self, websocket: WebSocket, user_id: str) -> Connection:
+        """Start delivering to an accepted WebSocket, beginning with its user's active runs."""
+        connection = Connection(websocket, user_id, self.queue_size)
+        connection.sender = asyncio.create_task(self._send_loop(connection))
+        self._connections.setdefault(user_id, set()).add(connection)
+        for channel in list(self._runs.values()):
+            if channel.user_id == user_id and not channel.finished and channel.state:
+                self._send_snapshot(connection, channel)
+        return connection
+
+    def disconnect(self, connection: Connection) -> None:
+        """Stop delivering to a connection (safe to call more than once)."""
+        connection.closed = True
+        if connection.sender is not None:
+            connection.sender.cancel()
+        connections = self._connections.get(connection.user_id)
+        if connections is not None:
+            connections.discard(connection)
+            if not connections:
+                del self._connections[connection.user_id]
+
+    def handle_client_message(self, connection: Connection, text: str) -> None:
+        """Apply a subscribe/unsubscribe request, or answer a heartbeat."""
+        try:
+            message = json.loads(text)
+        except ValueError:
+            message = None
+        if not isinstance(message, dict) or message.get("type") not in ("subscribe", "unsubscribe"):
+            self._offer(connection, json.dumps({"type": "pong", "data": text}))
+            return
+
+        run_id = str(message.get("run_id") or "")
+        if message["type"] == "unsubscribe":
+            if connection.runs is None:
+                connection.excluded.add(run_id)
+            else:
+                connection.runs.discard(run_id)
+            connection.known.discard(run_id)
+            return
+
+        channel = self._runs.get(run_id)
+        if channel is None or channel.user_id != connection.user_id:
+            self._offer(connection, json.dumps({
+                "type": "subscription_error", "run_id": run_id, "data": {"error": "Run not found"}
+            }))
+            return
+        if connection.runs is None:
+            connection.runs = set()
+            connection.excluded.clear()
+        connection.runs.add(run_id)
+        self._send_snapshot(connection, channel)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "connections": sum(len(connections) for connections in self._connections.values()),
+            "users": len(self._connections),
+            "runs": len(self._runs),
+            "published": self.published,
+            "delivered": self.delivered,
+            "evicted": self.evicted,
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _encode(event_type: str, channel: RunChannel, **payload: Any) -> str:
+        return json.dumps({"type": event_type, "run_id": channel.run_id, "seq": channel.sequence, **payload})
+
+    def _send_snapshot(self, connection: Connection, channel: RunChannel) -> None:
+        if not channel.state:
+            return
+        if self._offer(connection, self._encode("snapshot", channel, data=channel.state)):
+            connection.known.add(channel.run_id)
+
+    def _offer(self, connection: Connection, text: str) -> bool:
+        if connection.closed:
+            return False
+        try:
+            connection.queue.put_nowait(text)
+            return True
+        except asyncio.QueueFull:
+            self._evict(connection, "send queue full")
+            return False
+
+    async def _send_loop(self, connection: Connection) -> None:
+        try:
+            while True:
+                text = await connection.queue.get()
+                await asyncio.wait_for(connection.websocket.send_text(text), self.send_timeout_seconds)
+                self.delivered += 1
+        except asyncio.TimeoutError:
+            self._evict(connection, "send timed out")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # The client went away; the endpoint's receive loop unregisters it
+            logger.debug("WebSocket send failed", user_id=connection.user_id, error=str(e))
+            self.disconnect(connection)
+
+    def _evict(self, connection: Connection, reason: str) -> None:
+        if connection.closed:
+            return
+        self.evicted += 1
+        logger.warning("Evicting slow WebSocket client", user_id=connection.user_id, reason=reason)
+        self.disconnect(connection)
+        asyncio.create_task(self._close(connection.websocket))
+
+    async def _close(self, websocket: WebSocket) -> None:
+        try:
+            await asyncio.wait_for(
+                websocket.close(code=CLOSE_TRY_AGAIN_LATER, reason="Client too slow"),
+                self.send_timeout_seconds
+            )
+        except Exception:
+            pass
+
+    def _expire(self, channel: RunChannel) -> None:
+        if self._runs.get(channel.run_id) is channel:
+            del self._runs[channel.run_id]
+
+
+# Global broadcaster instance
+_broadcaster: Optional[RunUpdateBroadcaster] = None
+
+
+def get_run_broadcaster(settings: Optional[Settings] = None) -> RunUpdateBroadcaster:
+    """Get or create the global run update broadcaster."""
+    global _broadcaster
+    if _broadcaster is None:
+        settings = settings or Settings()
+        _broadcaster = RunUpdateBroadcaster(
+            queue_size=settings.ws_send_queue_size,
+            send_timeout_seconds=settings.ws_send_timeout_seconds
+        )
+    return _broadcaster
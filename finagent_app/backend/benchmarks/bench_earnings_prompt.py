@@ -0,0 +1,102 @@
+"""
+Earnings Prompt Budget Benchmark
+
+Builds EarningsAgent's analysis prompt around synthetic earnings call
+transcripts, from well under the model's context budget to several times
+over it, and checks that the request actually sent (system message plus
+user prompt) fits the budget. Reports build time, transcript tokens kept and
+the headroom left; a request over budget is flagged.
+
+Usage (from finagent_app/backend):
+    python -m benchmarks.bench_earnings_prompt
+    python -m benchmarks.bench_earnings_prompt --model gpt-4 --sizes 0.5 1 4
+
+Token counts are exact when tiktoken is installed and estimated otherwise.
+No Azure or FMP resources are used.
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from app.agents.earnings_agent import EarningsAgent
+from app.services.context_budget import ContextBudget
+
+SPEAKERS = ["Operator", "Chief Executive Officer", "Chief Financial Officer", "Analyst"]
+WORDS = (
+    "revenue margin guidance quarter growth demand pricing backlog capex "
+    "cloud segment operating cash flow buyback dividend headwind tailwind "
+    "inventory supply 2025 12% $4.2B basis points year-over-year"
+).split()
+
+
+def make_transcript(tokens: int, budget: ContextBudget, seed: int) -> str:
+    """Synthetic call transcript of about ``tokens`` tokens, one remark per line."""
+    rng = random.Random(seed)
+    lines = []
+    total = 0
+    while total < tokens:
+        line = f"{rng.choice(SPEAKERS)}: " + " ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 60)))
+        lines.append(line)
+        total += budget.count(line) + 1
+    return "\n".join(lines)
+
+
+def build(agent: EarningsAgent, transcript: str, task: str = "Summarize guidance and risks") -> str:
+    data = {"transcript": transcript, "source": "synthetic"}
+    return agent._build_analysis_prompt_with_data(task, "MSFT", "2025", data, {})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="gpt-4o", help="Model used to pick the tokenizer and context window")
+    parser.add_argument("--sizes", type=float, nargs="+", default=[0.25, 0.9, 1.5, 3.0],
+                        help="Transcript sizes as multiples of the prompt budget")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed prompt builds per size")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    agent = EarningsAgent(model=args.model)
+    # The budget the agent packs against (same reserve as the agent)
+    budget = ContextBudget(args.model, reserve_output_tokens=3000)
+    system_tokens = budget.count(agent.system_prompt)
+
+    print(
+        f"{args.model}: prompt budget {budget.budget_tokens} tokens, system message {system_tokens} "
+        f"({'tiktoken' if budget.tokenizer.exact else 'estimated'} counts)\n"
+    )
+    print(f"{'transcript':>12}{'build p50 ms':>14}{'kept':>10}{'request':>10}{'headroom':>10}  result")
+    # Prompt tokens around the transcript
+    template_tokens = budget.count(build(agent, "x")) - budget.count("x")
+    for size in args.sizes:
+        transcript = make_transcript(int(budget.budget_tokens * size), budget, args.seed)
+
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            prompt = build(agent, transcript)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        prompt_tokens = budget.count(prompt)
+        request_tokens = system_tokens + prompt_tokens
+        headroom = budget.budget_tokens - request_tokens
+        if headroom < 0:
+            result = "OVER BUDGET"
+        else:
+            result = "fits, whole" if transcript in prompt else "fits, truncated"
+        print(
+            f"{budget.count(transcript):>12}{statistics.median(timings):>14.1f}"
+            f"{prompt_tokens - template_tokens:>10}{request_tokens:>10}{headroom:>+10}  {result}"
+        )
+
+    # Placeholder-like text in the task or the transcript must pass through verbatim
+    task = "Explain what {transcript} and {ticker} mean in this call"
+    transcript = "Analyst: is {transcript} a template field? {0} {}\nOperator: next question"
+    prompt = build(agent, transcript, task)
+    verbatim = task in prompt and prompt.count(transcript) == 1
+    print(f"\nplaceholders in task/transcript: {'passed through' if verbatim else 'MANGLED'}")
+
+
+if __name__ == "__main__":
+    main()
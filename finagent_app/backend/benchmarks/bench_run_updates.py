@@ -0,0 +1,271 @@
+"""
+WebSocket Run Update Fan-out Benchmark
+
+Drives research runs' execution updates (started, streamed step tokens, step
+completions carrying the whole run, completed) to hundreds of simulated
+WebSocket clients spread over many users, a few of which are slow to read.
+Compares the previous broadcast, which awaited every socket in turn with the
+full run on every event, against RunUpdateBroadcaster.
+
+Reports how long runs were held up publishing, delivery latency to healthy
+clients, bytes sent per client, updates delivered to users who do not own the
+run, and slow clients evicted. Healthy clients rebuild each run from the
+snapshot and deltas they receive, and the result is checked against the
+run's final state.
+
+Usage (from finagent_app/backend):
+    python -m benchmarks.bench_run_updates
+    python -m benchmarks.bench_run_updates --clients 800 --users 200 --runs 20 --slow-clients 20
+
+Requires fastapi and pydantic; no Azure resources are used.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+
+from app.models.dto import (
+    AgentMessage,
+    ExecutionStatus,
+    ExecutionStep,
+    OrchestrationPattern,
+    OrchestrationResponse,
+)
+from app.services.run_updates import RunUpdateBroadcaster, apply_run_delta
+
+# Send time of a client that has stopped reading
+STALLED = 3600.0
+
+# Publish time of each payload object, for delivery latency (the payload is
+# kept so its id is not reused)
+published_at: Dict[int, Tuple[float, Any]] = {}
+
+
+def mark_published(payload: Any) -> None:
+    published_at.setdefault(id(payload), (time.perf_counter(), payload))
+
+
+class FakeWebSocket:
+    """Client socket whose sends take ``latency`` seconds; records what it receives."""
+
+    def __init__(self, user_id: str, latency: float):
+        self.user_id = user_id
+        self.latency = latency
+        self.bytes = 0
+        self.latencies: List[float] = []
+        self.foreign = 0
+        self.runs: Dict[str, Dict[str, Any]] = {}
+        self.owned: set = set()
+        self.closed = False
+
+    async def _receive(self, payload: Any, text: str) -> None:
+        await asyncio.sleep(self.latency)
+        self.bytes += len(text)
+        sent = published_at.get(id(payload))
+        if sent is not None:
+            self.latencies.append(time.perf_counter() - sent[0])
+        message = json.loads(text)
+        run_id = message.get("run_id")
+        if run_id not in self.owned:
+            self.foreign += 1
+        elif "delta" in message:
+            self.runs[run_id] = apply_run_delta(self.runs[run_id], message["delta"])
+        elif message.get("type") != "step_token" and "steps" in message.get("data", {}):
+            self.runs[run_id] = message["data"]
+
+    async def send_text(self, text: str) -> None:
+        await self._receive(text, text)
+
+    async def send_json(self, data: Dict[str, Any]) -> None:
+        # Starlette's send_json cannot encode datetimes; be generous to the old path
+        await self._receive(data, json.dumps(jsonable_encoder(data)))
+
+    async def close(self, code: int = 1000, reason: Optional[str] = None) -> None:
+        self.closed = True
+
+
+class LegacyBroadcast:
+    """The previous broadcast: every event awaited on every socket in turn."""
+
+    def __init__(self, sockets: List[FakeWebSocket]):
+        self.connections = list(sockets)
+
+    async def __call__(self, run_id: str, event_type: str, data: dict) -> None:
+        message = {"type": event_type, "run_id": run_id, "data": data}
+        mark_published(message)
+        disconnected = []
+        for ws in self.connections:
+            try:
+                await ws.send_json(message)
+            except Exception:
+                disconnected.append(ws)
+        for ws in disconnected:
+            self.connections.remove(ws)
+
+
+class TimedBroadcaster:
+    """RunUpdateBroadcaster.publish, recording when each payload was queued."""
+
+    def __init__(self, broadcaster: RunUpdateBroadcaster):
+        self.broadcaster = broadcaster
+
+    async def __call__(self, run_id: str, event_type: str, data: dict) -> None:
+        connections = list(self.broadcaster._connections.get(self.broadcaster._runs[run_id].user_id, ()))
+        sizes = [connection.queue.qsize() for connection in connections]
+        self.broadcaster.publish(run_id, event_type, data)
+        for connection, size in zip(connections, sizes):
+            if connection.queue.qsize() > size:
+                mark_published(connection.queue._queue[-1])
+
+
+async def run_research(run_id: str, broadcast, args, rng: random.Random) -> Tuple[float, Dict[str, Any]]:
+    """Emit one run's updates the way the orchestrator does; returns seconds spent publishing and the final run."""
+    response = OrchestrationResponse(
+        run_id=run_id,
+        ticker="MSFT",
+        pattern=OrchestrationPattern.SEQUENTIAL,
+        status=ExecutionStatus.RUNNING,
+        started_at=datetime.utcnow(),
+    )
+    blocked = 0.0
+
+    async def publish(event_type: str, data: dict) -> None:
+        nonlocal blocked
+        started = time.perf_counter()
+        await broadcast(run_id, event_type, data)
+        blocked += time.perf_counter() - started
+
+    await publish("started", response.model_dump())
+    for number in range(1, args.steps + 1):
+        step = ExecutionStep(step_number=number, agent=f"Agent_{number}", status=ExecutionStatus.RUNNING,
+                             started_at=datetime.utcnow())
+        response.steps.append(step)
+        text = []
+        for _ in range(args.tokens_per_step):
+            await asyncio.sleep(args.token_interval * rng.uniform(0.5, 1.5))
+            delta = "lorem ipsum " * 8
+            text.append(delta)
+            await publish("step_token", {"step_number": number, "agent": step.agent, "message_id": "m", "delta": delta})
+        step.status = ExecutionStatus.COMPLETED
+        step.completed_at = datetime.utcnow()
+        step.output = "".join(text)[:500]
+        response.messages.append(AgentMessage(agent=step.agent, content="x" * args.message_bytes,
+                                              timestamp=datetime.utcnow()))
+        await publish("step_completed", response.model_dump())
+    response.status = ExecutionStatus.COMPLETED
+    response.completed_at = datetime.utcnow()
+    await publish("completed", response.model_dump())
+    return blocked, jsonable_encoder(response.model_dump())
+
+
+async def run_mode(mode: str, args) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    published_at.clear()
+    users = [f"user-{n}" for n in range(args.users)]
+    sockets = [FakeWebSocket(users[n % args.users], args.fast_latency) for n in range(args.clients)]
+    owners = {f"run-{n}": rng.choice(users) for n in range(args.runs)}
+    for ws in sockets:
+        ws.owned = {run_id for run_id, owner in owners.items() if owner == ws.user_id}
+    # Slow and stalled readers are watching runs, so their backlog actually grows.
+    # The previous broadcast would wait on a stalled client forever, so it only
+    # gets the slow ones
+    watching = [ws for ws in sockets if ws.owned]
+    lagging = rng.sample(watching, min(args.slow_clients + args.stalled_clients, len(watching)))
+    for n, ws in enumerate(lagging):
+        if n < args.slow_clients:
+            ws.latency = args.slow_latency
+        elif mode != "legacy":
+            ws.latency = STALLED
+
+    broadcaster = None
+    if mode == "legacy":
+        broadcast = LegacyBroadcast(sockets)
+    else:
+        broadcaster = RunUpdateBroadcaster(queue_size=args.queue_size, send_timeout_seconds=args.send_timeout)
+        for ws in sockets:
+            broadcaster.connect(ws, ws.user_id)
+        for run_id, owner in owners.items():
+            broadcaster.register_run(run_id, owner)
+        broadcast = TimedBroadcaster(broadcaster)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(run_research(run_id, broadcast, args, random.Random(n))
+                                     for n, run_id in enumerate(owners)))
+    runs_done = time.perf_counter() - started
+    # Let healthy clients drain what is still queued
+    if broadcaster is not None:
+        while any(not c.queue.empty() for cs in broadcaster._connections.values() for c in cs):
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(args.fast_latency * 10)
+
+    healthy = [ws for ws in sockets if ws.latency == args.fast_latency]
+    final = {run_id: state for run_id, (_, state) in zip(owners, results)}
+    consistent = sum(
+        1 for ws in healthy for run_id in ws.owned
+        if ws.runs.get(run_id) == final[run_id]
+    )
+    expected = sum(len(ws.owned) for ws in healthy)
+    latencies = [value for ws in healthy for value in ws.latencies]
+    return {
+        "mode": mode,
+        "runs_done": runs_done,
+        "blocked": [blocked for blocked, _ in results],
+        "latencies": latencies,
+        "bytes": statistics.fmean(ws.bytes for ws in healthy),
+        "foreign": sum(ws.foreign for ws in sockets),
+        "evicted": sum(1 for ws in sockets if ws.closed),
+        "slow": len(sockets) - len(healthy),
+        "consistent": f"{consistent}/{expected}",
+    }
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=400, help="Simulated WebSocket clients")
+    parser.add_argument("--users", type=int, default=100, help="Users the clients belong to")
+    parser.add_argument("--runs", type=int, default=10, help="Concurrent research runs")
+    parser.add_argument("--steps", type=int, default=4, help="Steps per run")
+    parser.add_argument("--tokens-per-step", type=int, default=8, help="step_token events per step")
+    parser.add_argument("--token-interval", type=float, default=0.1, help="Seconds between step_token events")
+    parser.add_argument("--message-bytes", type=int, default=4000, help="Agent output size added per step")
+    parser.add_argument("--fast-latency", type=float, default=0.0005, help="Send time of a healthy client")
+    parser.add_argument("--slow-latency", type=float, default=0.2, help="Send time of a slow client")
+    parser.add_argument("--slow-clients", type=int, default=8, help="Slow clients, among those watching runs")
+    parser.add_argument("--stalled-clients", type=int, default=4,
+                        help="Clients that stop reading (broadcaster only; they would block the old broadcast)")
+    parser.add_argument("--queue-size", type=int, default=32, help="Broadcaster send queue per connection")
+    parser.add_argument("--send-timeout", type=float, default=2.0, help="Broadcaster per-send timeout")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{args.clients} clients over {args.users} users, {args.runs} runs x {args.steps} steps, "
+          f"{args.slow_clients} slow clients ({args.slow_latency * 1e3:.0f} ms/send), "
+          f"{args.stalled_clients} stalled clients\n")
+    print(f"{'mode':<12} {'runs s':>7} {'blocked p95 s':>14} {'deliver p50 ms':>15} {'p95 ms':>9} "
+          f"{'KB/client':>10} {'foreign':>8} {'evicted':>8} {'rebuilt':>9}")
+    for mode in ("legacy", "broadcaster"):
+        result = await run_mode(mode, args)
+        print(
+            f"{result['mode']:<12} {result['runs_done']:>7.1f} {percentile(result['blocked'], 0.95):>14.2f} "
+            f"{percentile(result['latencies'], 0.5) * 1e3:>15.1f} {percentile(result['latencies'], 0.95) * 1e3:>9.1f} "
+            f"{result['bytes'] / 1024:>10.1f} {result['foreign']:>8} "
+            f"{result['evicted']:>4}/{result['slow']:<3} {result['consistent']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -16,6 +16,8 @@ import json
 
 # Microsoft Agent Framework imports
 from agent_framework import BaseAgent, ChatMessage, Role, TextContent, AgentRunResponse, AgentRunResponseUpdate, AgentThread
+
+from .streaming import complete, emit, stream_run
 from pydantic import Field
 
 # Import data providers
@@ -220,7 +222,15 @@ Be data-driven, factual, and provide actionable insights."""
         # Execute with Azure OpenAI
         try:
             logger.info(f"CompanyAgent calling LLM for {ticker}")
+            heading = f"## Company Analysis for {ticker}\n\n"
+            footer = """
+
+---
+*Analysis provided by CompanyAgent using market data APIs and financial databases*
+"""
+            emit(heading)
             response = await self._execute_llm(prompt)
+            emit(footer)
             
             logger.info(
                 f"CompanyAgent LLM response received",
@@ -228,13 +238,7 @@ Be data-driven, factual, and provide actionable insights."""
                 response_length=len(response) if response else 0
             )
             
-            result_text = f"""## Company Analysis for {ticker}
-
-{response}
-
----
-*Analysis provided by CompanyAgent using market data APIs and financial databases*
-"""
+            result_text = f"{heading}{response}{footer}"
             
             # Track artifacts
             artifacts = context.get("artifacts", [])
@@ -496,8 +500,9 @@ Include specific numbers and dates where available."""
             ChatMessage(role=Role.USER, text=prompt)
         ]
         
-        response = await self.chat_client.get_response(
-            messages=messages,
+        text = await complete(
+            self.chat_client,
+            messages,
             temperature=0.7,
             max_tokens=2000
         )
@@ -507,10 +512,10 @@ Include specific numbers and dates where available."""
             "Azure OpenAI response received",
             model=self.model,
             duration_seconds=round(duration, 2),
-            response_length=len(response.text) if response.text else 0
+            response_length=len(text) if text else 0
         )
         
-        return response.text
+        return text
     
     def _extract_task(self, messages) -> str:
         """Extract task from messages."""
@@ -572,19 +577,11 @@ Include specific numbers and dates where available."""
         Yields:
             AgentRunResponseUpdate objects containing chunks of the response
         """
-        # For now, implement non-streaming version by yielding complete response
-        # Future: Implement true streaming with Azure OpenAI streaming API
-        response = await self.run(messages, thread=thread, **kwargs)
-        
-        # Yield the complete response as a single update
-        for message in response.messages:
-            if message.contents:
-                for content in message.contents:
-                    if isinstance(content, TextContent):
-                        yield AgentRunResponseUpdate(
-                            contents=[content],
-                            role=Role.ASSISTANT
-                        )
+        async for update in stream_run(
+            lambda: self.run(messages, thread=thread, **kwargs),
+            author_name=self.name
+        ):
+            yield update
     
     async def process(self, task: str, context: Dict[str, Any] = None) -> str:
         """Legacy method for YAML-based workflow compatibility."""
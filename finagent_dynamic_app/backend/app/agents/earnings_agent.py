@@ -13,6 +13,8 @@ import structlog
 # Microsoft Agent Framework imports
 from agent_framework import BaseAgent, ChatMessage, Role, TextContent, AgentRunResponse, AgentRunResponseUpdate, AgentThread
 
+from .streaming import complete, emit, stream_run
+
 # Import data providers
 import sys
 from pathlib import Path
@@ -21,6 +23,7 @@ if str(bridge_dir) not in sys.path:
     sys.path.insert(0, str(bridge_dir))
 
 from helpers.fmputils import FMPUtils
+from ..services.context_budget import ContextBudget
 
 logger = structlog.get_logger(__name__)
 
@@ -138,7 +141,15 @@ Be objective and balanced in extracting both positive and negative signals."""
         
         try:
             logger.info(f"EarningsAgent calling LLM for {ticker}")
+            heading = f"## Earnings Call Analysis for {ticker} ({year})\n\n"
+            footer = """
+
+---
+*Earnings analysis by EarningsAgent based on real earnings call transcripts*
+"""
+            emit(heading)
             response = await self._execute_llm(prompt)
+            emit(footer)
             
             logger.info(
                 f"EarningsAgent LLM response received",
@@ -146,13 +157,7 @@ Be objective and balanced in extracting both positive and negative signals."""
                 response_length=len(response) if response else 0
             )
             
-            result_text = f"""## Earnings Call Analysis for {ticker} ({year})
-
-{response}
-
----
-*Earnings analysis by EarningsAgent based on real earnings call transcripts*
-"""
+            result_text = f"{heading}{response}{footer}"
             
             # Track artifacts
             artifacts = context.get("artifacts", [])
@@ -272,9 +277,7 @@ Be objective and balanced in extracting both positive and negative signals."""
         
         if not transcript:
             # No transcript available
-            prompt = f"""{self.system_prompt}
-
-User Task: {task}
+            prompt = f"""User Task: {task}
 
 Company: {ticker}
 Year: {year}
@@ -285,14 +288,7 @@ Suggest they try a different year or check if the company has held earnings call
 """
             return prompt
         
-        # Truncate very long transcripts (keep first 15000 chars for context)
-        transcript_excerpt = transcript[:15000]
-        if len(transcript) > 15000:
-            transcript_excerpt += f"\n\n[... transcript truncated, {len(transcript)} total characters ...]"
-        
-        prompt = f"""{self.system_prompt}
-
-User Task: {task}
+        header = f"""User Task: {task}
 
 ## Company Information
 Ticker: {ticker}
@@ -300,7 +296,8 @@ Earnings Call Year: {year}
 Data Source: {transcript_data.get('source', 'FMP API')}
 
 ## Earnings Call Transcript
-{transcript_excerpt}
+"""
+        instructions = """
 
 ---
 
@@ -317,7 +314,21 @@ Provide specific quotes from the transcript to support your analysis.
 Be objective and balanced - include both positive and negative signals.
 """
         
-        return prompt
+        # Give the transcript whatever the model's context leaves after the system
+        # message, the rest of the prompt and the reply (cut at a line boundary if needed).
+        # The system prompt goes out once, as the system message in _execute_llm.
+        # Sections are joined rather than substituted, so braces or placeholder-like
+        # text in the task or the transcript are passed through untouched
+        budget = ContextBudget(self.model, reserve_output_tokens=3000)
+        available = (
+            budget.budget_tokens
+            - budget.count(self.system_prompt)
+            - budget.count(header)
+            - budget.count(instructions)
+        )
+        transcript_excerpt = budget.fit(transcript, available, name="earnings_transcript")
+        
+        return header + transcript_excerpt + instructions
     
     async def _execute_llm(self, prompt: str) -> str:
         """Execute LLM call using agent_framework's AzureOpenAIChatClient."""
@@ -331,13 +342,14 @@ Be objective and balanced - include both positive and negative signals.
             ChatMessage(role=Role.USER, text=prompt)
         ]
         
-        response = await self.chat_client.get_response(
-            messages=messages,
+        text = await complete(
+            self.chat_client,
+            messages,
             temperature=0.7,
             max_tokens=3000
         )
         
-        return response.text
+        return text
     
     def _create_response(self, text: str) -> AgentRunResponse:
         """Create agent response following MAF pattern."""
@@ -353,12 +365,11 @@ Be objective and balanced - include both positive and negative signals.
         **kwargs: Any
     ) -> AsyncIterable[AgentRunResponseUpdate]:
         """Execute and yield streaming response (MAF required method)."""
-        response = await self.run(messages, thread=thread, **kwargs)
-        for message in response.messages:
-            if message.contents:
-                for content in message.contents:
-                    if isinstance(content, TextContent):
-                        yield AgentRunResponseUpdate(contents=[content], role=Role.ASSISTANT)
+        async for update in stream_run(
+            lambda: self.run(messages, thread=thread, **kwargs),
+            author_name=self.name
+        ):
+            yield update
     
     async def process(self, task: str, context: Dict[str, Any] = None) -> str:
         """Legacy method for YAML workflow compatibility."""
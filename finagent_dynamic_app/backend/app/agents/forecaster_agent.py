@@ -14,6 +14,8 @@ import json
 # Microsoft Agent Framework imports
 from agent_framework import BaseAgent, ChatMessage, Role, TextContent, AgentRunResponse, AgentRunResponseUpdate, AgentThread
 
+from .streaming import complete, emit, stream_run
+
 logger = structlog.get_logger(__name__)
 
 
@@ -182,7 +184,15 @@ Be data-driven, factual, and transparent about uncertainty."""
         # Execute with Azure OpenAI
         try:
             logger.info(f"ForecasterAgent calling LLM for {ticker}")
+            heading = f"## Forecast Analysis for {ticker}\n\n"
+            footer = f"""
+
+---
+*Forecast provided by ForecasterAgent using {tool_name}*
+"""
+            emit(heading)
             response = await self._execute_llm(prompt)
+            emit(footer)
             
             logger.info(
                 f"ForecasterAgent LLM response received",
@@ -190,13 +200,7 @@ Be data-driven, factual, and transparent about uncertainty."""
                 response_length=len(response) if response else 0
             )
             
-            result_text = f"""## Forecast Analysis for {ticker}
-
-{response}
-
----
-*Forecast provided by ForecasterAgent using {tool_name}*
-"""
+            result_text = f"{heading}{response}{footer}"
             
             # Track artifacts
             artifacts = context.get("artifacts", [])
@@ -464,8 +468,9 @@ Provide your forecast analysis based on the task requirements and available data
             ChatMessage(role=Role.USER, text=prompt)
         ]
         
-        response = await self.chat_client.get_response(
-            messages=messages,
+        text = await complete(
+            self.chat_client,
+            messages,
             temperature=0.5,  # Slightly higher for creative forecasting
             max_tokens=1500
         )
@@ -475,10 +480,10 @@ Provide your forecast analysis based on the task requirements and available data
             "Azure OpenAI response received",
             model=self.model,
             duration_seconds=round(duration, 2),
-            response_length=len(response.text) if response.text else 0
+            response_length=len(text) if text else 0
         )
         
-        return response.text
+        return text
     
     def _normalize_messages(self, messages):
         """Normalize messages to a list of ChatMessage objects."""
@@ -520,16 +525,11 @@ Provide your forecast analysis based on the task requirements and available data
         """
         Execute the agent and yield streaming response updates (MAF required method).
         """
-        response = await self.run(messages, thread=thread, **kwargs)
-        
-        for message in response.messages:
-            if message.contents:
-                for content in message.contents:
-                    if isinstance(content, TextContent):
-                        yield AgentRunResponseUpdate(
-                            contents=[content],
-                            role=Role.ASSISTANT
-                        )
+        async for update in stream_run(
+            lambda: self.run(messages, thread=thread, **kwargs),
+            author_name=self.name
+        ):
+            yield update
     
     async def process(self, task: str, context: Dict[str, Any] = None) -> str:
         """Legacy method for YAML-based workflow compatibility."""
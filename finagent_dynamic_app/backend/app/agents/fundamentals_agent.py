@@ -13,6 +13,8 @@ import structlog
 # Microsoft Agent Framework imports
 from agent_framework import BaseAgent, ChatMessage, Role, TextContent, AgentRunResponse, AgentRunResponseUpdate, AgentThread
 
+from .streaming import complete, emit, stream_run
+
 # Import data providers
 import sys
 from pathlib import Path
@@ -141,7 +143,15 @@ Be quantitative, use specific numbers, and highlight trends and anomalies."""
         
         try:
             logger.info(f"FundamentalsAgent calling LLM for {ticker}")
+            heading = f"## Fundamental Analysis for {ticker}\n\n"
+            footer = """
+
+---
+*Fundamental analysis by FundamentalsAgent based on real financial statements and ratios*
+"""
+            emit(heading)
             response = await self._execute_llm(prompt)
+            emit(footer)
             
             logger.info(
                 f"FundamentalsAgent LLM response received",
@@ -149,13 +159,7 @@ Be quantitative, use specific numbers, and highlight trends and anomalies."""
                 response_length=len(response) if response else 0
             )
             
-            result_text = f"""## Fundamental Analysis for {ticker}
-
-{response}
-
----
-*Fundamental analysis by FundamentalsAgent based on real financial statements and ratios*
-"""
+            result_text = f"{heading}{response}{footer}"
             
             # Track artifacts
             artifacts = context.get("artifacts", [])
@@ -399,13 +403,14 @@ Be specific with numbers from the data above. Identify trends, anomalies, and pr
             ChatMessage(role=Role.USER, text=prompt)
         ]
         
-        response = await self.chat_client.get_response(
-            messages=messages,
+        text = await complete(
+            self.chat_client,
+            messages,
             temperature=0.7,
             max_tokens=3000
         )
         
-        return response.text
+        return text
     
     def _create_response(self, text: str) -> AgentRunResponse:
         """Create agent response following MAF pattern."""
@@ -413,12 +418,11 @@ Be specific with numbers from the data above. Identify trends, anomalies, and pr
     
     async def run_stream(self, messages: str | ChatMessage | list[str] | list[ChatMessage] | None = None, *, thread: AgentThread | None = None, **kwargs: Any) -> AsyncIterable[AgentRunResponseUpdate]:
         """Execute and yield streaming response (MAF required method)."""
-        response = await self.run(messages, thread=thread, **kwargs)
-        for message in response.messages:
-            if message.contents:
-                for content in message.contents:
-                    if isinstance(content, TextContent):
-                        yield AgentRunResponseUpdate(contents=[content], role=Role.ASSISTANT)
+        async for update in stream_run(
+            lambda: self.run(messages, thread=thread, **kwargs),
+            author_name=self.name
+        ):
+            yield update
     
     async def process(self, task: str, context: Dict[str, Any] = None) -> str:
         """Legacy method for YAML workflow compatibility."""
@@ -4,10 +4,12 @@ Report Agent Adapter
 Generates PDF equity research reports from accumulated analysis.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterable, Dict, List, Optional
 from datetime import datetime
 import structlog
-from agent_framework import BaseAgent, ChatMessage, Role, TextContent, AgentRunResponse
+from agent_framework import BaseAgent, ChatMessage, Role, TextContent, AgentRunResponse, AgentRunResponseUpdate
+
+from .streaming import complete, emit, stream_run
 
 logger = structlog.get_logger(__name__)
 
@@ -128,10 +130,8 @@ Style Guidelines:
         prompt = self._build_report_prompt(ticker, artifacts, context)
         
         try:
-            response = await self._execute_llm(prompt)
-            result_text = f"""## Equity Research Brief: {ticker}
-
-{response}
+            heading = f"## Equity Research Brief: {ticker}\n\n"
+            footer = """
 
 ---
 *Report generated by ReportAgent synthesizing multi-agent financial analysis*
@@ -139,6 +139,10 @@ Style Guidelines:
 **NOTE**: This report is ready for PDF export. The structured markdown can be converted 
 to a professional PDF document using standard report templates.
 """
+            emit(heading)
+            response = await self._execute_llm(prompt)
+            emit(footer)
+            result_text = f"{heading}{response}{footer}"
             
             # Track report artifact
             artifacts.append({
@@ -158,6 +162,20 @@ to a professional PDF document using standard report templates.
                 f"Report generation failed for {ticker}: {str(e)}"
             )
     
+    async def run_stream(
+        self,
+        messages: str | ChatMessage | list[str] | list[ChatMessage] | None = None,
+        *,
+        thread: Any = None,
+        **kwargs: Any
+    ) -> AsyncIterable[AgentRunResponseUpdate]:
+        """Generate equity research report, yielding text as it is written."""
+        async for update in stream_run(
+            lambda: self.run(messages, thread=thread, **kwargs),
+            author_name=self.name
+        ):
+            yield update
+    
     def _build_report_prompt(
         self,
         ticker: str,
@@ -296,13 +314,14 @@ Use clear, professional language. Include specific numbers. Be balanced and obje
             ChatMessage(role=Role.USER, text=prompt)
         ]
         
-        response = await self.chat_client.get_response(
-            messages=messages,
+        text = await complete(
+            self.chat_client,
+            messages,
             temperature=0.7,
             max_tokens=4000
         )
         
-        return response.text
+        return text
     
     def _extract_task(self, messages) -> str:
         """Extract task from messages."""
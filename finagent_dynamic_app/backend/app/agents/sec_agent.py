@@ -13,6 +13,8 @@ import structlog
 # Microsoft Agent Framework imports
 from agent_framework import BaseAgent, ChatMessage, Role, TextContent, AgentRunResponse, AgentRunResponseUpdate, AgentThread
 
+from .streaming import complete, emit, stream_run
+
 # Import data providers
 import sys
 from pathlib import Path
@@ -157,7 +159,15 @@ Structure your analysis clearly with supporting evidence from the filings."""
         
         try:
             logger.info(f"SECAgent calling LLM for {ticker}")
+            heading = f"## SEC Filing Analysis for {ticker} ({year})\n\n"
+            footer = """
+
+---
+*SEC analysis by SECAgent based on real regulatory filings*
+"""
+            emit(heading)
             response = await self._execute_llm(prompt)
+            emit(footer)
             
             logger.info(
                 f"SECAgent LLM response received",
@@ -165,13 +175,7 @@ Structure your analysis clearly with supporting evidence from the filings."""
                 response_length=len(response) if response else 0
             )
             
-            result_text = f"""## SEC Filing Analysis for {ticker} ({year})
-
-{response}
-
----
-*SEC analysis by SECAgent based on real regulatory filings*
-"""
+            result_text = f"{heading}{response}{footer}"
             
             # Track artifacts
             artifacts = context.get("artifacts", [])
@@ -402,13 +406,14 @@ Be professional, analytical, and provide actionable insights for investment deci
             ChatMessage(role=Role.USER, text=prompt)
         ]
         
-        response = await self.chat_client.get_response(
-            messages=messages,
+        text = await complete(
+            self.chat_client,
+            messages,
             temperature=0.7,
             max_tokens=3000
         )
         
-        return response.text
+        return text
     
     def _create_response(self, text: str) -> AgentRunResponse:
         """Create agent response following MAF pattern."""
@@ -436,19 +441,11 @@ Be professional, analytical, and provide actionable insights for investment deci
         Yields:
             AgentRunResponseUpdate objects containing chunks of the response
         """
-        # For now, implement non-streaming version by yielding complete response
-        # Future: Implement true streaming with Azure OpenAI streaming API
-        response = await self.run(messages, thread=thread, **kwargs)
-        
-        # Yield the complete response as a single update
-        for message in response.messages:
-            if message.contents:
-                for content in message.contents:
-                    if isinstance(content, TextContent):
-                        yield AgentRunResponseUpdate(
-                            contents=[content],
-                            role=Role.ASSISTANT
-                        )
+        async for update in stream_run(
+            lambda: self.run(messages, thread=thread, **kwargs),
+            author_name=self.name
+        ):
+            yield update
     
     async def process(self, task: str, context: Dict[str, Any] = None) -> str:
         """Legacy method for YAML-based workflow compatibility."""
@@ -5,11 +5,13 @@ Microsoft Agent Framework compliant agent for summarization tasks.
 Does NOT add extra structure or analysis - just summarizes what's provided.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterable, Dict, List, Optional
 import structlog
 
 # Microsoft Agent Framework imports
-from agent_framework import BaseAgent, ChatMessage, Role, TextContent, AgentRunResponse, AgentThread
+from agent_framework import BaseAgent, ChatMessage, Role, TextContent, AgentRunResponse, AgentRunResponseUpdate, AgentThread
+
+from .streaming import complete, stream_run
 
 logger = structlog.get_logger(__name__)
 
@@ -133,9 +135,7 @@ Be concise, focused, and directly address the summarization task."""
                 ])
             
             logger.info("Calling chat client for summary generation")
-            response = await self.chat_client.get_response(messages=chat_messages, temperature=0.3, max_tokens=2000)
-            
-            summary_text = response.text if hasattr(response, 'text') else str(response)
+            summary_text = await complete(self.chat_client, chat_messages, temperature=0.3, max_tokens=2000)
             
             logger.info(
                 "Summary generated successfully",
@@ -160,6 +160,20 @@ Be concise, focused, and directly address the summarization task."""
             )
             return AgentRunResponse(messages=[response_message])
     
+    async def run_stream(
+        self,
+        messages: str | ChatMessage | list[str] | list[ChatMessage] | None = None,
+        *,
+        thread: AgentThread | None = None,
+        **kwargs: Any
+    ) -> AsyncIterable[AgentRunResponseUpdate]:
+        """Execute summarization task, yielding the summary as it is generated."""
+        async for update in stream_run(
+            lambda: self.run(messages, thread=thread, **kwargs),
+            author_name=self.name
+        ):
+            yield update
+    
     def _normalize_messages(
         self, messages: str | ChatMessage | list[str] | list[ChatMessage] | None
     ) -> list[ChatMessage]:
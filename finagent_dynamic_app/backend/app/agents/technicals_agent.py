@@ -12,6 +12,8 @@ import structlog
 # Microsoft Agent Framework imports
 from agent_framework import BaseAgent, ChatMessage, Role, TextContent, AgentRunResponse, AgentRunResponseUpdate, AgentThread
 
+from .streaming import complete, emit, stream_run
+
 # Import data providers
 import sys
 from pathlib import Path
@@ -131,7 +133,15 @@ Be data-driven and explain the reasoning behind signals."""
         
         try:
             logger.info(f"TechnicalsAgent calling LLM for {ticker}")
+            heading = f"## Technical Analysis for {ticker}\n\n"
+            footer = """
+
+---
+*Technical analysis by TechnicalsAgent based on real price data and calculated indicators*
+"""
+            emit(heading)
             response = await self._execute_llm(prompt)
+            emit(footer)
             
             logger.info(
                 f"TechnicalsAgent LLM response received",
@@ -139,13 +149,7 @@ Be data-driven and explain the reasoning behind signals."""
                 response_length=len(response) if response else 0
             )
             
-            result_text = f"""## Technical Analysis for {ticker}
-
-{response}
-
----
-*Technical analysis by TechnicalsAgent based on real price data and calculated indicators*
-"""
+            result_text = f"{heading}{response}{footer}"
             
             # Track artifacts
             artifacts = context.get("artifacts", [])
@@ -427,13 +431,14 @@ Be specific with the actual numbers from the data above. Explain why certain ind
             ChatMessage(role=Role.USER, text=prompt)
         ]
         
-        response = await self.chat_client.get_response(
-            messages=messages,
+        text = await complete(
+            self.chat_client,
+            messages,
             temperature=0.7,
             max_tokens=3000
         )
         
-        return response.text
+        return text
     
     def _create_response(self, text: str) -> AgentRunResponse:
         """Create agent response following MAF pattern."""
@@ -441,12 +446,11 @@ Be specific with the actual numbers from the data above. Explain why certain ind
     
     async def run_stream(self, messages: str | ChatMessage | list[str] | list[ChatMessage] | None = None, *, thread: AgentThread | None = None, **kwargs: Any) -> AsyncIterable[AgentRunResponseUpdate]:
         """Execute and yield streaming response (MAF required method)."""
-        response = await self.run(messages, thread=thread, **kwargs)
-        for message in response.messages:
-            if message.contents:
-                for content in message.contents:
-                    if isinstance(content, TextContent):
-                        yield AgentRunResponseUpdate(contents=[content], role=Role.ASSISTANT)
+        async for update in stream_run(
+            lambda: self.run(messages, thread=thread, **kwargs),
+            author_name=self.name
+        ):
+            yield update
     
     async def process(self, task: str, context: Dict[str, Any] = None) -> str:
         """Legacy method for YAML workflow compatibility."""
@@ -0,0 +1,339 @@
+"""
+LLM Response Cache
+
+Exact-match cache of chat completion responses, consulted by clients wrapped
+with ``gate_openai_client`` / ``gate_chat_client`` before a request is queued
+at the gateway. Ticker extraction, planning, entity extraction and compliance
+checks send the same prompts again and again across sessions; with the cache
+enabled a repeated request is answered without reaching the model.
+
+The key is the SHA-256 of the endpoint and the canonical JSON of every request
+field that affects the completion: deployment, messages, tools, response
+format and sampling parameters. Only non-streaming calls are cached:
+temperature-0 calls always, other calls only inside ``cacheable_llm_calls``,
+where the caller accepts that a repeated prompt gets the first answer again.
+
+Entries live in a byte-bounded in-memory LRU in front of an optional SQLite
+file, which survives restarts and can be shared by the workers of one host.
+Identical calls made while the first is in flight wait for its response.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Tuple
+
+import openai
+import structlog
+from openai.types.chat import ChatCompletion
+from pydantic import BaseModel
+
+from .settings import Settings
+
+logger = structlog.get_logger(__name__)
+
+# Bump when the key material or the stored format changes
+CACHE_VERSION = 1
+
+# Request fields that don't affect the completion
+IGNORED_PARAMETERS = {"stream", "stream_options", "timeout", "user", "extra_headers", "metadata", "store"}
+
+TABLE = "llm_responses"
+
+_cacheable_scope: ContextVar[bool] = ContextVar("llm_cacheable_scope", default=False)
+
+
+@contextmanager
+def cacheable_llm_calls() -> Iterator[None]:
+    """Let non-zero-temperature calls in this task (and tasks it spawns) be served from the cache."""
+    token = _cacheable_scope.set(True)
+    try:
+        yield
+    finally:
+        _cacheable_scope.reset(token)
+
+
+def _given(value: Any) -> bool:
+    return value is not None and not isinstance(value, openai.NotGiven)
+
+
+def _canonical(value: Any) -> Any:
+    """JSON-compatible form of a request field, with unset SDK arguments dropped."""
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items() if not isinstance(v, openai.NotGiven)}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, type) and issubclass(value, BaseModel):
+        return value.model_json_schema()
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def is_cacheable(params: Dict[str, Any]) -> bool:
+    """Whether a ``chat.completions.create`` call may be answered from the cache."""
+    if params.get("stream") is True:
+        return False
+    if _given(params.get("n")) and params["n"] != 1:
+        return False
+    temperature = params.get("temperature")
+    return (_given(temperature) and temperature == 0) or _cacheable_scope.get()
+
+
+def make_cache_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """Derive the cache key from the endpoint and the request fields."""
+    material = json.dumps(
+        {
+            "version": CACHE_VERSION,
+            "endpoint": endpoint,
+            "request": _canonical({k: v for k, v in params.items() if k not in IGNORED_PARAMETERS}),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Two-tier (memory + optional SQLite) cache of chat completions."""
+
+    def __init__(
+        self,
+        memory_bytes: int = 16 * 1024 * 1024,
+        sqlite_path: Optional[str] = None,
+        sqlite_max_bytes: int = 256 * 1024 * 1024,
+        ttl_seconds: float = 86400
+    ):
+        """
+        Args:
+            memory_bytes: Size bound of the in-memory LRU (serialized responses)
+            sqlite_path: SQLite file for the persistent tier (None = memory only)
+            sqlite_max_bytes: Size bound of the SQLite tier; least recently used entries go first
+            ttl_seconds: Age after which an entry is no longer served (0 = never)
+        """
+        self.memory_bytes = memory_bytes
+        self.sqlite_path = sqlite_path
+        self.sqlite_max_bytes = sqlite_max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._memory_used = 0
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._sqlite_used: Optional[int] = None
+        self._stats: Dict[str, int] = {
+            "memory_hits": 0,
+            "sqlite_hits": 0,
+            "coalesced": 0,
+            "misses": 0,
+            "memory_evictions": 0,
+            "sqlite_evictions": 0,
+        }
+
+    async def get_or_create(self, key: str, create: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached response for ``key``, or call ``create`` and cache its result."""
+        data = await self._lookup(key)
+        if data is not None:
+            return ChatCompletion.model_validate_json(data)
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            self._stats["coalesced"] += 1
+            try:
+                data = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                data = None
+            # The first caller went away or got an uncacheable response; make our own call
+            return ChatCompletion.model_validate_json(data) if data is not None else await create()
+
+        self._stats["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        # Nobody may be waiting on it; don't log its exception as unretrieved
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._pending[key] = future
+        try:
+            response = await create()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._pending.pop(key, None)
+
+        data = None
+        if isinstance(response, ChatCompletion) and response.choices:
+            data = response.model_dump_json()
+            await self._store(key, data)
+        future.set_result(data)
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and tier sizes, for diagnostics."""
+        hits = self._stats["memory_hits"] + self._stats["sqlite_hits"] + self._stats["coalesced"]
+        total = hits + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": hits / total if total else 0.0,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_used,
+            "sqlite_bytes": self._sqlite_used,
+        }
+
+    # ------------------------------------------------------------------
+    # Memory tier
+    # ------------------------------------------------------------------
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return bool(self.ttl_seconds) and stored_at < now - self.ttl_seconds
+
+    def _remember(self, key: str, stored_at: float, data: str) -> None:
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_used -= len(previous[1])
+        if len(data) > self.memory_bytes:
+            return
+        self._memory[key] = (stored_at, data)
+        self._memory_used += len(data)
+        while self._memory_used > self.memory_bytes:
+            _, (_, evicted) = self._memory.popitem(last=False)
+            self._memory_used -= len(evicted)
+            self._stats["memory_evictions"] += 1
+
+    async def _lookup(self, key: str) -> Optional[str]:
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None:
+            if not self._expired(entry[0], now):
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return entry[1]
+            self._memory_used -= len(self._memory.pop(key)[1])
+
+        if self.sqlite_path:
+            try:
+                row = await self._run(self._sqlite_get, key, now)
+            except sqlite3.Error as e:
+                logger.warning("LLM cache read failed", error=str(e))
+                row = None
+            if row is not None:
+                self._remember(key, row[0], row[1])
+                self._stats["sqlite_hits"] += 1
+                logger.debug("LLM cache hit", key=key[:16], tier="sqlite")
+                return row[1]
+        return None
+
+    async def _store(self, key: str, data: str) -> None:
+        now = time.time()
+        self._remember(key, now, data)
+        if self.sqlite_path:
+            try:
+                await self._run(self._sqlite_put, key, data, now)
+            except sqlite3.Error as e:
+                logger.warning("Failed to persist LLM cache entry", key=key[:16], error=str(e))
+
+    # ------------------------------------------------------------------
+    # SQLite tier (every statement runs on one worker thread)
+    # ------------------------------------------------------------------
+
+    async def _run(self, fn, *args):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm-cache")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.sqlite_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.sqlite_path, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {TABLE} ("
+                "key TEXT PRIMARY KEY, "
+                "response TEXT NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "stored_at REAL NOT NULL, "
+                "last_used REAL NOT NULL)"
+            )
+            conn.execute(f"CREATE INDEX IF NOT EXISTS ix_{TABLE}_last_used ON {TABLE} (last_used)")
+            self._conn = conn
+            self._sqlite_used = self._sqlite_size()
+            logger.info("LLM cache database opened", path=self.sqlite_path, bytes=self._sqlite_used)
+        return self._conn
+
+    def _sqlite_size(self) -> int:
+        return self._conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {TABLE}").fetchone()[0]
+
+    def _sqlite_get(self, key: str, now: float) -> Optional[Tuple[float, str]]:
+        conn = self._connection()
+        row = conn.execute(f"SELECT stored_at, response FROM {TABLE} WHERE key = ?", (key,)).fetchone()
+        if row is None or self._expired(row[0], now):
+            return None
+        conn.execute(f"UPDATE {TABLE} SET last_used = ? WHERE key = ?", (now, key))
+        return row[0], row[1]
+
+    def _sqlite_put(self, key: str, data: str, now: float) -> None:
+        conn = self._connection()
+        conn.execute(
+            f"INSERT OR REPLACE INTO {TABLE} (key, response, size, stored_at, last_used) VALUES (?, ?, ?, ?, ?)",
+            (key, data, len(data), now, now)
+        )
+        self._sqlite_used += len(data)
+        if self._sqlite_used <= self.sqlite_max_bytes:
+            return
+        # Other workers write to the same file; recount before evicting
+        if self.ttl_seconds:
+            conn.execute(f"DELETE FROM {TABLE} WHERE stored_at < ?", (now - self.ttl_seconds,))
+        self._sqlite_used = self._sqlite_size()
+        target = int(self.sqlite_max_bytes * 0.9)
+        while self._sqlite_used > target:
+            rows = conn.execute(
+                f"SELECT key, size FROM {TABLE} ORDER BY last_used LIMIT 100"
+            ).fetchall()
+            if not rows:
+                break
+            conn.executemany(f"DELETE FROM {TABLE} WHERE key = ?", [(row[0],) for row in rows])
+            self._sqlite_used -= sum(row[1] for row in rows)
+            self._stats["sqlite_evictions"] += len(rows)
+
+
+# Process-wide cache; resolved once, so a disabled cache is not re-read from settings
+_cache: Optional[LLMResponseCache] = None
+_cache_resolved = False
+
+
+def get_llm_cache(settings: Optional[Settings] = None) -> Optional[LLMResponseCache]:
+    """Get or create the cache singleton (None unless LLM_CACHE_ENABLED is on)."""
+    global _cache, _cache_resolved
+    if not _cache_resolved:
+        settings = settings or Settings()
+        _cache_resolved = True
+        if not settings.llm_cache_enabled:
+            return None
+        _cache = LLMResponseCache(
+            memory_bytes=settings.llm_cache_memory_mb * 1024 * 1024,
+            sqlite_path=settings.llm_cache_sqlite_path,
+            sqlite_max_bytes=settings.llm_cache_sqlite_max_mb * 1024 * 1024,
+            ttl_seconds=settings.llm_cache_ttl_seconds
+        )
+        logger.info(
+            "LLM response cache initialized",
+            memory_mb=settings.llm_cache_memory_mb,
+            sqlite_path=settings.llm_cache_sqlite_path
+        )
+    return _cache
@@ -35,6 +35,8 @@ class Settings(BaseSettings):
         default="FinAgent Research Bot contact@example.com",
         alias="SEC_USER_AGENT"
     )
+    # Ask the LLM only when the local ticker resolver finds the objective ambiguous
+    ticker_llm_fallback: bool = Field(default=True, alias="TICKER_LLM_FALLBACK")
     
     @property
     def FMP_API_KEY(self) -> Optional[str]:
@@ -66,6 +68,9 @@ class Settings(BaseSettings):
     cosmosdb_key: Optional[str] = Field(default=None, alias="COSMOSDB_KEY")
     cosmosdb_database: str = Field(default="finagent", alias="COSMOS_DB_DATABASE")
     cosmosdb_container: str = Field(default="dynamic", alias="COSMOS_DB_CONTAINER")
+    memory_store_backend: str = Field(default="cosmos", alias="MEMORY_STORE_BACKEND")  # cosmos | sqlite
+    sqlite_memory_path: str = Field(default="data/memory_store.db", alias="SQLITE_MEMORY_PATH")
+    memory_store_record_path: Optional[str] = Field(default=None, alias="MEMORY_STORE_RECORD_PATH")
     
     # Azure Authentication (for managed identity/service principal)
     azure_tenant_id: Optional[str] = Field(default=None, alias="AZURE_TENANT_ID")
@@ -143,6 +148,25 @@ class Settings(BaseSettings):
     default_agent_timeout: int = Field(default=300, alias="DEFAULT_AGENT_TIMEOUT")
     enable_agent_telemetry: bool = Field(default=True, alias="ENABLE_AGENT_TELEMETRY")
     
+    # LLM Gateway (deployment quotas shared by all agents; 0 = no limit)
+    llm_gateway_enabled: bool = Field(default=True, alias="LLM_GATEWAY_ENABLED")
+    llm_requests_per_minute: int = Field(default=0, alias="LLM_REQUESTS_PER_MINUTE")
+    llm_tokens_per_minute: int = Field(default=0, alias="LLM_TOKENS_PER_MINUTE")
+    llm_max_concurrent_requests: int = Field(default=0, alias="LLM_MAX_CONCURRENT_REQUESTS")
+    llm_max_retries: int = Field(default=4, alias="LLM_MAX_RETRIES")
+    
+    # LLM Response Cache (exact-match; opt-in)
+    llm_cache_enabled: bool = Field(default=False, alias="LLM_CACHE_ENABLED")
+    llm_cache_memory_mb: int = Field(default=16, alias="LLM_CACHE_MEMORY_MB")
+    llm_cache_sqlite_path: Optional[str] = Field(default=None, alias="LLM_CACHE_SQLITE_PATH")
+    llm_cache_sqlite_max_mb: int = Field(default=256, alias="LLM_CACHE_SQLITE_MAX_MB")
+    llm_cache_ttl_seconds: int = Field(default=86400, alias="LLM_CACHE_TTL_SECONDS")
+    
+    # Plan Templates (plans for recurring objective shapes reused without a planner call)
+    plan_templates_enabled: bool = Field(default=True, alias="PLAN_TEMPLATES_ENABLED")
+    plan_template_max_entries: int = Field(default=256, alias="PLAN_TEMPLATE_MAX_ENTRIES")
+    plan_template_ttl_seconds: int = Field(default=86400, alias="PLAN_TEMPLATE_TTL_SECONDS")
+    
     # Execution Configuration
     max_sequential_steps: int = Field(default=10, alias="MAX_SEQUENTIAL_STEPS")
     handoff_max_iterations: int = Field(default=10, alias="HANDOFF_MAX_ITERATIONS")
@@ -2,7 +2,9 @@
 
 from .agent_factory import MAFAgentFactory, AgentDefinition  # noqa: F401
 from .planning import MAFDynamicPlanner, PlanStep, PlanParsingError  # noqa: F401
+from .plan_templates import PlanTemplateCache  # noqa: F401
 from .orchestrator import MAFOrchestrator, WorkflowResult  # noqa: F401
+from .workflow_cache import WorkflowCache  # noqa: F401
 from .mcp_adapter import (  # noqa: F401
     ExternalMCPServer,
     MAFMCPAdapter,
@@ -17,7 +19,9 @@ __all__ = [
     "MAFOrchestrator",
     "PlanParsingError",
     "PlanStep",
+    "PlanTemplateCache",
     "WorkflowResult",
+    "WorkflowCache",
     "MAFMCPAdapter",
     "ExternalMCPServer",
     "create_maf_mcp_adapter_from_config",
@@ -3,19 +3,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Sequence
+from typing import Dict, List, Sequence
 
 import structlog
 
 from agent_framework import (
     ChatMessage,
     Role,
-    SequentialBuilder,
-    ConcurrentBuilder,
     WorkflowOutputEvent,
     TextContent,
 )
 
+from .workflow_cache import WorkflowCache
+
 logger = structlog.get_logger(__name__)
 
 
@@ -38,16 +38,22 @@ class MAFOrchestrator:
 
     def __init__(self) -> None:
         self._agents: Dict[str, object] = {}
+        self._workflows = WorkflowCache()
         logger.info("Financial MAF orchestrator initialised")
 
     def register_agent(self, name: str, agent: object) -> None:
         """Register a MAF-compatible agent for workflow execution."""
+        previous = self._agents.get(name)
+        if previous is not None and previous is not agent:
+            self._workflows.invalidate(previous)
         self._agents[name] = agent
         logger.debug("Registered agent with orchestrator", agent=name)
 
     def unregister_agent(self, name: str) -> None:
         """Remove an agent from the orchestrator registry."""
-        self._agents.pop(name, None)
+        agent = self._agents.pop(name, None)
+        if agent is not None:
+            self._workflows.invalidate(agent)
         logger.debug("Unregistered agent", agent=name)
 
     def get_agent(self, name: str) -> object:
@@ -75,11 +81,7 @@ class MAFOrchestrator:
         if not agents:
             raise ValueError("At least one agent must be provided for sequential workflows")
 
-        builder = SequentialBuilder().participants(agents)
-        workflow = builder.build()
-        events = await workflow.run(self._build_messages(prompt))
-        messages = self._extract_output_messages(events)
-        return WorkflowResult(messages=messages)
+        return await self._run_workflow("sequential", agents, prompt)
 
     async def run_concurrent(
         self,
@@ -91,16 +93,22 @@ class MAFOrchestrator:
         if len(agents) < 2:
             raise ValueError("Concurrent workflows require at least two agents")
 
-        builder = ConcurrentBuilder().participants(agents)
-        workflow = builder.build()
-        events = await workflow.run(self._build_messages(prompt))
-        messages = self._extract_output_messages(events)
-        return WorkflowResult(messages=messages)
+        return await self._run_workflow("concurrent", agents, prompt)
 
-    @staticmethod
-    def _extract_output_messages(events: Iterable[object]) -> List[ChatMessage]:
+    async def _run_workflow(
+        self,
+        mode: str,
+        agents: List[object],
+        prompt: str | ChatMessage | Sequence[ChatMessage],
+    ) -> WorkflowResult:
+        """Run a cached workflow, keeping only output events as they stream."""
         collected: List[ChatMessage] = []
-        for event in events:
-            if isinstance(event, WorkflowOutputEvent):
-                collected.extend(event.data or [])
-        return collected
+        async with self._workflows.lease(mode, agents) as workflow:
+            async for event in workflow.run_stream(self._build_messages(prompt)):
+                if isinstance(event, WorkflowOutputEvent):
+                    collected.extend(event.data or [])
+        return WorkflowResult(messages=collected)
+
+    def workflow_cache_stats(self) -> Dict[str, int]:
+        """Hit/miss counters and size of the built-workflow cache."""
+        return self._workflows.stats()
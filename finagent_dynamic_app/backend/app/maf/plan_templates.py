@@ -0,0 +1,280 @@
+"""Parameterized plan templates for recurring planning objectives.
+
+Most objectives come in a handful of shapes ("full analysis of <company>",
+"forecast <ticker> price movement for Q3 2025"), and the planner produces the
+same steps for every instance of a shape. A template is learned from a plan
+the LLM produced: the ticker, the company's name and any dates in the
+objective become numbered slots, the same values are replaced in the plan
+steps, and later objectives of the same shape get the steps back with their
+own values filled in, without a planner call.
+
+Templates are keyed on the planning prompt built from the slotted objective
+together with the planner agent's instructions and ``PLAN_TEMPLATE_VERSION``,
+so changing the planning rules, the prompt or the planner never serves a plan
+learned under the old ones. A plan is only learned when the substitution is
+exact: filling the template with the original values must reproduce the plan,
+and no other reference to the company, and no date, may be left in the steps.
+Dates the planner derived from the objective's ("compare with Q3 2024" for
+Q3 2025) cannot be filled in for another objective.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Collection, Dict, List, Optional, Tuple
+
+import structlog
+
+from .planning import PlanStep
+
+logger = structlog.get_logger(__name__)
+
+# Bump when plan parsing or enrichment changes in a way that invalidates learned plans
+PLAN_TEMPLATE_VERSION = "1"
+
+TICKER_SLOT = "{{ticker}}"
+OBJECTIVE_SLOT = "{{objective}}"
+
+_MONTHS = (
+    "january|february|march|april|may|june|july|august|september|october|november|december"
+    "|jan|feb|mar|apr|jun|jul|aug|sept|sep|oct|nov|dec"
+)
+
+# Dates, months, quarters and fiscal years; longer forms first so "Q3 2025" is one slot
+DATE_RE = re.compile(
+    r"\b(?:"
+    r"\d{4}-\d{2}-\d{2}"
+    r"|\d{1,2}/\d{1,2}/\d{2,4}"
+    rf"|(?:{_MONTHS})\.?\s+\d{{1,2}}(?:st|nd|rd|th)?,?\s+\d{{4}}"
+    rf"|(?:{_MONTHS})\.?\s+\d{{4}}"
+    r"|[QH][1-4]\s*(?:FY\s*)?'?\d{2,4}"
+    r"|FY\s*'?\d{2,4}"
+    r"|[QH][1-4]"
+    r"|(?:19|20)\d{2}"
+    r")\b",
+    re.IGNORECASE,
+)
+
+Mentions = Callable[[str, str], List[Tuple[int, int]]]
+
+
+def symbol_mentions(text: str, symbol: str) -> List[Tuple[int, int]]:
+    """Spans of ``text`` holding the symbol itself (used when no name index is available)."""
+    pattern = re.compile(rf"(?<![\w-]){re.escape(symbol.upper())}(?![\w-])")
+    return [match.span() for match in pattern.finditer(text)]
+
+
+@dataclass(slots=True)
+class ObjectiveShape:
+    """An objective with its ticker, company mentions and dates replaced by slots."""
+
+    text: str
+    values: Dict[str, str] = field(default_factory=dict)
+    ticker: Optional[str] = None  # the ticker slot, when the plan has a ticker
+
+
+@dataclass(slots=True)
+class _Template:
+    steps: List[Dict[str, Any]]
+    learned_at: float
+
+
+class PlanTemplateCache:
+    """LRU of plan templates learned from LLM plans, keyed by objective shape."""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: float = 86400,
+        *,
+        mentions: Optional[Mentions] = None,
+        known_agents: Optional[Collection[str]] = None,
+    ) -> None:
+        """
+        Args:
+            max_entries: Templates kept; the least recently used is dropped
+            ttl_seconds: Age after which a template is relearned from the LLM (0 = never)
+            mentions: Finds the spans of a text that refer to a ticker, names included
+            known_agents: Agent names a learned plan may use (None = any)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._mentions = mentions or symbol_mentions
+        self._known_agents = set(known_agents) if known_agents is not None else None
+        self._templates: "OrderedDict[str, _Template]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.learned = 0
+        self.rejected = 0
+
+    def shape(self, objective: str, ticker: Optional[str]) -> ObjectiveShape:
+        """Replace the ticker, company mentions and dates in ``objective`` with slots."""
+        spans: List[Tuple[int, int, str]] = []
+        values: Dict[str, str] = {}
+        companies: Dict[str, str] = {}
+
+        if ticker:
+            # Enriched parameters carry the ticker even when the objective names the company
+            values[TICKER_SLOT] = ticker
+            for start, end in self._mentions(objective, ticker):
+                mention = objective[start:end]
+                if mention.lstrip("$").upper().replace(".", "-") == ticker.upper():
+                    slot = TICKER_SLOT
+                else:
+                    slot = companies.setdefault(mention.casefold(), f"{{{{company{len(companies) + 1}}}}}")
+                    values.setdefault(slot, mention)
+                spans.append((start, end, slot))
+
+        dates: Dict[str, str] = {}
+        for match in DATE_RE.finditer(objective):
+            start, end = match.span()
+            if any(start < taken_end and taken_start < end for taken_start, taken_end, _ in spans):
+                continue
+            slot = dates.setdefault(match.group().casefold(), f"{{{{date{len(dates) + 1}}}}}")
+            values.setdefault(slot, match.group())
+            spans.append((start, end, slot))
+
+        text = objective
+        for start, end, slot in sorted(spans, reverse=True):
+            text = text[:start] + slot + text[end:]
+        text = " ".join(text.split()).rstrip(".!?").lower()
+        return ObjectiveShape(text=text, values=values, ticker=TICKER_SLOT if ticker else None)
+
+    @staticmethod
+    def key(prompt: str, instructions: str = "") -> str:
+        """Cache key for the planning prompt of a slotted objective."""
+        material = "\n\x00".join((PLAN_TEMPLATE_VERSION, instructions, prompt))
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def instantiate(self, key: str, shape: ObjectiveShape, objective: str) -> Optional[List[PlanStep]]:
+        """Steps of the template under ``key`` filled in for ``objective``, or None."""
+        template = self._templates.get(key)
+        if template is not None and self.ttl_seconds and time.monotonic() - template.learned_at > self.ttl_seconds:
+            del self._templates[key]
+            template = None
+        if template is None:
+            self.misses += 1
+            return None
+
+        self._templates.move_to_end(key)
+        self.hits += 1
+        return self._fill(template.steps, shape.values, objective)
+
+    def learn(
+        self,
+        key: str,
+        shape: ObjectiveShape,
+        objective: str,
+        ticker: Optional[str],
+        steps: List[PlanStep],
+    ) -> bool:
+        """Store ``steps`` as the template for ``key`` if they parameterize cleanly."""
+        reason = self._invalid(steps)
+        original = [step.to_dict() for step in steps]
+        template: List[Dict[str, Any]] = []
+        if reason is None:
+            template = _replace(original, self._slot_patterns(shape, objective))
+            if [step.to_dict() for step in self._fill(template, shape.values, objective)] != original:
+                reason = "substitution is not reversible"
+            elif ticker and any(self._mentions(text, ticker) for text in _strings(template)):
+                reason = "plan refers to the company by a name the objective does not use"
+            elif any(DATE_RE.search(text) for text in _strings(template)):
+                reason = "plan has dates that are not in the objective"
+
+        if reason is not None:
+            self.rejected += 1
+            logger.debug("Plan not learned as template", reason=reason, shape=shape.text[:80])
+            return False
+
+        self._templates[key] = _Template(steps=template, learned_at=time.monotonic())
+        self._templates.move_to_end(key)
+        while len(self._templates) > self.max_entries:
+            self._templates.popitem(last=False)
+        self.learned += 1
+        logger.info("Plan template learned", shape=shape.text[:80], steps=len(template))
+        return True
+
+    def _invalid(self, steps: List[PlanStep]) -> Optional[str]:
+        if not steps:
+            return "no steps"
+        if len({step.order for step in steps}) != len(steps):
+            return "duplicate step numbers"
+        if self._known_agents is not None:
+            unknown = {step.agent for step in steps} - self._known_agents
+            if unknown:
+                return f"unknown agents {sorted(unknown)}"
+        return None
+
+    @staticmethod
+    def _slot_patterns(shape: ObjectiveShape, objective: str) -> List[Tuple[re.Pattern, str]]:
+        """Patterns replacing this instance's values with their slots, longest value first."""
+        patterns = []
+        for slot, value in sorted(shape.values.items(), key=lambda item: -len(item[1])):
+            # Tickers are matched case-sensitively: "ON" the symbol, not "on" the word
+            flags = 0 if slot == TICKER_SLOT else re.IGNORECASE
+            patterns.append((re.compile(rf"(?<![\w-]){re.escape(value)}(?![\w-])", flags), slot))
+        return [(re.compile(rf"^{re.escape(objective)}$"), OBJECTIVE_SLOT)] + patterns
+
+    @staticmethod
+    def _fill(template: List[Dict[str, Any]], values: Dict[str, str], objective: str) -> List[PlanStep]:
+        filled = _fill_slots(template, {**values, OBJECTIVE_SLOT: objective})
+        return [
+            PlanStep(
+                order=step["order"],
+                action=step["action"],
+                agent=step["agent"],
+                tool=step["tool"],
+                parameters=step["parameters"],
+            )
+            for step in filled
+        ]
+
+    def clear(self) -> None:
+        self._templates.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "learned": self.learned,
+            "rejected": self.rejected,
+            "templates": len(self._templates),
+        }
+
+
+def _replace(value: Any, patterns: List[Tuple[re.Pattern, str]]) -> Any:
+    if isinstance(value, str):
+        for pattern, slot in patterns:
+            value = pattern.sub(lambda _: slot, value)
+        return value
+    if isinstance(value, list):
+        return [_replace(item, patterns) for item in value]
+    if isinstance(value, dict):
+        return {key: _replace(item, patterns) for key, item in value.items()}
+    return value
+
+
+def _fill_slots(value: Any, values: Dict[str, str]) -> Any:
+    if isinstance(value, str):
+        for slot, filler in values.items():
+            value = value.replace(slot, filler)
+        return value
+    if isinstance(value, list):
+        return [_fill_slots(item, values) for item in value]
+    if isinstance(value, dict):
+        return {key: _fill_slots(item, values) for key, item in value.items()}
+    return value
+
+
+def _strings(value: Any) -> List[str]:
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list):
+        return [text for item in value for text in _strings(item)]
+    if isinstance(value, dict):
+        return [text for item in value.values() for text in _strings(item)]
+    return []
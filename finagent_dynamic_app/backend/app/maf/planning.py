@@ -4,12 +4,17 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
 import structlog
 
 from agent_framework import AgentRunResponse, ChatAgent, ChatMessage, Role, TextContent
 
+from ..infra.llm_cache import cacheable_llm_calls
+
+if TYPE_CHECKING:
+    from .plan_templates import PlanTemplateCache
+
 logger = structlog.get_logger(__name__)
 
 
@@ -46,9 +51,11 @@ class MAFDynamicPlanner:
         planner_agent: ChatAgent,
         *,
         planning_rules: Optional[str] = None,
+        templates: Optional[PlanTemplateCache] = None,
     ) -> None:
         self._planner_agent = planner_agent
         self._planning_rules = planning_rules or self._default_rules()
+        self._templates = templates
         logger.info("Financial MAF planner initialised", agent=planner_agent.name)
 
     async def generate_plan(
@@ -60,26 +67,47 @@ class MAFDynamicPlanner:
         persona: str = "investment",
         ticker: Optional[str] = None,
     ) -> List[PlanStep]:
-        """Create a structured plan using the underlying chat agent."""
+        """Create a structured plan using the underlying chat agent.
+
+        With a template cache, objectives of a shape planned before are
+        instantiated from the learned template and the LLM is not called.
+        """
+        files_info = list(files_info or [])
+        shape = template_key = None
+        if self._templates is not None and not files_info:
+            shape = self._templates.shape(objective, ticker)
+            template_key = self._templates.key(
+                self._build_prompt(shape.text, None, summary_type, persona, shape.ticker),
+                instructions=getattr(self._planner_agent.chat_options, "instructions", None) or "",
+            )
+            steps = self._templates.instantiate(template_key, shape, objective)
+            if steps is not None:
+                logger.info("Plan instantiated from template", steps=len(steps))
+                return steps
+
         prompt = self._build_prompt(objective, files_info, summary_type, persona, ticker)
         logger.debug("Generating plan with financial MAF planner", objective_preview=objective[:80])
 
-        response = await self._planner_agent.run(
-            messages=[
-                ChatMessage(role=Role.USER, contents=[TextContent(text=prompt)]),
-            ]
-        )
+        # Identical planning prompts get the same plan
+        with cacheable_llm_calls():
+            response = await self._planner_agent.run(
+                messages=[
+                    ChatMessage(role=Role.USER, contents=[TextContent(text=prompt)]),
+                ]
+            )
 
         plan_text = self._extract_text(response)
         steps = self.parse_plan_text(
             plan_text,
             objective=objective,
-            files_info=list(files_info or []),
+            files_info=files_info,
             summary_type=summary_type,
             persona=persona,
             ticker=ticker,
         )
         logger.info("Plan generated via financial MAF planner", steps=len(steps))
+        if shape is not None:
+            self._templates.learn(template_key, shape, objective, ticker, steps)
         return steps
 
     def _build_prompt(
@@ -20,6 +20,8 @@ from fastapi.staticfiles import StaticFiles
 from .routers import orchestration
 from .services.task_orchestrator import TaskOrchestrator
 from .infra.settings import Settings
+from .infra.llm_cache import get_llm_cache
+from .infra.llm_gateway import get_llm_gateway
 from .infra.telemetry import get_telemetry
 
 logger = structlog.get_logger(__name__)
@@ -85,9 +87,16 @@ app.include_router(orchestration.router)
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
+    gateway, cache = get_llm_gateway(settings), get_llm_cache(settings)
     return {
         "status": "healthy",
         "service": "financial-research-api-dynamic",
+        "llm_gateway": gateway.stats() if gateway else None,
+        "llm_cache": cache.stats() if cache else None,
+        "plan_templates": (
+            task_orchestrator.plan_templates.stats()
+            if task_orchestrator and task_orchestrator.plan_templates else None
+        ),
         "timestamp": datetime.utcnow().isoformat()
     }
 
@@ -151,8 +151,11 @@ class Step(BaseDataModel):
     human_approval_status: HumanFeedbackStatus = HumanFeedbackStatus.REQUESTED
     updated_action: Optional[str] = None
     
-    # Ordering
+    # Ordering: ``order`` is the 1-based position shown to users and the planner;
+    # ``order_key`` is a sparse sort key, so an injected step takes a key between
+    # its neighbours instead of renumbering every later step
     order: Optional[int] = None
+    order_key: Optional[float] = None
     
     # Injection tracking
     manually_injected: bool = Field(default=False)  # True if added via task injection feature
@@ -161,6 +164,42 @@ class Step(BaseDataModel):
     dependencies: List[str] = Field(default_factory=list)  # List of step IDs that must complete first
     required_artifacts: List[str] = Field(default_factory=list)  # Types of artifacts needed (e.g., "news", "recommendations")
     tools: List[str] = Field(default_factory=list)  # Specific tools/functions to call
+    
+    @property
+    def sort_key(self) -> float:
+        """Position within the plan; steps stored before order keys sort by ``order``."""
+        if self.order_key is not None:
+            return self.order_key
+        return float(self.order or 0)
+
+
+# Spacing between the order keys of consecutive planned steps
+ORDER_KEY_GAP = 1024.0
+
+
+def order_key_between(before: Optional[float], after: Optional[float]) -> Optional[float]:
+    """
+    Sort key for a step placed between two neighbours (None for a missing end).
+    
+    Returns None when no float lies strictly between them, i.e. after ~50
+    insertions at the same spot; the caller then re-spaces the plan's keys.
+    """
+    if before is None and after is None:
+        return ORDER_KEY_GAP
+    if before is None:
+        return after - ORDER_KEY_GAP
+    if after is None:
+        return before + ORDER_KEY_GAP
+    key = before + (after - before) / 2
+    return key if before < key < after else None
+
+
+def sort_steps(steps: List["Step"]) -> List["Step"]:
+    """Sort steps by plan position and renumber ``order`` as 1..N."""
+    ordered = sorted(steps, key=lambda step: (step.sort_key, step.timestamp))
+    for position, step in enumerate(ordered, start=1):
+        step.order = position
+    return ordered
 
 
 class AgentMessage(BaseDataModel):
@@ -5,6 +5,7 @@ Contains data access layer for CosmosDB and other storage backends.
 """
 
 from .memory_store_base import MemoryStoreBase
-from .cosmos_memory import CosmosMemoryStore
+from .cosmos_memory import CosmosMemoryStore, create_memory_store
+from .sqlite_memory import SqliteMemoryStore
 
-__all__ = ["MemoryStoreBase", "CosmosMemoryStore"]
+__all__ = ["MemoryStoreBase", "CosmosMemoryStore", "SqliteMemoryStore", "create_memory_store"]
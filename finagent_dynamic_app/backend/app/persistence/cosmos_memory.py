@@ -20,8 +20,10 @@ from app.models.task_models import (
     Plan,
     Session,
     Step,
+    sort_steps,
 )
 from app.persistence.memory_store_base import MemoryStoreBase
+from app.persistence.sqlite_container import RecordingContainer
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +65,7 @@ class CosmosMemoryStore(MemoryStoreBase):
         tenant_id: Optional[str] = None,
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
+        record_path: Optional[str] = None,
     ):
         self.endpoint = endpoint
         self.database_name = database_name
@@ -72,6 +75,7 @@ class CosmosMemoryStore(MemoryStoreBase):
         self.tenant_id = tenant_id
         self.client_id = client_id
         self.client_secret = client_secret
+        self.record_path = record_path
         
         self._client: Optional[CosmosClient] = None
         self._database = None
@@ -109,6 +113,10 @@ class CosmosMemoryStore(MemoryStoreBase):
                 partition_key=PartitionKey(path="/session_id"),
             )
             
+            # Record the live workload for replay by the persistence benchmark
+            if self.record_path:
+                self._container = RecordingContainer(self._container, self.record_path)
+            
             logger.info(f"CosmosDB initialized: {self.database_name}/{self.container_name}")
             self._initialized.set()
             
@@ -123,6 +131,8 @@ class CosmosMemoryStore(MemoryStoreBase):
     
     async def close(self) -> None:
         """Close Cosmos client."""
+        if isinstance(self._container, RecordingContainer):
+            self._container.close()
         if self._client:
             await self._client.close()
             self._client = None
@@ -402,7 +412,7 @@ class CosmosMemoryStore(MemoryStoreBase):
         return steps[0] if steps else None
     
     async def get_steps_by_plan(self, plan_id: str, session_id: str = None) -> List[Step]:
-        """Retrieve all steps for a plan (ordered by creation)."""
+        """Retrieve all steps for a plan in plan order, numbered 1..N."""
         if session_id:
             # Use partition key for efficient query
             query_parts = [
@@ -433,7 +443,8 @@ class CosmosMemoryStore(MemoryStoreBase):
         query_parts.append("ORDER BY c.timestamp ASC")
         query = " ".join(query_parts)
         
-        return await self._query_items(query, parameters, Step)
+        # Sorted client-side: steps written before order keys existed have none
+        return sort_steps(await self._query_items(query, parameters, Step))
     
     async def update_step(self, step: Step) -> None:
         """Update an existing step."""
@@ -447,6 +458,10 @@ class CosmosMemoryStore(MemoryStoreBase):
         """Add a new agent message."""
         await self._add_item(message)
     
+    async def update_message(self, message: AgentMessage) -> None:
+        """Update an existing agent message (e.g. a progress message as output streams in)."""
+        await self._update_item(message)
+    
     async def get_messages_by_session(
         self, 
         session_id: str,
@@ -611,3 +626,30 @@ class CosmosMemoryStore(MemoryStoreBase):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Context manager cleanup."""
         await self.close()
+
+
+def create_memory_store(settings, user_id: Optional[str] = None) -> CosmosMemoryStore:
+    """
+    Build the memory store selected by MEMORY_STORE_BACKEND.
+    
+    Returns:
+        SqliteMemoryStore for the "sqlite" backend, otherwise CosmosMemoryStore
+    """
+    if settings.memory_store_backend.strip().lower() == "sqlite":
+        from app.persistence.sqlite_memory import SqliteMemoryStore
+        return SqliteMemoryStore(
+            path=settings.sqlite_memory_path,
+            user_id=user_id,
+            record_path=settings.memory_store_record_path,
+        )
+    
+    return CosmosMemoryStore(
+        endpoint=settings.COSMOSDB_ENDPOINT,
+        database_name=settings.COSMOSDB_DATABASE,
+        container_name=settings.COSMOSDB_CONTAINER,
+        user_id=user_id,
+        tenant_id=settings.azure_tenant_id,
+        client_id=settings.azure_client_id,
+        client_secret=settings.azure_client_secret,
+        record_path=settings.memory_store_record_path,
+    )
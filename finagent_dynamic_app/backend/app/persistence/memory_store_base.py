@@ -101,6 +101,11 @@ class MemoryStoreBase(ABC):
         """Add a new agent message."""
         pass
     
+    @abstractmethod
+    async def update_message(self, message: AgentMessage) -> None:
+        """Update an existing agent message."""
+        pass
+    
     @abstractmethod
     async def get_messages_by_session(self, session_id: str) -> List[AgentMessage]:
         """Retrieve all messages for a session."""
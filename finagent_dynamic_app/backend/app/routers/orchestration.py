@@ -5,19 +5,25 @@ REST API endpoints for task planning, approval workflow, and execution.
 Uses TaskOrchestrator service to bridge framework patterns with Cosmos storage.
 """
 
+import asyncio
+import json
 from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 import structlog
 
 from ..models.task_models import (
     InputTask, Plan, Step, HumanFeedback, AgentMessage,
-    PlanWithSteps, TaskListItem, ActionResponse, StepStatus
+    PlanWithSteps, TaskListItem, ActionResponse, StepStatus,
+    ORDER_KEY_GAP, order_key_between
 )
 from ..services.task_orchestrator import TaskOrchestrator
 from ..services.task_injector import TaskInjector
-from ..persistence.cosmos_memory import CosmosMemoryStore
+from ..services.step_stream import get_step_stream_hub
+from ..persistence.cosmos_memory import create_memory_store
 from ..auth.auth_utils import get_authenticated_user_details
 from ..infra.settings import Settings
+from ..infra.llm_gateway import llm_request_context
 
 logger = structlog.get_logger(__name__)
 
@@ -87,7 +93,8 @@ async def create_plan_from_objective(
     )
 
     try:
-        plan = await orchestrator.create_plan_from_objective(input_task)
+        with llm_request_context(user_id):
+            plan = await orchestrator.create_plan_from_objective(input_task)
         
         logger.info(
             "API: Plan created successfully",
@@ -266,15 +273,7 @@ async def get_user_history(
 
     try:
         # Create a temporary memory store instance with user_id
-        cosmos = CosmosMemoryStore(
-            endpoint=orchestrator.cosmos.endpoint,
-            database_name=orchestrator.cosmos.database_name,
-            container_name=orchestrator.cosmos.container_name,
-            user_id=user_id,  # Set user_id for filtering
-            tenant_id=orchestrator.cosmos.tenant_id,
-            client_id=orchestrator.cosmos.client_id,
-            client_secret=orchestrator.cosmos.client_secret,
-        )
+        cosmos = create_memory_store(orchestrator.settings, user_id=user_id)  # Set user_id for filtering
         
         await cosmos.initialize()
         
@@ -560,6 +559,68 @@ async def get_steps_for_plan(
         )
 
 
+@router.get("/stream/{step_id}")
+async def stream_step_output(step_id: str, request: Request):
+    """
+    Stream a step's output as Server-Sent Events while it executes.
+    
+    **Path Parameters:**
+    - `step_id`: Step identifier
+    
+    **Events:**
+    - `snapshot`: Output produced before the client connected
+    - `token`: Newly generated text
+    - `done`: Step finished; carries `success`, `message_id` and timing
+      (`time_to_first_token_ms`, `duration_ms`)
+    
+    The client may connect before the step starts, e.g. right after approving it.
+    """
+    authenticated_user = get_authenticated_user_details(request_headers=request.headers)
+    user_id = authenticated_user.get("user_principal_id")
+    
+    hub = get_step_stream_hub()
+    stream = hub.subscribe(step_id)
+    if stream.user_id and user_id and stream.user_id != user_id:
+        hub.release(stream)
+        raise HTTPException(status_code=404, detail="Step not found")
+    
+    async def event_source():
+        events = stream.events()
+        pending = None
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(events.__anext__())
+                done, _ = await asyncio.wait({pending}, timeout=15.0)
+                if not done:
+                    if await request.is_disconnected():
+                        break
+                    # Keeps proxies from closing the connection while the agent fetches data
+                    yield ": keep-alive\n\n"
+                    continue
+                try:
+                    event, data = pending.result()
+                except StopAsyncIteration:
+                    break
+                pending = None
+                yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+                try:
+                    await pending
+                except (asyncio.CancelledError, StopAsyncIteration):
+                    pass
+            await events.aclose()
+            hub.release(stream)
+    
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/messages/{session_id}", response_model=List[AgentMessage])
 async def get_conversation_history(
     session_id: str,
@@ -661,11 +722,12 @@ async def inject_task(
         
         # Analyze the injection request using LLM
         logger.info("API: Starting LLM analysis of task request")
-        analysis = await injector.analyze_injection_request(
-            task_request=task_request,
-            objective=objective,
-            current_steps=current_steps
-        )
+        with llm_request_context(user_id):
+            analysis = await injector.analyze_injection_request(
+                task_request=task_request,
+                objective=objective,
+                current_steps=current_steps
+            )
         logger.info("API: LLM analysis returned", analysis_type=type(analysis).__name__)
         
         logger.info(
@@ -712,20 +774,24 @@ async def inject_task(
             )
             logger.info("API: New step created", step_id=new_step.id, insert_position=insert_position)
             
-            # Handle step reordering if inserting in middle
-            if insert_position < len(steps_data):
-                logger.info(
-                    "API: Reordering steps for middle insertion",
-                    insert_position=insert_position,
+            # The new step's order key sits between its neighbours, so existing
+            # steps keep theirs. Only when repeated insertions at one spot have
+            # exhausted the gap are the plan's keys re-spaced (one write per step).
+            if new_step.order_key is None:
+                logger.warning(
+                    "API: Order keys exhausted, re-spacing plan",
+                    plan_id=plan_id,
                     total_steps=len(steps_data)
                 )
-                
-                # Update orders of all subsequent steps
-                for step in steps_data:
-                    if step.order >= insert_position:
-                        step.order += 1
-                        await orchestrator.cosmos.update_step(step)
-                        logger.info("API: Updated step order", step_id=step.id, new_order=step.order)
+                for position, step in enumerate(steps_data, start=1):
+                    step.order_key = position * ORDER_KEY_GAP
+                    await orchestrator.cosmos.update_step(step)
+                before = steps_data[insert_position - 2] if insert_position > 1 else None
+                after = steps_data[insert_position - 1] if insert_position <= len(steps_data) else None
+                new_step.order_key = order_key_between(
+                    before.order_key if before else None,
+                    after.order_key if after else None
+                )
             
             # Persist the new step to Cosmos
             logger.info("API: Persisting new step to Cosmos", step_id=new_step.id)
@@ -736,6 +802,7 @@ async def inject_task(
                 "API: New step created and persisted",
                 step_id=new_step.id,
                 order=new_step.order,
+                order_key=new_step.order_key,
                 action=new_step.action
             )
             
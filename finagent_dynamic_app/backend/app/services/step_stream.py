@@ -0,0 +1,175 @@
+"""
+Step Output Streaming
+
+While a step executes, the agent's output is published here as the model
+generates it. ``GET /api/stream/{step_id}`` relays it to the UI as
+Server-Sent Events, and ``StepOutputWriter`` also keeps the step's progress
+message up to date, so clients that only poll messages see the text grow.
+
+A subscriber may connect before the step starts (right after approving it) or
+part-way through; it first receives the text produced so far, then each new
+delta, then a ``done`` event carrying the step's timing metadata.
+"""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+StreamEvent = Tuple[str, Any]
+
+
+class StepStream:
+    """Output of one step and the queues of its subscribers."""
+
+    def __init__(self, step_id: str, user_id: Optional[str] = None):
+        self.step_id = step_id
+        self.user_id = user_id
+        self.started = False
+        self.finished = False
+        self.result_metadata: Dict[str, Any] = {}
+        self._parts: List[str] = []
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, delta: str) -> None:
+        self._parts.append(delta)
+        for queue in self._subscribers:
+            queue.put_nowait(("token", delta))
+
+    def finish(self, metadata: Dict[str, Any]) -> None:
+        self.finished = True
+        self.result_metadata = metadata
+        for queue in self._subscribers:
+            queue.put_nowait(("done", metadata))
+
+    async def events(self) -> AsyncIterator[StreamEvent]:
+        """Yield ``snapshot`` (text so far), then ``token`` deltas, then ``done``."""
+        queue: asyncio.Queue = asyncio.Queue()
+        # Snapshot and registration happen without an await in between, so no
+        # delta is lost or repeated
+        snapshot = self.text
+        self._subscribers.add(queue)
+        try:
+            if snapshot:
+                yield "snapshot", snapshot
+            if self.finished:
+                yield "done", self.result_metadata
+                return
+            while True:
+                event = await queue.get()
+                yield event
+                if event[0] == "done":
+                    return
+        finally:
+            self._subscribers.discard(queue)
+
+
+class StepStreamHub:
+    """Process-wide registry of step streams."""
+
+    def __init__(self, linger_seconds: float = 30.0):
+        """
+        Args:
+            linger_seconds: How long a finished stream stays available to late subscribers
+        """
+        self.linger_seconds = linger_seconds
+        self._streams: Dict[str, StepStream] = {}
+
+    def start(self, step_id: str, user_id: Optional[str] = None) -> StepStream:
+        """Begin streaming a step, reusing the stream early subscribers are waiting on."""
+        stream = self._streams.get(step_id)
+        if stream is None or stream.finished:
+            stream = StepStream(step_id, user_id)
+            self._streams[step_id] = stream
+        stream.user_id = user_id
+        stream.started = True
+        return stream
+
+    def subscribe(self, step_id: str) -> StepStream:
+        """Get the stream for a step, waiting for it to start if it has not yet."""
+        stream = self._streams.get(step_id)
+        if stream is None:
+            stream = StepStream(step_id)
+            self._streams[step_id] = stream
+        return stream
+
+    def release(self, stream: StepStream) -> None:
+        """Forget a stream that never started once its last subscriber has left."""
+        if not stream.started and stream.subscriber_count == 0:
+            if self._streams.get(stream.step_id) is stream:
+                del self._streams[stream.step_id]
+
+    def finish(self, step_id: str, metadata: Dict[str, Any]) -> None:
+        stream = self._streams.get(step_id)
+        if stream is None:
+            return
+        stream.finish(metadata)
+        asyncio.get_running_loop().call_later(self.linger_seconds, self._expire, stream)
+
+    def _expire(self, stream: StepStream) -> None:
+        if self._streams.get(stream.step_id) is stream:
+            del self._streams[stream.step_id]
+
+
+class StepOutputWriter:
+    """
+    Token sink for one executing step.
+
+    Every delta is published to the step's stream immediately; the text so far
+    is persisted through ``persist`` at most once per ``flush_interval``, in
+    the background, so a slow store never holds up the model stream.
+    """
+
+    def __init__(
+        self,
+        stream: StepStream,
+        persist: Callable[[str], Awaitable[None]],
+        flush_interval: float = 1.0
+    ):
+        self.stream = stream
+        self.persist = persist
+        self.flush_interval = flush_interval
+        self._last_flush = 0.0
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def __call__(self, delta: str) -> None:
+        self.stream.publish(delta)
+        if self._flush_task is None and time.monotonic() - self._last_flush >= self.flush_interval:
+            self._flush_task = asyncio.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        text = self.stream.text
+        try:
+            await self.persist(text)
+        except Exception as e:
+            logger.warning("Failed to persist partial step output", step_id=self.stream.step_id, error=str(e))
+        finally:
+            self._last_flush = time.monotonic()
+            self._flush_task = None
+
+    async def aclose(self) -> None:
+        """Wait for an in-flight write; the final output is stored by the caller."""
+        if self._flush_task is not None:
+            await self._flush_task
+
+
+_hub: Optional[StepStreamHub] = None
+
+
+def get_step_stream_hub() -> StepStreamHub:
+    """Get the process-wide step stream hub."""
+    global _hub
+    if _hub is None:
+        _hub = StepStreamHub()
+    return _hub
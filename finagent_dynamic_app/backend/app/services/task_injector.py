@@ -16,8 +16,9 @@ from datetime import datetime
 from agent_framework.azure import AzureOpenAIChatClient
 from agent_framework import ChatMessage, Role
 
-from app.models.task_models import Step, StepStatus, AgentType
+from app.models.task_models import Step, StepStatus, AgentType, order_key_between
 from app.infra.settings import Settings
+from app.infra.llm_gateway import gate_chat_client
 
 logger = structlog.get_logger(__name__)
 
@@ -42,12 +43,12 @@ class TaskInjector:
         logger.info("TaskInjector: Settings - api_key exists", has_key=bool(settings.azure_openai_api_key))
         logger.info("TaskInjector: Settings - deployment", deployment=settings.azure_openai_deployment)
         
-        self.llm_client = AzureOpenAIChatClient(
+        self.llm_client = gate_chat_client(AzureOpenAIChatClient(
             endpoint=settings.azure_openai_endpoint,
             api_key=settings.azure_openai_api_key,
             deployment_name=settings.azure_openai_deployment,
             api_version=settings.azure_openai_api_version
-        )
+        ), settings=settings)
         logger.info("TaskInjector: LLM client created", client_type=type(self.llm_client).__name__)
         
         # Define available agents and their capabilities
@@ -274,6 +275,11 @@ EXAMPLES:
         """
         Create a new step based on analysis.
         
+        ``current_steps`` must be in plan order (as returned by the memory
+        store). The new step gets an order key between its neighbours, so no
+        other step needs rewriting; its ``order_key`` is None when the
+        neighbours' keys are too close to split and the plan must be re-spaced.
+        
         Returns:
             Tuple of (new_step, insert_position)
         """
@@ -284,6 +290,14 @@ EXAMPLES:
             insert_position = 1
         else:
             insert_position = len(current_steps) + 1
+        insert_position = max(1, min(insert_position, len(current_steps) + 1))
+        
+        before = current_steps[insert_position - 2] if insert_position > 1 else None
+        after = current_steps[insert_position - 1] if insert_position <= len(current_steps) else None
+        order_key = order_key_between(
+            before.sort_key if before else None,
+            after.sort_key if after else None
+        )
         
         # Map dependencies from step numbers to step IDs
         dependency_ids = []
@@ -300,6 +314,7 @@ EXAMPLES:
             session_id=session_id,
             user_id=user_id,
             order=insert_position,
+            order_key=order_key,
             action=analysis.get('new_task', ''),
             agent=AgentType(analysis.get('agent', 'Generic_Agent')),
             status=StepStatus.PLANNED,
@@ -314,6 +329,7 @@ EXAMPLES:
             "Created new step via injection",
             step_id=new_step.id,
             order=new_step.order,
+            order_key=new_step.order_key,
             agent=new_step.agent.value,
             dependencies=len(dependency_ids),
             manually_injected=True
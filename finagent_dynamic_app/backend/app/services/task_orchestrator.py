@@ -1,5 +1,6 @@
 """Task orchestrator service for the financial research application."""
 
+import re
 import uuid
 from datetime import datetime
 from types import SimpleNamespace
@@ -13,6 +14,7 @@ from ..maf import (
     MAFOrchestrator,
     PlanParsingError,
     PlanStep,
+    PlanTemplateCache,
 )
 
 from ..agents import (
@@ -25,6 +27,8 @@ from ..agents import (
     SummarizerAgent,
     TechnicalsAgent,
 )
+from ..agents.streaming import StreamStats, stream_tokens
+from ..infra.llm_gateway import llm_request_context
 
 from ..models.task_models import (
     InputTask,
@@ -41,9 +45,12 @@ from ..models.task_models import (
     PlanWithSteps,
     ActionRequest,
     ActionResponse,
+    ORDER_KEY_GAP,
 )
-from ..persistence.cosmos_memory import CosmosMemoryStore
+from ..persistence.cosmos_memory import CosmosMemoryStore, create_memory_store
 from ..infra.settings import Settings
+from .ticker_resolver import get_ticker_resolver
+from .step_stream import StepOutputWriter, get_step_stream_hub
 
 logger = structlog.get_logger(__name__)
 
@@ -67,8 +74,17 @@ class TaskOrchestrator:
 
         self.cosmos = cosmos_store
         self.registered_agents: Dict[str, object] = {}
+        self.step_streams = get_step_stream_hub()
 
         self.available_agents = self._get_available_agents()
+        self.plan_templates: Optional[PlanTemplateCache] = None
+        if self.settings.plan_templates_enabled:
+            self.plan_templates = PlanTemplateCache(
+                max_entries=self.settings.plan_template_max_entries,
+                ttl_seconds=self.settings.plan_template_ttl_seconds,
+                mentions=get_ticker_resolver().mentions,
+                known_agents=self.available_agents.keys(),
+            )
 
         logger.info(
             "TaskOrchestrator initialized",
@@ -79,14 +95,7 @@ class TaskOrchestrator:
         logger.info("Initializing TaskOrchestrator")
 
         if self.cosmos is None:
-            self.cosmos = CosmosMemoryStore(
-                endpoint=self.settings.COSMOSDB_ENDPOINT,
-                database_name=self.settings.COSMOSDB_DATABASE,
-                container_name=self.settings.COSMOSDB_CONTAINER,
-                tenant_id=self.settings.azure_tenant_id,
-                client_id=self.settings.azure_client_id,
-                client_secret=self.settings.azure_client_secret,
-            )
+            self.cosmos = create_memory_store(self.settings)
 
         await self.cosmos.initialize()
         self._register_agents()
@@ -193,7 +202,9 @@ class TaskOrchestrator:
             session_id = f"session-{uuid.uuid4().hex[:8]}"
             user_id = input_task.user_id or "default-user"
 
-            extracted_ticker = await self._extract_ticker_from_text(input_task.description)
+            extracted_ticker = None
+            if not input_task.ticker:
+                extracted_ticker = await self._extract_ticker_from_text(input_task.description)
             ticker = input_task.ticker or extracted_ticker
 
             logger.info(
@@ -218,7 +229,11 @@ class TaskOrchestrator:
             logger.info("Created new session for research task", session_id=session_id, ticker=ticker)
 
             planning_rules = self._compose_planning_rules(input_task.description)
-            planner = MAFDynamicPlanner(self.planning_agent, planning_rules=planning_rules)
+            planner = MAFDynamicPlanner(
+                self.planning_agent,
+                planning_rules=planning_rules,
+                templates=self.plan_templates,
+            )
 
             summary_type = input_task.depth or "executive"
             persona = "investment"
@@ -396,7 +411,7 @@ Formatting Requirements:
         pending_dependencies: Dict[str, List[int]] = {}
         steps: List[Step] = []
 
-        for plan_step in sorted(plan_steps, key=lambda s: s.order):
+        for position, plan_step in enumerate(sorted(plan_steps, key=lambda s: s.order), start=1):
             step_id = str(uuid.uuid4())
             order_to_step_id[plan_step.order] = step_id
 
@@ -415,7 +430,8 @@ Formatting Requirements:
                 action=plan_step.action,
                 agent=self._map_agent_name_to_type(plan_step.agent),
                 status=StepStatus.PLANNED,
-                order=plan_step.order,
+                order=position,
+                order_key=position * ORDER_KEY_GAP,
                 timestamp=datetime.utcnow(),
                 dependencies=[],
                 required_artifacts=required_artifacts,
@@ -590,7 +606,8 @@ Formatting Requirements:
             # Update step based on feedback
             if feedback.approved:
                 # Execute the step using framework patterns
-                result = await self._execute_step(step, feedback)
+                with llm_request_context(step.user_id):
+                    result = await self._execute_step(step, feedback)
                 
                 # Update step status to completed
                 step.status = StepStatus.COMPLETED
@@ -812,7 +829,7 @@ Formatting Requirements:
         # Filter to completed steps that come before this step
         previous_steps = [
             s for s in all_steps 
-            if s.status == StepStatus.COMPLETED and s.order < step.order
+            if s.status == StepStatus.COMPLETED and s.sort_key < step.sort_key
         ]
         
         logger.info(
@@ -824,7 +841,7 @@ Formatting Requirements:
         
         # Collect all outputs
         session_artifacts = []
-        for prev_step in sorted(previous_steps, key=lambda s: s.order):
+        for prev_step in previous_steps:
             if prev_step.agent_reply:
                 artifact = {
                     "type": "step_result",
@@ -992,13 +1009,29 @@ Formatting Requirements:
                     ticker=context.get("ticker"),
                     task_preview=task[:100],
                 )
-                result_text = await agent_instance.process(task, context)
+                # Stream the model output to SSE subscribers and into the
+                # progress message while the agent runs
+                stats = StreamStats()
+                step_stream = self.step_streams.start(step.id, step.user_id)
+
+                async def persist_partial(text: str) -> None:
+                    progress_message.content = text
+                    progress_message.metadata = {"progress": True, "streaming": True}
+                    await self.cosmos.update_message(progress_message)
+
+                writer = StepOutputWriter(step_stream, persist_partial)
+                try:
+                    with stream_tokens(writer, stats):
+                        result_text = await agent_instance.process(task, context)
+                finally:
+                    await writer.aclose()
                 result = SimpleNamespace(
                     result=result_text or "",
                     metadata={
                         "mode": "direct_process",
                         "agent": agent_name,
                         "tools": tools,
+                        **stats.as_metadata(),
                     },
                 )
             else:
@@ -1054,10 +1087,19 @@ Formatting Requirements:
             step.status = StepStatus.COMPLETED
             await self.cosmos.update_step(step)
 
+            execution_metadata = result.metadata if hasattr(result, "metadata") else {}
+            timing = {
+                key: execution_metadata.get(key)
+                for key in ("time_to_first_token_ms", "duration_ms", "streamed_chunks")
+                if key in execution_metadata
+            }
+            self.step_streams.finish(step.id, {"success": True, "message_id": message.id, **timing})
+
             logger.info(
                 "Step execution completed",
                 step_id=step.id,
-                agent=step.agent.value  # Use agent.value
+                agent=step.agent.value,  # Use agent.value
+                **timing
             )
 
             return ActionResponse(
@@ -1066,7 +1108,7 @@ Formatting Requirements:
                 session_id=feedback.session_id,
                 success=True,
                 result=str(result.result) if hasattr(result, 'result') else "Execution completed",
-                metadata={"message_id": message.id}
+                metadata={"message_id": message.id, **timing}
             )
 
         except Exception as e:
@@ -1097,6 +1139,7 @@ Formatting Requirements:
             # Update step status to FAILED
             step.status = StepStatus.FAILED
             await self.cosmos.update_step(step)
+            self.step_streams.finish(step.id, {"success": False, "error": str(e)})
 
             return ActionResponse(
                 step_id=step.id,
@@ -1463,8 +1506,11 @@ Formatting Requirements:
     
     async def _extract_ticker_from_text(self, text: str) -> Optional[str]:
         """
-        Intelligently extract ticker symbol from text using LLM.
-        Handles company names, ticker symbols, and various formats.
+        Extract a ticker symbol from text.
+        
+        Resolves symbols and company names against the local symbol index;
+        the LLM is only consulted when the local result is ambiguous (weak or
+        competing matches, or a company name the index does not know).
         
         Args:
             text: Input text that may contain a company name or ticker symbol
@@ -1472,10 +1518,30 @@ Formatting Requirements:
         Returns:
             Extracted ticker symbol or None
         """
+        resolution = get_ticker_resolver().resolve(text)
+        
+        if not resolution.ambiguous:
+            logger.info(
+                "Resolved ticker locally",
+                ticker=resolution.ticker,
+                method=resolution.method,
+                confidence=resolution.confidence,
+                original_text=text[:100]
+            )
+            return resolution.ticker
+        
+        if not self.settings.ticker_llm_fallback:
+            return resolution.ticker
+        
+        ticker = await self._extract_ticker_with_llm(text, [symbol for symbol, _ in resolution.candidates])
+        return ticker or resolution.ticker
+
+    async def _extract_ticker_with_llm(self, text: str, candidates: Sequence[str]) -> Optional[str]:
+        """Ask the LLM for the ticker in ambiguous text, hinting the local candidates."""
         try:
-            from agent_framework.azure import AzureOpenAIChatClient
             from agent_framework import ChatMessage, Role
             
+            hint = f"\nPossible matches from the symbol index: {', '.join(candidates[:5])}\n" if candidates else ""
             extraction_prompt = f"""Extract the stock ticker symbol from the following text. 
 The text may contain:
 - A ticker symbol (e.g., "TSLA", "AAPL", "MSFT")
@@ -1484,33 +1550,24 @@ The text may contain:
 
 If you find a ticker or company name, respond with ONLY the ticker symbol in uppercase.
 If no company or ticker is mentioned, respond with "NONE".
-
+{hint}
 Text: {text}
 
 Ticker symbol (uppercase only):"""
 
-            # Use Microsoft Agent Framework's AzureOpenAIChatClient
-            chat_client = AzureOpenAIChatClient(
-                endpoint=self.settings.AZURE_OPENAI_ENDPOINT,
-                api_key=self.settings.AZURE_OPENAI_API_KEY,
-                deployment_name=self.settings.AZURE_OPENAI_DEPLOYMENT,
-                api_version=self.settings.AZURE_OPENAI_API_VERSION
-            )
-            
-            # Create messages for the chat
             messages = [
                 ChatMessage(role=Role.SYSTEM, text="You are a financial assistant that extracts stock ticker symbols."),
                 ChatMessage(role=Role.USER, text=extraction_prompt)
             ]
             
-            # Call the chat client using get_response
-            response = await chat_client.get_response(messages=messages, temperature=0, max_tokens=10)
+            # Reuse the factory's client instead of building one per plan
+            response = await self.agent_factory.chat_client.get_response(messages=messages, temperature=0, max_tokens=10)
             
             # Extract ticker from response (ChatResponse has .text property directly)
             ticker = response.text.strip().upper()
             
             # Validate response
-            if ticker and ticker != "NONE" and 1 <= len(ticker) <= 5 and ticker.isalpha():
+            if ticker and ticker != "NONE" and re.fullmatch(r"[A-Z]{1,5}(?:[.-][A-Z])?", ticker):
                 logger.info(
                     "LLM extracted ticker from text",
                     ticker=ticker,
@@ -0,0 +1,286 @@
+"""
+Ticker Resolver
+
+Maps free-text objectives ("Analyze Tesla's latest 10-K", "$NVDA margins",
+"compare Johnson & Johnson to Pfizer") to a stock symbol in-process, using an
+alias index over the bundled symbol list (app/data/company_symbols.csv).
+
+Resolution order:
+1. Explicit symbols: ``$TSLA``, ``(TSLA)``, or a known upper-case symbol
+2. Company names and aliases, longest match first ("Bank of America")
+3. Fuzzy matching of single-word names for typos ("Nvidea", "Mircosoft")
+
+Each result carries a confidence and the competing candidates, so callers can
+fall back to an LLM only when the text is genuinely ambiguous: weak matches,
+close competitors, or an unknown capitalized name the index does not cover.
+"""
+
+import csv
+import re
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher, get_close_matches
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_SYMBOLS_PATH = Path(__file__).resolve().parents[1] / "data" / "company_symbols.csv"
+
+# Results at or above this confidence are used without an LLM call
+CONFIDENT = 0.8
+
+# Minimum lead of the best candidate over a competing symbol
+MARGIN = 0.15
+
+FUZZY_CUTOFF = 0.8
+
+TOKEN_RE = re.compile(r"[A-Za-z0-9]+(?:['’.\-&][A-Za-z0-9]+)*")
+
+# Legal suffixes stripped from company names to form an extra alias
+NAME_SUFFIXES = {
+    "inc", "inc.", "corp", "corp.", "corporation", "company", "co", "co.", "plc",
+    "ltd", "ltd.", "limited", "holdings", "group", "sa", "nv", "n.v", "ag", "se",
+    "llc", "a/s", "s.a", "sa/nv",
+}
+
+# Symbols that are also everyday words or finance acronyms; bare upper-case
+# occurrences are weak evidence ("IT spending", "ON track", "GM" margin)
+AMBIGUOUS_SYMBOLS = {
+    "A", "C", "D", "F", "O", "T", "U", "V", "ALL", "ARM", "BA", "CAT", "CB", "CI",
+    "DD", "DE", "DOW", "EA", "EL", "GE", "GM", "HD", "HON", "ICE", "IT", "KEY",
+    "LOW", "MA", "MAR", "MO", "MS", "NET", "NOW", "ON", "PG", "PH", "PM", "SE",
+    "SNOW", "SO", "TM", "WM",
+}
+
+# Single-word aliases that are ordinary English words; they need a capital
+# letter or finance context ("apple stock") to count as a company mention
+COMMON_WORD_ALIASES = {
+    "apple", "arm", "block", "booking", "cadence", "carnival", "chase", "delta",
+    "dominion", "dow", "ford", "freeport", "intel", "lilly", "lucid", "meta",
+    "novo", "oracle", "paramount", "progressive", "shell", "snap", "southwest",
+    "spectrum", "square", "target", "travelers", "unity", "visa", "zoom",
+}
+
+FINANCE_CONTEXT = {
+    "stock", "stocks", "share", "shares", "ticker", "earnings", "valuation",
+    "10-k", "10-q", "8-k", "filing", "filings", "investor", "investors", "dividend",
+    "revenue", "guidance", "analyst", "analysts", "company", "equity",
+}
+
+# Capitalized words that are not company names
+NON_ENTITY_WORDS = {
+    "i", "a", "an", "the", "and", "or", "of", "for", "in", "on", "to", "with", "it",
+    "ai", "ceo", "cfo", "coo", "sec", "us", "u.s", "usa", "uk", "eu", "eps", "esg",
+    "ipo", "etf", "gdp", "gaap", "ebitda", "ebit", "dcf", "roi", "roe", "yoy", "qoq",
+    "fy", "ttm", "fed", "fomc", "cpi", "nasdaq", "nyse", "s&p", "dow", "jones",
+    "wall", "street", "q1", "q2", "q3", "q4", "h1", "h2", "pdf", "report",
+    "january", "february", "march", "april", "may", "june", "july", "august",
+    "september", "october", "november", "december", "monday", "tuesday",
+    "wednesday", "thursday", "friday", "analyze", "analyse", "compare", "summarize",
+    "provide", "create", "generate", "what", "how", "why", "give", "show", "research",
+}
+
+
+def _normalize(token: str) -> str:
+    token = token.lower().replace("’", "'")
+    if token.endswith("'s"):
+        token = token[:-2]
+    return token
+
+
+def _tokens(text: str) -> List[Tuple[str, str, int]]:
+    """(normalized, original, start offset) for each word in ``text``."""
+    return [(_normalize(m.group()), m.group(), m.start()) for m in TOKEN_RE.finditer(text)]
+
+
+@dataclass
+class TickerResolution:
+    """Outcome of resolving one text."""
+
+    ticker: Optional[str]
+    confidence: float
+    method: str  # explicit, symbol, alias, fuzzy, none
+    candidates: List[Tuple[str, float]] = field(default_factory=list)
+    unknown_entity: bool = False
+
+    @property
+    def ambiguous(self) -> bool:
+        """Whether an LLM should arbitrate: weak or competing matches, or an uncovered name."""
+        if self.ticker is None:
+            return self.unknown_entity or bool(self.candidates)
+        return self.confidence < CONFIDENT
+
+
+class TickerResolver:
+    """Alias index over a symbol/company-name list."""
+
+    def __init__(self, symbols_path: Path = DEFAULT_SYMBOLS_PATH):
+        """Load the symbol list and build the alias index."""
+        self.symbols: Dict[str, str] = {}
+        self._aliases: Dict[Tuple[str, ...], str] = {}
+        self._max_alias_tokens = 1
+
+        with open(symbols_path, "r", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                symbol = row["symbol"].strip().upper()
+                name = row["name"].strip()
+                self.symbols[symbol] = name
+
+                names = [name] + [alias for alias in row.get("aliases", "").split("|") if alias.strip()]
+                for alias in names:
+                    full = tuple(token for token, _, _ in _tokens(alias))
+                    words = full
+                    while len(words) > 1 and words[-1] in NAME_SUFFIXES:
+                        words = words[:-1]
+                    if words and words[0] == "the" and len(words) > 1:
+                        words = words[1:]
+                    for key in {full, words}:
+                        if key:
+                            # First listed owner of an alias wins
+                            self._aliases.setdefault(key, symbol)
+                            self._max_alias_tokens = max(self._max_alias_tokens, len(key))
+
+        self._fuzzy_keys = [
+            words[0] for words in self._aliases
+            if len(words) == 1 and len(words[0]) >= 5 and words[0] not in COMMON_WORD_ALIASES
+        ]
+        logger.info("Ticker resolver loaded", symbols=len(self.symbols), aliases=len(self._aliases))
+
+    def resolve(self, text: str) -> TickerResolution:
+        """Resolve the most likely ticker mentioned in ``text``."""
+        if not text:
+            return TickerResolution(None, 0.0, "none")
+
+        tokens = _tokens(text)
+        finance_context = any(token in FINANCE_CONTEXT for token, _, _ in tokens)
+        # symbol -> (score, first offset, method)
+        found: Dict[str, Tuple[float, int, str]] = {}
+
+        def add(symbol: str, score: float, offset: int, method: str):
+            current = found.get(symbol)
+            if current is None or score > current[0]:
+                found[symbol] = (score, min(offset, current[1]) if current else offset, method)
+
+        # 1. Explicit and bare symbols
+        for _, original, offset in tokens:
+            bare = re.sub(r"['’]s$", "", original)
+            candidate = bare.upper().replace(".", "-")
+            prefix = text[offset - 1] if offset > 0 else ""
+            suffix = text[offset + len(original)] if offset + len(original) < len(text) else ""
+            cashtag = prefix == "$"
+            parenthesized = prefix == "(" and suffix == ")" and bare.isupper()
+            if (cashtag or parenthesized) and re.fullmatch(r"[A-Z]{1,5}(?:-[A-Z])?", candidate):
+                if candidate in self.symbols:
+                    add(candidate, 1.0, offset, "explicit")
+                elif cashtag:
+                    add(candidate, 0.95, offset, "explicit")
+                elif _normalize(bare) not in NON_ENTITY_WORDS:
+                    # "(FCF)" is more often an acronym than a symbol the index lacks
+                    add(candidate, 0.6, offset, "explicit")
+            elif bare.isupper() and candidate in self.symbols and len(candidate) >= 2:
+                add(candidate, 0.5 if candidate in AMBIGUOUS_SYMBOLS else 0.9, offset, "symbol")
+
+        # 2. Names and aliases, longest first; matched words are not reused
+        used = [False] * len(tokens)
+        for size in range(min(self._max_alias_tokens, len(tokens)), 0, -1):
+            for start in range(len(tokens) - size + 1):
+                if any(used[start:start + size]):
+                    continue
+                words = tuple(token for token, _, _ in tokens[start:start + size])
+                symbol = self._aliases.get(words)
+                if symbol is None:
+                    continue
+                original = tokens[start][1]
+                if size > 1:
+                    score = 0.95
+                elif words[0] in COMMON_WORD_ALIASES:
+                    score = 0.85 if (original[:1].isupper() or finance_context) else 0.55
+                else:
+                    score = 0.9
+                for i in range(start, start + size):
+                    used[i] = True
+                add(symbol, score, tokens[start][2], "alias")
+
+        # 3. Typos, only when nothing matched exactly
+        if not found:
+            for i, (token, original, offset) in enumerate(tokens):
+                if used[i] or len(token) < 5 or token in NON_ENTITY_WORDS or token in FINANCE_CONTEXT:
+                    continue
+                if not (original[:1].isupper() or len(token) >= 6):
+                    continue
+                match = get_close_matches(token, self._fuzzy_keys, n=1, cutoff=FUZZY_CUTOFF)
+                if match:
+                    ratio = SequenceMatcher(None, token, match[0]).ratio()
+                    add(self._aliases[(match[0],)], ratio, offset, "fuzzy")
+
+        ranked = sorted(found.items(), key=lambda item: (-item[1][0], item[1][1]))
+        candidates = [(symbol, round(score, 3)) for symbol, (score, _, _) in ranked]
+
+        if not ranked:
+            return TickerResolution(None, 0.0, "none", unknown_entity=self._has_unknown_entity(text, tokens))
+
+        best_symbol, (best_score, _, method) = ranked[0]
+        if len(ranked) > 1:
+            confident = [(symbol, entry) for symbol, entry in ranked if entry[0] >= CONFIDENT]
+            if len(confident) > 1 and best_score - ranked[1][1][0] < MARGIN:
+                # Several companies named with equal certainty ("compare Apple and
+                # Microsoft"): the plan is about the first one mentioned
+                best_symbol, (best_score, _, method) = min(confident, key=lambda item: item[1][1])
+            elif best_score - ranked[1][1][0] < MARGIN:
+                best_score = min(best_score, CONFIDENT - 0.01)
+
+        return TickerResolution(best_symbol, best_score, method, candidates)
+
+    def mentions(self, text: str, symbol: str) -> List[Tuple[int, int]]:
+        """Spans of ``text`` that refer to ``symbol``: the symbol itself or a known name for it."""
+        symbol = symbol.upper()
+        tokens = _tokens(text)
+        spans: List[Tuple[int, int]] = []
+        used = [False] * len(tokens)
+
+        for i, (_, original, offset) in enumerate(tokens):
+            bare = re.sub(r"['’]s$", "", original)
+            prefix = text[offset - 1] if offset > 0 else ""
+            if bare.upper().replace(".", "-") == symbol and (bare.isupper() or prefix == "$"):
+                spans.append((offset, offset + len(bare)))
+                used[i] = True
+
+        for size in range(min(self._max_alias_tokens, len(tokens)), 0, -1):
+            for start in range(len(tokens) - size + 1):
+                if any(used[start:start + size]):
+                    continue
+                words = tuple(token for token, _, _ in tokens[start:start + size])
+                if self._aliases.get(words) != symbol:
+                    continue
+                _, last, last_offset = tokens[start + size - 1]
+                # "Tesla's" refers to "Tesla"
+                end = last_offset + len(re.sub(r"['’]s$", "", last))
+                spans.append((tokens[start][2], end))
+                for i in range(start, start + size):
+                    used[i] = True
+
+        return sorted(spans)
+
+    def _has_unknown_entity(self, text: str, tokens: List[Tuple[str, str, int]]) -> bool:
+        """Whether the text names something capitalized the index does not know."""
+        for token, original, offset in tokens:
+            if token in NON_ENTITY_WORDS or not original[:1].isupper() or original.isdigit():
+                continue
+            before = text[:offset].rstrip()
+            if not before or before[-1] in ".!?:\n":
+                continue  # sentence-initial capital
+            return True
+        return False
+
+
+_resolver: Optional[TickerResolver] = None
+
+
+def get_ticker_resolver() -> TickerResolver:
+    """Get the process-wide ticker resolver (the index is built once)."""
+    global _resolver
+    if _resolver is None:
+        _resolver = TickerResolver()
+    return _resolver
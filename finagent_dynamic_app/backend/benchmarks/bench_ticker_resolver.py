@@ -0,0 +1,181 @@
+"""
+Ticker Resolution Benchmark
+
+Resolves a corpus of realistic research objectives with the local
+TickerResolver and reports accuracy, how often the LLM fallback would be
+needed, and per-objective latency. With --llm, the ambiguous objectives (or
+all of them, with --llm-all) are also sent to the configured Azure OpenAI
+deployment to compare against the previous one-LLM-call-per-plan behaviour.
+
+Usage (from finagent_dynamic_app/backend):
+    python -m benchmarks.bench_ticker_resolver
+    python -m benchmarks.bench_ticker_resolver --repeat 200
+    python -m benchmarks.bench_ticker_resolver --llm-all      # needs Azure OpenAI settings
+
+The local pass uses no network and no Azure resources.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List, Optional, Tuple
+
+from app.services.ticker_resolver import TickerResolver
+
+# (objective, expected ticker or None when no company is named)
+CORPUS: List[Tuple[str, Optional[str]]] = [
+    ("Analyze Tesla's latest 10-K and summarize the key risk factors", "TSLA"),
+    ("Provide a comprehensive financial analysis of Microsoft including cloud growth", "MSFT"),
+    ("What are the main revenue drivers for NVIDIA's data center segment?", "NVDA"),
+    ("Summarize the most recent earnings call for $AAPL", "AAPL"),
+    ("Compare Apple and Microsoft cloud strategy", "AAPL"),
+    ("Research Amazon's AWS margins over the last 8 quarters", "AMZN"),
+    ("Give me an overview of Berkshire Hathaway's insurance float", "BRK-B"),
+    ("Analyze JPMorgan Chase net interest income sensitivity to rate cuts", "JPM"),
+    ("How exposed is Bank of America to commercial real estate?", "BAC"),
+    ("Evaluate Johnson & Johnson's talc litigation exposure", "JNJ"),
+    ("Eli Lilly GLP-1 pipeline and manufacturing capacity", "LLY"),
+    ("Deep dive into Pfizer post-COVID revenue decline", "PFE"),
+    ("Assess Coca-Cola's pricing power and volume trends", "KO"),
+    ("Is PepsiCo's Frito-Lay division still growing?", "PEP"),
+    ("Analyze Walmart e-commerce profitability", "WMT"),
+    ("Costco membership fee income and renewal rates", "COST"),
+    ("What is driving Netflix subscriber growth after the password crackdown?", "NFLX"),
+    ("Disney parks segment outlook for the next fiscal year", "DIS"),
+    ("Analyze Exxon Mobil's Pioneer acquisition synergies", "XOM"),
+    ("Chevron free cash flow and buyback capacity", "CVX"),
+    ("Analyze free cash flow (FCF) trends for Chevron", "CVX"),
+    ("Review Boeing's 737 MAX production issues and FAA oversight", "BA"),
+    ("Lockheed Martin F-35 program backlog analysis", "LMT"),
+    ("Caterpillar dealer inventory trends", "CAT"),
+    ("Analyze Ford's EV losses in the Model e segment", "F"),
+    ("Review GM's Cruise write-down and autonomous strategy", "GM"),
+    ("UnitedHealth medical cost ratio trends", "UNH"),
+    ("Visa vs Mastercard cross-border volume growth", "V"),
+    ("Summarize Goldman Sachs consumer banking retreat", "GS"),
+    ("Morgan Stanley wealth management net new assets", "MS"),
+    ("Analyze Salesforce's operating margin expansion", "CRM"),
+    ("Oracle cloud infrastructure backlog and capex", "ORCL"),
+    ("Adobe generative AI monetization with Firefly", "ADBE"),
+    ("Broadcom VMware integration progress", "AVGO"),
+    ("Intel foundry business losses and roadmap", "INTC"),
+    ("AMD MI300 ramp and data center GPU share", "AMD"),
+    ("Qualcomm handset exposure and auto diversification", "QCOM"),
+    ("Analyze Meta's Reality Labs spending", "META"),
+    ("How is Alphabet Inc. (GOOGL) defending search share?", "GOOGL"),
+    ("Palantir commercial customer growth in the US", "PLTR"),
+    ("CrowdStrike outage impact on renewals", "CRWD"),
+    ("Snowflake consumption trends and product revenue", "SNOW"),
+    ("Uber profitability and free cash flow inflection", "UBER"),
+    ("Airbnb regulatory risks in major cities", "ABNB"),
+    ("Starbucks China same-store sales decline", "SBUX"),
+    ("McDonald's value menu and traffic trends", "MCD"),
+    ("Nike inventory and wholesale channel reset", "NKE"),
+    ("Analyze Home Depot's SRS acquisition", "HD"),
+    ("Target Corporation shrink and margin recovery", "TGT"),
+    ("AT&T fiber build-out and dividend safety", "T"),
+    ("Verizon wireless churn analysis", "VZ"),
+    ("Analyze T-Mobile postpaid phone net adds", "TMUS"),
+    ("Taiwan Semiconductor capacity expansion in Arizona", "TSM"),
+    ("ASML export restrictions and China revenue", "ASML"),
+    ("Novo Nordisk Wegovy supply constraints", "NVO"),
+    ("Analyze Nvidea's gross margin trajectory", "NVDA"),
+    ("Mircosoft Azure growth decomposition", "MSFT"),
+    ("What is the outlook for $pltr after index inclusion?", "PLTR"),
+    ("analyze apple stock buybacks", "AAPL"),
+    ("Summarize the latest SEC filings for the semiconductor sector", None),
+    ("Analyze market trends in renewable energy", None),
+    ("What are the macro risks for US regional banks this year?", None),
+    ("Build a DCF template for a mid-cap industrial company", None),
+    ("Research Rocket Lab's launch cadence and backlog", "RKLB"),
+    ("Analyze SoFi's deposit growth and lending margins", "SOFI"),
+    ("What's the price target consensus for Apple?", "AAPL"),
+]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+async def llm_extract(chat_client, text: str) -> Tuple[Optional[str], float]:
+    """One LLM extraction call, as the orchestrator used to make for every plan."""
+    from agent_framework import ChatMessage, Role
+
+    started = time.perf_counter()
+    response = await chat_client.get_response(
+        messages=[
+            ChatMessage(role=Role.SYSTEM, text="You are a financial assistant that extracts stock ticker symbols."),
+            ChatMessage(role=Role.USER, text=f"Respond with ONLY the stock ticker in this text, or NONE.\n\nText: {text}")
+        ],
+        temperature=0,
+        max_tokens=10
+    )
+    ticker = response.text.strip().upper()
+    return (None if ticker == "NONE" else ticker), time.perf_counter() - started
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=50, help="Timed passes over the corpus")
+    parser.add_argument("--llm", action="store_true", help="Send ambiguous objectives to Azure OpenAI")
+    parser.add_argument("--llm-all", action="store_true", help="Send every objective to Azure OpenAI")
+    parser.add_argument("--verbose", action="store_true", help="Print every resolution")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    resolver = TickerResolver()
+    print(f"Index built in {(time.perf_counter() - started) * 1000:.1f} ms "
+          f"({len(resolver.symbols)} symbols)\n")
+
+    latencies: List[float] = []
+    for _ in range(args.repeat):
+        for text, _ in CORPUS:
+            t0 = time.perf_counter()
+            resolver.resolve(text)
+            latencies.append(time.perf_counter() - t0)
+
+    correct = wrong = fallback = 0
+    for text, expected in CORPUS:
+        resolution = resolver.resolve(text)
+        if resolution.ambiguous:
+            fallback += 1
+            outcome = "LLM"
+        elif resolution.ticker == expected:
+            correct += 1
+            outcome = "ok"
+        else:
+            wrong += 1
+            outcome = "WRONG"
+        if args.verbose or outcome == "WRONG":
+            print(f"  [{outcome:>5}] {resolution.ticker or '-':<6} ({resolution.method}, "
+                  f"{resolution.confidence:.2f}) expected {expected or '-':<6} {text[:70]}")
+
+    resolved = correct + wrong
+    print(f"\nObjectives:              {len(CORPUS)}")
+    print(f"Resolved locally:        {resolved} ({resolved / len(CORPUS):.0%})")
+    print(f"  correct:               {correct} ({correct / max(resolved, 1):.0%} of local)")
+    print(f"LLM fallback needed:     {fallback} ({fallback / len(CORPUS):.0%})")
+    print(f"Local latency:           mean {statistics.fmean(latencies) * 1e6:.0f} us, "
+          f"p50 {percentile(latencies, 50) * 1e6:.0f} us, p95 {percentile(latencies, 95) * 1e6:.0f} us, "
+          f"p99 {percentile(latencies, 99) * 1e6:.0f} us")
+
+    if args.llm or args.llm_all:
+        from app.infra.settings import get_settings
+        from app.maf.agent_factory import MAFAgentFactory
+
+        chat_client = MAFAgentFactory(get_settings()).chat_client
+        texts = [text for text, _ in CORPUS if args.llm_all or resolver.resolve(text).ambiguous]
+        llm_latencies = []
+        for text in texts:
+            _, elapsed = await llm_extract(chat_client, text)
+            llm_latencies.append(elapsed)
+        if llm_latencies:
+            print(f"LLM latency ({len(llm_latencies)} calls): mean {statistics.fmean(llm_latencies) * 1000:.0f} ms, "
+                  f"p95 {percentile(llm_latencies, 95) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,131 @@
+"""
+Workflow Orchestration Overhead Benchmark
+
+Measures the per-step cost of MAFOrchestrator.run_sequential/run_concurrent
+without any LLM time: participants are in-process echo agents that answer
+immediately. Compares building a fresh Sequential/Concurrent workflow for every
+step (the previous behaviour) against leasing a cached one, and checks that a
+reused workflow starts every run with empty agent threads.
+
+Usage (from finagent_dynamic_app/backend):
+    python -m benchmarks.bench_workflow_cache
+    python -m benchmarks.bench_workflow_cache --steps 500 --agents 4
+
+Requires agent-framework; no Azure resources are used.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Awaitable, Callable, List
+
+from agent_framework import (
+    AgentRunResponse,
+    AgentRunResponseUpdate,
+    BaseAgent,
+    ChatMessage,
+    ConcurrentBuilder,
+    Role,
+    SequentialBuilder,
+    TextContent,
+    WorkflowOutputEvent,
+)
+
+from app.maf.orchestrator import MAFOrchestrator
+
+
+class EchoAgent(BaseAgent):
+    """Answers instantly; records how many messages it saw, including thread history."""
+
+    def __init__(self, name: str):
+        super().__init__(name=name)
+        self.seen: List[int] = []
+
+    async def _respond(self, messages: Any, thread: Any) -> ChatMessage:
+        messages = list(messages or [])
+        history = []
+        if thread is not None and thread.message_store is not None:
+            history = await thread.message_store.list_messages()
+        self.seen.append(len(history) + len(messages))
+        reply = ChatMessage(role=Role.ASSISTANT, text=f"{self.name} ok", author_name=self.name)
+        if thread is not None:
+            await self._notify_thread_of_new_messages(thread, messages, [reply])
+        return reply
+
+    async def run(self, messages=None, *, thread=None, **kwargs):
+        return AgentRunResponse(messages=[await self._respond(messages, thread)])
+
+    def run_stream(self, messages=None, *, thread=None, **kwargs):
+        async def _stream():
+            reply = await self._respond(messages, thread)
+            yield AgentRunResponseUpdate(contents=[TextContent(text=reply.text)], role=Role.ASSISTANT,
+                                         author_name=self.name)
+        return _stream()
+
+
+async def rebuild_per_step(agents: List[EchoAgent], prompt: str, concurrent: bool) -> List[ChatMessage]:
+    """The previous per-step path: build, run to completion, then scan the event list."""
+    builder = ConcurrentBuilder() if concurrent else SequentialBuilder()
+    workflow = builder.participants(agents).build()
+    events = await workflow.run([ChatMessage(role=Role.USER, contents=[TextContent(text=prompt)])])
+    collected: List[ChatMessage] = []
+    for event in events:
+        if isinstance(event, WorkflowOutputEvent):
+            collected.extend(event.data or [])
+    return collected
+
+
+async def time_steps(label: str, steps: int, step: Callable[[int], Awaitable[Any]]) -> List[float]:
+    """Run ``steps`` calls after a short warm-up and print latency percentiles."""
+    for n in range(5):
+        await step(n)
+    latencies = []
+    for n in range(steps):
+        started = time.perf_counter()
+        await step(n)
+        latencies.append(time.perf_counter() - started)
+    ordered = sorted(latencies)
+    print(
+        f"{label:<32} mean {statistics.fmean(latencies) * 1e3:7.3f} ms  "
+        f"p50 {ordered[len(ordered) // 2] * 1e3:7.3f} ms  "
+        f"p95 {ordered[int(len(ordered) * 0.95) - 1] * 1e3:7.3f} ms"
+    )
+    return latencies
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=300, help="Timed steps per scenario")
+    parser.add_argument("--agents", type=int, default=3, help="Participants per workflow")
+    args = parser.parse_args()
+
+    agents = [EchoAgent(f"Agent_{n}") for n in range(args.agents)]
+    names = [agent.name for agent in agents]
+    orchestrator = MAFOrchestrator()
+    for agent in agents:
+        orchestrator.register_agent(agent.name, agent)
+
+    print(f"{args.steps} steps, {args.agents} echo agents per workflow\n")
+    for concurrent in (False, True):
+        mode = "concurrent" if concurrent else "sequential"
+        rebuilt = await time_steps(
+            f"{mode}: rebuild per step", args.steps,
+            lambda n: rebuild_per_step(agents, f"step {n}", concurrent)
+        )
+        run = orchestrator.run_concurrent if concurrent else orchestrator.run_sequential
+        for agent in agents:
+            agent.seen.clear()
+        cached = await time_steps(f"{mode}: cached workflow", args.steps, lambda n: run(names, f"step {n}"))
+        print(f"{'':<32} overhead saved {(statistics.fmean(rebuilt) - statistics.fmean(cached)) * 1e3:.3f} ms/step "
+              f"({statistics.fmean(rebuilt) / statistics.fmean(cached):.1f}x)")
+        # Every cached run must start from empty threads: the inputs an agent
+        # sees stay constant instead of growing with each reuse
+        growth = max(max(agent.seen) - min(agent.seen) for agent in agents)
+        print(f"{'':<32} thread history growth across runs: {growth} messages\n")
+
+    print(f"Workflow cache: {orchestrator.workflow_cache_stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,49 @@
+"""Plan template learning: only plans that parameterize cleanly are reused."""
+
+import re
+from typing import List, Tuple
+
+from app.maf.plan_templates import PlanTemplateCache
+from app.maf.planning import PlanStep
+
+NAMES = {"TSLA": "Tesla", "AAPL": "Apple"}
+
+
+def mentions(text: str, ticker: str) -> List[Tuple[int, int]]:
+    """Spans of the ticker or the company's name."""
+    pattern = re.compile(rf"\b(?:{ticker}|{NAMES[ticker]})\b", re.IGNORECASE)
+    return [match.span() for match in pattern.finditer(text)]
+
+
+def learn(cache: PlanTemplateCache, objective: str, ticker: str, actions: List[str]) -> bool:
+    shape = cache.shape(objective, ticker)
+    steps = [
+        PlanStep(order=n, action=action, agent="EarningsAgent", tool="analyze", parameters={"ticker": ticker})
+        for n, action in enumerate(actions, start=1)
+    ]
+    return cache.learn(cache.key(shape.text), shape, objective, ticker, steps)
+
+
+def instantiate(cache: PlanTemplateCache, objective: str, ticker: str):
+    shape = cache.shape(objective, ticker)
+    return cache.instantiate(cache.key(shape.text), shape, objective)
+
+
+def test_objective_values_are_filled_in():
+    cache = PlanTemplateCache(mentions=mentions)
+    assert learn(cache, "Full analysis of Tesla for Q3 2025", "TSLA",
+                 ["Review Tesla earnings for Q3 2025", "Summarize TSLA outlook"])
+
+    steps = instantiate(cache, "Full analysis of Apple for Q1 2026", "AAPL")
+
+    assert [step.action for step in steps] == ["Review Apple earnings for Q1 2026", "Summarize AAPL outlook"]
+    assert all(step.parameters == {"ticker": "AAPL"} for step in steps)
+
+
+def test_plan_with_derived_dates_is_not_learned():
+    cache = PlanTemplateCache(mentions=mentions)
+    assert not learn(cache, "Full analysis of Tesla for Q3 2025", "TSLA",
+                     ["Review Tesla earnings for Q3 2025", "Compare with Q3 2024 results"])
+
+    assert instantiate(cache, "Full analysis of Apple for Q1 2026", "AAPL") is None
+    assert cache.stats()["rejected"] == 1
@@ -36,6 +36,7 @@ export const PlanView: React.FC<PlanViewProps> = ({
   const [processingSteps, setProcessingSteps] = useState<Set<string>>(new Set());
   const [stepMessages, setStepMessages] = useState<AgentMessage[]>([]);
   const [loadingMessages, setLoadingMessages] = useState(false);
+  const [streamingText, setStreamingText] = useState('');
   
   // Use ref to always have the latest plan without causing re-renders
   const planRef = useRef(plan);
@@ -129,6 +130,19 @@ export const PlanView: React.FC<PlanViewProps> = ({
     };
   }, [selectedStep, plan.session_id, plan.id]);
 
+  // Stream the selected step's output while it executes
+  const selectedStepStatus = plan.steps?.find(s => s.id === selectedStep)?.status;
+  useEffect(() => {
+    setStreamingText('');
+    if (!selectedStep || !selectedStepStatus) return;
+    if (['completed', 'failed', 'rejected'].includes(selectedStepStatus)) return;
+
+    const source = apiClient.streamStepOutput(selectedStep, {
+      onText: setStreamingText,
+    });
+    return () => source.close();
+  }, [selectedStep, selectedStepStatus]);
+
   const getStatusBadge = (status: string) => {
     const badges = {
       'planned': { text: 'PLANNED', class: 'bg-orange-500/20 text-orange-400 border-orange-500/30' },
@@ -569,7 +583,16 @@ export const PlanView: React.FC<PlanViewProps> = ({
                             <Activity className="w-4 h-4 text-blue-400 mt-0.5 animate-pulse" />
                             <div className="flex-1">
                               <span className="text-xs font-semibold text-blue-300 block mb-1">IN PROGRESS</span>
-                              <p className="text-sm text-blue-100">{msg.content}</p>
+                              {streamingText || msg.metadata?.streaming ? (
+                                <div
+                                  className="prose prose-invert prose-sm max-w-none text-blue-100"
+                                  dangerouslySetInnerHTML={{
+                                    __html: marked(streamingText || msg.content) as string
+                                  }}
+                                />
+                              ) : (
+                                <p className="text-sm text-blue-100">{msg.content}</p>
+                              )}
                             </div>
                           </div>
                         )}
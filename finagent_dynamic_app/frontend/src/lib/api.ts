@@ -74,6 +74,12 @@ export interface AgentMessage {
   content: string;
   message_type: 'info' | 'action' | 'result' | 'error' | 'progress' | 'action_response';
   timestamp: string;
+  metadata?: Record<string, any>;
+}
+
+export interface StepStreamHandlers {
+  onText: (text: string) => void;
+  onDone?: (result: { success: boolean; message_id?: string; time_to_first_token_ms?: number; error?: string }) => void;
 }
 
 export interface ActionResponse {
@@ -215,6 +221,33 @@ class APIClient {
     return response.data;
   }
 
+  /**
+   * Subscribe to a step's output while it executes (Server-Sent Events).
+   * onText receives the full text so far on every update. Returns the
+   * EventSource; call close() to unsubscribe.
+   */
+  streamStepOutput(stepId: string, handlers: StepStreamHandlers): EventSource {
+    const source = new EventSource(`${this.baseURL}/api/stream/${stepId}`);
+    let text = '';
+
+    source.addEventListener('snapshot', (event) => {
+      text = JSON.parse((event as MessageEvent).data);
+      handlers.onText(text);
+    });
+    source.addEventListener('token', (event) => {
+      text += JSON.parse((event as MessageEvent).data);
+      handlers.onText(text);
+    });
+    source.addEventListener('done', (event) => {
+      source.close();
+      handlers.onDone?.(JSON.parse((event as MessageEvent).data));
+    });
+    // Don't let EventSource reconnect on its own; message polling covers gaps
+    source.onerror = () => source.close();
+
+    return source;
+  }
+
   async healthCheck(): Promise<{ status: string; service: string }> {
     const response = await axios.get(`${this.baseURL}/health`);
     return response.data;
@@ -7,7 +7,7 @@ MAF-compatible agent implementation.
 
 import asyncio
 import json
-from typing import Dict, Any, List, Optional, AsyncIterable
+from typing import Dict, Any, List, Optional, AsyncIterable, Tuple
 from datetime import datetime
 from pathlib import Path
 import structlog
@@ -17,8 +17,14 @@ from agent_framework import BaseAgent, ChatMessage, Role, TextContent, AgentRunR
 
 from openai import AsyncAzureOpenAI
 
+from ..infra.llm_gateway import gate_openai_client
+from ..services.context_budget import ContextBudget
+
 logger = structlog.get_logger(__name__)
 
+# Tokens per map-reduce chunk
+CHUNK_TOKENS = 30000
+
 
 class AnalyticsAgent(BaseAgent):
     """
@@ -41,12 +47,16 @@ class AnalyticsAgent(BaseAgent):
         self.app_settings = settings
         
         # Initialize Azure OpenAI client
-        self.client = AsyncAzureOpenAI(
-            api_key=settings.AZURE_OPENAI_API_KEY,
-            api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT
+        self.client = gate_openai_client(
+            AsyncAzureOpenAI(
+                api_key=settings.AZURE_OPENAI_API_KEY,
+                api_version=settings.AZURE_OPENAI_API_VERSION,
+                azure_endpoint=settings.AZURE_OPENAI_ENDPOINT
+            ),
+            settings=settings
         )
         self.deployment = settings.AZURE_OPENAI_DEPLOYMENT
+        self.context_budget = ContextBudget(self.deployment)
         
         logger.info(f"Initialized {self.name}")
     
@@ -80,17 +90,21 @@ class AnalyticsAgent(BaseAgent):
             # Allow override from kwargs
             content = kwargs.get("content", content)
             analysis_focus = kwargs.get("analysis_focus")
+            file_analyses = kwargs.get("file_analyses")
             
-            if not content or len(content.strip()) == 0:
+            if file_analyses:
+                # Per-file results of a multi-file session are merged, not re-analyzed
+                result = await self.merge_file_analyses(file_analyses, analysis_focus, kwargs)
+            elif not content or len(content.strip()) == 0:
                 return AgentRunResponse(
                     messages=[ChatMessage(
                         role=Role.ASSISTANT,
                         contents=[TextContent(text="Error: No content provided for analytics")]
                     )]
                 )
-            
-            # Perform analytics
-            result = await self.analyze(content, analysis_focus, kwargs)
+            else:
+                # Perform analytics
+                result = await self.analyze(content, analysis_focus, kwargs)
             
             # Return result as ChatMessage
             result_text = json.dumps(result, ensure_ascii=False)
@@ -153,7 +167,7 @@ class AnalyticsAgent(BaseAgent):
     def _chunk_content(self, content: str, max_chunk_tokens: int = 30000) -> List[str]:
         """
         Split large content into manageable chunks for processing.
-        Uses approximate token count (4 chars ≈ 1 token).
+        Sizes are measured with the local tokenizer.
         
         Args:
             content: Text to chunk
@@ -162,10 +176,9 @@ class AnalyticsAgent(BaseAgent):
         Returns:
             List of content chunks
         """
-        # Approximate: 4 characters ≈ 1 token
-        max_chars = max_chunk_tokens * 4
+        count = self.context_budget.count
         
-        if len(content) <= max_chars:
+        if count(content) <= max_chunk_tokens:
             return [content]
         
         # Split by paragraphs first (double newlines)
@@ -176,10 +189,10 @@ class AnalyticsAgent(BaseAgent):
         current_length = 0
         
         for para in paragraphs:
-            para_length = len(para)
+            para_length = count(para)
             
             # If single paragraph is too large, split it further
-            if para_length > max_chars:
+            if para_length > max_chunk_tokens:
                 # If we have accumulated content, save it
                 if current_chunk:
                     chunks.append('\n\n'.join(current_chunk))
@@ -192,19 +205,20 @@ class AnalyticsAgent(BaseAgent):
                 para_chunk_len = 0
                 
                 for sentence in sentences:
-                    if para_chunk_len + len(sentence) > max_chars and para_chunk:
+                    sentence_length = count(sentence)
+                    if para_chunk_len + sentence_length > max_chunk_tokens and para_chunk:
                         chunks.append('. '.join(para_chunk) + '.')
                         para_chunk = [sentence]
-                        para_chunk_len = len(sentence)
+                        para_chunk_len = sentence_length
                     else:
                         para_chunk.append(sentence)
-                        para_chunk_len += len(sentence)
+                        para_chunk_len += sentence_length
                 
                 if para_chunk:
                     chunks.append('. '.join(para_chunk))
             
             # Regular paragraph processing
-            elif current_length + para_length > max_chars:
+            elif current_length + para_length > max_chunk_tokens:
                 # Save current chunk and start new one
                 if current_chunk:
                     chunks.append('\n\n'.join(current_chunk))
@@ -301,7 +315,7 @@ class AnalyticsAgent(BaseAgent):
         Step 2 (Reduce): Synthesize findings into final analysis
         """
         # Step 1: Split into chunks
-        chunks = self._chunk_content(content, max_chunk_tokens=30000)
+        chunks = self._chunk_content(content, max_chunk_tokens=CHUNK_TOKENS)
         logger.info(f"Processing {len(chunks)} chunks via map-reduce")
         
         # Step 2: Analyze each chunk (Map phase)
@@ -325,7 +339,7 @@ While analyzing this section, focus on insights relevant to the above objective.
 Focus on: {focus_text}{objective_guidance}
 
 Document Section:
-{chunk[:50000]}
+{self.context_budget.fit(chunk, CHUNK_TOKENS, name=f"chunk_{i + 1}")}
 
 Provide your analysis in JSON format with these fields:
 - key_insights: Array of important findings
@@ -432,6 +446,110 @@ Format your response as JSON with these sections:
         
         return result
     
+    async def merge_file_analyses(
+        self,
+        file_analyses: List[Tuple[str, Dict[str, Any]]],
+        analysis_focus: Optional[List[str]] = None,
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Combine the analytics of several files into one analysis.
+        
+        Args:
+            file_analyses: (file label, analyze result) per file
+            analysis_focus: Specific areas to focus on
+            context: Additional context (objective, etc.)
+            
+        Returns:
+            Dictionary containing the session-wide analytical insights
+        """
+        logger.info("Merging per-file analytics", file_count=len(file_analyses))
+        
+        per_file_tokens = CHUNK_TOKENS // len(file_analyses)
+        sections = "\n\n".join(
+            f"### {label}\n"
+            + self.context_budget.fit(json.dumps(analysis, ensure_ascii=False, default=str), per_file_tokens, name=label)
+            for label, analysis in file_analyses
+        )
+        
+        focus_areas = analysis_focus or ["general insights"]
+        objective_guidance = ""
+        if context and context.get("objective_context"):
+            objective_guidance = f"""
+
+CRITICAL - User's Original Objective:
+{context.get('objective_context')}
+
+Your final analysis MUST align with and address all requirements in the above objective."""
+        
+        prompt = f"""The {len(file_analyses)} files of this session were analyzed separately. Combine these per-file analyses into one analysis of the whole session. Focus on: {', '.join(focus_areas)}{objective_guidance}
+
+Per-file analyses:
+{sections}
+
+Create a comprehensive combined analysis that:
+1. Identifies the most important insights across all files, citing the file they come from
+2. Recognizes patterns that hold across files and where files contradict each other
+3. Provides prioritized, actionable recommendations
+4. Eliminates redundancy while preserving key findings
+5. Only uses findings present in the analyses above
+
+Provide your analysis in JSON format with the following structure:
+{{
+    "executive_summary": "High-level overview of key findings across all files",
+    "key_insights": [
+        {{
+            "insight": "specific insight",
+            "supporting_evidence": "evidence and the file it comes from",
+            "importance": "high|medium|low"
+        }}
+    ],
+    "metrics": {{
+        "quantitative_findings": ["finding 1", "finding 2"],
+        "qualitative_findings": ["finding 1", "finding 2"]
+    }},
+    "actionable_recommendations": [
+        {{
+            "recommendation": "specific recommendation",
+            "rationale": "why this is recommended",
+            "expected_impact": "anticipated outcome",
+            "priority": "high|medium|low"
+        }}
+    ],
+    "risks_opportunities": {{
+        "risks": ["risk 1", "risk 2"],
+        "opportunities": ["opportunity 1", "opportunity 2"]
+    }},
+    "conclusion": "Overall analytical conclusion"
+}}"""
+        
+        response = await self.client.chat.completions.create(
+            model=self.deployment,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You are an expert analyst merging file-level analyses into one report."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            temperature=0.4,
+            response_format={"type": "json_object"},
+            max_tokens=3000
+        )
+        
+        result = json.loads(response.choices[0].message.content)
+        result["analysis_metadata"] = {
+            "focus_areas": analysis_focus or ["general"],
+            "context_type": "combined",
+            "processing_method": "per_file_merge",
+            "files_merged": len(file_analyses)
+        }
+        
+        return result
+    
     async def analyze_conversation(
         self,
         transcription: str,
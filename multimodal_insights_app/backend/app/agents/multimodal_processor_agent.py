@@ -8,7 +8,6 @@ MAF-compatible agent implementation.
 
 import asyncio
 import json
-import os
 from pathlib import Path
 from typing import Dict, Any, List, Optional, AsyncIterable
 from datetime import datetime
@@ -30,11 +29,10 @@ from azure.ai.documentintelligence import DocumentIntelligenceClient
 from azure.ai.documentintelligence.models import AnalyzeDocumentRequest, DocumentContentFormat
 from azure.core.credentials import AzureKeyCredential
 
-# Video processing
-try:
-    from moviepy.editor import VideoFileClip
-except ImportError:
-    VideoFileClip = None
+from ..services.transcription_manager import get_sas_signer, get_transcription_manager
+from ..services.media_extraction import audio_suffix, get_media_pool
+from ..services.extraction_cache import ExtractionCache, make_cache_key
+from ..services.extraction_stage import has_extracted_content
 
 logger = structlog.get_logger(__name__)
 
@@ -69,10 +67,28 @@ class MultimodalProcessorAgent(BaseAgent):
             credential=AzureKeyCredential(settings.AZURE_DOCUMENT_INTELLIGENCE_KEY)
         )
         
+        # Process-wide batch transcription manager and SAS signer
+        self.transcription_manager = get_transcription_manager(settings)
+        self.sas_signer = get_sas_signer(settings)
+        
+        # Process pool for video demuxing (ffmpeg)
+        self.media_pool = get_media_pool(settings)
+        
         # Data directory for storing extracted content
         self.data_dir = Path(settings.data_directory)
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
+        # Content-addressed extraction cache shared across sessions and users
+        self.extraction_cache = (
+            ExtractionCache(
+                settings.extraction_cache_directory or str(self.data_dir / "_extraction_cache"),
+                max_bytes=settings.extraction_cache_max_mb * 1024 * 1024,
+                ttl_seconds=settings.extraction_cache_ttl_seconds
+            )
+            if settings.extraction_cache_enabled
+            else None
+        )
+        
         logger.info(f"Initialized {self.name}")
     
     @property
@@ -113,6 +129,7 @@ class MultimodalProcessorAgent(BaseAgent):
             file_type = kwargs.get("file_type")
             session_id = kwargs.get("session_id")
             file_id = kwargs.get("file_id")
+            content_sha256 = kwargs.get("content_sha256")
             
             if not all([file_path, file_type, session_id, file_id]):
                 error_msg = "Missing required parameters: file_path, file_type, session_id, or file_id"
@@ -124,7 +141,9 @@ class MultimodalProcessorAgent(BaseAgent):
                 )
             
             # Process the file
-            result = await self.process_file(file_path, file_type, session_id, file_id)
+            result = await self.process_file(
+                file_path, file_type, session_id, file_id, content_sha256=content_sha256
+            )
             
             # Return result as ChatMessage
             result_text = json.dumps(result, ensure_ascii=False, default=str)
@@ -191,7 +210,8 @@ class MultimodalProcessorAgent(BaseAgent):
         file_path: str,
         file_type: str,
         session_id: str,
-        file_id: str
+        file_id: str,
+        content_sha256: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Process a file based on its type.
@@ -201,12 +221,25 @@ class MultimodalProcessorAgent(BaseAgent):
             file_type: Type of file (audio, video, pdf)
             session_id: Session identifier
             file_id: File identifier
+            content_sha256: SHA-256 of the file bytes; enables the extraction cache
             
         Returns:
             Dictionary containing extracted content and metadata
         """
         logger.info(f"Processing file", file_path=file_path, file_type=file_type)
         
+        cache_key = None
+        if self.extraction_cache is not None and content_sha256:
+            cache_key = make_cache_key(content_sha256, file_type, self._processing_params(file_type))
+            cached = await self.extraction_cache.get(cache_key)
+            # Entries without content predate the check on put; extract again
+            if cached is not None and has_extracted_content(cached):
+                cached["file_id"] = file_id
+                cached["session_id"] = session_id
+                cached["extraction_cache"] = {"hit": True, "content_sha256": content_sha256}
+                self._save_extracted_content(cached, session_id, file_id)
+                return cached
+        
         try:
             if file_type == "audio":
                 result = await self._process_audio(file_path, session_id, file_id)
@@ -220,6 +253,10 @@ class MultimodalProcessorAgent(BaseAgent):
             # Save extracted content to JSON
             self._save_extracted_content(result, session_id, file_id)
             
+            # Failed or degraded extractions (no speech, no text) are retried on re-upload
+            if cache_key is not None and has_extracted_content(result):
+                await self.extraction_cache.put(cache_key, result)
+            
             logger.info(f"Successfully processed file", file_id=file_id)
             return result
             
@@ -227,6 +264,24 @@ class MultimodalProcessorAgent(BaseAgent):
             logger.error(f"Failed to process file", error=str(e), file_id=file_id)
             raise
     
+    def _processing_params(self, file_type: str) -> Dict[str, Any]:
+        """Parameters that affect extraction output and therefore the cache key."""
+        if file_type in ("audio", "video"):
+            params = {
+                "service": "speechtotext/v3.2",
+                "locale": "en-US",
+                "diarization": False,
+                "punctuation": "DictatedAndAutomatic",
+                "profanity": "Masked",
+            }
+            if file_type == "video":
+                params["audio_codec"] = self.media_pool.codec
+                params["sample_rate"] = self.media_pool.sample_rate
+            return params
+        if file_type == "pdf":
+            return {"model": "prebuilt-layout", "output_format": "markdown"}
+        return {}
+    
     async def _process_audio(
         self,
         file_path: str,
@@ -236,179 +291,34 @@ class MultimodalProcessorAgent(BaseAgent):
         """Process audio file using Azure Speech Batch Transcription API."""
         logger.info("Processing audio file with batch transcription", file_path=file_path)
         
-        import aiohttp
-        from urllib.parse import urlparse
-        from datetime import datetime, timedelta
-        from azure.storage.blob import BlobSasPermissions, generate_blob_sas
-        from azure.storage.blob.aio import BlobServiceClient
-        from azure.identity.aio import ClientSecretCredential
-        
         if not file_path.startswith("https://"):
             raise ValueError(f"Batch transcription requires blob URL, got: {file_path}")
         
-        # Parse the blob URL
-        parsed_url = urlparse(file_path)
-        path_parts = parsed_url.path.lstrip('/').split('/', 1)
-        container_name = path_parts[0]
-        blob_name = path_parts[1] if len(path_parts) > 1 else ""
-        
         try:
-            # Generate SAS token using Azure AD credentials
-            credential = ClientSecretCredential(
-                tenant_id=self.app_settings.azure_tenant_id,
-                client_id=self.app_settings.azure_client_id,
-                client_secret=self.app_settings.azure_client_secret
-            )
+            # SAS signing reuses the cached user delegation key
+            blob_url_with_sas = await self.sas_signer.sign(file_path)
+            logger.info("Generated SAS token for blob", file_id=file_id)
             
-            storage_account_url = f"https://{self.app_settings.azure_blob_storage_name}.blob.core.windows.net"
-            
-            async with BlobServiceClient(
-                account_url=storage_account_url,
-                credential=credential
-            ) as blob_service_client:
-                # Get user delegation key (allows SAS generation with Azure AD)
-                start_time = datetime.utcnow()
-                expiry_time = start_time + timedelta(hours=1)
-                
-                user_delegation_key = await blob_service_client.get_user_delegation_key(
-                    key_start_time=start_time,
-                    key_expiry_time=expiry_time
-                )
-                
-                # Generate SAS token for the blob
-                sas_token = generate_blob_sas(
-                    account_name=self.app_settings.azure_blob_storage_name,
-                    container_name=container_name,
-                    blob_name=blob_name,
-                    user_delegation_key=user_delegation_key,
-                    permission=BlobSasPermissions(read=True),
-                    expiry=expiry_time,
-                    start=start_time
-                )
-                
-                blob_url_with_sas = f"{file_path}?{sas_token}"
-                logger.info("Generated SAS token for blob", blob_name=blob_name)
-            
-            await credential.close()
-            
-            # Now use batch transcription API with SAS URL
-            speech_key = self.app_settings.AZURE_SPEECH_KEY
-            speech_region = self.app_settings.AZURE_SPEECH_REGION
-            base_url = f"https://{speech_region}.api.cognitive.microsoft.com/speechtotext/v3.2"
-            
-            headers = {
-                "Ocp-Apim-Subscription-Key": speech_key,
-                "Content-Type": "application/json"
-            }
+            # Shared manager multiplexes polling for every outstanding job
+            transcription = await self.transcription_manager.transcribe(
+                blob_url_with_sas,
+                display_name=f"Transcription_{file_id}",
+                locale="en-US"
+            )
             
-            transcription_request = {
-                "contentUrls": [blob_url_with_sas],
-                "locale": "en-US",
-                "displayName": f"Transcription_{file_id}",
-                "properties": {
-                    "diarizationEnabled": False,
-                    "wordLevelTimestampsEnabled": True,
-                    "punctuationMode": "DictatedAndAutomatic",
-                    "profanityFilterMode": "Masked"
-                }
+            return {
+                "file_id": file_id,
+                "session_id": session_id,
+                "file_type": "audio",
+                "transcription": transcription.text,
+                "text_content": transcription.text,
+                "audio_metadata": {
+                    "duration": transcription.duration,
+                    "format": Path(file_path).suffix,
+                    "language": "en-US"
+                },
+                "processing_timestamp": datetime.utcnow().isoformat()
             }
-            
-            async with aiohttp.ClientSession() as session:
-                # Submit transcription job
-                logger.info("Submitting batch transcription job")
-                async with session.post(
-                    f"{base_url}/transcriptions",
-                    headers=headers,
-                    json=transcription_request
-                ) as response:
-                    if response.status != 201:
-                        error_text = await response.text()
-                        raise Exception(f"Failed to create transcription: {response.status} - {error_text}")
-                    
-                    transcription_response = await response.json()
-                    transcription_id = transcription_response["self"].split("/")[-1]
-                    logger.info("Transcription job created", transcription_id=transcription_id)
-                
-                # Poll for completion
-                max_polls = 60  # 5 minutes max
-                poll_count = 0
-                
-                while poll_count < max_polls:
-                    await asyncio.sleep(5)
-                    poll_count += 1
-                    
-                    async with session.get(
-                        f"{base_url}/transcriptions/{transcription_id}",
-                        headers=headers
-                    ) as response:
-                        if response.status != 200:
-                            raise Exception(f"Failed to get transcription status: {response.status}")
-                        
-                        status_response = await response.json()
-                        status = status_response["status"]
-                        
-                        logger.info("Transcription status", status=status, poll=poll_count)
-                        
-                        if status == "Succeeded":
-                            # Get the transcription files
-                            files_url = status_response["links"]["files"]
-                            async with session.get(files_url, headers=headers) as files_response:
-                                if files_response.status != 200:
-                                    raise Exception(f"Failed to get transcription files: {files_response.status}")
-                                
-                                files_data = await files_response.json()
-                                
-                                # Find and download transcription result
-                                transcription_text = ""
-                                for file_info in files_data["values"]:
-                                    if file_info["kind"] == "Transcription":
-                                        result_url = file_info["links"]["contentUrl"]
-                                        async with session.get(result_url) as result_response:
-                                            if result_response.status != 200:
-                                                raise Exception(f"Failed to download result: {result_response.status}")
-                                            
-                                            result_data = await result_response.json()
-                                            
-                                            # Extract combined text
-                                            phrases = []
-                                            if "combinedRecognizedPhrases" in result_data:
-                                                for phrase in result_data["combinedRecognizedPhrases"]:
-                                                    if "display" in phrase:
-                                                        phrases.append(phrase["display"])
-                                            
-                                            transcription_text = " ".join(phrases)
-                                            logger.info("Transcription extracted", length=len(transcription_text))
-                                            break
-                            
-                            # Cleanup: Delete the transcription job
-                            try:
-                                async with session.delete(
-                                    f"{base_url}/transcriptions/{transcription_id}",
-                                    headers=headers
-                                ):
-                                    logger.info("Transcription job deleted")
-                            except Exception as e:
-                                logger.warning("Failed to delete transcription job", error=str(e))
-                            
-                            return {
-                                "file_id": file_id,
-                                "session_id": session_id,
-                                "file_type": "audio",
-                                "transcription": transcription_text,
-                                "text_content": transcription_text,
-                                "audio_metadata": {
-                                    "duration": status_response.get("duration"),
-                                    "format": Path(file_path).suffix,
-                                    "language": "en-US"
-                                },
-                                "processing_timestamp": datetime.utcnow().isoformat()
-                            }
-                        
-                        elif status == "Failed":
-                            error_msg = status_response.get("properties", {}).get("error", "Unknown error")
-                            raise Exception(f"Transcription failed: {error_msg}")
-                
-                raise Exception(f"Transcription timed out after {max_polls * 5} seconds")
         
         except Exception as e:
             logger.error("Batch transcription failed", error=str(e), exc_info=True)
@@ -420,50 +330,72 @@ class MultimodalProcessorAgent(BaseAgent):
         session_id: str,
         file_id: str
     ) -> Dict[str, Any]:
-        """Process video file by extracting audio and transcribing."""
+        """Process video file by extracting compressed audio off-loop and transcribing."""
         logger.info("Processing video file", file_path=file_path)
         
-        if VideoFileClip is None:
-            raise ImportError("moviepy is required for video processing")
+        if not file_path.startswith("https://"):
+            raise ValueError(f"Video processing requires blob URL, got: {file_path}")
         
-        # Extract audio from video
-        video = VideoFileClip(file_path)
-        audio_path = str(Path(file_path).with_suffix('.wav'))
+        # Audio is written next to the video blob, e.g. <session>/<file_id>_audio.ogg
+        base_url, _, _ = file_path.rpartition(".")
+        audio_blob_url = f"{base_url}_audio{audio_suffix(self.media_pool.codec)}"
         
-        if video.audio is not None:
-            video.audio.write_audiofile(audio_path, logger=None)
-            
-            # Process extracted audio
-            audio_result = await self._process_audio(audio_path, session_id, file_id)
+        source_url = await self.sas_signer.sign(file_path)
+        destination_url = await self.sas_signer.sign(audio_blob_url, writable=True)
+        
+        try:
+            # ffmpeg demux + upload runs in the process pool, never on the event loop
+            video_info = await self.media_pool.extract_audio(source_url, destination_url)
             
-            # Clean up temporary audio file
-            if os.path.exists(audio_path):
-                os.remove(audio_path)
+            if not video_info.get("has_audio"):
+                return {
+                    "file_id": file_id,
+                    "session_id": session_id,
+                    "file_type": "video",
+                    "transcription": None,
+                    "text_content": "Video has no audio track",
+                    "audio_metadata": {
+                        "has_audio": False
+                    },
+                    "extraction_metadata": {
+                        "service": "ffmpeg",
+                        "timestamp": str(asyncio.get_event_loop().time())
+                    }
+                }
             
-            # Add video-specific metadata
-            audio_result["file_type"] = "video"
-            audio_result["audio_metadata"]["video_duration"] = video.duration
-            audio_result["audio_metadata"]["video_fps"] = video.fps
-            audio_result["audio_metadata"]["video_size"] = (video.w, video.h)
+            logger.info(
+                "Extracted audio from video",
+                file_id=file_id,
+                audio_bytes=video_info.get("audio_bytes"),
+                elapsed_seconds=round(video_info.get("elapsed_seconds", 0.0), 2)
+            )
             
-            video.close()
-            return audio_result
-        else:
-            video.close()
-            return {
-                "file_id": file_id,
-                "session_id": session_id,
-                "file_type": "video",
-                "transcription": None,
-                "text_content": "Video has no audio track",
-                "audio_metadata": {
-                    "has_audio": False
-                },
-                "extraction_metadata": {
-                    "service": "moviepy",
-                    "timestamp": str(asyncio.get_event_loop().time())
-                }
-            }
+            # Process extracted audio
+            audio_result = await self._process_audio(audio_blob_url, session_id, file_id)
+        finally:
+            # The extracted audio is only an intermediate for transcription
+            await self._delete_extracted_audio(audio_blob_url, file_id)
+        
+        # Add video-specific metadata
+        audio_result["file_type"] = "video"
+        audio_result["audio_metadata"]["video_duration"] = video_info.get("video_duration")
+        audio_result["audio_metadata"]["video_fps"] = video_info.get("video_fps")
+        audio_result["audio_metadata"]["video_size"] = video_info.get("video_size")
+        audio_result["audio_metadata"]["extracted_audio"] = {
+            "codec": video_info.get("audio_codec"),
+            "sample_rate": video_info.get("sample_rate"),
+            "bytes": video_info.get("audio_bytes")
+        }
+        
+        return audio_result
+    
+    async def _delete_extracted_audio(self, audio_blob_url: str, file_id: str):
+        """Remove the audio blob extracted from a video, logging rather than raising on failure."""
+        try:
+            await self.sas_signer.delete(audio_blob_url)
+            logger.info("Deleted extracted audio", file_id=file_id)
+        except Exception as e:
+            logger.warning("Failed to delete extracted audio", file_id=file_id, blob_url=audio_blob_url, error=str(e))
     
     async def _process_pdf(
         self,
@@ -477,49 +409,8 @@ class MultimodalProcessorAgent(BaseAgent):
         # Check if file_path is a URL or local file
         if file_path.startswith("https://"):
             # For blob URLs, we need to use begin_analyze_document_from_url
-            # But first, generate a SAS token if needed
-            from urllib.parse import urlparse
-            from datetime import datetime, timedelta
-            from azure.storage.blob import BlobSasPermissions, generate_blob_sas
-            from azure.storage.blob.aio import BlobServiceClient
-            from azure.identity.aio import ClientSecretCredential
-            
-            parsed_url = urlparse(file_path)
-            path_parts = parsed_url.path.lstrip('/').split('/', 1)
-            container_name = path_parts[0]
-            blob_name = path_parts[1] if len(path_parts) > 1 else ""
-            
-            # Generate SAS token for the blob
-            credential = ClientSecretCredential(
-                tenant_id=self.app_settings.azure_tenant_id,
-                client_id=self.app_settings.azure_client_id,
-                client_secret=self.app_settings.azure_client_secret
-            )
-            
-            storage_account_url = f"https://{self.app_settings.azure_blob_storage_name}.blob.core.windows.net"
-            
-            async with BlobServiceClient(
-                account_url=storage_account_url,
-                credential=credential
-            ) as blob_service_client:
-                start_time = datetime.utcnow()
-                expiry_time = start_time + timedelta(hours=1)
-                
-                user_delegation_key = await blob_service_client.get_user_delegation_key(
-                    key_start_time=start_time,
-                    key_expiry_time=expiry_time
-                )
-                
-                sas_token = generate_blob_sas(
-                    account_name=self.app_settings.azure_blob_storage_name,
-                    container_name=container_name,
-                    blob_name=blob_name,
-                    user_delegation_key=user_delegation_key,
-                    permission=BlobSasPermissions(read=True),
-                    expiry=expiry_time
-                )
-                
-                blob_url_with_sas = f"{file_path}?{sas_token}"
+            # with a SAS token signed by the cached user delegation key
+            blob_url_with_sas = await self.sas_signer.sign(file_path)
             
             # Analyze document from URL
             logger.info("Analyzing PDF from blob URL", blob_url=file_path)
@@ -7,7 +7,7 @@ MAF-compatible agent implementation.
 
 import asyncio
 import json
-from typing import Dict, Any, List, Optional, AsyncIterable
+from typing import Dict, Any, List, Optional, AsyncIterable, Tuple
 from datetime import datetime
 from pathlib import Path
 import structlog
@@ -17,8 +17,14 @@ from agent_framework import BaseAgent, ChatMessage, Role, TextContent, AgentRunR
 
 from openai import AsyncAzureOpenAI
 
+from ..infra.llm_gateway import gate_openai_client
+from ..services.context_budget import ContextBudget
+
 logger = structlog.get_logger(__name__)
 
+# Tokens per map-reduce chunk
+CHUNK_TOKENS = 30000
+
 
 class SentimentAgent(BaseAgent):
     """
@@ -39,12 +45,16 @@ class SentimentAgent(BaseAgent):
         self.app_settings = settings
         
         # Initialize Azure OpenAI client
-        self.client = AsyncAzureOpenAI(
-            api_key=settings.AZURE_OPENAI_API_KEY,
-            api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT
+        self.client = gate_openai_client(
+            AsyncAzureOpenAI(
+                api_key=settings.AZURE_OPENAI_API_KEY,
+                api_version=settings.AZURE_OPENAI_API_VERSION,
+                azure_endpoint=settings.AZURE_OPENAI_ENDPOINT
+            ),
+            settings=settings
         )
         self.deployment = settings.AZURE_OPENAI_DEPLOYMENT
+        self.context_budget = ContextBudget(self.deployment)
         
         logger.info(f"Initialized {self.name}")
     
@@ -75,17 +85,21 @@ class SentimentAgent(BaseAgent):
             
             # Allow override from kwargs
             content = kwargs.get("content", content)
+            file_analyses = kwargs.get("file_analyses")
             
-            if not content or len(content.strip()) == 0:
+            if file_analyses:
+                # Per-file results of a multi-file session are merged, not re-analyzed
+                result = await self.merge_file_analyses(file_analyses, kwargs)
+            elif not content or len(content.strip()) == 0:
                 return AgentRunResponse(
                     messages=[ChatMessage(
                         role=Role.ASSISTANT,
                         contents=[TextContent(text="Error: No content provided for sentiment analysis")]
                     )]
                 )
-            
-            # Perform sentiment analysis
-            result = await self.analyze_sentiment(content, kwargs)
+            else:
+                # Perform sentiment analysis
+                result = await self.analyze_sentiment(content, kwargs)
             
             # Return result as ChatMessage
             result_text = json.dumps(result, ensure_ascii=False)
@@ -148,7 +162,7 @@ class SentimentAgent(BaseAgent):
     def _chunk_content(self, content: str, max_chunk_tokens: int = 30000) -> List[str]:
         """
         Split large content into manageable chunks for processing.
-        Uses approximate token count (4 chars ≈ 1 token).
+        Sizes are measured with the local tokenizer.
         
         Args:
             content: Text to chunk
@@ -157,10 +171,9 @@ class SentimentAgent(BaseAgent):
         Returns:
             List of content chunks
         """
-        # Approximate: 4 characters ≈ 1 token
-        max_chars = max_chunk_tokens * 4
+        count = self.context_budget.count
         
-        if len(content) <= max_chars:
+        if count(content) <= max_chunk_tokens:
             return [content]
         
         # Split by paragraphs first (double newlines)
@@ -171,10 +184,10 @@ class SentimentAgent(BaseAgent):
         current_length = 0
         
         for para in paragraphs:
-            para_length = len(para)
+            para_length = count(para)
             
             # If single paragraph is too large, split it further
-            if para_length > max_chars:
+            if para_length > max_chunk_tokens:
                 # If we have accumulated content, save it
                 if current_chunk:
                     chunks.append('\n\n'.join(current_chunk))
@@ -187,19 +200,20 @@ class SentimentAgent(BaseAgent):
                 para_chunk_len = 0
                 
                 for sentence in sentences:
-                    if para_chunk_len + len(sentence) > max_chars and para_chunk:
+                    sentence_length = count(sentence)
+                    if para_chunk_len + sentence_length > max_chunk_tokens and para_chunk:
                         chunks.append('. '.join(para_chunk) + '.')
                         para_chunk = [sentence]
-                        para_chunk_len = len(sentence)
+                        para_chunk_len = sentence_length
                     else:
                         para_chunk.append(sentence)
-                        para_chunk_len += len(sentence)
+                        para_chunk_len += sentence_length
                 
                 if para_chunk:
                     chunks.append('. '.join(para_chunk))
             
             # Regular paragraph processing
-            elif current_length + para_length > max_chars:
+            elif current_length + para_length > max_chunk_tokens:
                 # Save current chunk and start new one
                 if current_chunk:
                     chunks.append('\n\n'.join(current_chunk))
@@ -289,7 +303,7 @@ class SentimentAgent(BaseAgent):
         Step 3 (Reduce): Synthesize comprehensive sentiment analysis
         """
         # Step 1: Split into chunks
-        chunks = self._chunk_content(content, max_chunk_tokens=30000)
+        chunks = self._chunk_content(content, max_chunk_tokens=CHUNK_TOKENS)
         logger.info(f"Processing {len(chunks)} chunks via map-reduce")
         
         # Extract objective context if available
@@ -313,7 +327,7 @@ While analyzing sentiment in this section, pay special attention to aspects rele
             prompt = f"""Analyze the sentiment of this section from a larger document. Provide detailed sentiment metrics in JSON format.{objective_guidance}
 
 Document Section:
-{chunk[:50000]}
+{self.context_budget.fit(chunk, CHUNK_TOKENS, name=f"chunk_{i + 1}")}
 
 Provide analysis in this JSON structure:
 {{
@@ -474,6 +488,92 @@ Return your analysis in this JSON structure:
         
         return final_result
     
+    async def merge_file_analyses(
+        self,
+        file_analyses: List[Tuple[str, Dict[str, Any]]],
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Combine the sentiment analyses of several files into one.
+        
+        Args:
+            file_analyses: (file label, analyze_sentiment result) per file
+            context: Additional context (objective, etc.)
+            
+        Returns:
+            Dictionary containing the session-wide sentiment analysis
+        """
+        logger.info("Merging per-file sentiment analyses", file_count=len(file_analyses))
+        
+        per_file_tokens = CHUNK_TOKENS // len(file_analyses)
+        sections = "\n\n".join(
+            f"### {label}\n"
+            + self.context_budget.fit(json.dumps(analysis, ensure_ascii=False, default=str), per_file_tokens, name=label)
+            for label, analysis in file_analyses
+        )
+        
+        objective_guidance = ""
+        if context and context.get('objective_context'):
+            objective_guidance = f"""
+
+CRITICAL - Align with the user's objective:
+{context.get('objective_context')}
+
+Ensure your sentiment insights directly support understanding this objective."""
+        
+        prompt = f"""The {len(file_analyses)} files of this session had their sentiment analyzed separately. Combine these per-file analyses into one sentiment analysis of the whole session.{objective_guidance}
+
+Per-file analyses:
+{sections}
+
+Weigh each file by how much it contributes, keep differences between files visible, and do not invent findings that none of the analyses support.
+
+Return your analysis in this JSON structure:
+{{
+    "overall_sentiment": "positive|negative|neutral|mixed",
+    "sentiment_score": <float between -1.0 and 1.0>,
+    "confidence": <float between 0.0 and 1.0>,
+    "emotions": [
+        {{
+            "emotion": "emotion_name",
+            "intensity": <float between 0.0 and 1.0>
+        }}
+    ],
+    "tone": "description of overall tone",
+    "key_phrases": ["phrase1", "phrase2", "phrase3"],
+    "sentiment_by_file": [
+        {{
+            "file": "file label",
+            "sentiment": "positive|negative|neutral|mixed",
+            "score": <float>
+        }}
+    ],
+    "insights": "summary of sentiment across all files with key takeaways"
+}}"""
+        
+        response = await self.client.chat.completions.create(
+            model=self.deployment,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You are an expert sentiment analyst. Merge file-level sentiment analyses into one consistent assessment."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            temperature=0.3,
+            response_format={"type": "json_object"}
+        )
+        
+        result = json.loads(response.choices[0].message.content)
+        result["metadata"] = {
+            "processing_method": "per_file_merge",
+            "files_merged": len(file_analyses)
+        }
+        return result
+    
     def _build_sentiment_prompt(
         self,
         content: str,
@@ -7,7 +7,7 @@ MAF-compatible agent implementation.
 
 import asyncio
 import json
-from typing import Dict, Any, List, Optional, Literal, AsyncIterable
+from typing import Dict, Any, List, Optional, Literal, AsyncIterable, Tuple
 from datetime import datetime
 from pathlib import Path
 import structlog
@@ -17,8 +17,14 @@ from agent_framework import BaseAgent, ChatMessage, Role, TextContent, AgentRunR
 
 from openai import AsyncAzureOpenAI
 
+from ..infra.llm_gateway import gate_openai_client
+from ..services.context_budget import ContextBudget
+
 logger = structlog.get_logger(__name__)
 
+# Tokens per map-reduce chunk
+CHUNK_TOKENS = 30000
+
 
 class SummarizerAgent(BaseAgent):
     """
@@ -39,12 +45,16 @@ class SummarizerAgent(BaseAgent):
         self.app_settings = settings
         
         # Initialize Azure OpenAI client
-        self.client = AsyncAzureOpenAI(
-            api_key=settings.AZURE_OPENAI_API_KEY,
-            api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT
+        self.client = gate_openai_client(
+            AsyncAzureOpenAI(
+                api_key=settings.AZURE_OPENAI_API_KEY,
+                api_version=settings.AZURE_OPENAI_API_VERSION,
+                azure_endpoint=settings.AZURE_OPENAI_ENDPOINT
+            ),
+            settings=settings
         )
         self.deployment = settings.AZURE_OPENAI_DEPLOYMENT
+        self.context_budget = ContextBudget(self.deployment)
         
         logger.info(f"Initialized {self.name}")
     
@@ -80,23 +90,33 @@ class SummarizerAgent(BaseAgent):
             persona = kwargs.get("persona", "general")
             focus_areas = kwargs.get("focus_areas")
             objective_context = kwargs.get("objective_context")
+            file_analyses = kwargs.get("file_analyses")
             
-            if not content or len(content.strip()) == 0:
+            if file_analyses:
+                # Per-file summaries of a multi-file session are merged, not re-summarized
+                result = await self.merge_file_summaries(
+                    file_analyses,
+                    summary_type,
+                    persona,
+                    focus_areas,
+                    objective_context
+                )
+            elif not content or len(content.strip()) == 0:
                 return AgentRunResponse(
                     messages=[ChatMessage(
                         role=Role.ASSISTANT,
                         contents=[TextContent(text="Error: No content provided for summarization")]
                     )]
                 )
-            
-            # Perform summarization
-            result = await self.summarize(
-                content, 
-                summary_type, 
-                persona, 
-                focus_areas,
-                objective_context
-            )
+            else:
+                # Perform summarization
+                result = await self.summarize(
+                    content, 
+                    summary_type, 
+                    persona, 
+                    focus_areas,
+                    objective_context
+                )
             
             # Return result as ChatMessage
             result_text = json.dumps(result, ensure_ascii=False)
@@ -159,7 +179,7 @@ class SummarizerAgent(BaseAgent):
     def _chunk_content(self, content: str, max_chunk_tokens: int = 30000) -> List[str]:
         """
         Split large content into manageable chunks for processing.
-        Uses approximate token count (4 chars ≈ 1 token).
+        Sizes are measured with the local tokenizer.
         
         Args:
             content: Text to chunk
@@ -168,10 +188,9 @@ class SummarizerAgent(BaseAgent):
         Returns:
             List of content chunks
         """
-        # Approximate: 4 characters ≈ 1 token
-        max_chars = max_chunk_tokens * 4
+        count = self.context_budget.count
         
-        if len(content) <= max_chars:
+        if count(content) <= max_chunk_tokens:
             return [content]
         
         # Split by paragraphs first (double newlines)
@@ -182,10 +201,10 @@ class SummarizerAgent(BaseAgent):
         current_length = 0
         
         for para in paragraphs:
-            para_length = len(para)
+            para_length = count(para)
             
             # If single paragraph is too large, split it further
-            if para_length > max_chars:
+            if para_length > max_chunk_tokens:
                 # If we have accumulated content, save it
                 if current_chunk:
                     chunks.append('\n\n'.join(current_chunk))
@@ -198,19 +217,20 @@ class SummarizerAgent(BaseAgent):
                 para_chunk_len = 0
                 
                 for sentence in sentences:
-                    if para_chunk_len + len(sentence) > max_chars and para_chunk:
+                    sentence_length = count(sentence)
+                    if para_chunk_len + sentence_length > max_chunk_tokens and para_chunk:
                         chunks.append('. '.join(para_chunk) + '.')
                         para_chunk = [sentence]
-                        para_chunk_len = len(sentence)
+                        para_chunk_len = sentence_length
                     else:
                         para_chunk.append(sentence)
-                        para_chunk_len += len(sentence)
+                        para_chunk_len += sentence_length
                 
                 if para_chunk:
                     chunks.append('. '.join(para_chunk))
             
             # Regular paragraph processing
-            elif current_length + para_length > max_chars:
+            elif current_length + para_length > max_chunk_tokens:
                 # Save current chunk and start new one
                 if current_chunk:
                     chunks.append('\n\n'.join(current_chunk))
@@ -325,7 +345,7 @@ class SummarizerAgent(BaseAgent):
         Step 2 (Reduce): Combine chunk summaries into final summary
         """
         # Step 1: Split into chunks
-        chunks = self._chunk_content(content, max_chunk_tokens=30000)
+        chunks = self._chunk_content(content, max_chunk_tokens=CHUNK_TOKENS)
         logger.info(f"Processing {len(chunks)} chunks via map-reduce")
         
         # Step 2: Summarize each chunk (Map phase)
@@ -350,7 +370,7 @@ While summarizing this section, extract information relevant to the above object
             prompt = f"""Summarize this section of a larger document. Focus on key points and maintain important details.{objective_guidance}{focus_guidance}
 
 Document Section:
-{chunk[:50000]}"""  # Extra safety limit
+{self.context_budget.fit(chunk, CHUNK_TOKENS, name=f"chunk_{i + 1}")}"""
             
             response = await self.client.chat.completions.create(
                 model=self.deployment,
@@ -414,6 +434,96 @@ Document Section:
             "chunks_processed": len(chunks)
         }
     
+    async def merge_file_summaries(
+        self,
+        file_summaries: List[Tuple[str, Dict[str, Any]]],
+        summary_type: str = "detailed",
+        persona: str = "general",
+        focus_areas: Optional[List[str]] = None,
+        objective_context: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Combine the summaries of several files into one session summary.
+        
+        Args:
+            file_summaries: (file label, summarize result) per file
+            summary_type: Level of detail
+            persona: Target audience persona
+            focus_areas: Specific areas to focus on
+            objective_context: Original user objective to align with
+            
+        Returns:
+            Dictionary containing summary and metadata
+        """
+        logger.info("Merging per-file summaries", file_count=len(file_summaries))
+        
+        per_file_tokens = CHUNK_TOKENS // len(file_summaries)
+        sections = "\n\n---\n\n".join(
+            f"### {label}\n"
+            + self.context_budget.fit(str(summary.get("summary") or summary.get("raw_result", "")), per_file_tokens, name=label)
+            for label, summary in file_summaries
+        )
+        
+        length_guidance = {
+            "brief": "1-2 paragraphs",
+            "detailed": "3-5 paragraphs with key sections",
+            "comprehensive": "Detailed multi-section summary covering all aspects requested in the objective"
+        }
+        focus_text = f"\n\nFocus specifically on: {', '.join(focus_areas)}" if focus_areas else ""
+        objective_text = ""
+        if objective_context:
+            objective_text = f"""
+
+IMPORTANT - User's Original Objective:
+{objective_context}
+
+Your summary MUST align with and address all key points, analysis areas, and requirements specified in the above objective."""
+        
+        prompt = f"""You are combining the summaries of {len(file_summaries)} separate files from one session into a single summary.
+
+Per-file summaries:
+
+{sections}
+
+Create a unified, well-structured {summary_type} summary ({length_guidance.get(summary_type, 'appropriate length')}).{focus_text}{objective_text}
+
+Ensure the final summary:
+1. Covers every file, saying which file a point comes from where it matters
+2. Brings out where the files agree, differ or build on each other
+3. Eliminates redundancy while preserving important details
+4. Only uses information present in the summaries above"""
+        
+        response = await self.client.chat.completions.create(
+            model=self.deployment,
+            messages=[
+                {
+                    "role": "system",
+                    "content": self._get_persona_system_message(persona)
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            temperature=0.5,
+            max_tokens=self._get_max_tokens_for_type(summary_type)
+        )
+        
+        summary_text = response.choices[0].message.content
+        original_length = sum(summary.get("original_length", 0) for _, summary in file_summaries)
+        
+        return {
+            "summary": summary_text,
+            "summary_type": summary_type,
+            "persona": persona,
+            "focus_areas": focus_areas or [],
+            "original_length": original_length,
+            "summary_length": len(summary_text),
+            "compression_ratio": len(summary_text) / original_length if original_length else 0,
+            "processing_method": "per_file_merge",
+            "files_merged": len(file_summaries)
+        }
+    
     async def create_multiple_summaries(
         self,
         content: str,
@@ -5,7 +5,7 @@ Loads environment variables and provides typed configuration for multimodal insi
 """
 
 import os
-from typing import Optional, List, Union
+from typing import Literal, Optional, List, Union
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, field_validator
 
@@ -29,6 +29,10 @@ class Settings(BaseSettings):
     # Azure Speech Services
     azure_speech_key: str = Field(..., alias="AZURE_SPEECH_KEY")
     azure_speech_region: str = Field(..., alias="AZURE_SPEECH_REGION")
+    speech_batch_endpoint: Optional[str] = Field(default=None, alias="SPEECH_BATCH_ENDPOINT")  # Override for local/fake batch API
+    transcription_min_poll_interval: float = Field(default=2.0, alias="TRANSCRIPTION_MIN_POLL_INTERVAL")
+    transcription_max_poll_interval: float = Field(default=30.0, alias="TRANSCRIPTION_MAX_POLL_INTERVAL")
+    transcription_timeout: float = Field(default=3600.0, alias="TRANSCRIPTION_TIMEOUT")
     
     # Azure Document Intelligence
     azure_document_intelligence_endpoint: str = Field(..., alias="AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT")
@@ -50,6 +54,9 @@ class Settings(BaseSettings):
     cosmosdb_key: Optional[str] = Field(default=None, alias="COSMOSDB_KEY")  # Optional - use Azure AD if not provided
     cosmosdb_database: str = Field(default="finagent", alias="COSMOS_DB_DATABASE")
     cosmosdb_container: str = Field(default="multimodal", alias="COSMOS_DB_CONTAINER")
+    memory_store_backend: str = Field(default="cosmos", alias="MEMORY_STORE_BACKEND")  # cosmos | sqlite
+    sqlite_memory_path: str = Field(default="data/memory_store.db", alias="SQLITE_MEMORY_PATH")
+    memory_store_record_path: Optional[str] = Field(default=None, alias="MEMORY_STORE_RECORD_PATH")
     
     # Azure Authentication (for managed identity/service principal)
     azure_tenant_id: Optional[str] = Field(default=None, alias="AZURE_TENANT_ID")
@@ -64,6 +71,8 @@ class Settings(BaseSettings):
     
     # File Upload Configuration
     max_upload_size: int = Field(default=104857600, alias="MAX_UPLOAD_SIZE")  # 100MB
+    upload_block_size: int = Field(default=4194304, alias="UPLOAD_BLOCK_SIZE")  # 4MB staged blocks
+    upload_max_concurrency: int = Field(default=4, alias="UPLOAD_MAX_CONCURRENCY")  # Blocks staged in parallel
     allowed_audio_extensions: List[str] = Field(
         default=[".mp3", ".wav", ".m4a", ".flac", ".ogg", ".wma"],
         alias="ALLOWED_AUDIO_EXTENSIONS"
@@ -79,6 +88,12 @@ class Settings(BaseSettings):
     upload_directory: str = Field(default="uploads", alias="UPLOAD_DIRECTORY")
     data_directory: str = Field(default="data", alias="DATA_DIRECTORY")
     
+    # Extraction cache (content hash + processing parameters -> transcript/markdown)
+    extraction_cache_enabled: bool = Field(default=True, alias="EXTRACTION_CACHE_ENABLED")
+    extraction_cache_directory: Optional[str] = Field(default=None, alias="EXTRACTION_CACHE_DIRECTORY")  # Defaults to <DATA_DIRECTORY>/_extraction_cache
+    extraction_cache_max_mb: int = Field(default=1024, alias="EXTRACTION_CACHE_MAX_MB")  # Oldest entries are evicted beyond this
+    extraction_cache_ttl_seconds: int = Field(default=30 * 86400, alias="EXTRACTION_CACHE_TTL_SECONDS")  # 0 = never expire
+    
     # Backend Configuration
     backend_host: str = Field(default="0.0.0.0", alias="BACKEND_HOST")
     backend_port: int = Field(default=8000, alias="BACKEND_PORT")
@@ -103,6 +118,34 @@ class Settings(BaseSettings):
     default_agent_timeout: int = Field(default=300, alias="DEFAULT_AGENT_TIMEOUT")
     enable_agent_telemetry: bool = Field(default=True, alias="ENABLE_AGENT_TELEMETRY")
     
+    # LLM Gateway (deployment quotas shared by all agents; 0 = no limit)
+    llm_gateway_enabled: bool = Field(default=True, alias="LLM_GATEWAY_ENABLED")
+    llm_requests_per_minute: int = Field(default=0, alias="LLM_REQUESTS_PER_MINUTE")
+    llm_tokens_per_minute: int = Field(default=0, alias="LLM_TOKENS_PER_MINUTE")
+    llm_max_concurrent_requests: int = Field(default=0, alias="LLM_MAX_CONCURRENT_REQUESTS")
+    llm_max_retries: int = Field(default=4, alias="LLM_MAX_RETRIES")
+    
+    # LLM Response Cache (exact-match; opt-in)
+    llm_cache_enabled: bool = Field(default=False, alias="LLM_CACHE_ENABLED")
+    llm_cache_memory_mb: int = Field(default=16, alias="LLM_CACHE_MEMORY_MB")
+    llm_cache_sqlite_path: Optional[str] = Field(default=None, alias="LLM_CACHE_SQLITE_PATH")
+    llm_cache_sqlite_max_mb: int = Field(default=256, alias="LLM_CACHE_SQLITE_MAX_MB")
+    llm_cache_ttl_seconds: int = Field(default=86400, alias="LLM_CACHE_TTL_SECONDS")
+    
+    # File Extraction Concurrency (per file kind)
+    max_concurrent_audio_extractions: int = Field(default=4, alias="MAX_CONCURRENT_AUDIO_EXTRACTIONS")
+    max_concurrent_video_extractions: int = Field(default=2, alias="MAX_CONCURRENT_VIDEO_EXTRACTIONS")
+    max_concurrent_pdf_extractions: int = Field(default=4, alias="MAX_CONCURRENT_PDF_EXTRACTIONS")
+    
+    # Video Audio Extraction (ffmpeg in a process pool)
+    video_extraction_workers: int = Field(default=2, alias="VIDEO_EXTRACTION_WORKERS")
+    video_audio_codec: Literal["opus", "flac"] = Field(default="opus", alias="VIDEO_AUDIO_CODEC")
+    video_audio_sample_rate: int = Field(default=16000, alias="VIDEO_AUDIO_SAMPLE_RATE")
+    
+    # Report Export (dedicated render threads; ReportLab PDFs in a process pool)
+    export_render_threads: int = Field(default=4, alias="EXPORT_RENDER_THREADS")
+    export_pdf_workers: int = Field(default=2, alias="EXPORT_PDF_WORKERS")
+    
     # Execution Configuration
     max_sequential_steps: int = Field(default=10, alias="MAX_SEQUENTIAL_STEPS")
     handoff_max_iterations: int = Field(default=10, alias="HANDOFF_MAX_ITERATIONS")
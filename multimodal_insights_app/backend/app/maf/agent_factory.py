@@ -10,6 +10,7 @@ import structlog
 from agent_framework import ChatAgent
 from agent_framework.azure import AzureOpenAIChatClient
 
+from ..infra.llm_gateway import gate_chat_client
 from ..infra.settings import Settings
 
 
@@ -50,12 +51,12 @@ class MAFAgentFactory:
     def _create_chat_client(self, settings: Settings) -> AzureOpenAIChatClient:
         """Create an Azure OpenAI chat client for Microsoft Agent Framework."""
         try:
-            client = AzureOpenAIChatClient(
+            client = gate_chat_client(AzureOpenAIChatClient(
                 endpoint=settings.AZURE_OPENAI_ENDPOINT,
                 api_key=settings.AZURE_OPENAI_API_KEY,
                 deployment_name=settings.AZURE_OPENAI_DEPLOYMENT,
                 api_version=settings.AZURE_OPENAI_API_VERSION,
-            )
+            ), settings=settings)
             logger.debug("Azure OpenAI chat client created for MAF usage")
             return client
         except Exception as exc:  # pragma: no cover - defensive logging
@@ -20,9 +20,14 @@ from .routers import orchestration, files, export_router, sessions
 from .services.task_orchestrator import TaskOrchestrator
 from .services.file_handler import FileHandler
 from .services.export_service import ExportService
+from .services.transcription_manager import shutdown_transcription_services
+from .services.media_extraction import shutdown_media_pool
+from .services.export_workers import shutdown_export_pool
 from .infra.settings import Settings
+from .infra.llm_cache import get_llm_cache
+from .infra.llm_gateway import get_llm_gateway
 from .infra.telemetry import get_telemetry
-from .persistence.cosmos_memory import CosmosMemoryStore
+from .persistence.cosmos_memory import CosmosMemoryStore, create_memory_store
 
 logger = structlog.get_logger(__name__)
 
@@ -45,7 +50,7 @@ async def lifespan(app: FastAPI):
     telemetry.initialize(app)
     
     # Initialize memory store
-    memory_store = CosmosMemoryStore(settings)
+    memory_store = create_memory_store(settings)
     await memory_store.initialize()
     
     # Initialize file handler
@@ -80,8 +85,11 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down application")
     if task_orchestrator:
         await task_orchestrator.shutdown()
+    await shutdown_transcription_services()
+    shutdown_media_pool()
     if export_service:
         await export_service.shutdown()
+    shutdown_export_pool()
     if file_handler:
         await file_handler.shutdown()
     if memory_store:
@@ -123,9 +131,12 @@ app.include_router(export_router.router)
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
+    gateway, cache = get_llm_gateway(settings), get_llm_cache(settings)
     return {
         "status": "healthy",
         "service": "multimodal-insights-api",
+        "llm_gateway": gateway.stats() if gateway else None,
+        "llm_cache": cache.stats() if cache else None,
         "timestamp": datetime.utcnow().isoformat()
     }
 
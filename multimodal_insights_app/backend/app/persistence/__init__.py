@@ -1 +1,6 @@
 """Persistence module."""
+
+from .cosmos_memory import CosmosMemoryStore, create_memory_store
+from .sqlite_memory import SqliteMemoryStore
+
+__all__ = ["CosmosMemoryStore", "SqliteMemoryStore", "create_memory_store"]
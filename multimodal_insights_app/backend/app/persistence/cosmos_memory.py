@@ -22,6 +22,7 @@ from ..models.task_models import (
     DataType, PlanStatus, StepStatus, PlanWithSteps
 )
 from ..infra.settings import Settings
+from .sqlite_container import RecordingContainer
 
 logger = structlog.get_logger(__name__)
 
@@ -79,6 +80,10 @@ class CosmosMemoryStore:
                 offer_throughput=400
             )
             
+            # Record the live workload for replay by the persistence benchmark
+            if self.settings.memory_store_record_path:
+                self.container = RecordingContainer(self.container, self.settings.memory_store_record_path)
+            
             logger.info(
                 "Cosmos DB initialized",
                 database=self.settings.cosmosdb_database,
@@ -95,6 +100,8 @@ class CosmosMemoryStore:
     
     async def close(self):
         """Close Cosmos DB client."""
+        if isinstance(self.container, RecordingContainer):
+            self.container.close()
         if self.client:
             await self.client.close()
             logger.info("Cosmos DB connection closed")
@@ -576,3 +583,11 @@ class CosmosMemoryStore:
         except Exception as e:
             logger.error(f"Failed to get plan with steps", error=str(e))
             return None
+
+
+def create_memory_store(settings: Settings) -> CosmosMemoryStore:
+    """Build the memory store selected by MEMORY_STORE_BACKEND (cosmos or sqlite)."""
+    if settings.memory_store_backend.strip().lower() == "sqlite":
+        from .sqlite_memory import SqliteMemoryStore
+        return SqliteMemoryStore(settings)
+    return CosmosMemoryStore(settings)
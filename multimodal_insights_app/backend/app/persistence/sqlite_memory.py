@@ -0,0 +1,57 @@
+"""
+SQLite Memory Store - Multimodal Insights Application
+
+Runs the Cosmos memory store against a local SQLite (WAL) database, so the
+application and the persistence benchmark work without a Cosmos account.
+Every store method is inherited unchanged; only the container underneath is
+replaced, which keeps queries, partitioning (session_id) and paging identical.
+
+Selected with MEMORY_STORE_BACKEND=sqlite (default: cosmos).
+"""
+
+from typing import Optional
+
+import structlog
+
+from .cosmos_memory import CosmosMemoryStore
+from .sqlite_container import RecordingContainer, SqliteContainer
+from ..infra.settings import Settings
+
+logger = structlog.get_logger(__name__)
+
+# Secondary indexes matching the store's filters and sort orders
+SQLITE_INDEXES = (
+    ("data_type", "user_id", "last_active"),
+    ("data_type", "user_id", "timestamp"),
+    ("data_type", "timestamp"),
+)
+
+
+class SqliteMemoryStore(CosmosMemoryStore):
+    """CosmosMemoryStore backed by a local SQLite database."""
+    
+    def __init__(self, settings: Settings):
+        """Initialize SQLite memory store."""
+        super().__init__(settings)
+        self._sqlite: Optional[SqliteContainer] = None
+    
+    async def initialize(self):
+        """Open the database and create the table and indexes."""
+        if self.container is not None:
+            return
+        
+        path = self.settings.sqlite_memory_path
+        record_path = self.settings.memory_store_record_path
+        
+        self._sqlite = await SqliteContainer(path, partition_key_path="/session_id", indexes=SQLITE_INDEXES).open()
+        self.container = RecordingContainer(self._sqlite, record_path) if record_path else self._sqlite
+        
+        logger.info("SQLite memory store initialized", path=path, recording=bool(record_path))
+    
+    async def close(self):
+        """Close the database."""
+        if isinstance(self.container, RecordingContainer):
+            self.container.close()
+        if self._sqlite:
+            await self._sqlite.close()
+            logger.info("SQLite memory store closed")
@@ -12,6 +12,7 @@ import structlog
 
 from ..models.task_models import FileMetadata, FileUploadResponse
 from ..services.file_handler import FileHandler
+from ..services.blob_upload import UploadTooLargeError
 from ..persistence.cosmos_memory import CosmosMemoryStore
 from ..infra.settings import Settings
 from ..auth.auth_utils import get_authenticated_user_details
@@ -184,6 +185,12 @@ async def upload_files(
         
     except HTTPException:
         raise
+    except UploadTooLargeError as e:
+        logger.warning("Rejected oversized upload", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Failed to upload files", error=str(e))
         raise HTTPException(
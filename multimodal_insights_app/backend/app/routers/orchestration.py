@@ -6,7 +6,10 @@ Built from scratch for multimodal content processing.
 """
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, status, Request
+from fastapi.responses import StreamingResponse
 from typing import Optional, List
+import asyncio
+import json
 import structlog
 
 from ..models.task_models import (
@@ -14,8 +17,10 @@ from ..models.task_models import (
     ActionRequest, ActionResponse, PlanExecutionResponse
 )
 from ..services.task_orchestrator import TaskOrchestrator
+from ..services.plan_events import PlanEvent, TERMINAL_PLAN_STATUSES
 from ..services.file_handler import FileHandler
 from ..infra.settings import Settings
+from ..infra.llm_gateway import Priority, llm_request_context
 from ..auth.auth_utils import get_authenticated_user_details
 
 logger = structlog.get_logger(__name__)
@@ -43,6 +48,20 @@ def get_orchestrator() -> TaskOrchestrator:
     return _orchestrator
 
 
+async def _execute_plan_for_user(
+    orchestrator: TaskOrchestrator,
+    plan_id: str,
+    session_id: str,
+    user_id: str
+):
+    """
+    Background plan execution. Its LLM calls are queued under the plan's user,
+    behind interactive requests such as plan creation.
+    """
+    with llm_request_context(user_id, Priority.BACKGROUND):
+        await orchestrator.execute_plan(plan_id, session_id)
+
+
 @router.post("/plans", response_model=PlanWithSteps, status_code=status.HTTP_201_CREATED)
 async def create_plan(
     input_task: InputTask,
@@ -67,7 +86,8 @@ async def create_plan(
     )
     
     try:
-        plan = await orchestrator.create_plan_from_objective(input_task)
+        with llm_request_context(input_task.user_id):
+            plan = await orchestrator.create_plan_from_objective(input_task)
         
         logger.info(
             "Plan created successfully via API",
@@ -129,9 +149,11 @@ async def execute_plan(
         
         # Start execution in background
         background_tasks.add_task(
-            orchestrator.execute_plan,
+            _execute_plan_for_user,
+            orchestrator,
             plan_id,
-            action_request.session_id
+            action_request.session_id,
+            plan.user_id
         )
         
         logger.info("Plan execution started in background", plan_id=plan_id)
@@ -237,6 +259,103 @@ async def get_execution_status(
         )
 
 
+def _format_sse(event: PlanEvent) -> str:
+    return f"id: {event.id}\nevent: {event.type}\ndata: {json.dumps(event.data)}\n\n"
+
+
+@router.get("/plans/{plan_id}/events")
+async def stream_execution_events(
+    plan_id: str,
+    session_id: str,
+    request: Request,
+    last_event_id: Optional[str] = None,
+    orchestrator: TaskOrchestrator = Depends(get_orchestrator)
+):
+    """
+    Stream execution status of a plan as Server-Sent Events.
+    
+    Every event carries the same status as the status endpoint (under
+    `status`); `step` events also carry the step that changed. The stream ends
+    after the event in which the plan completes or fails.
+    
+    While the plan executes in this process, events come from memory with no
+    database reads. Reconnecting clients send the last event id (the browser's
+    `Last-Event-ID` header, or `last_event_id`) and receive only what they
+    missed.
+    
+    Args:
+        plan_id: Plan ID
+        session_id: Session ID
+        last_event_id: Id of the last event received, when reconnecting
+    
+    Returns:
+        text/event-stream response
+    """
+    last_event_id = request.headers.get("last-event-id") or last_event_id
+    bus = orchestrator.plan_events
+    
+    # Events of a plan executing here are served from memory, so the owning
+    # session is checked against the bus as well as the store
+    owner = bus.session_of(plan_id)
+    if owner is not None and owner != session_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Plan {plan_id} not found")
+    
+    initial_status = None
+    if not bus.is_tracked(plan_id):
+        # Not executing here (yet): read the starting status once
+        try:
+            initial_status = await orchestrator.get_execution_status(plan_id, session_id)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    
+    logger.info("Streaming execution events via API", plan_id=plan_id, resumed=bool(last_event_id))
+    
+    async def event_source():
+        if initial_status is not None and initial_status.overall_status in TERMINAL_PLAN_STATUSES:
+            event = PlanEvent(
+                id="final",
+                type="status",
+                data={"status": initial_status.model_dump(mode="json")},
+                final=True
+            )
+            yield _format_sse(event)
+            return
+        
+        events = bus.subscribe(plan_id, last_event_id, initial_status)
+        pending = None
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(events.__anext__())
+                done, _ = await asyncio.wait({pending}, timeout=15.0)
+                if not done:
+                    if await request.is_disconnected():
+                        break
+                    # Keeps proxies from closing the connection during long steps
+                    yield ": keep-alive\n\n"
+                    continue
+                try:
+                    event = pending.result()
+                except StopAsyncIteration:
+                    break
+                pending = None
+                yield _format_sse(event)
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+                try:
+                    await pending
+                except (asyncio.CancelledError, StopAsyncIteration):
+                    pass
+            await events.aclose()
+    
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.post("/execute-direct", response_model=PlanExecutionResponse)
 async def execute_direct(
     request: Request,
@@ -276,13 +395,16 @@ async def execute_direct(
     
     try:
         # Create plan
-        plan = await orchestrator.create_plan_from_objective(input_task)
+        with llm_request_context(user_id):
+            plan = await orchestrator.create_plan_from_objective(input_task)
         
         # Start execution in background
         background_tasks.add_task(
-            orchestrator.execute_plan,
+            _execute_plan_for_user,
+            orchestrator,
             plan.id,
-            plan.session_id
+            plan.session_id,
+            user_id
         )
         
         logger.info(
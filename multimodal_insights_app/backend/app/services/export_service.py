@@ -7,10 +7,12 @@ Built from scratch for multimodal content processing results.
 
 import json
 import asyncio
+import hashlib
+import os
 import tempfile
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Awaitable, Callable, Dict, List, Optional, Any
 from pathlib import Path
 import structlog
 import aiofiles
@@ -36,11 +38,91 @@ if not PDFKIT_AVAILABLE:
         REPORTLAB_AVAILABLE = False
 
 from ..models.task_models import PlanWithSteps, StepStatus
-from ..persistence.cosmos_memory import CosmosMemoryStore
+from ..persistence.cosmos_memory import create_memory_store
 from ..infra.settings import Settings
+from .export_workers import get_export_pool
 
 logger = structlog.get_logger(__name__)
 
+# Bump when report layout changes, so exports cached on disk are re-rendered
+EXPORT_VERSION = 1
+
+EXPORT_EXTENSIONS = {"markdown": "md", "html": "html", "pdf": "pdf", "json": "json"}
+
+
+def make_export_key(export_data: Dict[str, Any]) -> str:
+    """
+    Hash everything a report is rendered from.
+    
+    Exports are stored under this key, so downloading an unchanged report
+    again in any format that was already produced costs no rendering.
+    """
+    material = json.dumps(
+        {
+            "version": EXPORT_VERSION,
+            "include_metadata": export_data["include_metadata"],
+            "plan": export_data["plan"].model_dump(mode="json"),
+            "files": [f.model_dump(mode="json") for f in export_data["files"]],
+            "messages": [m.model_dump(mode="json") for m in export_data["messages"]],
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _render_pdf_reportlab(plan: PlanWithSteps, files: List[Any], pdf_path: str) -> None:
+    """Generate PDF using ReportLab (fallback method); runs in an export worker process."""
+    doc = SimpleDocTemplate(pdf_path, pagesize=letter)
+    story = []
+    styles = getSampleStyleSheet()
+    
+    # Title
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor='#2c3e50',
+        alignment=TA_CENTER
+    )
+    story.append(Paragraph("Multimodal Insights Report", title_style))
+    story.append(Spacer(1, 0.3 * inch))
+    
+    # Metadata
+    story.append(Paragraph(f"<b>Session ID:</b> {plan.session_id}", styles['Normal']))
+    story.append(Paragraph(f"<b>Plan ID:</b> {plan.id}", styles['Normal']))
+    story.append(Paragraph(f"<b>Generated:</b> {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}", styles['Normal']))
+    story.append(Spacer(1, 0.3 * inch))
+    
+    # Executive Summary
+    story.append(Paragraph("Executive Summary", styles['Heading2']))
+    story.append(Paragraph(f"<b>Objective:</b> {plan.initial_goal}", styles['Normal']))
+    story.append(Paragraph(f"<b>Status:</b> {plan.overall_status.value.upper()}", styles['Normal']))
+    story.append(Paragraph(f"<b>Progress:</b> {plan.completed_steps}/{plan.total_steps} steps", styles['Normal']))
+    story.append(Spacer(1, 0.2 * inch))
+    
+    # Files
+    if files:
+        story.append(Paragraph("Processed Files", styles['Heading2']))
+        for file in files:
+            story.append(Paragraph(f"• {file.filename} ({file.file_type.value})", styles['Normal']))
+        story.append(Spacer(1, 0.2 * inch))
+    
+    # Steps
+    story.append(Paragraph("Analysis Results", styles['Heading2']))
+    for idx, step in enumerate(plan.steps, 1):
+        story.append(Paragraph(f"Step {idx}: {step.action}", styles['Heading3']))
+        story.append(Paragraph(f"<b>Agent:</b> {step.agent.value}", styles['Normal']))
+        story.append(Paragraph(f"<b>Status:</b> {step.status.value}", styles['Normal']))
+        if step.agent_reply:
+            reply_preview = step.agent_reply[:500] + "..." if len(step.agent_reply) > 500 else step.agent_reply
+            story.append(Paragraph(f"<b>Results:</b> {reply_preview}", styles['Normal']))
+        story.append(Spacer(1, 0.1 * inch))
+    
+    # Build PDF
+    doc.build(story)
+
 
 class ExportService:
     """
@@ -56,12 +138,15 @@ class ExportService:
     def __init__(self, settings: Settings):
         """Initialize export service."""
         self.settings = settings
-        self.memory_store = CosmosMemoryStore(settings)
+        self.memory_store = create_memory_store(settings)
         
         # Create exports directory
         self.exports_dir = Path("exports")
         self.exports_dir.mkdir(exist_ok=True)
         
+        # Exports being rendered, by filename, so concurrent requests share one render
+        self._rendering: Dict[str, asyncio.Future] = {}
+        
         logger.info("Export Service initialized", exports_dir=str(self.exports_dir))
     
     async def initialize(self):
@@ -123,15 +208,27 @@ class ExportService:
                 "include_metadata": include_metadata
             }
             
+            # Rendering happens on the export workers, never on the event loop
+            export_key = await get_export_pool(self.settings).run(make_export_key, export_data)
+            renderers = {
+                "markdown": self._render_markdown,
+                "md": self._render_markdown,
+                "html": self._render_html,
+                "json": self._render_json,
+            }
+            
             # Export based on format
-            if export_format.lower() == "markdown" or export_format.lower() == "md":
-                result = await self._export_markdown(export_data, plan_id, session_id)
-            elif export_format.lower() == "pdf":
-                result = await self._export_pdf(export_data, plan_id, session_id)
-            elif export_format.lower() == "json":
-                result = await self._export_json(export_data, plan_id, session_id)
-            elif export_format.lower() == "html":
-                result = await self._export_html(export_data, plan_id, session_id)
+            if export_format.lower() == "pdf":
+                result = await self._export_pdf(export_data, plan_id, session_id, export_key)
+            elif export_format.lower() in renderers:
+                result = await self._export_text(
+                    renderers[export_format.lower()],
+                    export_data,
+                    plan_id,
+                    session_id,
+                    export_key,
+                    "markdown" if export_format.lower() == "md" else export_format.lower()
+                )
             else:
                 raise ValueError(f"Unsupported export format: {export_format}")
             
@@ -139,7 +236,8 @@ class ExportService:
                 "Export completed successfully",
                 plan_id=plan_id,
                 format=export_format,
-                file_path=result["file_path"]
+                file_path=result["file_path"],
+                cached=result["cached"]
             )
             
             return result
@@ -148,13 +246,77 @@ class ExportService:
             logger.error(f"Export failed", error=str(e), plan_id=plan_id)
             raise
     
-    async def _export_markdown(
+    def _export_path(self, plan_id: str, export_key: str, export_format: str) -> Path:
+        return self.exports_dir / f"insights_report_{plan_id[:8]}_{export_key[:16]}.{EXPORT_EXTENSIONS[export_format]}"
+    
+    async def _write_export(
         self,
+        plan_id: str,
+        export_key: str,
+        export_format: str,
+        render: Callable[[str], Awaitable[Any]]
+    ) -> Dict[str, Any]:
+        """
+        Return the export file for ``export_key``, rendering it if it doesn't exist yet.
+        
+        ``render`` writes the file to the temporary path it is given, which is
+        renamed into place only once complete.
+        """
+        file_path = self._export_path(plan_id, export_key, export_format)
+        cached = file_path.exists()
+        if not cached:
+            pending = self._rendering.get(file_path.name)
+            if pending is None:
+                pending = asyncio.ensure_future(self._render_file(file_path, render))
+                self._rendering[file_path.name] = pending
+                pending.add_done_callback(lambda _: self._rendering.pop(file_path.name, None))
+            # A client going away must not abort a render other requests wait on
+            await asyncio.shield(pending)
+        
+        return {
+            "file_path": str(file_path),
+            "filename": file_path.name,
+            "format": export_format,
+            "size_bytes": file_path.stat().st_size,
+            "cached": cached
+        }
+    
+    async def _render_file(self, file_path: Path, render: Callable[[str], Awaitable[Any]]) -> None:
+        tmp_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            await render(str(tmp_path))
+            os.replace(tmp_path, file_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+    
+    async def _export_text(
+        self,
+        renderer: Callable[[Dict[str, Any], str, str], str],
         export_data: Dict[str, Any],
         plan_id: str,
-        session_id: str
+        session_id: str,
+        export_key: str,
+        export_format: str
     ) -> Dict[str, Any]:
-        """Export results as Markdown."""
+        """Export results in a text format (Markdown, HTML or JSON)."""
+        def write(tmp_path: str) -> None:
+            content = renderer(export_data, plan_id, session_id)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(content)
+        
+        workers = get_export_pool(self.settings)
+        return await self._write_export(
+            plan_id, export_key, export_format,
+            lambda tmp_path: workers.run(write, tmp_path)
+        )
+    
+    def _render_markdown(
+        self,
+        export_data: Dict[str, Any],
+        plan_id: str,
+        session_id: str
+    ) -> str:
+        """Render results as Markdown."""
         plan = export_data["plan"]
         messages = export_data["messages"]
         files = export_data["files"]
@@ -237,29 +399,15 @@ class ExportService:
             md_lines.append(f"- **User ID:** {plan.user_id}")
             md_lines.append("")
         
-        # Write to file
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        filename = f"insights_report_{plan_id[:8]}_{timestamp}.md"
-        file_path = self.exports_dir / filename
-        
-        async with asyncio.Lock():
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write("\n".join(md_lines))
-        
-        return {
-            "file_path": str(file_path),
-            "filename": filename,
-            "format": "markdown",
-            "size_bytes": file_path.stat().st_size
-        }
+        return "\n".join(md_lines)
     
-    async def _export_html(
+    def _render_html(
         self,
         export_data: Dict[str, Any],
         plan_id: str,
         session_id: str
-    ) -> Dict[str, Any]:
-        """Export results as HTML."""
+    ) -> str:
+        """Render results as HTML."""
         plan = export_data["plan"]
         messages = export_data["messages"]
         files = export_data["files"]
@@ -367,84 +515,63 @@ class ExportService:
         html_lines.append("</body>")
         html_lines.append("</html>")
         
-        # Write to file
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        filename = f"insights_report_{plan_id[:8]}_{timestamp}.html"
-        file_path = self.exports_dir / filename
-        
-        async with asyncio.Lock():
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write("\n".join(html_lines))
-        
-        return {
-            "file_path": str(file_path),
-            "filename": filename,
-            "format": "html",
-            "size_bytes": file_path.stat().st_size
-        }
+        return "\n".join(html_lines)
     
     async def _export_pdf(
         self,
         export_data: Dict[str, Any],
         plan_id: str,
-        session_id: str
+        session_id: str,
+        export_key: str
     ) -> Dict[str, Any]:
         """Export results as PDF using pdfkit (wkhtmltopdf) or ReportLab as fallback."""
-        
-        # First generate HTML
-        html_result = await self._export_html(export_data, plan_id, session_id)
-        html_path = Path(html_result["file_path"])
-        
-        # Generate PDF filename
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        pdf_filename = f"insights_report_{plan_id[:8]}_{timestamp}.pdf"
-        pdf_path = self.exports_dir / pdf_filename
+        workers = get_export_pool(self.settings)
         
         try:
             if PDFKIT_AVAILABLE:
-                # Use pdfkit (wkhtmltopdf) for better PDF quality
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: self._html_to_pdf_pdfkit(str(html_path), str(pdf_path))
+                # wkhtmltopdf runs as its own process, so a thread only waits on it
+                result = await self._write_export(
+                    plan_id, export_key, "pdf",
+                    lambda tmp_path: workers.run(
+                        lambda: self._html_to_pdf_pdfkit(
+                            self._render_html(export_data, plan_id, session_id),
+                            tmp_path
+                        )
+                    )
                 )
-                logger.info("PDF generated using pdfkit")
-            elif REPORTLAB_AVAILABLE:
-                # Fallback to ReportLab
-                await self._generate_pdf_reportlab(export_data, pdf_path)
-                logger.info("PDF generated using ReportLab")
-            else:
-                # No PDF library available, keep HTML
-                logger.warning("No PDF library available, returning HTML instead")
-                return {
-                    "file_path": str(html_path),
-                    "filename": html_result["filename"],
-                    "format": "html",
-                    "size_bytes": html_path.stat().st_size,
-                    "warning": "PDF generation not available, HTML returned instead"
-                }
-            
-            # Clean up temporary HTML file
-            html_path.unlink(missing_ok=True)
+                if not result["cached"]:
+                    logger.info("PDF generated using pdfkit")
+                return result
+            if REPORTLAB_AVAILABLE:
+                # ReportLab lays out from the plan directly; no HTML needed
+                result = await self._write_export(
+                    plan_id, export_key, "pdf",
+                    lambda tmp_path: workers.run_in_process(
+                        _render_pdf_reportlab,
+                        export_data["plan"],
+                        export_data["files"],
+                        tmp_path
+                    )
+                )
+                if not result["cached"]:
+                    logger.info("PDF generated using ReportLab")
+                return result
             
-            return {
-                "file_path": str(pdf_path),
-                "filename": pdf_filename,
-                "format": "pdf",
-                "size_bytes": pdf_path.stat().st_size
-            }
+            # No PDF library available, keep HTML
+            logger.warning("No PDF library available, returning HTML instead")
+            warning = "PDF generation not available, HTML returned instead"
         except Exception as e:
             logger.error(f"PDF generation failed: {e}")
-            # Return HTML as fallback
-            return {
-                "file_path": str(html_path),
-                "filename": html_result["filename"],
-                "format": "html",
-                "size_bytes": html_path.stat().st_size,
-                "warning": f"PDF generation failed: {str(e)}. HTML returned instead"
-            }
+            warning = f"PDF generation failed: {str(e)}. HTML returned instead"
+        
+        # Return HTML as fallback
+        result = await self._export_text(
+            self._render_html, export_data, plan_id, session_id, export_key, "html"
+        )
+        return {**result, "warning": warning}
     
-    def _html_to_pdf_pdfkit(self, html_file_path: str, pdf_file_path: str) -> None:
-        """Convert HTML file to PDF using pdfkit (wkhtmltopdf)."""
+    def _html_to_pdf_pdfkit(self, html: str, pdf_file_path: str) -> None:
+        """Convert HTML to PDF using pdfkit (wkhtmltopdf)."""
         # Configuration options for wkhtmltopdf
         options = {
             'page-size': 'A4',
@@ -474,76 +601,18 @@ class ExportService:
         
         if wkhtmltopdf_path:
             config = pdfkit.configuration(wkhtmltopdf=wkhtmltopdf_path)
-            pdfkit.from_file(html_file_path, pdf_file_path, options=options, configuration=config)
+            pdfkit.from_string(html, pdf_file_path, options=options, configuration=config)
         else:
             # Try without explicit path (assumes it's in PATH)
-            pdfkit.from_file(html_file_path, pdf_file_path, options=options)
-    
-    async def _generate_pdf_reportlab(
-        self,
-        export_data: Dict[str, Any],
-        pdf_path: Path
-    ):
-        """Generate PDF using ReportLab (fallback method)."""
-        plan = export_data["plan"]
-        files = export_data["files"]
-        
-        doc = SimpleDocTemplate(str(pdf_path), pagesize=letter)
-        story = []
-        styles = getSampleStyleSheet()
-        
-        # Title
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor='#2c3e50',
-            alignment=TA_CENTER
-        )
-        story.append(Paragraph("Multimodal Insights Report", title_style))
-        story.append(Spacer(1, 0.3 * inch))
-        
-        # Metadata
-        story.append(Paragraph(f"<b>Session ID:</b> {plan.session_id}", styles['Normal']))
-        story.append(Paragraph(f"<b>Plan ID:</b> {plan.id}", styles['Normal']))
-        story.append(Paragraph(f"<b>Generated:</b> {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}", styles['Normal']))
-        story.append(Spacer(1, 0.3 * inch))
-        
-        # Executive Summary
-        story.append(Paragraph("Executive Summary", styles['Heading2']))
-        story.append(Paragraph(f"<b>Objective:</b> {plan.initial_goal}", styles['Normal']))
-        story.append(Paragraph(f"<b>Status:</b> {plan.overall_status.value.upper()}", styles['Normal']))
-        story.append(Paragraph(f"<b>Progress:</b> {plan.completed_steps}/{plan.total_steps} steps", styles['Normal']))
-        story.append(Spacer(1, 0.2 * inch))
-        
-        # Files
-        if files:
-            story.append(Paragraph("Processed Files", styles['Heading2']))
-            for file in files:
-                story.append(Paragraph(f"• {file.filename} ({file.file_type.value})", styles['Normal']))
-            story.append(Spacer(1, 0.2 * inch))
-        
-        # Steps
-        story.append(Paragraph("Analysis Results", styles['Heading2']))
-        for idx, step in enumerate(plan.steps, 1):
-            story.append(Paragraph(f"Step {idx}: {step.action}", styles['Heading3']))
-            story.append(Paragraph(f"<b>Agent:</b> {step.agent.value}", styles['Normal']))
-            story.append(Paragraph(f"<b>Status:</b> {step.status.value}", styles['Normal']))
-            if step.agent_reply:
-                reply_preview = step.agent_reply[:500] + "..." if len(step.agent_reply) > 500 else step.agent_reply
-                story.append(Paragraph(f"<b>Results:</b> {reply_preview}", styles['Normal']))
-            story.append(Spacer(1, 0.1 * inch))
-        
-        # Build PDF
-        doc.build(story)
+            pdfkit.from_string(html, pdf_file_path, options=options)
     
-    async def _export_json(
+    def _render_json(
         self,
         export_data: Dict[str, Any],
         plan_id: str,
         session_id: str
-    ) -> Dict[str, Any]:
-        """Export results as JSON."""
+    ) -> str:
+        """Render results as JSON."""
         plan = export_data["plan"]
         messages = export_data["messages"]
         files = export_data["files"]
@@ -607,21 +676,7 @@ class ExportService:
                 for msg in messages
             ]
         
-        # Write to file
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        filename = f"insights_report_{plan_id[:8]}_{timestamp}.json"
-        file_path = self.exports_dir / filename
-        
-        async with asyncio.Lock():
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False)
-        
-        return {
-            "file_path": str(file_path),
-            "filename": filename,
-            "format": "json",
-            "size_bytes": file_path.stat().st_size
-        }
+        return json.dumps(json_data, indent=2, ensure_ascii=False)
     
     async def list_exports(self, session_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """List all available exports, optionally filtered by session."""
@@ -0,0 +1,89 @@
+"""
+Export Workers - Multimodal Insights Application
+
+Dedicated executors for report export, so rendering never runs on the event
+loop or competes with other work in the loop's default executor. Text formats
+(Markdown, HTML, JSON) and pdfkit, which drives wkhtmltopdf in its own
+process, run on a small thread pool; ReportLab PDF layout is pure-Python CPU
+work and runs in worker processes.
+"""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+import structlog
+
+from ..infra.settings import Settings
+
+logger = structlog.get_logger(__name__)
+
+
+class ExportWorkerPool:
+    """Thread and process workers reserved for export rendering."""
+
+    def __init__(self, settings: Settings):
+        """Initialize the pool (workers are started lazily)."""
+        self.max_threads = settings.export_render_threads
+        self.max_processes = settings.export_pdf_workers
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[ProcessPoolExecutor] = None
+
+    def _get_threads(self) -> ThreadPoolExecutor:
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(
+                max_workers=self.max_threads,
+                thread_name_prefix="export"
+            )
+        return self._threads
+
+    def _get_processes(self) -> ProcessPoolExecutor:
+        if self._processes is None:
+            self._processes = ProcessPoolExecutor(max_workers=self.max_processes)
+        return self._processes
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run ``fn(*args)`` on an export thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_threads(), fn, *args)
+
+    async def run_in_process(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run ``fn(*args)`` in an export worker process (``fn`` and args must pickle)."""
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._get_processes(), fn, *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM); start a fresh pool for the next export
+            logger.warning("Export worker process pool broken, restarting")
+            self._processes = None
+            raise
+
+    def shutdown(self):
+        """Stop the workers."""
+        if self._threads is not None:
+            self._threads.shutdown(wait=False, cancel_futures=True)
+            self._threads = None
+        if self._processes is not None:
+            self._processes.shutdown(wait=False, cancel_futures=True)
+            self._processes = None
+
+
+# Process-wide pool
+_export_pool: Optional[ExportWorkerPool] = None
+
+
+def get_export_pool(settings: Optional[Settings] = None) -> ExportWorkerPool:
+    """Get or create the export worker pool singleton."""
+    global _export_pool
+    if _export_pool is None:
+        _export_pool = ExportWorkerPool(settings or Settings())
+    return _export_pool
+
+
+def shutdown_export_pool():
+    """Shut down the export worker pool if it was started."""
+    global _export_pool
+    if _export_pool is not None:
+        _export_pool.shutdown()
+        _export_pool = None
@@ -0,0 +1,193 @@
+"""
+Extraction Cache - Multimodal Insights Application
+
+Content-addressed cache for extraction results (transcripts, markdown). Keys
+combine the SHA-256 of the uploaded bytes with the processing parameters, so
+the same recording or PDF uploaded in any session by any user is extracted
+once. Entries live in a small in-memory LRU in front of a directory of JSON
+files. Entries older than the TTL are not served, and once the directory
+outgrows its size bound the oldest entries are deleted.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Bump when the shape of cached results changes
+CACHE_VERSION = 1
+
+
+def make_cache_key(content_sha256: str, kind: str, params: Dict[str, Any]) -> str:
+    """Derive the cache key from content hash, file kind and processing parameters."""
+    material = json.dumps(
+        {
+            "version": CACHE_VERSION,
+            "content_sha256": content_sha256,
+            "kind": kind,
+            "params": params,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ExtractionCache:
+    """
+    Two-tier (memory + disk) cache of extraction results keyed by content.
+
+    Disk entries are written atomically (temp file + rename), so concurrent
+    workers sharing the directory never observe partial JSON.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        memory_entries: int = 64,
+        max_bytes: int = 1024 * 1024 * 1024,
+        ttl_seconds: float = 30 * 86400
+    ):
+        """
+        Args:
+            directory: Directory of the disk tier (may be shared by workers)
+            memory_entries: Entries kept in the in-memory LRU
+            max_bytes: Size bound of the disk tier; the oldest entries go first
+            ttl_seconds: Age after which an entry is no longer served (0 = never)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.memory_entries = memory_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # Disk tier size, counted on first write and kept up to date after
+        self._disk_used: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _path(self, key: str) -> Path:
+        # Fan out over sub-directories to keep directory listings small
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _expired(self, stored_at: float) -> bool:
+        return bool(self.ttl_seconds) and stored_at < time.time() - self.ttl_seconds
+
+    def _remember(self, key: str, stored_at: float, value: Dict[str, Any]):
+        self._memory[key] = (stored_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _read(self, path: Path) -> Optional[Tuple[float, Dict[str, Any]]]:
+        try:
+            stored_at = path.stat().st_mtime
+            if self._expired(stored_at):
+                path.unlink(missing_ok=True)
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return stored_at, json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Ignoring unreadable extraction cache entry", path=str(path), error=str(e))
+            return None
+
+    def _write(self, path: Path, value: Dict[str, Any]) -> List[str]:
+        """Write an entry; returns the keys evicted to make room."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(value, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)
+
+        if self._disk_used is None:
+            self._disk_used = sum(size for _, size, _ in self._entries())
+        else:
+            self._disk_used += path.stat().st_size
+        if self._disk_used > self.max_bytes:
+            return self._evict()
+        return []
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        """(mtime, size, path) of every disk entry."""
+        entries = []
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> List[str]:
+        # Other workers write to the same directory; recount before evicting
+        entries = sorted(self._entries())
+        used = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        evicted = []
+        for stored_at, size, path in entries:
+            if used <= target and not self._expired(stored_at):
+                break
+            path.unlink(missing_ok=True)
+            used -= size
+            evicted.append(path.stem)
+        self._disk_used = used
+        logger.info("Evicted extraction cache entries", evicted=len(evicted), disk_bytes=used)
+        return evicted
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached result, or None."""
+        entry = self._memory.get(key)
+        if entry is not None and self._expired(entry[0]):
+            del self._memory[key]
+            entry = None
+        if entry is None:
+            entry = await asyncio.to_thread(self._read, self._path(key))
+            if entry is not None:
+                self._remember(key, *entry)
+        else:
+            self._memory.move_to_end(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        logger.info("Extraction cache hit", key=key[:16])
+        # Callers personalise the result (file/session ids); never hand out the shared copy
+        return json.loads(json.dumps(entry[1]))
+
+    async def put(self, key: str, value: Dict[str, Any]):
+        """Store a result."""
+        self._remember(key, time.time(), value)
+        try:
+            evicted = await asyncio.to_thread(self._write, self._path(key), value)
+        except OSError as e:
+            logger.warning("Failed to persist extraction cache entry", key=key[:16], error=str(e))
+            return
+        for evicted_key in evicted:
+            self._memory.pop(evicted_key, None)
+        self.evictions += len(evicted)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for diagnostics."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "memory_entries": len(self._memory),
+            "disk_bytes": self._disk_used,
+            "evictions": self.evictions,
+        }
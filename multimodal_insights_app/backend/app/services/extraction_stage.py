@@ -0,0 +1,189 @@
+"""
+File Extraction Stage - Multimodal Insights Application
+
+Runs multimodal file extraction concurrently with per-kind concurrency limits
+(audio, video, PDF) and yields each file's result as soon as it lands.
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import structlog
+
+from ..models.task_models import FileMetadata, FileType
+from ..persistence.cosmos_memory import CosmosMemoryStore
+from ..infra.settings import Settings
+
+logger = structlog.get_logger(__name__)
+
+# Minimum number of characters for an extraction to count as successful
+MIN_CONTENT_LENGTH = 50
+
+
+def has_extracted_content(result_data: Dict[str, Any]) -> bool:
+    """Whether an extraction result carries enough text to count as successful."""
+    content_field = (
+        result_data.get("transcript")
+        or result_data.get("text_content")
+        or result_data.get("transcription")
+    )
+    return bool(content_field) and len(str(content_field).strip()) > MIN_CONTENT_LENGTH
+
+
+@dataclass
+class ExtractionOutcome:
+    """Result of extracting a single file."""
+
+    file_id: str
+    step_id: Optional[str] = None
+    file_meta: Optional[FileMetadata] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    elapsed_seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None and self.result is not None
+
+    @property
+    def skipped(self) -> bool:
+        return self.error is None and self.result is None
+
+
+@dataclass
+class ExtractionJob:
+    """A file queued for extraction, tagged with the step that owns it."""
+
+    file_id: str
+    step_id: Optional[str] = None
+
+
+class FileExtractionStage:
+    """
+    Concurrent file extraction stage for the multimodal processor.
+
+    Each file kind gets its own semaphore so that a batch of long audio
+    transcriptions cannot starve PDF extraction (and vice versa). Results are
+    streamed back in completion order so callers can act on each file as soon
+    as its content is available.
+    """
+
+    def __init__(self, settings: Settings, memory_store: CosmosMemoryStore, processor):
+        """Initialize the extraction stage."""
+        self.memory_store = memory_store
+        self.processor = processor
+        self._limits = {
+            FileType.AUDIO: asyncio.Semaphore(max(1, settings.max_concurrent_audio_extractions)),
+            FileType.VIDEO: asyncio.Semaphore(max(1, settings.max_concurrent_video_extractions)),
+            FileType.PDF: asyncio.Semaphore(max(1, settings.max_concurrent_pdf_extractions)),
+        }
+        # Unknown kinds are rare; serialize them rather than reject outright
+        self._fallback_limit = asyncio.Semaphore(1)
+
+    def _limit_for(self, file_type: FileType) -> asyncio.Semaphore:
+        return self._limits.get(file_type, self._fallback_limit)
+
+    async def stream(
+        self,
+        jobs: List[ExtractionJob],
+        session_id: str
+    ) -> AsyncIterator[ExtractionOutcome]:
+        """
+        Extract all files concurrently and yield outcomes as they complete.
+
+        Args:
+            jobs: Files to extract
+            session_id: Session the files belong to
+
+        Yields:
+            ExtractionOutcome for each job, in completion order
+        """
+        if not jobs:
+            return
+
+        tasks = [
+            asyncio.create_task(self._extract(job, session_id))
+            for job in jobs
+        ]
+        logger.info("Extraction stage started", file_count=len(tasks))
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer stopped early (or was cancelled) - don't leak extractions
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _extract(self, job: ExtractionJob, session_id: str) -> ExtractionOutcome:
+        """Fetch metadata, wait for a slot for the file's kind and run the processor."""
+        outcome = ExtractionOutcome(file_id=job.file_id, step_id=job.step_id)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        try:
+            file_meta = await self.memory_store.get_file_metadata(job.file_id, session_id)
+            if not file_meta:
+                # Skipped rather than failed, matching the sequential behaviour
+                logger.warning(f"File metadata not found for file_id: {job.file_id}")
+                return outcome
+            outcome.file_meta = file_meta
+
+            async with self._limit_for(file_meta.file_type):
+                logger.info(
+                    "Processing file",
+                    file_id=job.file_id,
+                    filename=file_meta.filename,
+                    file_type=file_meta.file_type.value
+                )
+
+                # Call MAF-compliant agent with kwargs
+                result_response = await self.processor.run(
+                    messages=f"Process file: {file_meta.filename}",
+                    file_path=file_meta.file_path,
+                    file_type=file_meta.file_type.value,
+                    session_id=session_id,
+                    file_id=job.file_id,
+                    content_sha256=(file_meta.metadata or {}).get("sha256")
+                )
+
+            result_content = result_response.messages[0].text if result_response.messages else ""
+            outcome.result = self._parse_result(result_content, file_meta)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("File extraction failed", file_id=job.file_id, error=str(e))
+            outcome.error = str(e)
+        finally:
+            outcome.elapsed_seconds = loop.time() - started
+
+        logger.info(
+            "File extraction finished",
+            file_id=job.file_id,
+            succeeded=outcome.succeeded,
+            elapsed_seconds=round(outcome.elapsed_seconds, 2)
+        )
+        return outcome
+
+    @staticmethod
+    def _parse_result(result_content: str, file_meta: FileMetadata) -> Dict[str, Any]:
+        """Parse the processor reply and check that it actually contains content."""
+        try:
+            result_data = json.loads(result_content)
+        except json.JSONDecodeError:
+            logger.error(
+                f"Failed to parse result as JSON for {file_meta.filename}",
+                raw_result=result_content[:200]
+            )
+            raise ValueError(f"Failed to parse result as JSON for {file_meta.filename}")
+
+        if not has_extracted_content(result_data):
+            raise ValueError(
+                f"Content extraction failed for {file_meta.filename} - no valid content extracted"
+            )
+
+        return result_data
@@ -16,6 +16,7 @@ from azure.identity.aio import ClientSecretCredential
 
 from ..models.task_models import FileMetadata, FileType, ProcessingStatus
 from ..infra.settings import Settings
+from .blob_upload import stream_upload
 
 logger = structlog.get_logger(__name__)
 
@@ -102,14 +103,6 @@ class FileHandler:
         logger.info(f"Uploading file to Azure Blob Storage", filename=file.filename, session_id=session_id)
         
         try:
-            # Validate file size
-            file_size = 0
-            content = await file.read()
-            file_size = len(content)
-            
-            if file_size > self.settings.max_upload_size:
-                raise ValueError(f"File size {file_size} exceeds maximum {self.settings.max_upload_size}")
-            
             # Determine file type
             file_type = self._detect_file_type(file.filename)
             
@@ -117,13 +110,21 @@ class FileHandler:
             file_extension = Path(file.filename).suffix
             blob_name = f"{session_id}/{file_id}{file_extension}"
             
-            # Upload to Azure Blob Storage
+            # Stream to Azure Blob Storage in staged blocks (size checked as bytes arrive)
             blob_client = self.blob_service_client.get_blob_client(
                 container=self.container_name,
                 blob=blob_name
             )
             
-            await blob_client.upload_blob(content, overwrite=True)
+            upload = await stream_upload(
+                blob_client,
+                file,
+                max_size=self.settings.max_upload_size,
+                block_size=self.settings.upload_block_size,
+                max_concurrency=self.settings.upload_max_concurrency,
+                content_type=file.content_type
+            )
+            file_size = upload.size
             
             # Get blob URL
             blob_url = blob_client.url
@@ -145,7 +146,8 @@ class FileHandler:
                 file_size=file_size,
                 mime_type=file.content_type or "application/octet-stream",
                 file_path=blob_url,  # Store blob URL as file_path
-                processing_status=ProcessingStatus.PENDING
+                processing_status=ProcessingStatus.PENDING,
+                metadata={"sha256": upload.sha256}
             )
             
             logger.info(
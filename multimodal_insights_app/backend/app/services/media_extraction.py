@@ -0,0 +1,231 @@
+"""
+Media Extraction - Multimodal Insights Application
+
+Off-loop audio extraction for video files. Demuxing runs in a dedicated process
+pool; each worker drives ffmpeg to emit compressed 16 kHz mono audio (Opus or
+FLAC) and streams it straight to its destination (a blob SAS URL or a local
+path) without writing an intermediate WAV.
+"""
+
+import asyncio
+import json
+import shutil
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+import structlog
+
+from ..infra.settings import Settings
+
+logger = structlog.get_logger(__name__)
+
+# ffmpeg output arguments per codec: (codec args, container format, file suffix)
+AUDIO_CODECS = {
+    "opus": (["-c:a", "libopus", "-b:a", "32k"], "ogg", ".ogg"),
+    "flac": (["-c:a", "flac"], "flac", ".flac"),
+}
+
+# Size of each read from ffmpeg's stdout when streaming to the destination
+STREAM_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+class _CountingReader:
+    """File-like wrapper that counts bytes read from a pipe."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._stream.read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def _ffmpeg_binary(name: str = "ffmpeg") -> str:
+    """Locate ffmpeg/ffprobe, falling back to the imageio-ffmpeg bundled binary."""
+    found = shutil.which(name)
+    if found:
+        return found
+    if name == "ffmpeg":
+        try:
+            import imageio_ffmpeg
+            return imageio_ffmpeg.get_ffmpeg_exe()
+        except ImportError:
+            pass
+    raise RuntimeError(f"{name} is required for video processing but was not found on PATH")
+
+
+def audio_suffix(codec: str) -> str:
+    """File suffix used for extracted audio in the given codec."""
+    return AUDIO_CODECS[codec][2]
+
+
+def probe_video(source: str) -> Dict[str, Any]:
+    """Read duration, frame rate, frame size and audio presence with ffprobe."""
+    try:
+        ffprobe = _ffmpeg_binary("ffprobe")
+    except RuntimeError:
+        return {}
+
+    completed = subprocess.run(
+        [ffprobe, "-v", "error", "-print_format", "json", "-show_streams", "-show_format", source],
+        capture_output=True,
+        check=False,
+        timeout=120
+    )
+    if completed.returncode != 0:
+        return {}
+
+    info = json.loads(completed.stdout or b"{}")
+    streams = info.get("streams", [])
+    video_stream = next((s for s in streams if s.get("codec_type") == "video"), {})
+    has_audio = any(s.get("codec_type") == "audio" for s in streams)
+
+    fps = None
+    rate = video_stream.get("avg_frame_rate") or video_stream.get("r_frame_rate")
+    if rate and "/" in rate:
+        num, den = rate.split("/", 1)
+        if float(den or 0):
+            fps = float(num) / float(den)
+
+    duration = info.get("format", {}).get("duration")
+    return {
+        "video_duration": float(duration) if duration else None,
+        "video_fps": fps,
+        "video_size": (video_stream.get("width"), video_stream.get("height")),
+        "has_audio": has_audio,
+    }
+
+
+def extract_audio_track(
+    source: str,
+    destination: str,
+    codec: str = "opus",
+    sample_rate: int = 16000
+) -> Dict[str, Any]:
+    """
+    Extract a video's audio track as compressed mono audio.
+
+    Runs inside a worker process. ffmpeg reads ``source`` (local path or SAS
+    URL) and writes to stdout; the output is streamed in fixed-size chunks to
+    ``destination`` - a block blob when it is an ``https://`` SAS URL, otherwise
+    a local file - so memory use stays bounded regardless of video length.
+
+    Returns:
+        Dictionary with video metadata, ``has_audio`` and ``audio_bytes``
+    """
+    started = time.perf_counter()
+    metadata = probe_video(source)
+    if metadata and not metadata.get("has_audio"):
+        metadata.update({"audio_bytes": 0, "elapsed_seconds": time.perf_counter() - started})
+        return metadata
+
+    codec_args, container, _ = AUDIO_CODECS[codec]
+    command = [
+        _ffmpeg_binary(), "-nostdin", "-v", "error",
+        "-i", source,
+        "-vn", "-ac", "1", "-ar", str(sample_rate),
+        *codec_args,
+        "-f", container, "pipe:1",
+    ]
+
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    written = 0
+    try:
+        if destination.startswith("https://"):
+            from azure.storage.blob import BlobClient
+
+            reader = _CountingReader(process.stdout)
+            blob_client = BlobClient.from_blob_url(destination, max_block_size=STREAM_CHUNK_SIZE)
+            blob_client.upload_blob(
+                reader,
+                blob_type="BlockBlob",
+                overwrite=True,
+                max_concurrency=2
+            )
+            written = reader.bytes_read
+        else:
+            with open(destination, "wb") as out:
+                while True:
+                    chunk = process.stdout.read(STREAM_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    out.write(chunk)
+                    written += len(chunk)
+        stderr = process.stderr.read()
+        returncode = process.wait()
+    except Exception:
+        process.kill()
+        process.wait()
+        raise
+
+    if returncode != 0:
+        if not metadata and b"does not contain any stream" in stderr:
+            # No ffprobe available to tell us up front that there is no audio
+            return {"has_audio": False, "audio_bytes": 0, "elapsed_seconds": time.perf_counter() - started}
+        raise RuntimeError(f"ffmpeg audio extraction failed: {stderr.decode(errors='replace')[-500:]}")
+
+    metadata.setdefault("has_audio", True)
+    metadata["audio_bytes"] = written
+    metadata["audio_codec"] = codec
+    metadata["sample_rate"] = sample_rate
+    metadata["elapsed_seconds"] = time.perf_counter() - started
+    return metadata
+
+
+class MediaExtractionPool:
+    """Dedicated process pool for video demuxing, kept off the event loop."""
+
+    def __init__(self, settings: Settings):
+        """Initialize the pool (workers are spawned lazily)."""
+        self.codec = settings.video_audio_codec
+        self.sample_rate = settings.video_audio_sample_rate
+        self.max_workers = settings.video_extraction_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    async def extract_audio(self, source: str, destination: str) -> Dict[str, Any]:
+        """Extract the audio track of ``source`` into ``destination`` in a worker process."""
+        loop = asyncio.get_running_loop()
+        logger.info("Extracting audio from video", codec=self.codec, sample_rate=self.sample_rate)
+        return await loop.run_in_executor(
+            self._get_executor(),
+            extract_audio_track,
+            source,
+            destination,
+            self.codec,
+            self.sample_rate
+        )
+
+    def shutdown(self):
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Process-wide pool
+_media_pool: Optional[MediaExtractionPool] = None
+
+
+def get_media_pool(settings: Optional[Settings] = None) -> MediaExtractionPool:
+    """Get or create the media extraction pool singleton."""
+    global _media_pool
+    if _media_pool is None:
+        _media_pool = MediaExtractionPool(settings or Settings())
+    return _media_pool
+
+
+def shutdown_media_pool():
+    """Shut down the media extraction pool if it was started."""
+    global _media_pool
+    if _media_pool is not None:
+        _media_pool.shutdown()
+        _media_pool = None
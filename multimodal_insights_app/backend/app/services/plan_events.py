@@ -0,0 +1,253 @@
+"""
+Plan Events - Multimodal Insights Application
+
+In-process event bus for plan execution status. ``execute_plan`` publishes
+every step and plan transition here, and each event carries the plan's full
+execution status (the same fields as ``GET /plans/{plan_id}/status``), so a
+status view can be kept current from the event stream alone, without reading
+the plan, its steps and its messages back from Cosmos on every refresh.
+
+Events are numbered per plan and the recent ones are kept, so a client that
+reconnects with the id of the last event it saw gets exactly the events it
+missed. If those have already been dropped, or the id belongs to an earlier
+execution, it gets a fresh status snapshot instead.
+"""
+
+import asyncio
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Set
+
+import structlog
+
+from ..models.task_models import (
+    ExecutionStatusResponse, Plan, PlanStatus, Step, StepStatus
+)
+
+logger = structlog.get_logger(__name__)
+
+TERMINAL_PLAN_STATUSES = {PlanStatus.COMPLETED, PlanStatus.FAILED, PlanStatus.CANCELLED}
+
+
+@dataclass
+class PlanEvent:
+    """One published change, with the plan status after it."""
+    id: str
+    type: str
+    data: Dict[str, Any]
+    final: bool = False
+
+
+@dataclass
+class PlanChannel:
+    """Status, recent events and subscribers of one plan."""
+    plan_id: str
+    session_id: str
+    epoch: str = field(default_factory=lambda: uuid.uuid4().hex[:8])
+    sequence: int = 0
+    tracked: bool = False
+    finished: bool = False
+    status: Dict[str, Any] = field(default_factory=dict)
+    steps: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    history: Deque[PlanEvent] = field(default_factory=deque)  # bounded by the bus
+    subscribers: Set[asyncio.Queue] = field(default_factory=set)
+
+    @property
+    def last_event_id(self) -> str:
+        return f"{self.epoch}:{self.sequence}"
+
+    def _missed_events(self, last_event_id: Optional[str]) -> Optional[List[PlanEvent]]:
+        """Events after ``last_event_id``, or None when they can't be replayed."""
+        if not last_event_id:
+            return None
+        epoch, _, sequence = last_event_id.partition(":")
+        if epoch != self.epoch or not sequence.isdigit():
+            return None
+        seen = int(sequence)
+        if seen > self.sequence:
+            return None
+        missed = [event for event in self.history if int(event.id.split(":")[1]) > seen]
+        # The oldest missed event must still be in the history
+        if missed and int(missed[0].id.split(":")[1]) != seen + 1:
+            return None
+        return missed
+
+    def snapshot(self) -> PlanEvent:
+        return PlanEvent(
+            id=self.last_event_id,
+            type="status",
+            data={"status": self.status},
+            final=self.finished
+        )
+
+
+class PlanEventBus:
+    """Publishes plan execution events to SSE subscribers."""
+
+    def __init__(self, history_size: int = 256, linger_seconds: float = 300.0):
+        """
+        Args:
+            history_size: Events kept per plan for replay after a reconnect
+            linger_seconds: How long a finished plan's events stay available
+        """
+        self.history_size = history_size
+        self.linger_seconds = linger_seconds
+        self._channels: Dict[str, PlanChannel] = {}
+
+    # ------------------------------------------------------------------
+    # Publishing (called by the orchestrator)
+    # ------------------------------------------------------------------
+
+    def track(self, plan: Plan, steps: List[Step]) -> None:
+        """Start publishing for a plan that has just been set in progress."""
+        channel = self._channels.get(plan.id)
+        if channel is None or channel.finished:
+            channel = self._new_channel(plan.id, plan.session_id)
+        channel.tracked = True
+        channel.session_id = plan.session_id
+        channel.steps = {
+            step.id: self._step_info(step)
+            for step in sorted(steps, key=lambda s: s.order or 0)
+        }
+        self._publish(channel, "status", plan)
+
+    def step_changed(self, plan: Plan, step: Step) -> None:
+        channel = self._channels.get(plan.id)
+        if channel is None or not channel.tracked:
+            return
+        info = self._step_info(step)
+        channel.steps[step.id] = info
+        self._publish(channel, "step", plan, step=info)
+
+    def plan_changed(self, plan: Plan) -> None:
+        channel = self._channels.get(plan.id)
+        if channel is None or not channel.tracked:
+            return
+        self._publish(channel, "plan", plan)
+
+    # ------------------------------------------------------------------
+    # Subscribing (called by the SSE endpoint)
+    # ------------------------------------------------------------------
+
+    def is_tracked(self, plan_id: str) -> bool:
+        channel = self._channels.get(plan_id)
+        return channel is not None and channel.tracked
+
+    def session_of(self, plan_id: str) -> Optional[str]:
+        """Session that owns a plan with events here, if any."""
+        channel = self._channels.get(plan_id)
+        return channel.session_id if channel is not None else None
+
+    def current_status(self, plan_id: str) -> Optional[Dict[str, Any]]:
+        """Latest published status of a plan executing (or recently finished) here."""
+        channel = self._channels.get(plan_id)
+        if channel is None or not channel.tracked:
+            return None
+        return channel.status
+
+    async def subscribe(
+        self,
+        plan_id: str,
+        last_event_id: Optional[str] = None,
+        initial_status: Optional[ExecutionStatusResponse] = None
+    ) -> AsyncIterator[PlanEvent]:
+        """
+        Yield the events after ``last_event_id`` (or a status snapshot), then
+        live events until the plan finishes.
+
+        ``initial_status`` seeds the snapshot for a plan whose execution has
+        not started publishing yet; its events are delivered once it does.
+        """
+        channel = self._channels.get(plan_id)
+        if channel is None:
+            if initial_status is None:
+                raise KeyError(plan_id)
+            channel = self._new_channel(plan_id, initial_status.session_id)
+            channel.status = initial_status.model_dump(mode="json")
+
+        queue: asyncio.Queue = asyncio.Queue()
+        missed = channel._missed_events(last_event_id)
+        backlog = missed if missed is not None else [channel.snapshot()]
+        channel.subscribers.add(queue)
+        try:
+            for event in backlog:
+                yield event
+                if event.final:
+                    return
+            if channel.finished:
+                return
+            while True:
+                event = await queue.get()
+                yield event
+                if event.final:
+                    return
+        finally:
+            channel.subscribers.discard(queue)
+            # A channel opened only for waiting subscribers is not kept around
+            if not channel.tracked and not channel.subscribers and self._channels.get(plan_id) is channel:
+                del self._channels[plan_id]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _new_channel(self, plan_id: str, session_id: str) -> PlanChannel:
+        channel = PlanChannel(plan_id=plan_id, session_id=session_id)
+        channel.history = deque(maxlen=self.history_size)
+        self._channels[plan_id] = channel
+        return channel
+
+    @staticmethod
+    def _step_info(step: Step) -> Dict[str, Any]:
+        return {
+            "id": step.id,
+            "order": step.order,
+            "action": step.action,
+            "agent": step.agent.value,
+            "status": step.status.value,
+            "error_message": step.error_message,
+        }
+
+    def _status(self, channel: PlanChannel, plan: Plan) -> Dict[str, Any]:
+        """Same fields as ``TaskOrchestrator.get_execution_status``, from memory."""
+        current = next(
+            (info for info in channel.steps.values() if info["status"] == StepStatus.EXECUTING.value),
+            None
+        )
+        progress = (plan.completed_steps / plan.total_steps * 100) if plan.total_steps > 0 else 0
+        return ExecutionStatusResponse(
+            plan_id=plan.id,
+            session_id=plan.session_id,
+            overall_status=plan.overall_status,
+            current_step=current["action"] if current else None,
+            current_agent=current["agent"] if current else None,
+            completed_steps=plan.completed_steps,
+            total_steps=plan.total_steps,
+            progress_percentage=progress,
+            # execute_plan records results on the steps and writes no agent messages
+            recent_messages=[]
+        ).model_dump(mode="json")
+
+    def _publish(self, channel: PlanChannel, event_type: str, plan: Plan, **extra: Any) -> None:
+        channel.sequence += 1
+        channel.status = self._status(channel, plan)
+        final = plan.overall_status in TERMINAL_PLAN_STATUSES
+        event = PlanEvent(
+            id=channel.last_event_id,
+            type=event_type,
+            data={"status": channel.status, **extra},
+            final=final
+        )
+        channel.history.append(event)
+        for queue in channel.subscribers:
+            queue.put_nowait(event)
+
+        if final and not channel.finished:
+            channel.finished = True
+            asyncio.get_running_loop().call_later(self.linger_seconds, self._expire, channel)
+            logger.debug("Plan events finished", plan_id=channel.plan_id, events=channel.sequence)
+
+    def _expire(self, channel: PlanChannel) -> None:
+        if self._channels.get(channel.plan_id) is channel:
+            del self._channels[channel.plan_id]
@@ -19,8 +19,10 @@ from ..models.task_models import (
     InputTask, Plan, Step, AgentMessage, PlanStatus, StepStatus,
     AgentType, PlanWithSteps, ExecutionStatusResponse
 )
-from ..persistence.cosmos_memory import CosmosMemoryStore
+from ..persistence.cosmos_memory import create_memory_store
 from ..services.file_handler import FileHandler
+from ..services.extraction_stage import MIN_CONTENT_LENGTH, ExtractionJob, FileExtractionStage
+from ..services.plan_events import PlanEventBus
 from ..agents import (
     MultimodalProcessorAgent,
     SentimentAgent,
@@ -50,7 +52,7 @@ class TaskOrchestrator:
         self.file_handler = file_handler
         
         # Initialize persistence
-        self.memory_store = CosmosMemoryStore(settings)
+        self.memory_store = create_memory_store(settings)
         
         # Initialize agents
         self.multimodal_processor = MultimodalProcessorAgent(settings)
@@ -58,6 +60,14 @@ class TaskOrchestrator:
         self.summarizer_agent = SummarizerAgent(settings)
         self.analytics_agent = AnalyticsAgent(settings)
         
+        # Concurrent extraction stage with per-kind limits (audio, video, PDF)
+        self.extraction_stage = FileExtractionStage(
+            settings, self.memory_store, self.multimodal_processor
+        )
+        
+        # Analysis agent runs in flight at once, across all plans (per-file runs included)
+        self.analysis_limit = asyncio.Semaphore(max(1, settings.max_concurrent_agents))
+        
         # Native Microsoft Agent Framework components
         self.agent_factory = MAFAgentFactory(self.settings)
         self.planning_agent = self.agent_factory.create_chat_agent(
@@ -67,6 +77,9 @@ class TaskOrchestrator:
         self.planner = MAFDynamicPlanner(self.planning_agent)
         self.orchestrator = MAFOrchestrator()
         
+        # Execution status is pushed to SSE subscribers instead of polled
+        self.plan_events = PlanEventBus()
+        
         logger.info("Task Orchestrator initialized")
     
     async def initialize_agents(self):
@@ -538,17 +551,21 @@ USER PREFERENCES:
     
     async def execute_plan(self, plan_id: str, session_id: str):
         """
-        Execute plan using MAF-inspired Sequential and Concurrent patterns.
+        Execute plan using MAF-inspired Concurrent patterns.
         
-        Note: While we use the pattern concepts from MAF (Sequential for file processing,
-        Concurrent for analysis), we call agents directly because they need specific context
+        Note: While we use the pattern concepts from MAF (Concurrent for file extraction
+        and analysis), we call agents directly because they need specific context
         (file paths, parameters) that doesn't fit the standard ChatMessage workflow.
         
-        Phase 1: Sequential for file processing (one file at a time)
-        Phase 2: Concurrent for analysis (parallel: sentiment, summarizer, analytics)
+        Phase 1: Concurrent file extraction (per-kind limits for audio, video, PDF);
+                 the analysis agents start on each file as soon as its content lands
+        Phase 2: Concurrent merge of each agent's per-file results (parallel:
+                 sentiment, summarizer, analytics)
         """
-        logger.info("Executing plan with Sequential→Concurrent pattern", plan_id=plan_id)
+        logger.info("Executing plan with Concurrent extraction→analysis pattern", plan_id=plan_id)
         
+        plan = None
+        analysis_tasks: List[asyncio.Task] = []
         try:
             # Get plan and steps
             plan = await self.memory_store.get_plan(plan_id, session_id)
@@ -575,6 +592,7 @@ USER PREFERENCES:
             
             # Update plan status
             plan.overall_status = PlanStatus.IN_PROGRESS
+            self.plan_events.track(plan, steps)
             await self.memory_store.update_plan(plan)
             
             # Context accumulator
@@ -594,125 +612,140 @@ USER PREFERENCES:
                        file_steps_count=len(file_steps),
                        analysis_steps_count=len(analysis_steps))
             
-            # Phase 1: Sequential - File Processing (MAF Sequential Pattern concept)
+            analysis_agents = {
+                AgentType.SENTIMENT: self.sentiment_agent,
+                AgentType.SUMMARIZER: self.summarizer_agent,
+                AgentType.ANALYTICS: self.analytics_agent,
+            }
+            runnable_steps = [s for s in analysis_steps if s.agent in analysis_agents]
+            
+            # Per-file analysis results, filled in while extraction is still running
+            file_analyses: Dict[str, Dict[str, Any]] = {step.id: {} for step in runnable_steps}
+            file_labels: Dict[str, str] = {}
+            started_steps = set()
+            
+            async def analyze_file(step: Step, file_id: str, text: str):
+                """Run one analysis agent over one file's content as soon as it lands."""
+                try:
+                    if step.id not in started_steps:
+                        started_steps.add(step.id)
+                        step.status = StepStatus.EXECUTING
+                        await self._save_step(plan, step)
+                    file_analyses[step.id][file_id] = await self._run_analysis_agent(
+                        step, analysis_agents[step.agent], text
+                    )
+                except Exception as e:
+                    # Only this file is analyzed again when the step finishes
+                    logger.warning("Per-file analysis failed",
+                                   agent_type=step.agent.value, file_id=file_id, error=str(e))
+            
+            # Phase 1: Concurrent file extraction stage (per-kind concurrency limits)
             if file_steps:
-                logger.info("Phase 1: Sequential file processing (one file at a time)")
+                logger.info("Phase 1: Concurrent file extraction",
+                           file_count=sum(len(s.file_ids) for s in file_steps))
                 
-                # Process files sequentially
+                steps_by_id = {step.id: step for step in file_steps}
+                step_results: Dict[str, Dict[str, Any]] = {step.id: {} for step in file_steps}
+                step_errors: Dict[str, List[str]] = {step.id: [] for step in file_steps}
+                pending_files = {step.id: len(step.file_ids) for step in file_steps}
+                
+                jobs = []
                 for step in file_steps:
-                    try:
-                        step.status = StepStatus.EXECUTING
-                        await self.memory_store.update_step(step)
-                        
-                        # Process each file in the step
-                        for file_id in step.file_ids:
-                            file_meta = await self.memory_store.get_file_metadata(file_id, session_id)
-                            if not file_meta:
-                                logger.warning(f"File metadata not found for file_id: {file_id}")
-                                continue
-                            
-                            logger.info(f"Processing file", 
-                                       file_id=file_id, 
-                                       filename=file_meta.filename,
-                                       file_type=file_meta.file_type.value)
-                            
-                            # Call MAF-compliant agent with kwargs
-                            result_response = await self.multimodal_processor.run(
-                                messages=f"Process file: {file_meta.filename}",
-                                file_path=file_meta.file_path,
-                                file_type=file_meta.file_type.value,
-                                session_id=session_id,
-                                file_id=file_id
-                            )
-                            
-                            # Extract result from MAF response
-                            result_content = result_response.messages[0].text if result_response.messages else ""
-                            
-                            logger.info(f"File processing completed", 
-                                       file_id=file_id, 
-                                       result_length=len(result_content))
-                            
-                            # Parse the result and store in execution context
-                            import json
-                            try:
-                                result_data = json.loads(result_content)
-                                
-                                # Check if extraction actually succeeded
-                                has_content = False
-                                if "transcript" in result_data or "text_content" in result_data or "transcription" in result_data:
-                                    content_field = result_data.get("transcript") or result_data.get("text_content") or result_data.get("transcription")
-                                    has_content = bool(content_field and len(str(content_field).strip()) > 50)  # At least 50 chars
-                                
-                                if not has_content:
-                                    error_msg = f"Content extraction failed for {file_meta.filename} - no valid content extracted"
-                                    logger.error(error_msg, file_id=file_id)
-                                    raise ValueError(error_msg)
-                                
-                                execution_context.setdefault("extracted_content", {})[file_id] = result_data
-                                logger.info(f"Parsed file processing result", 
-                                           file_id=file_id,
-                                           has_transcript="transcript" in result_data,
-                                           has_text="text_content" in result_data)
-                            except json.JSONDecodeError:
-                                error_msg = f"Failed to parse result as JSON for {file_meta.filename}"
-                                logger.error(error_msg, file_id=file_id, raw_result=result_content[:200])
-                                raise ValueError(error_msg)
+                    step.status = StepStatus.EXECUTING
+                    await self._save_step(plan, step)
+                    jobs.extend(ExtractionJob(file_id=file_id, step_id=step.id) for file_id in step.file_ids)
+                
+                # Consume results as each file lands instead of after the whole batch
+                async for outcome in self.extraction_stage.stream(jobs, session_id):
+                    step = steps_by_id[outcome.step_id]
+                    pending_files[step.id] -= 1
+                    
+                    if outcome.succeeded:
+                        execution_context["extracted_content"][outcome.file_id] = outcome.result
+                        step_results[step.id][outcome.file_id] = outcome.result
+                        logger.info(f"Parsed file processing result",
+                                   file_id=outcome.file_id,
+                                   has_transcript="transcript" in outcome.result,
+                                   has_text="text_content" in outcome.result)
                         
-                        # Update step with results - wrap in 'results' for frontend compatibility
-                        extracted_content = execution_context.get("extracted_content", {})
-                        step.agent_reply = json.dumps(
-                            {
-                                "results": extracted_content,
-                                "processed_files": len(extracted_content)
-                            },
-                            ensure_ascii=False,
-                            default=str
+                        # Start the analysis agents on this file while the others are extracted
+                        file_labels[outcome.file_id] = (
+                            outcome.file_meta.filename if outcome.file_meta else outcome.file_id
                         )
-                        step.status = StepStatus.COMPLETED
-                        await self.memory_store.update_step(step)
-                        plan.completed_steps += 1
-                        
-                    except Exception as e:
-                        logger.error("File processing failed", error=str(e), exc_info=True)
+                        text = self._content_text(outcome.result)
+                        if len(text.strip()) >= MIN_CONTENT_LENGTH:
+                            analysis_tasks.extend(
+                                asyncio.create_task(analyze_file(analysis_step, outcome.file_id, text))
+                                for analysis_step in runnable_steps
+                            )
+                    elif outcome.error:
+                        step_errors[step.id].append(outcome.error)
+                    
+                    # Update step with results - wrap in 'results' for frontend compatibility
+                    step.agent_reply = json.dumps(
+                        {
+                            "results": step_results[step.id],
+                            "processed_files": len(step_results[step.id])
+                        },
+                        ensure_ascii=False,
+                        default=str
+                    )
+                    
+                    if pending_files[step.id] > 0:
+                        await self._save_step(plan, step)
+                        continue
+                    
+                    if step_errors[step.id]:
+                        logger.error("File processing failed", step_id=step.id, errors=step_errors[step.id])
                         step.status = StepStatus.FAILED
-                        step.error_message = str(e)
-                        await self.memory_store.update_step(step)
+                        step.error_message = "; ".join(step_errors[step.id])
                         plan.failed_steps += 1
+                    else:
+                        step.status = StepStatus.COMPLETED
+                        plan.completed_steps += 1
+                    await self._save_step(plan, step)
                 
-                await self.memory_store.update_plan(plan)
+                # Steps without any files never receive an outcome
+                for step in file_steps:
+                    if not step.file_ids:
+                        step.agent_reply = json.dumps({"results": {}, "processed_files": 0})
+                        step.status = StepStatus.COMPLETED
+                        await self._save_step(plan, step)
+                        plan.completed_steps += 1
+                
+                # Files land in completion order; keep analysis input in plan order
+                landed = execution_context["extracted_content"]
+                execution_context["extracted_content"] = {
+                    job.file_id: landed[job.file_id] for job in jobs if job.file_id in landed
+                }
+                
+                await self._save_plan(plan)
             
             # Check if Phase 1 extraction succeeded before proceeding to Phase 2
             if file_steps and not execution_context.get("extracted_content"):
                 error_msg = "Phase 1 content extraction failed - no valid content extracted from files. Stopping execution."
                 logger.error(error_msg)
                 plan.overall_status = PlanStatus.FAILED
-                await self.memory_store.update_plan(plan)
+                await self._save_plan(plan)
                 # Mark all remaining analysis steps as skipped
                 for step in analysis_steps:
                     step.status = StepStatus.FAILED
                     step.error_message = "Skipped due to Phase 1 extraction failure"
-                    await self.memory_store.update_step(step)
+                    await self._save_step(plan, step)
                 return
             
-            # Phase 2: Concurrent - Analysis Agents (MAF Concurrent Pattern concept)
+            # Phase 2: Merge the per-file analyses into one result per agent
             if analysis_steps and execution_context.get("extracted_content"):
-                logger.info("Phase 2: Concurrent analysis (parallel execution)")
+                logger.info("Phase 2: Merging per-file analysis",
+                           files_analyzed=len(file_labels),
+                           pending_tasks=sum(1 for task in analysis_tasks if not task.done()))
                 
                 # Get all extracted content for analysis
-                all_content = []
-                for file_id, content in execution_context["extracted_content"].items():
-                    # Extract text from different content types
-                    if isinstance(content, dict):
-                        if "transcript" in content:
-                            all_content.append(content["transcript"])
-                        elif "text_content" in content:
-                            all_content.append(content["text_content"])
-                        elif "transcription" in content:
-                            all_content.append(content["transcription"])
-                        elif "raw_result" in content:
-                            all_content.append(content["raw_result"])
-                
-                combined_text = "\n\n".join(all_content) if all_content else ""
+                file_texts = {
+                    file_id: self._content_text(content)
+                    for file_id, content in execution_context["extracted_content"].items()
+                }
+                combined_text = "\n\n".join(text for text in file_texts.values() if text)
                 
                 logger.info(f"Combined text for analysis",
                            content_length=len(combined_text),
@@ -722,56 +755,53 @@ USER PREFERENCES:
                     error_msg = f"Insufficient text content for analysis (only {len(combined_text)} characters extracted)"
                     logger.error(error_msg)
                     plan.overall_status = PlanStatus.FAILED
-                    await self.memory_store.update_plan(plan)
+                    await self._save_plan(plan)
                     # Mark all analysis steps as failed
                     for step in analysis_steps:
                         step.status = StepStatus.FAILED
                         step.error_message = error_msg
-                        await self.memory_store.update_step(step)
+                        await self._save_step(plan, step)
                     return
                 
-                # Run analysis agents concurrently using asyncio.gather (Concurrent Pattern)
-                async def run_analysis_agent(step: Step, agent, context_overrides: Dict = None):
-                    """Run a single analysis agent."""
+                # analyze_file records its own failures
+                await asyncio.gather(*analysis_tasks)
+                
+                async def finish_analysis(step: Step):
+                    """Combine one agent's per-file results, or analyze the combined content."""
                     try:
-                        logger.info(f"Starting analysis agent", 
-                                   agent_type=step.agent.value,
-                                   agent_name=agent.name)
+                        if step.id not in started_steps:
+                            started_steps.add(step.id)
+                            step.status = StepStatus.EXECUTING
+                            await self._save_step(plan, step)
                         
-                        step.status = StepStatus.EXECUTING
-                        await self.memory_store.update_step(step)
-                        
-                        # Prepare kwargs for MAF agent
-                        kwargs = {
-                            "content": combined_text
-                        }
-                        
-                        # Add context overrides
-                        if context_overrides:
-                            kwargs.update(context_overrides)
-                        
-                        # Add step-specific parameters (including objective_context)
-                        if step.parameters:
-                            kwargs.update(step.parameters)
-                        
-                        # Call MAF-compliant agent with kwargs
-                        result_response = await agent.run(
-                            messages=f"Analyze the extracted content",
-                            **kwargs
-                        )
-                        
-                        # Extract result from MAF response
-                        result_content = result_response.messages[0].text if result_response.messages else ""
-                        
-                        logger.info(f"Analysis agent completed",
-                                   agent_type=step.agent.value,
-                                   result_length=len(result_content))
+                        agent = analysis_agents[step.agent]
+                        analyses = file_analyses[step.id]
+                        analyzable = [
+                            file_id for file_id, text in file_texts.items()
+                            if len(text.strip()) >= MIN_CONTENT_LENGTH
+                        ]
+                        # Keep the files already analyzed; retry only the ones that failed
+                        await asyncio.gather(*(
+                            analyze_file(step, file_id, file_texts[file_id])
+                            for file_id in analyzable if file_id not in analyses
+                        ))
+                        missing = [file_id for file_id in analyzable if file_id not in analyses]
+                        if missing:
+                            raise RuntimeError(
+                                "Analysis failed for " + ", ".join(file_labels.get(f, f) for f in missing)
+                            )
                         
-                        # Parse and store results
-                        try:
-                            result_data = json.loads(result_content)
-                        except json.JSONDecodeError:
-                            result_data = {"raw_result": result_content}
+                        if not analyzable:
+                            # No single file has enough content on its own
+                            result_data = await self._run_analysis_agent(step, agent, combined_text)
+                        elif len(analyzable) == 1:
+                            result_data = analyses[analyzable[0]]
+                        else:
+                            result_data = await self._run_analysis_agent(
+                                step, agent,
+                                file_analyses=[(file_labels.get(file_id, file_id), analyses[file_id])
+                                               for file_id in analyzable]
+                            )
                         
                         # Store in execution context
                         if step.agent == AgentType.SENTIMENT:
@@ -783,30 +813,16 @@ USER PREFERENCES:
                         
                         step.agent_reply = json.dumps(result_data, ensure_ascii=False, default=str)
                         step.status = StepStatus.COMPLETED
-                        await self.memory_store.update_step(step)
+                        await self._save_step(plan, step)
                         
                     except Exception as e:
                         logger.error(f"Analysis failed for {step.agent.value}", error=str(e), exc_info=True)
                         step.status = StepStatus.FAILED
                         step.error_message = str(e)
-                        await self.memory_store.update_step(step)
-                
-                # Create concurrent tasks for each analysis agent
-                analysis_tasks = []
-                for step in analysis_steps:
-                    if step.agent == AgentType.SENTIMENT:
-                        task = run_analysis_agent(step, self.sentiment_agent)
-                    elif step.agent == AgentType.SUMMARIZER:
-                        task = run_analysis_agent(step, self.summarizer_agent)
-                    elif step.agent == AgentType.ANALYTICS:
-                        task = run_analysis_agent(step, self.analytics_agent)
-                    else:
-                        continue
-                    analysis_tasks.append(task)
+                        await self._save_step(plan, step)
                 
-                # Execute all analysis agents concurrently (Concurrent Pattern)
-                logger.info(f"Launching {len(analysis_tasks)} analysis agents in parallel")
-                await asyncio.gather(*analysis_tasks, return_exceptions=True)
+                logger.info(f"Finishing {len(runnable_steps)} analysis agents in parallel")
+                await asyncio.gather(*(finish_analysis(step) for step in runnable_steps), return_exceptions=True)
                 
                 # Update plan progress based on actual step statuses
                 for step in analysis_steps:
@@ -815,21 +831,94 @@ USER PREFERENCES:
                     elif step.status == StepStatus.FAILED:
                         plan.failed_steps += 1
                 
-                await self.memory_store.update_plan(plan)
+                await self._save_plan(plan)
             
             # Update final status
             plan.overall_status = PlanStatus.COMPLETED if plan.failed_steps == 0 else PlanStatus.FAILED
-            await self.memory_store.update_plan(plan)
+            await self._save_plan(plan)
             
-            logger.info("Plan execution completed (Sequential→Concurrent pattern)", plan_id=plan_id)
+            logger.info("Plan execution completed (Concurrent extraction→analysis pattern)", plan_id=plan_id)
             
         except Exception as e:
             logger.error(f"Failed to execute plan", error=str(e), plan_id=plan_id)
+            for task in analysis_tasks:
+                task.cancel()
             if plan:
                 plan.overall_status = PlanStatus.FAILED
-                await self.memory_store.update_plan(plan)
+                # Subscribers get the terminal event even when the store is what failed
+                self.plan_events.plan_changed(plan)
+                try:
+                    await self.memory_store.update_plan(plan)
+                except Exception as save_error:
+                    logger.error("Failed to save failed plan status", error=str(save_error), plan_id=plan_id)
             raise
     
+    async def _run_analysis_agent(
+        self,
+        step: Step,
+        agent,
+        content: str = "",
+        file_analyses: Optional[List[tuple]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run an analysis agent with the step's parameters, over ``content`` or,
+        given ``file_analyses`` ((file label, result) pairs), merging its
+        per-file results with the agent's merge prompt.
+        """
+        logger.info(f"Starting analysis agent",
+                   agent_type=step.agent.value,
+                   agent_name=agent.name,
+                   content_length=len(content),
+                   files_merged=len(file_analyses or ()))
+        
+        # Step-specific parameters (including objective_context) go to the MAF agent as kwargs
+        kwargs = {"content": content}
+        if file_analyses:
+            kwargs["file_analyses"] = file_analyses
+        if step.parameters:
+            kwargs.update(step.parameters)
+        
+        async with self.analysis_limit:
+            result_response = await agent.run(
+                messages="Merge the per-file analyses" if file_analyses else "Analyze the extracted content",
+                **kwargs
+            )
+        
+        # Extract result from MAF response
+        result_content = result_response.messages[0].text if result_response.messages else ""
+        
+        logger.info(f"Analysis agent completed",
+                   agent_type=step.agent.value,
+                   result_length=len(result_content))
+        
+        # The agents report failures as an "Error: ..." reply rather than raising
+        if result_content.startswith("Error:"):
+            raise RuntimeError(result_content)
+        
+        try:
+            return json.loads(result_content)
+        except json.JSONDecodeError:
+            return {"raw_result": result_content}
+    
+    @staticmethod
+    def _content_text(content: Any) -> str:
+        """Text of one file's extraction result, whichever kind of file it was."""
+        if isinstance(content, dict):
+            for key in ("transcript", "text_content", "transcription", "raw_result"):
+                if key in content:
+                    return content[key]
+        return ""
+    
+    async def _save_step(self, plan: Plan, step: Step):
+        """Persist a step and publish the change to plan event subscribers."""
+        await self.memory_store.update_step(step)
+        self.plan_events.step_changed(plan, step)
+    
+    async def _save_plan(self, plan: Plan):
+        """Persist a plan and publish the change to plan event subscribers."""
+        await self.memory_store.update_plan(plan)
+        self.plan_events.plan_changed(plan)
+    
     async def _execute_step(self, step: Step, context: Dict[str, Any]):
         """Execute a single step."""
         logger.info(
@@ -1021,7 +1110,14 @@ USER PREFERENCES:
         session_id: str
     ) -> ExecutionStatusResponse:
         """Get current execution status of a plan."""
+        # Plans executing in this process have their status in memory
+        published = self.plan_events.current_status(plan_id)
+        if published is not None and published["session_id"] == session_id:
+            return ExecutionStatusResponse(**published)
+        
         plan = await self.memory_store.get_plan(plan_id, session_id)
+        if not plan:
+            raise ValueError(f"Plan {plan_id} not found")
         steps = await self.memory_store.get_steps_for_plan(plan_id, session_id)
         
         # Find current executing step
@@ -0,0 +1,490 @@
+"""
+Batch Transcription Job Manager - Multimodal Insights Application
+
+Process-wide manager for Azure Speech batch transcription jobs. All outstanding
+jobs are multiplexed through a single poller task with adaptive backoff, SAS
+URLs are signed with a cached user delegation key, and every HTTP call goes
+through one pooled aiohttp session.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+import structlog
+
+from ..infra.settings import Settings
+
+logger = structlog.get_logger(__name__)
+
+
+class TranscriptionError(Exception):
+    """Raised when a batch transcription job cannot be completed."""
+
+
+class BlobSasSigner:
+    """
+    Generates read-only SAS URLs for blobs using Azure AD credentials, and
+    deletes the intermediate blobs extraction writes.
+
+    The user delegation key is fetched once and reused until shortly before it
+    expires, instead of minting a credential and key for every file.
+    """
+
+    # Refresh the delegation key this long before it actually expires
+    REFRESH_MARGIN = timedelta(minutes=10)
+
+    def __init__(self, settings: Settings, key_lifetime: timedelta = timedelta(hours=6)):
+        """Initialize the signer."""
+        self.settings = settings
+        self.key_lifetime = key_lifetime
+        self._credential = None
+        self._service_client = None
+        self._delegation_key = None
+        self._key_expiry: Optional[datetime] = None
+        self._lock = asyncio.Lock()
+
+    async def _get_delegation_key(self):
+        """Return the cached user delegation key, refreshing it when close to expiry."""
+        async with self._lock:
+            now = datetime.utcnow()
+            if self._delegation_key is not None and self._key_expiry - now > self.REFRESH_MARGIN:
+                return self._delegation_key, self._key_expiry
+
+            expiry = now + self.key_lifetime
+            self._delegation_key = await self._get_service_client().get_user_delegation_key(
+                key_start_time=now,
+                key_expiry_time=expiry
+            )
+            self._key_expiry = expiry
+            logger.info("Refreshed user delegation key", expires=expiry.isoformat())
+            return self._delegation_key, self._key_expiry
+
+    def _get_service_client(self):
+        """Return the storage client, creating it (and its credential) on first use."""
+        if self._service_client is None:
+            from azure.identity.aio import ClientSecretCredential
+            from azure.storage.blob.aio import BlobServiceClient
+
+            self._credential = ClientSecretCredential(
+                tenant_id=self.settings.azure_tenant_id,
+                client_id=self.settings.azure_client_id,
+                client_secret=self.settings.azure_client_secret
+            )
+            self._service_client = BlobServiceClient(
+                account_url=f"https://{self.settings.azure_blob_storage_name}.blob.core.windows.net",
+                credential=self._credential
+            )
+        return self._service_client
+
+    @staticmethod
+    def _blob_path(blob_url: str):
+        """(container, blob name) of a blob URL."""
+        path_parts = urlparse(blob_url).path.lstrip('/').split('/', 1)
+        return path_parts[0], path_parts[1] if len(path_parts) > 1 else ""
+
+    async def sign(
+        self,
+        blob_url: str,
+        lifetime: timedelta = timedelta(hours=1),
+        writable: bool = False
+    ) -> str:
+        """Return ``blob_url`` with a SAS token appended (read, plus create/write if ``writable``)."""
+        from azure.storage.blob import BlobSasPermissions, generate_blob_sas
+
+        container_name, blob_name = self._blob_path(blob_url)
+
+        delegation_key, key_expiry = await self._get_delegation_key()
+        start_time = datetime.utcnow()
+        expiry_time = min(start_time + lifetime, key_expiry)
+
+        sas_token = generate_blob_sas(
+            account_name=self.settings.azure_blob_storage_name,
+            container_name=container_name,
+            blob_name=blob_name,
+            user_delegation_key=delegation_key,
+            permission=BlobSasPermissions(read=True, create=writable, write=writable),
+            expiry=expiry_time,
+            start=start_time
+        )
+        return f"{blob_url}?{sas_token}"
+
+    async def delete(self, blob_url: str):
+        """Delete ``blob_url``; a blob that does not exist is not an error."""
+        from azure.core.exceptions import ResourceNotFoundError
+
+        container_name, blob_name = self._blob_path(blob_url)
+        try:
+            await self._get_service_client().get_blob_client(container_name, blob_name).delete_blob()
+        except ResourceNotFoundError:
+            pass
+
+    async def close(self):
+        """Release the storage client and credential."""
+        if self._service_client is not None:
+            await self._service_client.close()
+            self._service_client = None
+        if self._credential is not None:
+            await self._credential.close()
+            self._credential = None
+        self._delegation_key = None
+
+
+@dataclass
+class _TranscriptionJob:
+    """Book-keeping for one outstanding transcription job."""
+
+    transcription_id: str
+    future: asyncio.Future
+    deadline: float
+    next_poll_at: float
+    interval: float
+    last_status: Optional[str] = None
+    polls: int = 0
+
+
+@dataclass
+class TranscriptionResult:
+    """Completed transcription."""
+
+    transcription_id: str
+    text: str
+    duration: Optional[str] = None
+    status_response: Dict[str, Any] = field(default_factory=dict)
+
+
+class TranscriptionJobManager:
+    """
+    Multiplexes Azure Speech batch transcription jobs through one poller.
+
+    Jobs are submitted immediately; a single background task polls every
+    outstanding job. Each job starts at ``min_poll_interval`` and backs off by
+    ``backoff_factor`` (up to ``max_poll_interval``) while its status is
+    unchanged, so long recordings cost a handful of requests rather than one
+    every five seconds.
+
+    ``base_url`` and ``session`` can be overridden to run against a local fake
+    of the batch API.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        *,
+        base_url: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        min_poll_interval: Optional[float] = None,
+        max_poll_interval: Optional[float] = None,
+        backoff_factor: float = 1.5,
+        job_timeout: Optional[float] = None,
+    ):
+        """Initialize the job manager."""
+        self.settings = settings
+        self.base_url = (
+            base_url
+            or settings.speech_batch_endpoint
+            or f"https://{settings.AZURE_SPEECH_REGION}.api.cognitive.microsoft.com/speechtotext/v3.2"
+        ).rstrip("/")
+        self.min_poll_interval = min_poll_interval or settings.transcription_min_poll_interval
+        self.max_poll_interval = max_poll_interval or settings.transcription_max_poll_interval
+        self.backoff_factor = backoff_factor
+        self.job_timeout = job_timeout or settings.transcription_timeout
+
+        self._headers = {
+            "Ocp-Apim-Subscription-Key": settings.AZURE_SPEECH_KEY,
+            "Content-Type": "application/json"
+        }
+        self._session = session
+        self._owns_session = session is None
+        self._jobs: Dict[str, _TranscriptionJob] = {}
+        self._wakeup = asyncio.Event()
+        self._poller: Optional[asyncio.Task] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=120)
+            )
+            self._owns_session = True
+        return self._session
+
+    @property
+    def outstanding_jobs(self) -> int:
+        """Number of jobs currently being polled."""
+        return len(self._jobs)
+
+    async def transcribe(
+        self,
+        content_url: str,
+        display_name: str,
+        locale: str = "en-US"
+    ) -> TranscriptionResult:
+        """
+        Submit a batch transcription job and wait for its result.
+
+        Args:
+            content_url: Readable (SAS) URL of the audio
+            display_name: Display name for the job
+            locale: Recognition locale
+
+        Returns:
+            TranscriptionResult with the combined display text
+        """
+        transcription_id = await self._submit(content_url, display_name, locale)
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        job = _TranscriptionJob(
+            transcription_id=transcription_id,
+            future=loop.create_future(),
+            deadline=now + self.job_timeout,
+            next_poll_at=now + self.min_poll_interval,
+            interval=self.min_poll_interval
+        )
+        self._jobs[transcription_id] = job
+        self._ensure_poller()
+        self._wakeup.set()
+
+        try:
+            status_response = await job.future
+            text = await self._download_text(status_response)
+            return TranscriptionResult(
+                transcription_id=transcription_id,
+                text=text,
+                duration=status_response.get("duration"),
+                status_response=status_response
+            )
+        finally:
+            self._jobs.pop(transcription_id, None)
+            await self._delete(transcription_id)
+
+    async def _submit(self, content_url: str, display_name: str, locale: str) -> str:
+        """Create the transcription job and return its id."""
+        transcription_request = {
+            "contentUrls": [content_url],
+            "locale": locale,
+            "displayName": display_name,
+            "properties": {
+                "diarizationEnabled": False,
+                "wordLevelTimestampsEnabled": True,
+                "punctuationMode": "DictatedAndAutomatic",
+                "profanityFilterMode": "Masked"
+            }
+        }
+
+        session = await self._get_session()
+        logger.info("Submitting batch transcription job", display_name=display_name)
+        async with session.post(
+            f"{self.base_url}/transcriptions",
+            headers=self._headers,
+            json=transcription_request
+        ) as response:
+            if response.status != 201:
+                error_text = await response.text()
+                raise TranscriptionError(f"Failed to create transcription: {response.status} - {error_text}")
+
+            transcription_response = await response.json()
+            transcription_id = transcription_response["self"].split("/")[-1]
+
+        logger.info("Transcription job created", transcription_id=transcription_id)
+        return transcription_id
+
+    def _ensure_poller(self):
+        """Start the shared poller task if it is not running."""
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.create_task(self._poll_loop())
+
+    async def _poll_loop(self):
+        """Single poller for all outstanding jobs."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            # Finished jobs stay registered until their callers clean up; skip them
+            pending = [job for job in self._jobs.values() if not job.future.done()]
+            if not pending:
+                break
+
+            now = loop.time()
+            due = [job for job in pending if job.next_poll_at <= now]
+            if due:
+                results = await asyncio.gather(*(self._poll_job(job) for job in due), return_exceptions=True)
+                for job, result in zip(due, results):
+                    # One job's failure must not take down the poller shared by all jobs
+                    if isinstance(result, BaseException):
+                        logger.warning(
+                            "Transcription poll failed",
+                            transcription_id=job.transcription_id,
+                            error=str(result)
+                        )
+                        self._fail(job, result)
+                continue
+
+            self._wakeup.clear()
+            next_poll_at = min(job.next_poll_at for job in pending)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(0.0, next_poll_at - now))
+            except asyncio.TimeoutError:
+                pass
+
+        logger.debug("Transcription poller idle, exiting")
+
+    async def _poll_job(self, job: _TranscriptionJob):
+        """Poll one job and resolve its future or schedule the next poll."""
+        loop = asyncio.get_running_loop()
+        job.polls += 1
+
+        try:
+            session = await self._get_session()
+            async with session.get(
+                f"{self.base_url}/transcriptions/{job.transcription_id}",
+                headers=self._headers
+            ) as response:
+                if response.status == 429 or response.status >= 500:
+                    # Throttled or transient - back off harder, keep the job
+                    try:
+                        retry_after = float(response.headers.get("Retry-After", job.interval * 2))
+                    except ValueError:
+                        retry_after = job.interval * 2
+                    job.interval = min(self.max_poll_interval, max(job.interval, retry_after))
+                    now = loop.time()
+                    if now >= job.deadline:
+                        self._fail(job, self._timeout_error())
+                        return
+                    job.next_poll_at = min(now + job.interval, job.deadline)
+                    return
+                if response.status != 200:
+                    raise TranscriptionError(f"Failed to get transcription status: {response.status}")
+
+                status_response = await response.json()
+        except Exception as e:
+            self._fail(job, e)
+            return
+
+        status = status_response.get("status")
+        logger.info("Transcription status", transcription_id=job.transcription_id, status=status, poll=job.polls)
+
+        if status == "Succeeded":
+            if not job.future.done():
+                job.future.set_result(status_response)
+            return
+        if status == "Failed":
+            error_msg = status_response.get("properties", {}).get("error", "Unknown error")
+            self._fail(job, TranscriptionError(f"Transcription failed: {error_msg}"))
+            return
+
+        now = loop.time()
+        if now >= job.deadline:
+            self._fail(job, self._timeout_error())
+            return
+
+        if status == job.last_status:
+            job.interval = min(self.max_poll_interval, job.interval * self.backoff_factor)
+        else:
+            job.interval = self.min_poll_interval
+        job.last_status = status
+        job.next_poll_at = min(now + job.interval, job.deadline)
+
+    @staticmethod
+    def _fail(job: _TranscriptionJob, error: BaseException):
+        """Fail a job's caller, unless it has already been resolved or cancelled."""
+        if not job.future.done():
+            job.future.set_exception(error if isinstance(error, TranscriptionError) else TranscriptionError(str(error)))
+
+    def _timeout_error(self) -> TranscriptionError:
+        return TranscriptionError(f"Transcription timed out after {self.job_timeout:.0f} seconds")
+
+    async def _download_text(self, status_response: Dict[str, Any]) -> str:
+        """Fetch the transcription file and join its combined phrases."""
+        session = await self._get_session()
+        files_url = status_response["links"]["files"]
+
+        async with session.get(files_url, headers=self._headers) as files_response:
+            if files_response.status != 200:
+                raise TranscriptionError(f"Failed to get transcription files: {files_response.status}")
+            files_data = await files_response.json()
+
+        for file_info in files_data.get("values", []):
+            if file_info.get("kind") != "Transcription":
+                continue
+
+            result_url = file_info["links"]["contentUrl"]
+            async with session.get(result_url) as result_response:
+                if result_response.status != 200:
+                    raise TranscriptionError(f"Failed to download result: {result_response.status}")
+                result_data = await result_response.json()
+
+            phrases = [
+                phrase["display"]
+                for phrase in result_data.get("combinedRecognizedPhrases", [])
+                if "display" in phrase
+            ]
+            transcription_text = " ".join(phrases)
+            logger.info("Transcription extracted", length=len(transcription_text))
+            return transcription_text
+
+        return ""
+
+    async def _delete(self, transcription_id: str):
+        """Best-effort cleanup of a finished job."""
+        try:
+            session = await self._get_session()
+            async with session.delete(
+                f"{self.base_url}/transcriptions/{transcription_id}",
+                headers=self._headers
+            ):
+                logger.info("Transcription job deleted", transcription_id=transcription_id)
+        except Exception as e:
+            logger.warning("Failed to delete transcription job", error=str(e))
+
+    async def close(self):
+        """Cancel the poller and close the pooled session."""
+        if self._poller is not None and not self._poller.done():
+            self._poller.cancel()
+            try:
+                await self._poller
+            except asyncio.CancelledError:
+                pass
+        for job in self._jobs.values():
+            if not job.future.done():
+                job.future.set_exception(TranscriptionError("Transcription manager shut down"))
+        self._jobs.clear()
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+# Process-wide instances
+_transcription_manager: Optional[TranscriptionJobManager] = None
+_sas_signer: Optional[BlobSasSigner] = None
+
+
+def get_transcription_manager(settings: Optional[Settings] = None) -> TranscriptionJobManager:
+    """Get or create the transcription job manager singleton."""
+    global _transcription_manager
+    if _transcription_manager is None:
+        _transcription_manager = TranscriptionJobManager(settings or Settings())
+    return _transcription_manager
+
+
+def get_sas_signer(settings: Optional[Settings] = None) -> BlobSasSigner:
+    """Get or create the blob SAS signer singleton."""
+    global _sas_signer
+    if _sas_signer is None:
+        _sas_signer = BlobSasSigner(settings or Settings())
+    return _sas_signer
+
+
+async def shutdown_transcription_services():
+    """Close the process-wide transcription manager and SAS signer."""
+    global _transcription_manager, _sas_signer
+    if _transcription_manager is not None:
+        await _transcription_manager.close()
+        _transcription_manager = None
+    if _sas_signer is not None:
+        await _sas_signer.close()
+        _sas_signer = None
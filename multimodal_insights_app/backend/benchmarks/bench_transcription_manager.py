@@ -0,0 +1,133 @@
+"""
+Batch Transcription Manager Benchmark
+
+Runs the transcription job manager against the local fake batch API
+(benchmarks.fake_speech_batch): submits concurrent jobs, some of which fail
+and some of whose polls are throttled, then checks every transcript, every
+failure and that each job was deleted. Reports HTTP requests per job and
+latency, so poller/backoff changes can be measured without Azure.
+
+Usage (from multimodal_insights_app/backend):
+    python -m benchmarks.bench_transcription_manager
+    python -m benchmarks.bench_transcription_manager --jobs 200 --job-seconds 5 --throttle-every 7
+
+No Azure resources are used; exits non-zero if any check fails.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+from app.infra.settings import Settings
+from app.services.transcription_manager import TranscriptionError, TranscriptionJobManager
+
+from .fake_speech_batch import API_PREFIX, FakeSpeechBatchApi
+
+
+async def run_job(manager: TranscriptionJobManager, index: int, fail: bool) -> dict:
+    """Transcribe one fake recording and record the outcome."""
+    content_url = f"https://fake.blob/audio/{'fail' if fail else 'ok'}-{index}.wav"
+    display_name = f"job-{index}"
+    started = time.perf_counter()
+    try:
+        result = await manager.transcribe(content_url, display_name)
+        outcome = {"ok": True, "text": result.text}
+    except TranscriptionError as e:
+        outcome = {"ok": False, "error": str(e)}
+    outcome.update(
+        index=index,
+        expect_fail=fail,
+        content_url=content_url,
+        display_name=display_name,
+        latency_s=time.perf_counter() - started,
+    )
+    return outcome
+
+
+def check(outcomes: list, api: FakeSpeechBatchApi, manager: TranscriptionJobManager) -> list:
+    """Return a list of problems; empty means the run behaved."""
+    problems = []
+    for o in outcomes:
+        if o["expect_fail"]:
+            if o["ok"] or "Transcription failed" not in o["error"]:
+                problems.append(f"job {o['index']}: expected a failed transcription, got {o}")
+        elif not o["ok"]:
+            problems.append(f"job {o['index']}: {o['error']}")
+        elif o["display_name"] not in o["text"] or o["content_url"] not in o["text"]:
+            problems.append(f"job {o['index']}: unexpected transcript {o['text']!r}")
+    if len(api.jobs) != len(outcomes):
+        problems.append(f"{len(api.jobs)} jobs submitted for {len(outcomes)} transcriptions")
+    leaked = set(api.jobs) - api.deleted
+    if leaked:
+        problems.append(f"{len(leaked)} jobs were never deleted")
+    if manager.outstanding_jobs:
+        problems.append(f"{manager.outstanding_jobs} jobs still outstanding")
+    return problems
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=50, help="Concurrent transcriptions")
+    parser.add_argument("--fail-every", type=int, default=10, help="Every Nth job fails (0 = none)")
+    parser.add_argument("--job-seconds", type=float, default=2.0, help="Fake service time per job")
+    parser.add_argument("--throttle-every", type=int, default=5, help="Throttle every Nth status poll (0 = never)")
+    parser.add_argument("--min-poll", type=float, default=0.1, help="Manager min poll interval")
+    parser.add_argument("--max-poll", type=float, default=1.0, help="Manager max poll interval")
+    args = parser.parse_args()
+
+    api = FakeSpeechBatchApi(
+        job_seconds=args.job_seconds,
+        throttle_every=args.throttle_every,
+        retry_after=args.max_poll / 2
+    )
+    base_url = await api.start()
+
+    # Only the speech fields are read by the manager; skip .env and validation
+    settings = Settings.model_construct(
+        azure_speech_key=api.subscription_key,
+        azure_speech_region="local",
+        speech_batch_endpoint=base_url,
+    )
+    manager = TranscriptionJobManager(
+        settings,
+        min_poll_interval=args.min_poll,
+        max_poll_interval=args.max_poll,
+        job_timeout=args.job_seconds * 10 + 30
+    )
+
+    started = time.perf_counter()
+    try:
+        outcomes = await asyncio.gather(*(
+            run_job(manager, i, bool(args.fail_every) and i % args.fail_every == args.fail_every - 1)
+            for i in range(args.jobs)
+        ))
+        wall = time.perf_counter() - started
+        problems = check(outcomes, api, manager)
+    finally:
+        await manager.close()
+        await api.stop()
+
+    latencies = sorted(o["latency_s"] for o in outcomes)
+    polls = api.requests.get(f"GET {API_PREFIX}/transcriptions/{{id}}", 0)
+    print(f"base url          {base_url}")
+    print(f"jobs              {len(outcomes)} ({sum(o['ok'] for o in outcomes)} succeeded, "
+          f"{sum(not o['ok'] for o in outcomes)} failed)")
+    print(f"wall s            {wall:.2f}")
+    print(f"latency p50/max s {statistics.median(latencies):.2f} / {latencies[-1]:.2f}")
+    print(f"status polls/job  {polls / max(1, len(outcomes)):.1f}")
+    print(f"requests/job      {sum(api.requests.values()) / max(1, len(outcomes)):.1f}")
+    for route, count in sorted(api.requests.items()):
+        print(f"  {route:<52}{count:>6}")
+
+    if problems:
+        print("\nFAILED")
+        for problem in problems:
+            print(f"  {problem}")
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+"""
+Video Audio Extraction Benchmark
+
+Compares extracting a video's audio track inline on the event loop (the old
+behaviour) with extraction in the media process pool, reporting wall time and
+event-loop responsiveness (heartbeat lag) for each.
+
+Usage (from multimodal_insights_app/backend):
+    python -m benchmarks.bench_video_extraction                # synthetic 1-hour video
+    python -m benchmarks.bench_video_extraction --video call.mp4 --codec flac
+
+Requires the ffmpeg binary on PATH. No Azure resources are used; audio is
+written to a local temporary file.
+"""
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from app.services.media_extraction import _ffmpeg_binary, audio_suffix, extract_audio_track
+
+HEARTBEAT_INTERVAL = 0.01  # seconds
+
+
+def make_synthetic_video(path: Path, minutes: int):
+    """Render a small test-pattern video with a sine-wave audio track."""
+    subprocess.run(
+        [
+            _ffmpeg_binary(), "-y", "-v", "error",
+            "-f", "lavfi", "-i", f"testsrc=size=320x240:rate=5:duration={minutes * 60}",
+            "-f", "lavfi", "-i", f"sine=frequency=440:sample_rate=44100:duration={minutes * 60}",
+            "-c:v", "libx264", "-preset", "ultrafast", "-c:a", "aac", "-shortest",
+            str(path),
+        ],
+        check=True
+    )
+
+
+async def heartbeat(lags: list, stop: asyncio.Event):
+    """Record how late each 10 ms tick fires; large values mean a blocked loop."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + HEARTBEAT_INTERVAL
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+async def run_mode(mode: str, video: Path, destination: Path, codec: str) -> dict:
+    """Extract audio in the given mode while measuring heartbeat lag."""
+    lags: list = []
+    stop = asyncio.Event()
+    beat = asyncio.create_task(heartbeat(lags, stop))
+    await asyncio.sleep(HEARTBEAT_INTERVAL * 2)
+
+    started = time.perf_counter()
+    if mode == "inline":
+        info = extract_audio_track(str(video), str(destination), codec)
+    else:
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            info = await loop.run_in_executor(pool, extract_audio_track, str(video), str(destination), codec)
+    wall = time.perf_counter() - started
+
+    stop.set()
+    await beat
+
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    return {
+        "mode": mode,
+        "wall_s": wall,
+        "ticks": len(lags),
+        "lag_p50_ms": statistics.median(lags_ms),
+        "lag_p99_ms": lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))],
+        "lag_max_ms": lags_ms[-1],
+        "audio_mb": info.get("audio_bytes", 0) / 1_000_000,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", type=Path, help="Video to extract (default: synthetic test video)")
+    parser.add_argument("--minutes", type=int, default=60, help="Length of the synthetic video")
+    parser.add_argument("--codec", choices=["opus", "flac"], default="opus")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        video = args.video
+        if video is None:
+            video = Path(tmp) / "synthetic.mp4"
+            print(f"Rendering {args.minutes}-minute synthetic video...")
+            make_synthetic_video(video, args.minutes)
+
+        results = []
+        for mode in ("inline", "pool"):
+            destination = Path(tmp) / f"audio_{mode}{audio_suffix(args.codec)}"
+            results.append(await run_mode(mode, video, destination, args.codec))
+
+    print(f"\n{'mode':<8}{'wall s':>10}{'ticks':>8}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}{'audio MB':>10}")
+    for r in results:
+        print(
+            f"{r['mode']:<8}{r['wall_s']:>10.2f}{r['ticks']:>8}{r['lag_p50_ms']:>10.1f}"
+            f"{r['lag_p99_ms']:>10.1f}{r['lag_max_ms']:>10.1f}{r['audio_mb']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
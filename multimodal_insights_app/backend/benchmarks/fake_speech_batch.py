@@ -0,0 +1,190 @@
+"""
+Fake Azure Speech Batch Transcription API
+
+Small aiohttp app that implements the parts of the Speech-to-text v3.2 batch
+API the transcription job manager uses: create, poll, list files, download
+the result and delete. Jobs report NotStarted, then Running, then Succeeded
+after a configurable time; content URLs containing the failure marker end in
+Failed, and every Nth status poll can be throttled with a 429 + Retry-After.
+
+Usage (from multimodal_insights_app/backend):
+    python -m benchmarks.fake_speech_batch --port 9000
+    # then set SPEECH_BATCH_ENDPOINT=http://localhost:9000/speechtotext/v3.2
+
+Used in-process by benchmarks.bench_transcription_manager.
+"""
+
+import argparse
+import time
+import uuid
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from aiohttp import web
+
+API_PREFIX = "/speechtotext/v3.2"
+
+
+class FakeSpeechBatchApi:
+    """In-memory batch transcription service with request counters."""
+
+    def __init__(
+        self,
+        subscription_key: str = "fake-speech-key",
+        job_seconds: float = 1.0,
+        throttle_every: int = 0,
+        retry_after: float = 0.5,
+        fail_marker: str = "fail"
+    ):
+        """
+        Args:
+            subscription_key: Expected Ocp-Apim-Subscription-Key header
+            job_seconds: Time from submission until a job has finished
+            throttle_every: Answer every Nth status poll with 429 (0 = never)
+            retry_after: Retry-After seconds sent with throttled polls
+            fail_marker: Content URLs containing this end in status Failed
+        """
+        self.subscription_key = subscription_key
+        self.job_seconds = job_seconds
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.fail_marker = fail_marker
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.deleted: set = set()
+        self.requests: Counter = Counter()
+        self._status_polls = 0
+        self._runner: Optional[web.AppRunner] = None
+
+    def make_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._count_and_authorize])
+        app.router.add_post(f"{API_PREFIX}/transcriptions", self._create)
+        app.router.add_get(f"{API_PREFIX}/transcriptions/{{id}}", self._status)
+        app.router.add_delete(f"{API_PREFIX}/transcriptions/{{id}}", self._delete)
+        app.router.add_get(f"{API_PREFIX}/transcriptions/{{id}}/files", self._files)
+        app.router.add_get("/results/{id}", self._result)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve in the running loop; returns the base URL for the job manager."""
+        self._runner = web.AppRunner(self.make_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        return f"http://{host}:{bound_port}{API_PREFIX}"
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _count_and_authorize(self, request: web.Request, handler):
+        route = request.match_info.route.resource.canonical if request.match_info.route.resource else "?"
+        self.requests[f"{request.method} {route}"] += 1
+        # Result downloads are SAS-style URLs and carry no key, like the real service
+        if request.path.startswith(API_PREFIX) and request.headers.get("Ocp-Apim-Subscription-Key") != self.subscription_key:
+            return web.json_response({"code": "Unauthorized"}, status=401)
+        return await handler(request)
+
+    def _job(self, request: web.Request) -> Dict[str, Any]:
+        job = self.jobs.get(request.match_info["id"])
+        if job is None or job["id"] in self.deleted:
+            raise web.HTTPNotFound()
+        return job
+
+    def _job_status(self, job: Dict[str, Any]) -> str:
+        elapsed = time.monotonic() - job["created"]
+        if elapsed < self.job_seconds * 0.2:
+            return "NotStarted"
+        if elapsed < self.job_seconds:
+            return "Running"
+        return "Failed" if self.fail_marker in job["content_url"] else "Succeeded"
+
+    async def _create(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        content_urls = body.get("contentUrls") or []
+        if not content_urls:
+            return web.json_response({"code": "InvalidPayload", "message": "contentUrls is required"}, status=400)
+
+        transcription_id = str(uuid.uuid4())
+        self.jobs[transcription_id] = {
+            "id": transcription_id,
+            "content_url": content_urls[0],
+            "display_name": body.get("displayName", ""),
+            "created": time.monotonic(),
+        }
+        return web.json_response(
+            {"self": f"{request.url.origin()}{API_PREFIX}/transcriptions/{transcription_id}"},
+            status=201
+        )
+
+    async def _status(self, request: web.Request) -> web.Response:
+        job = self._job(request)
+        self._status_polls += 1
+        if self.throttle_every and self._status_polls % self.throttle_every == 0:
+            return web.json_response(
+                {"code": "TooManyRequests"},
+                status=429,
+                headers={"Retry-After": str(self.retry_after)}
+            )
+
+        status = self._job_status(job)
+        response: Dict[str, Any] = {
+            "self": f"{request.url.origin()}{API_PREFIX}/transcriptions/{job['id']}",
+            "displayName": job["display_name"],
+            "status": status,
+            "links": {"files": f"{request.url.origin()}{API_PREFIX}/transcriptions/{job['id']}/files"},
+            "properties": {},
+        }
+        if status == "Succeeded":
+            response["duration"] = "PT1M"
+        elif status == "Failed":
+            response["properties"]["error"] = {"code": "InvalidData", "message": "The audio could not be decoded."}
+        return web.json_response(response)
+
+    async def _files(self, request: web.Request) -> web.Response:
+        job = self._job(request)
+        return web.json_response({
+            "values": [
+                {"kind": "TranscriptionReport", "links": {"contentUrl": f"{request.url.origin()}/results/{job['id']}?report"}},
+                {"kind": "Transcription", "links": {"contentUrl": f"{request.url.origin()}/results/{job['id']}"}},
+            ]
+        })
+
+    async def _result(self, request: web.Request) -> web.Response:
+        job = self.jobs.get(request.match_info["id"])
+        if job is None:
+            raise web.HTTPNotFound()
+        return web.json_response({
+            "combinedRecognizedPhrases": [
+                {"channel": 0, "display": f"Transcript of {job['display_name']}."},
+                {"channel": 0, "display": f"Source {job['content_url']}."},
+            ]
+        })
+
+    async def _delete(self, request: web.Request) -> web.Response:
+        job = self._job(request)
+        self.deleted.add(job["id"])
+        return web.Response(status=204)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--key", default="fake-speech-key", help="Expected AZURE_SPEECH_KEY")
+    parser.add_argument("--job-seconds", type=float, default=10.0, help="Time until a job finishes")
+    parser.add_argument("--throttle-every", type=int, default=0, help="Throttle every Nth status poll")
+    args = parser.parse_args()
+
+    api = FakeSpeechBatchApi(
+        subscription_key=args.key,
+        job_seconds=args.job_seconds,
+        throttle_every=args.throttle_every
+    )
+    web.run_app(api.make_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,49 +1,10 @@
-import React, { useEffect, useState } from 'react';
+import React from 'react';
 import { useSession } from '../contexts/SessionContext';
 import { CheckCircle, Circle, Loader2, AlertCircle } from 'lucide-react';
-import * as api from '../services/api';
 
 const ExecutionProgress: React.FC = () => {
-  const { session, updateStatus, setCurrentPlan } = useSession();
-  const [polling, setPolling] = useState(false);
-
-  useEffect(() => {
-    if (!session?.currentPlan) return;
-
-    const planId = session.currentPlan.id;
-    const sessionId = session.id;
-
-    const poll = async () => {
-      try {
-        const status = await api.getPlanStatus(planId, sessionId);
-        updateStatus(status);
-
-        if (status.overall_status === 'in_progress' && !polling) {
-          setPolling(true);
-        } else if (['completed', 'failed'].includes(status.overall_status)) {
-          setPolling(false);
-          // Fetch complete plan with results
-          const completePlan = await api.getPlan(planId, sessionId);
-          setCurrentPlan(completePlan);
-        }
-      } catch (error) {
-        console.error('Failed to fetch status:', error);
-      }
-    };
-
-    // Initial poll
-    poll();
-
-    // Continue polling if in progress
-    let interval: number | null = null;
-    if (session.status?.overall_status === 'in_progress') {
-      interval = setInterval(poll, 2000);
-    }
-
-    return () => {
-      if (interval) clearInterval(interval);
-    };
-  }, [session?.currentPlan?.id, session?.status?.overall_status]);
+  // Status is kept current by the page's plan event subscription
+  const { session } = useSession();
 
   if (!session?.currentPlan || !session.status) {
     return null;
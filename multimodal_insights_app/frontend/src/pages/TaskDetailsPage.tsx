@@ -10,7 +10,7 @@ import type { PlanWithSteps } from '../types';
 
 const TaskDetailsPage: React.FC = () => {
   const [searchParams] = useSearchParams();
-  const { session, messages, setCurrentPlan, initializeSession } = useSession();
+  const { session, messages, setCurrentPlan, updateStatus, initializeSession } = useSession();
   const [isPolling, setIsPolling] = useState(false);
   const [isLoadingFromUrl, setIsLoadingFromUrl] = useState(false);
   const [historicalPlan, setHistoricalPlan] = useState<PlanWithSteps | null>(null);
@@ -44,33 +44,46 @@ const TaskDetailsPage: React.FC = () => {
     }
   }, [searchParams, setCurrentPlan, initializeSession, session, hasLoadedFromUrl]);
 
-  // Poll for plan status updates
+  // Follow plan execution over server-sent events
+  const planId = session?.currentPlan?.id;
+  const planSessionId = session?.currentPlan?.session_id;
+  const planFinished = ['completed', 'failed', 'cancelled'].includes(session?.currentPlan?.overall_status ?? '');
+
   useEffect(() => {
-    if (!session?.currentPlan || session.currentPlan.overall_status === 'completed' || session.currentPlan.overall_status === 'failed') {
+    if (!planId || !planSessionId || planFinished) {
       return;
     }
 
-    setIsPolling(true);
-    const pollInterval = setInterval(async () => {
+    const refreshPlan = async () => {
       try {
-        const plan = await api.getPlan(session.currentPlan!.id, session.currentPlan!.session_id);
+        const plan = await api.getPlan(planId, planSessionId);
         setCurrentPlan(plan);
+      } catch (error) {
+        console.error('Failed to fetch plan:', error);
+      }
+    };
 
-        // Stop polling if completed or failed
-        if (plan.overall_status === 'completed' || plan.overall_status === 'failed') {
+    setIsPolling(true);
+    const source = api.subscribePlanEvents(planId, planSessionId, {
+      onEvent: (data) => {
+        updateStatus(data.status);
+
+        // Step results and the final plan are only read when they change
+        if (source.readyState === EventSource.CLOSED) {
           setIsPolling(false);
-          clearInterval(pollInterval);
+          refreshPlan();
+        } else if (data.step && ['completed', 'failed'].includes(data.step.status)) {
+          refreshPlan();
         }
-      } catch (error) {
-        console.error('Failed to fetch plan status:', error);
-      }
-    }, 2000); // Poll every 2 seconds
+      },
+      onError: () => setIsPolling(false),
+    });
 
     return () => {
-      clearInterval(pollInterval);
+      source.close();
       setIsPolling(false);
     };
-  }, [session?.currentPlan, setCurrentPlan]);
+  }, [planId, planSessionId, planFinished, setCurrentPlan, updateStatus]);
 
   // Show loading state when loading plan from URL
   if (isLoadingFromUrl) {
@@ -3,6 +3,7 @@ import type {
   FileMetadata,
   PlanWithSteps,
   ExecutionStatus,
+  PlanEventData,
   ActionResponse,
   UploadResponse,
   ExportResponse,
@@ -96,6 +97,47 @@ export const getPlanStatus = async (planId: string, sessionId: string): Promise<
   return response.data;
 };
 
+export interface PlanEventHandlers {
+  onEvent: (data: PlanEventData, type: 'status' | 'step' | 'plan') => void;
+  onError?: () => void;
+}
+
+const TERMINAL_PLAN_STATUSES = ['completed', 'failed', 'cancelled'];
+
+/**
+ * Subscribe to a plan's execution status (Server-Sent Events) instead of
+ * polling getPlanStatus. The browser reconnects on its own and resumes from
+ * the last event it received; the source is closed once the plan finishes.
+ * Returns the EventSource; call close() to unsubscribe.
+ */
+export const subscribePlanEvents = (
+  planId: string,
+  sessionId: string,
+  handlers: PlanEventHandlers
+): EventSource => {
+  const source = new EventSource(
+    `${API_BASE_URL}/api/orchestration/plans/${planId}/events?session_id=${encodeURIComponent(sessionId)}`
+  );
+
+  (['status', 'step', 'plan'] as const).forEach((type) => {
+    source.addEventListener(type, (event) => {
+      const data: PlanEventData = JSON.parse((event as MessageEvent).data);
+      if (TERMINAL_PLAN_STATUSES.includes(data.status.overall_status)) {
+        source.close();
+      }
+      handlers.onEvent(data, type);
+    });
+  });
+  source.onerror = () => {
+    // CLOSED means the browser gave up (e.g. the plan was not found)
+    if (source.readyState === EventSource.CLOSED) {
+      handlers.onError?.();
+    }
+  };
+
+  return source;
+};
+
 // Export API
 export const exportPlanResults = async (
   planId: string,
@@ -59,6 +59,21 @@ export interface ExecutionStatus {
   recent_messages: string[];
 }
 
+export interface PlanEventStep {
+  id: string;
+  order: number;
+  action: string;
+  agent: string;
+  status: string;
+  error_message?: string | null;
+}
+
+// Payload of a plan execution event (status, step or plan)
+export interface PlanEventData {
+  status: ExecutionStatus;
+  step?: PlanEventStep;
+}
+
 export interface ActionResponse {
   status: string;
   message: string;
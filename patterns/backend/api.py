@@ -5,7 +5,7 @@ This provides REST API endpoints for the React frontend to interact with
 the Microsoft Agent Framework patterns.
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
@@ -73,8 +73,10 @@ else:
 from auth.auth_utils import get_authenticated_user_details
 
 # Import persistence layer
-from persistence.cosmos_memory import CosmosMemoryStore
+from persistence.cosmos_memory import CosmosMemoryStore, InvalidContinuationToken
+from persistence.sqlite_memory import DEFAULT_SQLITE_PATH, SqliteMemoryStore, memory_store_backend
 from persistence.persistence_models import PatternSession, PatternExecution
+from middleware.metrics import get_metrics
 
 # Import pattern functions
 from sequential.sequential import run_sequential_orchestration
@@ -132,6 +134,7 @@ class SystemStatus(BaseModel):
     agent_framework_available: bool
     endpoint: str
     model: str
+    metrics: Optional[Dict[str, Any]] = None
 
 # Global execution tracking
 executions: Dict[str, ExecutionStatus] = {}
@@ -287,7 +290,16 @@ async def startup_event():
     client_id = os.getenv("AZURE_CLIENT_ID")
     client_secret = os.getenv("AZURE_CLIENT_SECRET")
     
-    if cosmos_endpoint and cosmos_database and cosmos_container:
+    if memory_store_backend() == "sqlite":
+        sqlite_path = os.getenv("SQLITE_MEMORY_PATH", DEFAULT_SQLITE_PATH)
+        cosmos_store = SqliteMemoryStore(
+            path=sqlite_path,
+            record_path=os.getenv("MEMORY_STORE_RECORD_PATH")
+        )
+        await cosmos_store.initialize()
+        logger.info(f"SQLite persistence initialized: {sqlite_path}")
+        print(f"[OK] SQLite persistence initialized: {sqlite_path}")
+    elif cosmos_endpoint and cosmos_database and cosmos_container:
         try:
             cosmos_store = CosmosMemoryStore(
                 endpoint=cosmos_endpoint,
@@ -322,6 +334,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Continuation-Token"],
 )
 
 async def execute_pattern_background(execution_id: str, pattern: str, task: str, session_id: str = None, mode: str = None):
@@ -432,7 +445,7 @@ async def execute_pattern_background(execution_id: str, pattern: str, task: str,
                                 "timestamp": a.timestamp
                             } for a in (execution.agent_outputs or [])
                         ]
-                    })
+                    }, session_id=session_id)
                 except Exception as e:
                     print(f"[WARNING] Failed to persist completion to CosmosDB: {e}")
             
@@ -453,7 +466,7 @@ async def execute_pattern_background(execution_id: str, pattern: str, task: str,
                     "completed_at": datetime.utcnow(),
                     "execution_time": execution.duration,
                     "error_message": str(e)
-                })
+                }, session_id=session_id)
             except Exception as persist_error:
                 print(f"[WARNING] Failed to persist failure to CosmosDB: {persist_error}")
     finally:
@@ -645,11 +658,18 @@ async def get_execution_history():
 @app.get("/patterns/history/cosmos")
 async def get_cosmos_history(
     http_request: Request,
+    response: Response,
     session_id: Optional[str] = None, 
     user_id: Optional[str] = None, 
-    limit: int = 50
+    limit: int = 50,
+    continuation_token: Optional[str] = None
 ):
-    """Get execution history from CosmosDB."""
+    """
+    Get execution history from CosmosDB.
+    
+    User history is paged; the cursor for the next page is returned in the
+    X-Continuation-Token header and passed back as ``continuation_token``.
+    """
     if not cosmos_store:
         raise HTTPException(status_code=503, detail="CosmosDB persistence not configured")
     
@@ -666,7 +686,11 @@ async def get_cosmos_history(
             pattern_executions = await cosmos_store.get_executions_by_session(session_id)
         else:
             # Get executions for authenticated/specified user
-            pattern_executions = await cosmos_store.get_executions_by_user(user_id, limit)
+            pattern_executions, next_token = await cosmos_store.get_executions_page(
+                user_id, limit, continuation_token
+            )
+            if next_token:
+                response.headers["X-Continuation-Token"] = next_token
         
         # Convert to ExecutionStatus format
         return [
@@ -688,12 +712,25 @@ async def get_cosmos_history(
             }
             for exec in pattern_executions
         ]
+    except InvalidContinuationToken as e:
+        raise HTTPException(status_code=400, detail=f"{e}; request the first page again")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve history: {str(e)}")
 
 @app.get("/patterns/sessions/cosmos")
-async def get_cosmos_sessions(http_request: Request, user_id: Optional[str] = None, limit: int = 50):
-    """Get sessions from CosmosDB."""
+async def get_cosmos_sessions(
+    http_request: Request,
+    response: Response,
+    user_id: Optional[str] = None,
+    limit: int = 50,
+    continuation_token: Optional[str] = None
+):
+    """
+    Get sessions from CosmosDB.
+    
+    The cursor for the next page is returned in the X-Continuation-Token header
+    and passed back as ``continuation_token``.
+    """
     if not cosmos_store:
         raise HTTPException(status_code=503, detail="CosmosDB persistence not configured")
     
@@ -705,7 +742,9 @@ async def get_cosmos_sessions(http_request: Request, user_id: Optional[str] = No
             if not user_id:
                 raise HTTPException(status_code=401, detail="User authentication required")
         
-        sessions = await cosmos_store.get_all_sessions(user_id, limit)
+        sessions, next_token = await cosmos_store.get_sessions_page(user_id, limit, continuation_token)
+        if next_token:
+            response.headers["X-Continuation-Token"] = next_token
         
         return [
             {
@@ -717,6 +756,8 @@ async def get_cosmos_sessions(http_request: Request, user_id: Optional[str] = No
             }
             for session in sessions
         ]
+    except InvalidContinuationToken as e:
+        raise HTTPException(status_code=400, detail=f"{e}; request the first page again")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve sessions: {str(e)}")
 
@@ -841,7 +882,16 @@ async def get_system_status():
         azure_openai_configured=azure_configured,
         agent_framework_available=framework_available,
         endpoint=azure_endpoint or "Not configured",
-        model=deployment_name or "Not configured"
+        model=deployment_name or "Not configured",
+        metrics=get_metrics().snapshot()
+    )
+
+@app.get("/metrics", include_in_schema=False)
+async def get_prometheus_metrics():
+    """Agent latency, token and tool metrics in Prometheus text format."""
+    return Response(
+        content=get_metrics().render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
     )
 
 # Register /api-prefixed aliases so the SPA can continue using the Vite proxy path
@@ -14,6 +14,8 @@ from pathlib import Path
 from agent_framework import ChatAgent
 from agent_framework.azure import AzureOpenAIChatClient
 
+from middleware import AGENT_MIDDLEWARE
+
 # Load environment variables from .env file
 env_file = Path(__file__).parent.parent / '.env'  # Load from backend directory
 if env_file.exists():
@@ -49,9 +51,14 @@ class AgentFactory:
             api_version=api_version
         )
     
+    def _create_agent(self, **kwargs) -> ChatAgent:
+        """Create an agent with the shared instrumentation middleware."""
+        kwargs.setdefault("middleware", list(AGENT_MIDDLEWARE))
+        return self.chat_client.create_agent(**kwargs)
+    
     def create_planner_agent(self) -> ChatAgent:
         """Create a planning agent for task decomposition."""
-        return self.chat_client.create_agent(
+        return self._create_agent(
             name="Planner",
             instructions="""
             You are an expert task planner and strategist. Your role is to:
@@ -70,7 +77,7 @@ class AgentFactory:
     
     def create_researcher_agent(self) -> ChatAgent:
         """Create a research agent for information gathering.""" 
-        return self.chat_client.create_agent(
+        return self._create_agent(
             name="Researcher",
             instructions="""
             You are a thorough research specialist. Your role is to:
@@ -89,7 +96,7 @@ class AgentFactory:
     
     def create_writer_agent(self) -> ChatAgent:
         """Create a content writing agent."""
-        return self.chat_client.create_agent(
+        return self._create_agent(
             name="Writer", 
             instructions="""
             You are a skilled content writer and communicator. Your role is to:
@@ -108,7 +115,7 @@ class AgentFactory:
     
     def create_reviewer_agent(self) -> ChatAgent:
         """Create a quality review agent."""
-        return self.chat_client.create_agent(
+        return self._create_agent(
             name="Reviewer",
             instructions="""
             You are a meticulous quality reviewer and editor. Your role is to:
@@ -129,7 +136,7 @@ class AgentFactory:
     
     def create_router_agent(self) -> ChatAgent:
         """Create a routing agent for request delegation."""
-        return self.chat_client.create_agent(
+        return self._create_agent(
             name="Router",
             instructions="""
             You are an intelligent request router and coordinator. Your role is to:
@@ -149,7 +156,7 @@ class AgentFactory:
     
     def create_status_agent(self) -> ChatAgent:
         """Create a status inquiry specialist."""
-        return self.chat_client.create_agent(
+        return self._create_agent(
             name="StatusAgent",
             instructions="""
             You are a customer service specialist for status inquiries. Your role is to:
@@ -164,7 +171,7 @@ class AgentFactory:
     
     def create_returns_agent(self) -> ChatAgent:
         """Create a returns and refunds specialist."""
-        return self.chat_client.create_agent(
+        return self._create_agent(
             name="ReturnsAgent", 
             instructions="""
             You are a returns and refunds specialist. Your role is to:
@@ -179,7 +186,7 @@ class AgentFactory:
     
     def create_support_agent(self) -> ChatAgent:
         """Create a technical support specialist."""
-        return self.chat_client.create_agent(
+        return self._create_agent(
             name="SupportAgent",
             instructions="""
             You are a technical support specialist. Your role is to:
@@ -194,7 +201,7 @@ class AgentFactory:
     
     def create_summarizer_agent(self) -> ChatAgent:
         """Create a content summarization agent."""
-        return self.chat_client.create_agent(
+        return self._create_agent(
             name="Summarizer",
             instructions="""
             You are an expert at synthesizing and summarizing information. Your role is to:
@@ -213,7 +220,7 @@ class AgentFactory:
     
     def create_pros_cons_agent(self) -> ChatAgent:
         """Create a pros/cons analysis agent."""
-        return self.chat_client.create_agent(
+        return self._create_agent(
             name="ProsCons",
             instructions="""
             You are an analytical specialist for pros and cons evaluation. Your role is to:
@@ -232,7 +239,7 @@ class AgentFactory:
     
     def create_risk_assessor_agent(self) -> ChatAgent:
         """Create a risk assessment agent."""
-        return self.chat_client.create_agent(
+        return self._create_agent(
             name="RiskAssessor",
             instructions="""
             You are a risk assessment specialist. Your role is to:
@@ -253,7 +260,7 @@ class AgentFactory:
     
     def create_moderator_agent(self) -> ChatAgent:
         """Create a conversation moderator agent."""
-        return self.chat_client.create_agent(
+        return self._create_agent(
             name="Moderator",
             instructions="""
             You are a conversation moderator and facilitator. Your role is to:
@@ -272,7 +279,7 @@ class AgentFactory:
     
     def create_validator_agent(self) -> ChatAgent:
         """Create a validation and verification agent."""
-        return self.chat_client.create_agent(
+        return self._create_agent(
             name="Validator",
             instructions="""
             You are a validation and verification specialist. Your role is to:
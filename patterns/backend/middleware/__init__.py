@@ -5,15 +5,22 @@ This package contains middleware implementations for:
 - Security validation
 - Performance monitoring  
 - Function logging
-- Observability tracking
+- Observability tracking (metrics exposed on /metrics)
 """
 
 from .security_middleware import SecurityAgentMiddleware
 from .performance_middleware import performance_monitor_middleware
 from .function_middleware import function_logging_middleware
+from .metrics import AgentMetrics, get_metrics
+
+# Instrumentation attached to every agent created by the patterns
+AGENT_MIDDLEWARE = [performance_monitor_middleware, function_logging_middleware]
 
 __all__ = [
     "SecurityAgentMiddleware",
     "performance_monitor_middleware", 
-    "function_logging_middleware"
+    "function_logging_middleware",
+    "AgentMetrics",
+    "get_metrics",
+    "AGENT_MIDDLEWARE"
 ]
\ No newline at end of file
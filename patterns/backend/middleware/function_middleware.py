@@ -2,25 +2,39 @@
 Function logging middleware for Microsoft Agent Framework.
 
 Based on: agent_and_run_level_middleware.py sample
+
+Times every tool call into the metrics registry. Only argument names are
+logged; values can be large (documents, search results) or sensitive.
 """
 
+import logging
+import time
 from typing import Callable, Awaitable
 from agent_framework import FunctionInvocationContext
 
+from .metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
 
 async def function_logging_middleware(
     context: FunctionInvocationContext,
     next: Callable[[FunctionInvocationContext], Awaitable[None]],
 ) -> None:
-    """Function middleware that logs all function calls."""
+    """Function middleware that times and logs all function calls."""
     function_name = context.function.name
-    args = context.arguments
-    
-    print(f"[FunctionLog] Calling function: {function_name} with args: {args}")
+    start_time = time.perf_counter()
     
     try:
         await next(context)
-        print(f"[FunctionLog] Function {function_name} completed successfully")
     except Exception as e:
-        print(f"[FunctionLog] Function {function_name} failed: {e}")
-        raise
\ No newline at end of file
+        get_metrics().observe_tool_call(function_name, time.perf_counter() - start_time, "error")
+        logger.warning(f"[FunctionLog] Function {function_name} failed: {e}")
+        raise
+    
+    duration = time.perf_counter() - start_time
+    get_metrics().observe_tool_call(function_name, duration)
+    if logger.isEnabledFor(logging.DEBUG):
+        arguments = context.arguments
+        names = list(arguments.model_dump()) if hasattr(arguments, "model_dump") else list(arguments or {})
+        logger.debug(f"[FunctionLog] {function_name}({', '.join(names)}) completed in {duration:.3f}s")
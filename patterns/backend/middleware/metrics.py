@@ -0,0 +1,224 @@
+"""
+In-process metrics for agent runs and tool calls.
+
+Aggregates per-agent and per-tool latency histograms, token counts and
+time-to-first-token for streaming runs, and renders them in the Prometheus
+text exposition format for the /metrics endpoint. Recording an observation is
+a dictionary lookup, a bisect and a few additions under a lock, so the
+middleware can call it on every run without measurable overhead.
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Seconds; agent runs span sub-second tool routing to multi-minute research
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+TTFT_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+TOOL_BUCKETS = (0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """Fixed-bucket histogram keyed by label values."""
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...], buckets: Iterable[float]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [bucket counts..., +Inf count, sum]
+        self._series: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, labels: LabelValues, value: float):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                le = 'le="' + _format(bound) + '"'
+                lines.append(f"{self.name}_bucket{_labels(self.label_names, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, labels)} {series[-1]}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, labels)} {cumulative}")
+        return lines
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Count, mean and approximate p50/p95 (bucket upper bounds) per series."""
+        result = {}
+        for labels, series in self._series.items():
+            count = sum(series[:-1])
+            result["/".join(labels)] = {
+                "count": count,
+                "mean_seconds": round(series[-1] / count, 4) if count else 0.0,
+                "p50_seconds": self._quantile(series, count, 0.50),
+                "p95_seconds": self._quantile(series, count, 0.95),
+            }
+        return result
+
+    def _quantile(self, series: List[float], count: int, q: float) -> Optional[float]:
+        if not count:
+            return None
+        target = q * count
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, series[:-1]):
+            cumulative += bucket_count
+            if cumulative >= target:
+                return bound
+        return None  # beyond the largest bucket
+
+
+class Counter:
+    """Monotonic counter keyed by label values."""
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, labels: LabelValues, amount: float = 1):
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_labels(self.label_names, labels)} {value}")
+        return lines
+
+    def summary(self) -> Dict[str, float]:
+        return {"/".join(labels): value for labels, value in self._values.items()}
+
+
+class AgentMetrics:
+    """Process-wide registry of agent and tool metrics."""
+
+    def __init__(
+        self,
+        prompt_cost_per_1k: float = 0.0,
+        completion_cost_per_1k: float = 0.0
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            prompt_cost_per_1k: USD per 1,000 prompt tokens (0 disables cost tracking)
+            completion_cost_per_1k: USD per 1,000 completion tokens
+        """
+        self.prompt_cost_per_1k = prompt_cost_per_1k
+        self.completion_cost_per_1k = completion_cost_per_1k
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+
+        self.agent_latency = Histogram(
+            "patterns_agent_run_duration_seconds", "Agent run latency.",
+            ("agent", "mode", "status"), LATENCY_BUCKETS
+        )
+        self.agent_ttft = Histogram(
+            "patterns_agent_time_to_first_token_seconds", "Time to first streamed token.",
+            ("agent",), TTFT_BUCKETS
+        )
+        self.tool_latency = Histogram(
+            "patterns_tool_call_duration_seconds", "Tool (function) call latency.",
+            ("tool", "status"), TOOL_BUCKETS
+        )
+        self.tokens = Counter(
+            "patterns_agent_tokens_total", "LLM tokens consumed by agent runs.",
+            ("agent", "kind")
+        )
+        self.cost = Counter(
+            "patterns_agent_cost_usd_total", "Estimated LLM cost of agent runs.",
+            ("agent",)
+        )
+
+    def observe_agent_run(self, agent: str, seconds: float, status: str = "ok", streaming: bool = False):
+        with self._lock:
+            self.agent_latency.observe((agent, "stream" if streaming else "run", status), seconds)
+
+    def observe_ttft(self, agent: str, seconds: float):
+        with self._lock:
+            self.agent_ttft.observe((agent,), seconds)
+
+    def observe_tool_call(self, tool: str, seconds: float, status: str = "ok"):
+        with self._lock:
+            self.tool_latency.observe((tool, status), seconds)
+
+    def add_tokens(self, agent: str, prompt_tokens: int, completion_tokens: int):
+        if not prompt_tokens and not completion_tokens:
+            return
+        cost = (
+            prompt_tokens * self.prompt_cost_per_1k + completion_tokens * self.completion_cost_per_1k
+        ) / 1000
+        with self._lock:
+            self.tokens.inc((agent, "prompt"), prompt_tokens)
+            self.tokens.inc((agent, "completion"), completion_tokens)
+            if cost:
+                self.cost.inc((agent,), cost)
+
+    def render_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            lines: List[str] = []
+            for metric in (self.agent_latency, self.agent_ttft, self.tool_latency, self.tokens, self.cost):
+                lines.extend(metric.render())
+        lines.append("# HELP patterns_process_start_time_seconds Start time of the process since unix epoch.")
+        lines.append("# TYPE patterns_process_start_time_seconds gauge")
+        lines.append(f"patterns_process_start_time_seconds {self.started_at}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Compact JSON summary for /system/status."""
+        with self._lock:
+            return {
+                "uptime_seconds": round(time.time() - self.started_at, 1),
+                "agent_runs": self.agent_latency.summary(),
+                "time_to_first_token": self.agent_ttft.summary(),
+                "tool_calls": self.tool_latency.summary(),
+                "tokens": self.tokens.summary(),
+                "cost_usd": {key: round(value, 6) for key, value in self.cost.summary().items()},
+            }
+
+
+_metrics: Optional[AgentMetrics] = None
+
+
+def get_metrics() -> AgentMetrics:
+    """
+    Get the process-wide metrics registry.
+
+    Token prices for the cost estimate come from LLM_PROMPT_COST_PER_1K and
+    LLM_COMPLETION_COST_PER_1K (USD, default 0).
+    """
+    global _metrics
+    if _metrics is None:
+        _metrics = AgentMetrics(
+            prompt_cost_per_1k=float(os.getenv("LLM_PROMPT_COST_PER_1K", "0") or 0),
+            completion_cost_per_1k=float(os.getenv("LLM_COMPLETION_COST_PER_1K", "0") or 0)
+        )
+    return _metrics
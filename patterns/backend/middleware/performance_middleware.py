@@ -2,29 +2,98 @@
 Performance monitoring middleware for Microsoft Agent Framework.
 
 Based on: agent_and_run_level_middleware.py sample
+
+Records per-agent latency, token usage and, for streaming runs,
+time-to-first-token into the process-wide metrics registry (see metrics.py).
 """
 
+import logging
 import time
-from typing import Callable, Awaitable
+from typing import Any, AsyncIterable, Callable, Awaitable, Iterable, Tuple
 from agent_framework import AgentRunContext
 
+from .metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+
+def _agent_name(context: AgentRunContext) -> str:
+    agent = getattr(context, "agent", None)
+    return getattr(agent, "name", None) or type(agent).__name__
+
+
+def _usage_tokens(details: Any) -> Tuple[int, int]:
+    """(prompt, completion) token counts from a UsageDetails-like object."""
+    if details is None:
+        return 0, 0
+    return (
+        getattr(details, "input_token_count", None) or 0,
+        getattr(details, "output_token_count", None) or 0,
+    )
+
+
+def _update_usage(contents: Iterable[Any]) -> Tuple[int, int]:
+    """Token counts carried by usage contents of a streamed update."""
+    prompt = completion = 0
+    for content in contents or ():
+        details = getattr(content, "details", None)
+        if details is not None and hasattr(details, "input_token_count"):
+            p, c = _usage_tokens(details)
+            prompt += p
+            completion += c
+    return prompt, completion
+
+
+async def _observe_stream(stream: AsyncIterable[Any], agent: str, start_time: float):
+    """Pass streamed updates through, timing the first token and the whole run."""
+    metrics = get_metrics()
+    first_token = False
+    prompt_tokens = completion_tokens = 0
+    status = "ok"
+    try:
+        async for update in stream:
+            if not first_token and getattr(update, "text", None):
+                first_token = True
+                metrics.observe_ttft(agent, time.perf_counter() - start_time)
+            p, c = _update_usage(getattr(update, "contents", None))
+            prompt_tokens += p
+            completion_tokens += c
+            yield update
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        duration = time.perf_counter() - start_time
+        metrics.observe_agent_run(agent, duration, status, streaming=True)
+        metrics.add_tokens(agent, prompt_tokens, completion_tokens)
+        logger.debug(f"[PerformanceMonitor] {agent} stream finished in {duration:.3f}s ({status})")
+
 
 async def performance_monitor_middleware(
     context: AgentRunContext,
     next: Callable[[AgentRunContext], Awaitable[None]],
 ) -> None:
     """Agent-level performance monitoring for all runs."""
-    print("[PerformanceMonitor] Starting performance monitoring...")
-    
-    start_time = time.time()
-    context.metadata["start_time"] = start_time
+    agent = _agent_name(context)
+    start_time = time.perf_counter()
+    context.metadata["start_time"] = time.time()
     
     try:
         await next(context)
-    finally:
-        end_time = time.time()
-        duration = end_time - start_time
-        
-        print(f"[PerformanceMonitor] Total execution time: {duration:.3f}s")
-        context.metadata["execution_time"] = duration
-        context.metadata["end_time"] = end_time
\ No newline at end of file
+    except BaseException:
+        get_metrics().observe_agent_run(agent, time.perf_counter() - start_time, "error")
+        raise
+    
+    if getattr(context, "is_streaming", False) and context.result is not None:
+        # The run has only started; latency is recorded when the stream is drained
+        context.result = _observe_stream(context.result, agent, start_time)
+        return
+    
+    duration = time.perf_counter() - start_time
+    metrics = get_metrics()
+    metrics.observe_agent_run(agent, duration)
+    metrics.add_tokens(agent, *_usage_tokens(getattr(context.result, "usage_details", None)))
+    
+    context.metadata["execution_time"] = duration
+    context.metadata["end_time"] = time.time()
+    logger.debug(f"[PerformanceMonitor] {agent} run finished in {duration:.3f}s")
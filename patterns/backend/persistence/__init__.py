@@ -2,5 +2,6 @@
 
 from .cosmos_memory import CosmosMemoryStore
 from .persistence_models import PatternSession, PatternExecution
+from .sqlite_memory import SqliteMemoryStore
 
-__all__ = ["CosmosMemoryStore", "PatternSession", "PatternExecution"]
+__all__ = ["CosmosMemoryStore", "SqliteMemoryStore", "PatternSession", "PatternExecution"]
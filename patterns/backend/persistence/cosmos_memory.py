@@ -7,10 +7,14 @@ Supports Azure AD authentication via service principal or managed identity.
 
 import asyncio
 import logging
+import os
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from azure.core import MatchConditions
 from azure.cosmos.aio import CosmosClient
+from azure.cosmos.exceptions import CosmosAccessConditionFailedError, CosmosHttpResponseError
 from azure.cosmos.partition_key import PartitionKey
 from azure.identity.aio import (
     DefaultAzureCredential,
@@ -18,9 +22,44 @@ from azure.identity.aio import (
 )
 
 from .persistence_models import PatternSession, PatternExecution
+from .sqlite_container import RecordingContainer
 
 logger = logging.getLogger(__name__)
 
+# Cosmos DB accepts at most 10 operations per patch request
+MAX_PATCH_OPERATIONS = 10
+
+# execution_id -> (document id, session_id) locations kept for point writes
+EXECUTION_LOCATION_CACHE_SIZE = 1024
+
+# Attempts at a conditional full replace before a concurrent writer wins
+MAX_REPLACE_ATTEMPTS = 5
+
+
+def _to_document_value(value: Any) -> Any:
+    """Serialize a field value the way create_execution stores it."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {key: _to_document_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_document_value(item) for item in value]
+    return value
+
+
+class InvalidContinuationToken(ValueError):
+    """A paging cursor that is malformed, expired or belongs to another query."""
+
+
+def _is_bad_continuation_token(error: Exception, continuation_token: Optional[str]) -> bool:
+    """Whether a paged query failed because of the continuation token it resumed from."""
+    if not continuation_token:
+        return False
+    if isinstance(error, CosmosHttpResponseError):
+        return error.status_code == 400
+    # The SDK (and the SQLite container) decode the token client-side
+    return isinstance(error, (ValueError, TypeError, KeyError))
+
 
 class CosmosMemoryStore:
     """
@@ -64,6 +103,7 @@ class CosmosMemoryStore:
         self._database = None
         self._container = None
         self._initialized = asyncio.Event()
+        self._execution_locations: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
     
     async def initialize(self) -> None:
         """Initialize CosmosDB client and container."""
@@ -97,6 +137,11 @@ class CosmosMemoryStore:
                 offer_throughput=400
             )
             
+            # Record the live workload for replay by the persistence benchmark
+            record_path = os.getenv("MEMORY_STORE_RECORD_PATH")
+            if record_path:
+                self._container = RecordingContainer(self._container, record_path)
+            
             logger.info(
                 f"CosmosDB initialized successfully - endpoint={self.endpoint}, database={self.database_name}, container={self.container_name}"
             )
@@ -114,6 +159,8 @@ class CosmosMemoryStore:
     
     async def close(self) -> None:
         """Close the Cosmos DB client."""
+        if isinstance(self._container, RecordingContainer):
+            self._container.close()
         if self._client:
             await self._client.close()
             logger.info("CosmosDB client closed")
@@ -195,41 +242,90 @@ class CosmosMemoryStore:
             logger.error(f"Failed to update session: {e}, session_id={session_id}")
             raise
     
-    async def get_all_sessions(self, user_id: Optional[str] = None, limit: int = 50) -> List[PatternSession]:
-        """Retrieve all sessions, optionally filtered by user."""
+    async def _query_page(
+        self,
+        query: str,
+        parameters: List[Dict[str, Any]],
+        limit: int,
+        continuation_token: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Run a cross-partition query and return a single page of at most ``limit`` items.
+        
+        Paging uses Cosmos continuation tokens rather than OFFSET/LIMIT, so the
+        request charge of page N does not grow with N.
+        
+        Returns:
+            Tuple of (items, continuation token for the next page or None)
+        """
+        query_iter = self._container.query_items(
+            query=query,
+            parameters=parameters,
+            max_item_count=limit
+        )
+        items: List[Dict[str, Any]] = []
+        next_token = None
+        try:
+            pages = query_iter.by_page(continuation_token)
+            async for page in pages:
+                items.extend([item async for item in page])
+                next_token = pages.continuation_token
+                # Cross-partition pages can come back empty while more results remain
+                if items or not next_token:
+                    break
+        except Exception as e:
+            if _is_bad_continuation_token(e, continuation_token):
+                raise InvalidContinuationToken("Invalid or expired continuation token") from e
+            raise
+        
+        return items, next_token
+    
+    async def get_sessions_page(
+        self,
+        user_id: Optional[str] = None,
+        limit: int = 50,
+        continuation_token: Optional[str] = None
+    ) -> Tuple[List[PatternSession], Optional[str]]:
+        """
+        Retrieve one page of sessions (most recent first), optionally filtered by user.
+        
+        Returns:
+            Tuple of (sessions, continuation token for the next page or None)
+        """
         await self.ensure_initialized()
         
+        query_parts = ["SELECT * FROM c WHERE c.data_type='session'"]
+        parameters = []
+        
+        if user_id:
+            query_parts.append("AND c.user_id=@user_id")
+            parameters.append({"name": "@user_id", "value": user_id})
+        
+        query_parts.append("ORDER BY c.created_at DESC")
+        query = " ".join(query_parts)
+        
+        raw_items, next_token = await self._query_page(query, parameters, limit, continuation_token)
+        
+        items = []
+        for item in raw_items:
+            try:
+                # Parse datetime strings
+                if "created_at" in item and isinstance(item["created_at"], str):
+                    item["created_at"] = datetime.fromisoformat(item["created_at"])
+                if "last_active" in item and isinstance(item["last_active"], str):
+                    item["last_active"] = datetime.fromisoformat(item["last_active"])
+                items.append(PatternSession(**item))
+            except Exception as e:
+                logger.warning(f"Failed to parse session: {e}")
+                continue
+        
+        logger.info(f"Retrieved {len(items)} sessions, user_id={user_id if user_id else 'all'}")
+        return items, next_token
+    
+    async def get_all_sessions(self, user_id: Optional[str] = None, limit: int = 50) -> List[PatternSession]:
+        """Retrieve all sessions, optionally filtered by user (first page only)."""
         try:
-            query_parts = ["SELECT * FROM c WHERE c.data_type='session'"]
-            parameters = []
-            
-            if user_id:
-                query_parts.append("AND c.user_id=@user_id")
-                parameters.append({"name": "@user_id", "value": user_id})
-            
-            query_parts.append(f"ORDER BY c.created_at DESC OFFSET 0 LIMIT {limit}")
-            query = " ".join(query_parts)
-            
-            items = []
-            # Cross-partition query (no partition_key specified)
-            query_iter = self._container.query_items(
-                query=query,
-                parameters=parameters
-            )
-            
-            async for item in query_iter:
-                try:
-                    # Parse datetime strings
-                    if "created_at" in item and isinstance(item["created_at"], str):
-                        item["created_at"] = datetime.fromisoformat(item["created_at"])
-                    if "last_active" in item and isinstance(item["last_active"], str):
-                        item["last_active"] = datetime.fromisoformat(item["last_active"])
-                    items.append(PatternSession(**item))
-                except Exception as e:
-                    logger.warning(f"Failed to parse session: {e}")
-                    continue
-            
-            logger.info(f"Retrieved {len(items)} sessions, user_id={user_id if user_id else 'all'}")
+            items, _ = await self.get_sessions_page(user_id=user_id, limit=limit)
             return items
             
         except Exception as e:
@@ -302,6 +398,7 @@ class CosmosMemoryStore:
             logger.info(f"Creating PatternExecution in Cosmos DB: execution_id={execution.execution_id}, session_id={execution.session_id}, pattern={execution.pattern}")
             
             await self._container.create_item(body=execution_dict)
+            self._remember_execution_location(execution.execution_id, execution.id, execution.session_id)
             
             logger.info(f"PatternExecution created successfully in Cosmos DB: execution_id={execution.execution_id}, pattern={execution.pattern}, user_id={execution.user_id}")
             return execution
@@ -331,7 +428,9 @@ class CosmosMemoryStore:
                         item["started_at"] = datetime.fromisoformat(item["started_at"])
                     if "completed_at" in item and item["completed_at"] and isinstance(item["completed_at"], str):
                         item["completed_at"] = datetime.fromisoformat(item["completed_at"])
-                    return PatternExecution(**item)
+                    execution = PatternExecution(**item)
+                    self._remember_execution_location(execution.execution_id, execution.id, execution.session_id)
+                    return execution
                 except Exception as e:
                     logger.warning(f"Failed to parse execution: {e}")
                     continue
@@ -342,35 +441,141 @@ class CosmosMemoryStore:
             logger.error(f"Failed to get execution: {e}, execution_id={execution_id}")
             return None
     
-    async def update_execution(self, execution_id: str, updates: Dict[str, Any]) -> None:
-        """Partially update an execution with given fields."""
+    def _remember_execution_location(self, execution_id: str, item_id: str, session_id: str) -> None:
+        self._execution_locations[execution_id] = (item_id, session_id)
+        self._execution_locations.move_to_end(execution_id)
+        while len(self._execution_locations) > EXECUTION_LOCATION_CACHE_SIZE:
+            self._execution_locations.popitem(last=False)
+    
+    async def _locate_execution(
+        self,
+        execution_id: str,
+        session_id: Optional[str] = None
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Find the document id and partition key of an execution.
+        
+        Executions created or read by this process are known already; otherwise
+        a projection query fetches just the id (scoped to one partition when the
+        session is known).
+        """
+        location = self._execution_locations.get(execution_id)
+        if location:
+            return location
+        
+        query = "SELECT c.id, c.session_id FROM c WHERE c.execution_id=@execution_id AND c.data_type='pattern_execution'"
+        parameters = [{"name": "@execution_id", "value": execution_id}]
+        kwargs = {"partition_key": session_id} if session_id else {}
+        
+        async for item in self._container.query_items(query=query, parameters=parameters, **kwargs):
+            self._remember_execution_location(execution_id, item["id"], item["session_id"])
+            return item["id"], item["session_id"]
+        
+        return None
+    
+    async def patch_execution(
+        self,
+        execution_id: str,
+        fields: Dict[str, Any],
+        session_id: Optional[str] = None
+    ) -> None:
+        """
+        Set top-level execution fields with a partial-document patch.
+        
+        Status and progress updates become a point write of just the changed
+        fields instead of a read and full-document upsert. Unknown fields are
+        ignored, as in update_execution.
+        """
         await self.ensure_initialized()
         
+        operations = [
+            {"op": "set", "path": f"/{key}", "value": _to_document_value(value)}
+            for key, value in fields.items()
+            if key in PatternExecution.model_fields and key not in ("id", "execution_id", "session_id")
+        ]
+        if not operations:
+            return
+        
+        location = await self._locate_execution(execution_id, session_id)
+        if not location:
+            raise ValueError(f"Execution {execution_id} not found")
+        item_id, partition_key = location
+        
         try:
-            # Get existing execution
-            execution = await self.get_execution(execution_id)
-            if not execution:
+            for start in range(0, len(operations), MAX_PATCH_OPERATIONS):
+                await self._container.patch_item(
+                    item=item_id,
+                    partition_key=partition_key,
+                    patch_operations=operations[start:start + MAX_PATCH_OPERATIONS]
+                )
+            logger.debug(f"Execution patched: execution_id={execution_id}, fields={list(fields.keys())}")
+        except Exception as e:
+            self._execution_locations.pop(execution_id, None)
+            logger.error(f"Failed to patch execution: {e}, execution_id={execution_id}")
+            raise
+    
+    async def update_execution(
+        self,
+        execution_id: str,
+        updates: Dict[str, Any],
+        session_id: Optional[str] = None
+    ) -> None:
+        """
+        Partially update an execution with given fields.
+        
+        Small updates (up to MAX_PATCH_OPERATIONS fields) are applied as a
+        single patch. Larger ones read the document by point lookup and replace
+        it so all fields change atomically. The replace is conditional on the
+        document's etag and starts over from a fresh read if another writer
+        got there first, so concurrent patches are never lost.
+        """
+        await self.ensure_initialized()
+        
+        known_updates = {key: value for key, value in updates.items() if key in PatternExecution.model_fields}
+        if len(known_updates) <= MAX_PATCH_OPERATIONS:
+            await self.patch_execution(execution_id, known_updates, session_id=session_id)
+            return
+        
+        try:
+            location = await self._locate_execution(execution_id, session_id)
+            if not location:
                 raise ValueError(f"Execution {execution_id} not found")
-            
-            # Apply updates
-            for key, value in updates.items():
-                if hasattr(execution, key):
-                    setattr(execution, key, value)
-            
-            # Convert to dict for upsert
-            execution_dict = execution.dict()
-            # Serialize datetime objects
-            execution_dict["started_at"] = execution.started_at.isoformat()
-            if execution.completed_at:
-                execution_dict["completed_at"] = execution.completed_at.isoformat()
-            
-            await self._container.upsert_item(body=execution_dict)
+            item_id, partition_key = location
+            
+            for attempt in range(1, MAX_REPLACE_ATTEMPTS + 1):
+                execution_dict = await self._container.read_item(item=item_id, partition_key=partition_key)
+                
+                # Apply updates
+                for key, value in known_updates.items():
+                    execution_dict[key] = _to_document_value(value)
+                
+                try:
+                    await self._replace_if_unchanged(item_id, execution_dict)
+                    break
+                except CosmosAccessConditionFailedError:
+                    if attempt == MAX_REPLACE_ATTEMPTS:
+                        raise
+                    logger.debug(f"Execution changed during update, retrying: execution_id={execution_id}")
             logger.debug(f"Execution updated: execution_id={execution_id}, updates={list(updates.keys())}")
             
         except Exception as e:
             logger.error(f"Failed to update execution: {e}, execution_id={execution_id}")
             raise
     
+    async def _replace_if_unchanged(self, item_id: str, document: Dict[str, Any]) -> None:
+        """Replace a document read earlier, failing with a 412 if it has changed since."""
+        etag = document.get("_etag")
+        if etag is None:
+            # The local SQLite container keeps no etags
+            await self._container.replace_item(item=item_id, body=document)
+            return
+        await self._container.replace_item(
+            item=item_id,
+            body=document,
+            etag=etag,
+            match_condition=MatchConditions.IfNotModified
+        )
+    
     async def get_executions_by_session(self, session_id: str) -> List[PatternExecution]:
         """Retrieve all executions for a session."""
         await self.ensure_initialized()
@@ -408,38 +613,49 @@ class CosmosMemoryStore:
             logger.error(f"Failed to get executions by session: {e}, session_id={session_id}")
             return []
     
-    async def get_executions_by_user(self, user_id: str, limit: int = 50) -> List[PatternExecution]:
-        """Retrieve all executions for a user."""
+    async def get_executions_page(
+        self,
+        user_id: str,
+        limit: int = 50,
+        continuation_token: Optional[str] = None
+    ) -> Tuple[List[PatternExecution], Optional[str]]:
+        """
+        Retrieve one page of executions for a user (most recent first).
+        
+        Returns:
+            Tuple of (executions, continuation token for the next page or None)
+        """
         await self.ensure_initialized()
         
+        query = """
+        SELECT * FROM c 
+        WHERE c.user_id=@user_id AND c.data_type='pattern_execution'
+        ORDER BY c.started_at DESC
+        """
+        parameters = [{"name": "@user_id", "value": user_id}]
+        
+        # Cross-partition query
+        raw_items, next_token = await self._query_page(query, parameters, limit, continuation_token)
+        
+        items = []
+        for item in raw_items:
+            try:
+                # Parse datetime strings
+                if "started_at" in item and isinstance(item["started_at"], str):
+                    item["started_at"] = datetime.fromisoformat(item["started_at"])
+                if "completed_at" in item and item["completed_at"] and isinstance(item["completed_at"], str):
+                    item["completed_at"] = datetime.fromisoformat(item["completed_at"])
+                items.append(PatternExecution(**item))
+            except Exception as e:
+                logger.warning(f"Failed to parse execution: {e}")
+                continue
+        
+        return items, next_token
+    
+    async def get_executions_by_user(self, user_id: str, limit: int = 50) -> List[PatternExecution]:
+        """Retrieve all executions for a user (first page only)."""
         try:
-            query = f"""
-            SELECT * FROM c 
-            WHERE c.user_id=@user_id AND c.data_type='pattern_execution'
-            ORDER BY c.started_at DESC
-            OFFSET 0 LIMIT {limit}
-            """
-            parameters = [{"name": "@user_id", "value": user_id}]
-            
-            items = []
-            # Cross-partition query
-            query_iter = self._container.query_items(
-                query=query,
-                parameters=parameters
-            )
-            
-            async for item in query_iter:
-                try:
-                    # Parse datetime strings
-                    if "started_at" in item and isinstance(item["started_at"], str):
-                        item["started_at"] = datetime.fromisoformat(item["started_at"])
-                    if "completed_at" in item and item["completed_at"] and isinstance(item["completed_at"], str):
-                        item["completed_at"] = datetime.fromisoformat(item["completed_at"])
-                    items.append(PatternExecution(**item))
-                except Exception as e:
-                    logger.warning(f"Failed to parse execution: {e}")
-                    continue
-            
+            items, _ = await self.get_executions_page(user_id, limit=limit)
             return items
             
         except Exception as e:
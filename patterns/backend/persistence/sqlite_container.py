@@ -0,0 +1,568 @@
+"""
+SQLite Document Container
+
+A local stand-in for the subset of the Azure Cosmos DB async container API the
+memory stores use (create/upsert/read/delete/patch item, parameterized
+queries with continuation-token paging). Documents are stored as JSON in one
+SQLite table keyed by (partition key, id), mirroring Cosmos partitioning, with
+expression indexes on the JSON fields the stores filter and sort on.
+
+The database runs in WAL mode and every statement executes on a single worker
+thread, so the event loop never blocks on disk I/O.
+
+Queries use the small Cosmos SQL dialect found in the stores: ``SELECT *`` or
+a projection, ``WHERE`` with AND/OR comparisons, IS_STRING / IS_DEFINED /
+LENGTH / ARRAY_LENGTH / ARRAY_CONTAINS / CONTAINS, ``ORDER BY`` and
+``OFFSET ... LIMIT``.
+
+RecordingContainer wraps any container (Cosmos or SQLite) and appends every
+operation to a JSONL file, so production traffic can be replayed by the
+persistence benchmark.
+"""
+
+import asyncio
+import json
+import logging
+import re
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from azure.cosmos.exceptions import CosmosResourceExistsError, CosmosResourceNotFoundError
+
+logger = logging.getLogger(__name__)
+
+TABLE = "items"
+
+_PATH = re.compile(r'\bc((?:\.[A-Za-z_][A-Za-z0-9_]*|\["[^"]+"\])+)')
+_PATH_FUNCTIONS = re.compile(
+    r'\b(IS_STRING|IS_DEFINED|IS_NULL|IS_NUMBER|IS_BOOL|IS_ARRAY|ARRAY_LENGTH)\s*\(\s*'
+    r'c((?:\.[A-Za-z_][A-Za-z0-9_]*|\["[^"]+"\])+)\s*\)',
+    re.IGNORECASE
+)
+_ARRAY_CONTAINS = re.compile(
+    r'\bARRAY_CONTAINS\s*\(\s*c((?:\.[A-Za-z_][A-Za-z0-9_]*|\["[^"]+"\])+)\s*,\s*([^)]+?)\s*\)',
+    re.IGNORECASE
+)
+_QUERY = re.compile(
+    r'^SELECT\s+(?P<select>.+?)\s+FROM\s+c'
+    r'(?:\s+WHERE\s+(?P<where>.+?))?'
+    r'(?:\s+ORDER\s+BY\s+(?P<order>.+?))?'
+    r'(?:\s+OFFSET\s+(?P<offset>\S+)\s+LIMIT\s+(?P<limit>\S+))?\s*$',
+    re.IGNORECASE | re.DOTALL
+)
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+
+_TYPE_CHECKS = {
+    "IS_STRING": "= 'text'",
+    "IS_NUMBER": "IN ('integer', 'real')",
+    "IS_BOOL": "IN ('true', 'false')",
+    "IS_ARRAY": "= 'array'",
+    "IS_NULL": "= 'null'",
+    "IS_DEFINED": "IS NOT NULL",
+}
+
+
+def _json_path(segments: str) -> str:
+    """Turn a Cosmos property path (``.a.b`` or ``["a"]``) into a SQLite JSON path."""
+    parts = re.findall(r'\.([A-Za-z_][A-Za-z0-9_]*)|\["([^"]+)"\]', segments)
+    return "$" + "".join(f'."{plain or quoted}"' for plain, quoted in parts)
+
+
+def _split_top_level(text: str, separator: str = ",") -> List[str]:
+    """Split on ``separator`` outside parentheses."""
+    parts, depth, current = [], 0, []
+    for char in text:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        if char == separator and depth == 0:
+            parts.append("".join(current).strip())
+            current = []
+        else:
+            current.append(char)
+    if "".join(current).strip():
+        parts.append("".join(current).strip())
+    return parts
+
+
+def _translate_expression(expression: str) -> str:
+    """Translate a Cosmos SQL expression to SQLite over the ``doc`` column."""
+    # Keep string literals out of the rewriting below
+    literals: List[str] = []
+
+    def stash(match: "re.Match") -> str:
+        literals.append(match.group(0))
+        return f"\x00{len(literals) - 1}\x00"
+
+    sql = _STRING_LITERAL.sub(stash, expression)
+
+    def path_function(match: "re.Match") -> str:
+        name, path = match.group(1).upper(), _json_path(match.group(2))
+        if name == "ARRAY_LENGTH":
+            return f"json_array_length(doc, '{path}')"
+        return f"(json_type(doc, '{path}') {_TYPE_CHECKS[name]})"
+
+    sql = _PATH_FUNCTIONS.sub(path_function, sql)
+    sql = _ARRAY_CONTAINS.sub(
+        lambda m: f"EXISTS (SELECT 1 FROM json_each(doc, '{_json_path(m.group(1))}') WHERE value = {m.group(2)})",
+        sql
+    )
+    sql = _PATH.sub(lambda m: f"json_extract(doc, '{_json_path(m.group(1))}')", sql)
+    sql = re.sub(r'\bCONTAINS\s*\(', "_contains(", sql, flags=re.IGNORECASE)
+    sql = re.sub(r'\bLENGTH\s*\(', "length(", sql, flags=re.IGNORECASE)
+    sql = re.sub(r'\btrue\b', "1", sql, flags=re.IGNORECASE)
+    sql = re.sub(r'\bfalse\b', "0", sql, flags=re.IGNORECASE)
+    sql = sql.replace("!=", "<>")
+    sql = re.sub(r'@([A-Za-z_][A-Za-z0-9_]*)', r':\1', sql)
+
+    return re.sub(r"\x00(\d+)\x00", lambda m: literals[int(m.group(1))], sql)
+
+
+class _Projection:
+    """How to build one output field of a projected row."""
+
+    def __init__(self, expression: str):
+        match = re.match(r'^(?P<expr>.+?)\s+AS\s+(?P<alias>[A-Za-z_][A-Za-z0-9_]*)$', expression, re.IGNORECASE)
+        expr = match.group("expr") if match else expression
+        path = re.fullmatch(r'c((?:\.[A-Za-z_][A-Za-z0-9_]*|\["[^"]+"\])+)', expr.strip())
+
+        if path:
+            json_path = _json_path(path.group(1))
+            self.name = match.group("alias") if match else json_path.rsplit(".", 1)[-1].strip('"')
+            # json_quote keeps arrays/objects as JSON so they round-trip
+            self.sql = f"json_quote(json_extract(doc, '{json_path}'))"
+            self.decode = "json"
+        else:
+            if not match:
+                raise ValueError(f"Projected expression needs an alias: {expression}")
+            self.name = match.group("alias")
+            self.sql = _translate_expression(expr)
+            is_predicate = re.search(r"IS_|ARRAY_CONTAINS|CONTAINS|[<>=]|\bAND\b|\bOR\b|\bNOT\b", expr, re.IGNORECASE)
+            self.decode = "bool" if is_predicate else "raw"
+
+    def value(self, raw: Any) -> Any:
+        if self.decode == "json":
+            return json.loads(raw) if raw is not None else None
+        if self.decode == "bool":
+            return bool(raw) if raw is not None else False
+        return raw
+
+
+@lru_cache(maxsize=256)
+def translate_query(query: str, partitioned: bool = False) -> Tuple[str, Optional[Tuple[_Projection, ...]], bool]:
+    """
+    Translate a Cosmos SQL query, optionally scoped to the ``:__pk`` partition.
+
+    Returns:
+        Tuple of (SQLite SQL without paging, projections or None for SELECT *,
+        whether the query carries its own OFFSET/LIMIT)
+    """
+    normalized = " ".join(query.split())
+    match = _QUERY.match(normalized)
+    if not match:
+        raise ValueError(f"Unsupported query for SQLite container: {query}")
+
+    select = match.group("select").strip()
+    projections = None
+    if select == "*":
+        columns = "doc"
+    else:
+        if select.upper().startswith(("VALUE ", "DISTINCT ", "TOP ")):
+            raise ValueError(f"Unsupported SELECT form for SQLite container: {select}")
+        projections = tuple(_Projection(part) for part in _split_top_level(select))
+        columns = ", ".join(p.sql for p in projections)
+
+    sql = f"SELECT {columns} FROM {TABLE} WHERE " + ("partition_key = :__pk" if partitioned else "1=1")
+    if match.group("where"):
+        sql += f" AND ({_translate_expression(match.group('where'))})"
+    if match.group("order"):
+        order_terms = []
+        for term in _split_top_level(match.group("order")):
+            pieces = term.rsplit(" ", 1)
+            direction = pieces[1].upper() if len(pieces) == 2 and pieces[1].upper() in ("ASC", "DESC") else ""
+            expr = pieces[0] if direction else term
+            order_terms.append(f"{_translate_expression(expr)} {direction}".strip())
+        sql += " ORDER BY " + ", ".join(order_terms)
+
+    has_limit = match.group("limit") is not None
+    if has_limit:
+        limit = _translate_expression(match.group("limit"))
+        offset = _translate_expression(match.group("offset"))
+        sql += f" LIMIT {limit} OFFSET {offset}"
+
+    return sql, projections, has_limit
+
+
+def _bind(parameters: Optional[Iterable[Dict[str, Any]]], partition_key: Optional[str]) -> Dict[str, Any]:
+    bound: Dict[str, Any] = {"__pk": str(partition_key)} if partition_key is not None else {}
+    for parameter in parameters or []:
+        value = parameter["value"]
+        if isinstance(value, bool):
+            value = int(value)
+        elif isinstance(value, (list, dict)):
+            value = json.dumps(value)
+        bound[parameter["name"].lstrip("@")] = value
+    return bound
+
+
+def _apply_patch(document: Dict[str, Any], operations: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """Apply Cosmos patch operations (add/set/replace/remove/incr) to a document."""
+    for operation in operations:
+        op = operation["op"].lower()
+        keys = [key for key in operation["path"].split("/") if key]
+        if not keys:
+            raise ValueError("Patch path must name a property")
+        parent = document
+        for key in keys[:-1]:
+            parent = parent[int(key)] if isinstance(parent, list) else parent.setdefault(key, {})
+        leaf = keys[-1]
+
+        if isinstance(parent, list):
+            index = len(parent) if leaf == "-" else int(leaf)
+            if op == "add":
+                parent.insert(index, operation["value"])
+            elif op in ("set", "replace"):
+                parent[index] = operation["value"]
+            elif op == "remove":
+                parent.pop(index)
+            elif op == "incr":
+                parent[index] += operation["value"]
+            continue
+
+        if op in ("add", "set"):
+            parent[leaf] = operation["value"]
+        elif op == "replace":
+            if leaf not in parent:
+                raise CosmosResourceNotFoundError(status_code=400, message=f"Path {operation['path']} does not exist")
+            parent[leaf] = operation["value"]
+        elif op == "remove":
+            parent.pop(leaf, None)
+        elif op == "incr":
+            parent[leaf] = parent.get(leaf, 0) + operation["value"]
+        else:
+            raise ValueError(f"Unsupported patch operation: {op}")
+    return document
+
+
+class _Page:
+    """One page of query results."""
+
+    def __init__(self, items: List[Dict[str, Any]]):
+        self._items = items
+
+    def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        return self._iterate()
+
+    async def _iterate(self):
+        for item in self._items:
+            yield item
+
+
+class _PageIterator:
+    """Async iterator of pages exposing ``continuation_token`` like the Cosmos SDK."""
+
+    def __init__(self, query: "_QueryIterable", continuation_token: Optional[str]):
+        self._query = query
+        self._offset = int(json.loads(continuation_token)["offset"]) if continuation_token else 0
+        self._done = False
+        self.continuation_token: Optional[str] = continuation_token
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> _Page:
+        if self._done:
+            raise StopAsyncIteration
+        page_size = self._query.max_item_count or 100
+        # Fetch one extra row to learn whether another page exists
+        rows = await self._query.fetch(self._offset, page_size + 1)
+        more = len(rows) > page_size
+        rows = rows[:page_size]
+        self._offset += len(rows)
+        self.continuation_token = json.dumps({"offset": self._offset}) if more else None
+        self._done = not more
+        return _Page(rows)
+
+
+class _QueryIterable:
+    """Result of ``query_items``: async-iterable, with ``by_page`` for paging."""
+
+    def __init__(self, container: "SqliteContainer", query: str, parameters, partition_key, max_item_count):
+        self._container = container
+        self._query = query
+        self._parameters = parameters
+        self._partition_key = partition_key
+        self.max_item_count = max_item_count
+
+    async def fetch(self, offset: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return await self._container._run(
+            self._container._query_sync, self._query, self._parameters, self._partition_key, offset, limit
+        )
+
+    def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        return self._iterate()
+
+    async def _iterate(self):
+        for item in await self.fetch():
+            yield item
+
+    def by_page(self, continuation_token: Optional[str] = None) -> _PageIterator:
+        return _PageIterator(self, continuation_token)
+
+
+class SqliteContainer:
+    """Cosmos-container-compatible document store backed by SQLite (WAL)."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        partition_key_path: str = "/session_id",
+        indexes: Sequence[Sequence[str]] = (("data_type",),)
+    ):
+        """
+        Initialize the container (call ``open`` before use).
+
+        Args:
+            path: Database file, or ":memory:"
+            partition_key_path: Document property used as the partition key
+            indexes: Secondary indexes, each a tuple of top-level document fields
+        """
+        self.path = str(path)
+        self.partition_key_field = partition_key_path.strip("/")
+        self.indexes = [tuple(index) for index in indexes]
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-store")
+        self._conn: Optional[sqlite3.Connection] = None
+
+    async def _run(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def _open_sync(self):
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.create_function("_contains", 2, lambda text, part: int(text is not None and part is not None and str(part) in str(text)), deterministic=True)
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {TABLE} ("
+            "partition_key TEXT NOT NULL, "
+            "id TEXT NOT NULL, "
+            "doc TEXT NOT NULL, "
+            "_ts INTEGER NOT NULL, "
+            "PRIMARY KEY (partition_key, id))"
+        )
+        for fields in self.indexes:
+            name = f"ix_{TABLE}_" + "_".join(fields)
+            columns = ", ".join(f"json_extract(doc, '$.\"{field}\"')" for field in fields)
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {TABLE} ({columns})")
+        self._conn = conn
+
+    async def open(self) -> "SqliteContainer":
+        """Open the database and create the table and indexes."""
+        if self._conn is None:
+            await self._run(self._open_sync)
+            logger.info(f"SQLite container opened: path={self.path}, indexes={self.indexes}")
+        return self
+
+    async def close(self) -> None:
+        """Close the database."""
+        if self._conn is not None:
+            await self._run(self._conn.close)
+            self._conn = None
+        self._executor.shutdown(wait=False)
+
+    # ------------------------------------------------------------------
+    # Item operations
+    # ------------------------------------------------------------------
+
+    def _partition_of(self, body: Dict[str, Any]) -> str:
+        value = body.get(self.partition_key_field)
+        if value is None:
+            raise ValueError(f"Document is missing partition key '{self.partition_key_field}'")
+        return str(value)
+
+    def _write_sync(self, body: Dict[str, Any], upsert: bool) -> Dict[str, Any]:
+        document = dict(body)
+        document["_ts"] = int(time.time())
+        params = (self._partition_of(document), str(document["id"]), json.dumps(document, default=str), document["_ts"])
+        if upsert:
+            self._conn.execute(
+                f"INSERT INTO {TABLE} (partition_key, id, doc, _ts) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (partition_key, id) DO UPDATE SET doc=excluded.doc, _ts=excluded._ts",
+                params
+            )
+        else:
+            try:
+                self._conn.execute(f"INSERT INTO {TABLE} (partition_key, id, doc, _ts) VALUES (?, ?, ?, ?)", params)
+            except sqlite3.IntegrityError:
+                raise CosmosResourceExistsError(status_code=409, message=f"Item {document['id']} already exists")
+        return document
+
+    def _read_sync(self, item: str, partition_key: str) -> Dict[str, Any]:
+        row = self._conn.execute(
+            f"SELECT doc FROM {TABLE} WHERE partition_key=? AND id=?", (str(partition_key), str(item))
+        ).fetchone()
+        if row is None:
+            raise CosmosResourceNotFoundError(status_code=404, message=f"Item {item} not found")
+        return json.loads(row[0])
+
+    def _delete_sync(self, item: str, partition_key: str) -> None:
+        cursor = self._conn.execute(
+            f"DELETE FROM {TABLE} WHERE partition_key=? AND id=?", (str(partition_key), str(item))
+        )
+        if cursor.rowcount == 0:
+            raise CosmosResourceNotFoundError(status_code=404, message=f"Item {item} not found")
+
+    def _patch_sync(self, item: str, partition_key: str, operations: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            document = _apply_patch(self._read_sync(item, partition_key), operations)
+            document["_ts"] = int(time.time())
+            self._conn.execute(
+                f"UPDATE {TABLE} SET doc=?, _ts=? WHERE partition_key=? AND id=?",
+                (json.dumps(document, default=str), document["_ts"], str(partition_key), str(item))
+            )
+            self._conn.execute("COMMIT")
+            return document
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def _query_sync(
+        self,
+        query: str,
+        parameters: Optional[Iterable[Dict[str, Any]]],
+        partition_key: Optional[str],
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        sql, projections, has_limit = translate_query(query, partition_key is not None)
+        bound = _bind(parameters, partition_key)
+        if limit is not None:
+            # Page over the query's own result set
+            sql = f"SELECT * FROM ({sql}) LIMIT :__page_limit OFFSET :__page_offset" if has_limit else \
+                f"{sql} LIMIT :__page_limit OFFSET :__page_offset"
+            bound.update({"__page_limit": limit, "__page_offset": offset})
+
+        rows = self._conn.execute(sql, bound).fetchall()
+        if projections is None:
+            return [json.loads(row[0]) for row in rows]
+        return [
+            {projection.name: projection.value(value) for projection, value in zip(projections, row)}
+            for row in rows
+        ]
+
+    async def create_item(self, body: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        """Insert a new document; raises CosmosResourceExistsError if the id exists in the partition."""
+        return await self._run(self._write_sync, body, False)
+
+    async def upsert_item(self, body: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        """Insert or replace a document."""
+        return await self._run(self._write_sync, body, True)
+
+    async def replace_item(self, item: Any, body: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        """Replace an existing document."""
+        await self._run(self._read_sync, body.get("id", item), self._partition_of(body))
+        return await self._run(self._write_sync, body, True)
+
+    async def read_item(self, item: str, partition_key: str, **kwargs) -> Dict[str, Any]:
+        """Point read; raises CosmosResourceNotFoundError."""
+        return await self._run(self._read_sync, item, partition_key)
+
+    async def delete_item(self, item: Union[str, Dict[str, Any]], partition_key: str, **kwargs) -> None:
+        """Point delete; raises CosmosResourceNotFoundError."""
+        item_id = item["id"] if isinstance(item, dict) else item
+        await self._run(self._delete_sync, item_id, partition_key)
+
+    async def patch_item(
+        self,
+        item: str,
+        partition_key: str,
+        patch_operations: Sequence[Dict[str, Any]],
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Apply patch operations atomically to one document."""
+        return await self._run(self._patch_sync, item, partition_key, patch_operations)
+
+    def query_items(
+        self,
+        query: str,
+        parameters: Optional[List[Dict[str, Any]]] = None,
+        partition_key: Optional[str] = None,
+        max_item_count: Optional[int] = None,
+        **kwargs
+    ) -> _QueryIterable:
+        """Run a query, scoped to one partition when ``partition_key`` is given."""
+        return _QueryIterable(self, query, parameters, partition_key, max_item_count)
+
+
+class RecordingContainer:
+    """
+    Pass-through container wrapper that records each operation as a JSON line.
+
+    The log is the workload format replayed by the persistence benchmark.
+    """
+
+    def __init__(self, container: Any, path: Union[str, Path]):
+        """Wrap ``container``, appending operations to ``path``."""
+        self._container = container
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _record(self, op: str, **args):
+        self._file.write(json.dumps({"op": op, "t": time.time(), **args}, default=str) + "\n")
+        self._file.flush()
+
+    async def create_item(self, body, **kwargs):
+        self._record("create_item", body=body)
+        return await self._container.create_item(body=body, **kwargs)
+
+    async def upsert_item(self, body, **kwargs):
+        self._record("upsert_item", body=body)
+        return await self._container.upsert_item(body=body, **kwargs)
+
+    async def replace_item(self, item, body, **kwargs):
+        self._record("replace_item", item=item, body=body)
+        return await self._container.replace_item(item=item, body=body, **kwargs)
+
+    async def read_item(self, item, partition_key, **kwargs):
+        self._record("read_item", item=item, partition_key=partition_key)
+        return await self._container.read_item(item=item, partition_key=partition_key, **kwargs)
+
+    async def delete_item(self, item, partition_key, **kwargs):
+        self._record("delete_item", item=item["id"] if isinstance(item, dict) else item, partition_key=partition_key)
+        return await self._container.delete_item(item=item, partition_key=partition_key, **kwargs)
+
+    async def patch_item(self, item, partition_key, patch_operations, **kwargs):
+        self._record("patch_item", item=item, partition_key=partition_key, patch_operations=patch_operations)
+        return await self._container.patch_item(
+            item=item, partition_key=partition_key, patch_operations=patch_operations, **kwargs
+        )
+
+    def query_items(self, query, parameters=None, partition_key=None, max_item_count=None, **kwargs):
+        self._record(
+            "query_items",
+            query=query,
+            parameters=parameters,
+            partition_key=partition_key,
+            max_item_count=max_item_count
+        )
+        extra = {"max_item_count": max_item_count} if max_item_count is not None else {}
+        if partition_key is not None:
+            extra["partition_key"] = partition_key
+        return self._container.query_items(query=query, parameters=parameters, **extra, **kwargs)
+
+    def close(self):
+        self._file.close()
@@ -65,6 +65,8 @@ from agent_framework import (
     ai_function
 )
 
+from middleware import AGENT_MIDDLEWARE
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -324,6 +326,7 @@ async def run_deep_research_orchestration(
         logger.info("Creating probe agent for grounded planning...")
         probe_agent = client.create_agent(
             name="probe_bing",
+            middleware=list(AGENT_MIDDLEWARE),
             instructions=(
                 "Use web search to gather quick evidence for planning. "
                 "Return ONLY a compact JSON array: [{title, url, snippet, date}, ...] (max 5 items). "
@@ -344,6 +347,7 @@ async def run_deep_research_orchestration(
         logger.info("Creating ReAct planner agent...")
         planner = client.create_agent(
             name="planner",
+            middleware=list(AGENT_MIDDLEWARE),
             instructions=(
                 "You are a ReAct planner for deep research. Think step-by-step. "
                 "If uncertain about any aspect, CALL the probe_bing_grounding tool to gather evidence. "
@@ -396,6 +400,7 @@ async def run_deep_research_orchestration(
         logger.info("Creating researcher agent...")
         researcher = client.create_agent(
             name="researcher",
+            middleware=list(AGENT_MIDDLEWARE),
             instructions=(
                 "Expand the research plan into actionable queries. "
                 "Return STRICT JSON with these keys ONLY:\n"
@@ -452,6 +457,7 @@ async def run_deep_research_orchestration(
             logger.info(f"Creating private search agent with vector store: {vector_store_id}")
             private_search = client.create_agent(
                 name="private_search",
+                middleware=list(AGENT_MIDDLEWARE),
                 instructions=(
                     "Use File/Vector Search over the connected store. "
                     "Return ONLY JSON array of {title, url, snippet, date} (max 12). "
@@ -496,6 +502,7 @@ async def run_deep_research_orchestration(
             logger.info("Creating PDF search agent...")
             pdf_search = client.create_agent(
                 name="pdf_search",
+                middleware=list(AGENT_MIDDLEWARE),
                 instructions=(
                     "Use File Search to read the uploaded PDF. "
                     "Cite filename and page when possible. "
@@ -542,6 +549,7 @@ async def run_deep_research_orchestration(
                 logger.info(f"  - Creating search agent: {name}")
                 return client.create_agent(
                     name=f"search_{name}",
+                    middleware=list(AGENT_MIDDLEWARE),
                     instructions=(
                         f"Use web search focused on: {focus}. "
                         "Return ONLY a JSON array of {title, url, snippet, date} (max 8 items). "
@@ -629,6 +637,7 @@ async def run_deep_research_orchestration(
             logger.info("Creating analyst agent with Code Interpreter...")
             analyst = client.create_agent(
                 name="analyst",
+                middleware=list(AGENT_MIDDLEWARE),
                 instructions=(
                     "You have a Python Code Interpreter. "
                     "Given an evidence JSON array, use Python to:\n"
@@ -667,6 +676,7 @@ async def run_deep_research_orchestration(
         logger.info("Creating writer agent...")
         writer = client.create_agent(
             name="writer",
+            middleware=list(AGENT_MIDDLEWARE),
             instructions=(
                 "Write a comprehensive Markdown research report with:\n"
                 "1. Title\n"
@@ -734,6 +744,7 @@ async def run_deep_research_orchestration(
             logger.info("Creating reviewer agent...")
             reviewer = client.create_agent(
                 name="reviewer",
+                middleware=list(AGENT_MIDDLEWARE),
                 instructions=(
                     "Be a critical reviewer. Provide:\n"
                     "1. Numbered list of specific issues (facts, citations, structure, clarity)\n"